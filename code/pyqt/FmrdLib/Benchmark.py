@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import time
+import platform
+from timeit import default_timer
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+from FmrdLib import (Constants, QueryStats)
+
+"""Contains classes and functions that time scripted data entry sessions and compare them to a baseline.
+
+Every step of a session is timed, and the number of SQL round trips it makes is taken from
+QueryStats, which is switched on while a recorder is active.  Round trips are those issued
+through FmrdLib.QueryCache; statements issued by Qt's own table models (select, submit) are
+included in the latency but not in the count.
+
+Classes:
+BenchmarkRecorder -- time session steps and summarize results
+MessageBoxResponder -- answer modal message boxes during unattended sessions
+
+Functions:
+Percentile -- return percentile of list of values
+WriteResults -- write results to JSON file
+ReadResults -- read results from JSON file
+CompareResults -- return regressions of results against a baseline
+"""
+
+RESULTS_VERSION = 1
+
+# default regression thresholds: relative slowdown of median, and minimum absolute slowdown
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_MIN_DELTA_MS = 2.0
+
+def Percentile(values, fraction):
+    """Returns percentile of values (nearest-rank method), or 0.0 if there are no values.
+
+    Arguments:
+        values -- list of numbers
+        fraction -- percentile as a fraction (0.5 = median)
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = int(round(fraction * len(ordered) + 0.5)) - 1
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+def _roundTrips():
+    """Returns number of statements recorded by QueryStats so far."""
+    return sum(entry[0] for statements in QueryStats.Statistics().values() for entry in statements.values())
+
+
+class BenchmarkRecorder(object):
+    """Times steps of scripted sessions and collects latency and round-trip counts."""
+
+    def __init__(self):
+        """Constructor for BenchmarkRecorder class."""
+        # {session: {step: [[elapsed ms, ...], [round trips, ...]]}}
+        self.results = {}
+        # {session: number of message boxes answered}
+        self.prompts = {}
+        self.skipped = {}
+        self.session = None
+        self.wasEnabled = None
+
+    def begin(self, session):
+        """Starts recording a session.  Switches query instrumentation on if it is off."""
+        if self.wasEnabled is None:
+            self.wasEnabled = QueryStats.IsEnabled()
+            QueryStats.SetEnabled(True)
+        self.session = session
+        self.results.setdefault(session, {})
+
+    def end(self):
+        """Stops recording current session."""
+        self.session = None
+
+    def close(self):
+        """Restores query instrumentation setting.  Statistics of the benchmark are discarded."""
+        if self.wasEnabled is False:
+            QueryStats.ResetStatistics()
+            QueryStats.SetEnabled(False)
+        self.wasEnabled = None
+
+    def measure(self, step, function, *args):
+        """Calls function with arguments, records its latency and round trips, and returns its result.
+
+        Pending events are processed before the clock starts, so that each step is timed on
+        its own.
+        """
+        QApplication.processEvents()
+        trips = _roundTrips()
+        started = default_timer()
+        result = function(*args)
+        elapsed = (default_timer() - started) * 1000.0
+        entry = self.results[self.session].setdefault(step, [[], []])
+        entry[0].append(elapsed)
+        entry[1].append(_roundTrips() - trips)
+        return result
+
+    def skip(self, step):
+        """Records that a step could not be run on the current dataset."""
+        key = "%s.%s" % (self.session, step)
+        self.skipped[key] = self.skipped.get(key, 0) + 1
+
+    def prompt(self):
+        """Records that a message box was answered during the current session."""
+        if self.session is not None:
+            self.prompts[self.session] = self.prompts.get(self.session, 0) + 1
+
+    def summary(self):
+        """Returns {session: {step: statistics}} with sample count, mean, p50/p90/p99, maximum
+        latency (ms) and mean round trips per step."""
+        summary = {}
+        for session, steps in self.results.items():
+            summary[session] = {}
+            for step, (samples, trips) in steps.items():
+                summary[session][step] = {
+                    "samples": len(samples),
+                    "mean_ms": round(sum(samples) / len(samples), 3),
+                    "p50_ms": round(Percentile(samples, 0.50), 3),
+                    "p90_ms": round(Percentile(samples, 0.90), 3),
+                    "p99_ms": round(Percentile(samples, 0.99), 3),
+                    "max_ms": round(max(samples), 3),
+                    "roundtrips": round(float(sum(trips)) / len(trips), 2),
+                }
+        return summary
+
+
+class MessageBoxResponder(object):
+    """Answers modal QMessageBox calls while installed, so that sessions run unattended.
+
+    Questions are answered Save (or Yes), all other boxes are acknowledged.  Every box is
+    reported to the recorder.
+    """
+
+    _methods = ("question", "critical", "warning", "information")
+
+    def __init__(self, recorder):
+        """Constructor for MessageBoxResponder class."""
+        self.recorder = recorder
+        self.originals = {}
+
+    def install(self):
+        for name in self._methods:
+            self.originals[name] = getattr(QMessageBox, name)
+        QMessageBox.question = staticmethod(self._question)
+        for name in self._methods[1:]:
+            setattr(QMessageBox, name, staticmethod(self._acknowledge))
+
+    def uninstall(self):
+        for name, method in self.originals.items():
+            setattr(QMessageBox, name, method)
+        self.originals = {}
+
+    def _question(self, parent, title, text, buttons=QMessageBox.Ok, *args):
+        self.recorder.prompt()
+        for answer in (QMessageBox.Save, QMessageBox.Yes, QMessageBox.Ok):
+            if int(buttons) & int(answer):
+                return answer
+        return QMessageBox.NoButton
+
+    def _acknowledge(self, parent, title, text, buttons=QMessageBox.Ok, *args):
+        self.recorder.prompt()
+        return QMessageBox.Close
+
+
+def WriteResults(fileName, recorder, dataset=None):
+    """Writes summary of recorder to JSON file.
+
+    Arguments:
+        fileName -- name of results file
+        recorder -- BenchmarkRecorder object
+        dataset -- dictionary that describes the benchmark database (e.g. row counts)
+
+    """
+    results = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "application": Constants.DATAENTRY_VERSION,
+        "platform": "Python %s - Qt %s - PyQt %s on %s" % (platform.python_version(), QT_VERSION_STR,
+                                                           PYQT_VERSION_STR, platform.system()),
+        "dataset": dataset or {},
+        "sessions": recorder.summary(),
+        "prompts": recorder.prompts,
+        "skipped": recorder.skipped,
+    }
+    resultsFile = open(fileName, "w")
+    try:
+        json.dump(results, resultsFile, indent=2, sort_keys=True)
+    finally:
+        resultsFile.close()
+    return results
+
+def ReadResults(fileName):
+    """Reads results from JSON file.  Returns None if file cannot be read."""
+    try:
+        resultsFile = open(fileName)
+    except IOError:
+        return None
+    try:
+        return json.load(resultsFile)
+    finally:
+        resultsFile.close()
+
+def CompareResults(results, baseline, tolerance=DEFAULT_TOLERANCE, minDelta=DEFAULT_MIN_DELTA_MS):
+    """Returns list of regression messages of results against a baseline.
+
+    A step regresses if its median latency exceeds the baseline median by more than
+    tolerance (fraction) and minDelta (ms), or if it makes more round trips than in the
+    baseline.  Steps that are missing from either side are ignored.
+    """
+    regressions = []
+    for session, steps in sorted(results["sessions"].items()):
+        baseSteps = baseline.get("sessions", {}).get(session, {})
+        for step, stats in sorted(steps.items()):
+            base = baseSteps.get(step)
+            if base is None:
+                continue
+            delta = stats["p50_ms"] - base["p50_ms"]
+            if delta > minDelta and stats["p50_ms"] > base["p50_ms"] * (1.0 + tolerance):
+                regressions.append("%s/%s: median %.1f ms, baseline %.1f ms (+%.0f%%)" %
+                                   (session, step, stats["p50_ms"], base["p50_ms"],
+                                    100.0 * delta / max(base["p50_ms"], 0.001)))
+            if stats["roundtrips"] > base["roundtrips"]:
+                regressions.append("%s/%s: %.1f round trips, baseline %.1f" %
+                                   (session, step, stats["roundtrips"], base["roundtrips"]))
+    return regressions
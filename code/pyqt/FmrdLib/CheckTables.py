@@ -18,105 +18,68 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from PyQt4.QtCore import *
-from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 from FmrdLib import Constants
+from FmrdLib.QueryCache import *
+from FmrdLib.TableCounters import CounterValue
 
-"""Contains functions that count number of records in FMRD tables."""
+"""Contains functions that count number of records in FMRD tables.
+
+The CheckMinimum* functions read trigger-maintained counters (see FmrdLib.TableCounters);
+lineup counts of a match are kept by FmrdLib.LineupReadiness.LineupSummary.  HasChildRecords
+and ChildRecordCounts check references to a record in the child tables found from foreign
+key metadata.
+"""
+
+def CountRecords(sql, params=()):
+    """Executes SELECT COUNT(*) statement through the query cache and returns an integer.
+    
+    Returns -1 if the query fails.
+    """
+    value = ScalarQuery(sql, params)
+    if not value.isValid():
+        return -1
+    return value.toInt()[0]
 
 def CheckMinimumCompetitions():
     """Check Competitions table and returns True if there is at least one record in it."""
-    CompetitionQuery = QSqlQuery()
-    CompetitionQuery.prepare("SELECT COUNT(*) FROM tbl_competitions")
-    CompetitionQuery.exec_()
-    
-    if CompetitionQuery.isActive():
-        CompetitionQuery.next()
-        numCompetitions = CompetitionQuery.value(0).toInt()[0]
-        if numCompetitions >= Constants.MIN_COMPETITIONS:
-            return 1
-        else:
-            return 0
+    if CounterValue("competitions") >= Constants.MIN_COMPETITIONS:
+        return 1
     else:
         return 0
 
 def CheckMinimumTeams():
     """Check Teams table and returns True if there are at least two records in it."""
-    TeamsQuery = QSqlQuery()
-    TeamsQuery.prepare("SELECT COUNT(*) FROM tbl_teams")
-    TeamsQuery.exec_()
-    
-    if TeamsQuery.isActive():
-        TeamsQuery.next()
-        numTeams = TeamsQuery.value(0).toInt()[0]
-        if numTeams >= Constants.MIN_TEAMS:
-            return 1
-        else:
-            return 0
+    if CounterValue("teams") >= Constants.MIN_TEAMS:
+        return 1
     else:
         return 0
     
 def CheckMinimumVenueHosts():
     """Check Teams table and returns True if there is at least one record in it."""
-    HostsQuery = QSqlQuery()
-    HostsQuery.prepare("SELECT COUNT(*) FROM tbl_teams")
-    HostsQuery.exec_()
-    
-    if HostsQuery.isActive():
-        HostsQuery.next()
-        numHosts = HostsQuery.value(0).toInt()[0]
-        if numHosts >= Constants.MIN_VENUEHOSTS:
-            return 1
-        else:
-            return 0
+    if CounterValue("teams") >= Constants.MIN_VENUEHOSTS:
+        return 1
     else:
         return 0
         
 def CheckMinimumVenues():
     """Check Venues table and returns True if there is at least one record in it."""
-    VenuesQuery = QSqlQuery()
-    VenuesQuery.prepare("SELECT COUNT(*) FROM tbl_venues")
-    VenuesQuery.exec_()
-    
-    if VenuesQuery.isActive():
-        VenuesQuery.next()
-        numVenues = VenuesQuery.value(0).toInt()[0]
-        if numVenues >= Constants.MIN_VENUES:
-            return 1
-        else:
-            return 0
+    if CounterValue("venues") >= Constants.MIN_VENUES:
+        return 1
     else:
         return 0
     
 def CheckMinimumManagers():
     """Check Managers table and returns True if there are at least two records in it."""
-    ManagerQuery = QSqlQuery()
-    ManagerQuery.prepare("SELECT COUNT(*) FROM tbl_managers")
-    ManagerQuery.exec_()
-
-    if ManagerQuery.isActive():
-        ManagerQuery.next()
-        numManagers = ManagerQuery.value(0).toInt()[0]
-        if numManagers >= Constants.MIN_MANAGERS:
-            return 1
-        else:
-            return 0
+    if CounterValue("managers") >= Constants.MIN_MANAGERS:
+        return 1
     else:
         return 0
 
 def CheckMinimumReferees():
     """Check Referees table and returns True if there is at least one record in it."""
-    RefereeQuery = QSqlQuery()
-    RefereeQuery.prepare("SELECT COUNT(*) FROM tbl_referees")
-    RefereeQuery.exec_()
-    
-    if RefereeQuery.isActive():
-        RefereeQuery.next()
-        numReferees = RefereeQuery.value(0).toInt()[0]
-        if numReferees >= Constants.MIN_REFEREES:
-            return 1
-        else:
-            return 0
+    if CounterValue("referees") >= Constants.MIN_REFEREES:
+        return 1
     else:
         return 0
 
@@ -145,35 +108,14 @@ def CheckMinimumLineups():
         (2) at least one starting player in Lineups table where Captain = TRUE
         (3) at least one starting player in Lineups table at Goalkeeper position
     """
-    StartersQuery = QSqlQuery()
-    StartersQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE lp_starting")
-    StartersQuery.exec_()
-    
-    CaptainQuery = QSqlQuery()
-    CaptainQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE lp_starting AND lp_captain")
-    CaptainQuery.exec_()
-    
-    GoalkeeperQuery = QSqlQuery()
-    GoalkeeperQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE lp_starting AND "
-                                            "position_id IN (SELECT position_id from positions_list WHERE position_name = ?)")
-    GoalkeeperQuery.addBindValue(QVariant("Goalkeeper"))
-    GoalkeeperQuery.exec_()
-    if StartersQuery.isActive() and CaptainQuery.isActive() and GoalkeeperQuery.isActive():
-        StartersQuery.next()
-        numStarters = StartersQuery.value(0).toInt()[0]
+    numStarters = CounterValue("starters")
+    numCaptains = CounterValue("captains")
+    numGoalkeepers = CounterValue("goalkeepers")
         
-        CaptainQuery.next()
-        numCaptains = CaptainQuery.value(0).toInt()[0]
-        
-        GoalkeeperQuery.next()
-        numGoalkeepers = GoalkeeperQuery.value(0).toInt()[0]
-        
-        if (numStarters >= Constants.MIN_STARTERS) and \
-        (numCaptains >= Constants.MIN_STARTING_CAPTAINS) and \
-        (numGoalkeepers >= Constants.MIN_STARTING_GOALKEEPERS):
-            return 1
-        else:
-            return 0
+    if (numStarters >= Constants.MIN_STARTERS) and \
+    (numCaptains >= Constants.MIN_STARTING_CAPTAINS) and \
+    (numGoalkeepers >= Constants.MIN_STARTING_GOALKEEPERS):
+        return 1
     else:
         return 0
 
@@ -183,18 +125,8 @@ def CheckMinimumSubstitutes():
     Returns True if there is at least one record in Lineups table where Starting = FALSE.
     
     """
-    SubstituteQuery = QSqlQuery()
-    SubstituteQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE NOT lp_starting")
-    SubstituteQuery.exec_()
-    
-    if SubstituteQuery.isActive():
-        SubstituteQuery.next()
-        numSubstitutes = SubstituteQuery.value(0).toInt()[0]
-        
-        if numSubstitutes >= Constants.MIN_SUBSTITUTES:
-            return 1
-        else:
-            return 0
+    if CounterValue("substitutes") >= Constants.MIN_SUBSTITUTES:
+        return 1
     else:
         return 0
 
@@ -204,126 +136,137 @@ def CheckMinimumKnockoutMatches():
     Returns TRUE if there is at least one record in Knockout Matches table.
     
     """
-    KnockoutQuery = QSqlQuery()
-    KnockoutQuery.prepare("SELECT COUNT(*) FROM tbl_knockoutmatches")
-    KnockoutQuery.exec_()
-    
-    if KnockoutQuery.isActive():
-        KnockoutQuery.next()
-        numKnockoutMatches = KnockoutQuery.value(0).toInt()[0]
-        
-        if numKnockoutMatches >= Constants.MIN_KNOCKOUT_MATCHES:
-            return 1
-        else:
-            return 0
+    if CounterValue("knockoutmatches") >= Constants.MIN_KNOCKOUT_MATCHES:
+        return 1
     else:
         return 0
 
-def CountStarters(match_id, team_id):
-    """Counts number of starters for a team in Lineup table and returns an integer.
+# child tables read from foreign key metadata: {connection name: {parent table: [(child table, column), ...]}}
+_childTables = {}
+
+def _metadataRows(db, sql):
+    """Executes metadata statement on a connection.  Returns list of rows, or None if the statement fails."""
+    query = QSqlQuery(db)
+    query.setForwardOnly(True)
+    if not query.exec_(sql):
+        return None
+    rows = []
+    while query.next():
+        rows.append([query.value(k) for k in range(query.record().count())])
+    query.finish()
+    return rows
+
+def _readForeignKeys(db):
+    """Reads single-column foreign keys of database and returns {parent table: [(child table, column), ...]}.
     
-    Returns number of entries where starter = TRUE.
-    Arguments:
-        match_id - ID number from Matches table
-        team_id - ID number from Teams table
-        
+    Returns None if the metadata cannot be read, or if the database declares no foreign keys
+    (e.g. a schema created without them), as child references cannot be checked then.
     """
-    StartersQuery = QSqlQuery()
-    StartersQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE match_id=? AND team_id=? AND lp_starting")
-    StartersQuery.addBindValue(QVariant(match_id))
-    StartersQuery.addBindValue(QVariant(team_id))
-    StartersQuery.exec_()
-    
-    if StartersQuery.next():
-        return StartersQuery.value(0).toInt()[0]
+    keys = []
+    if db.driverName() == "QPSQL":
+        rows = _metadataRows(db, "SELECT parent.relname, child.relname, att.attname FROM pg_constraint con "
+                                 "JOIN pg_class child ON child.oid = con.conrelid "
+                                 "JOIN pg_class parent ON parent.oid = con.confrelid "
+                                 "JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = con.conkey[1] "
+                                 "WHERE con.contype = 'f' AND array_length(con.conkey, 1) = 1")
+        if rows is None:
+            return None
+        keys = [tuple(unicode(value.toString()) for value in row) for row in rows]
     else:
-        return 0
-        
-def CountSubstitutes(match_id, team_id):
-    """Counts number of substitutes for a team in Lineup table and returns an integer.
+        # PRAGMA foreign_key_list columns: id, seq, table, from, to, ...
+        for table in db.tables():
+            rows = _metadataRows(db, QString("PRAGMA foreign_key_list(%1)").arg(table))
+            if rows is None:
+                return None
+            # a composite key has one row per column, numbered by seq
+            composite = set(row[0].toInt()[0] for row in rows if row[1].toInt()[0] > 0)
+            for row in rows:
+                if row[0].toInt()[0] not in composite:
+                    keys.append((unicode(row[2].toString()), unicode(table), unicode(row[3].toString())))
+    if not keys:
+        return None
+    children = {}
+    for parent, child, column in sorted(keys):
+        children.setdefault(parent, []).append((child, column))
+    return children
+
+def ChildTables(parent, connectionName=None):
+    """Returns list of (child table, foreign key column) pairs that refer to parent table.
     
-    Returns number of entries where starter = FALSE.
-    Arguments:
-        match_id - ID number from Matches table
-        team_id - ID number from Teams table
-        
+    The list is derived from the foreign keys declared in the database, which are read once 
+    per connection.  Returns None if the foreign keys cannot be read; the read is tried again
+    on the next call.
     """
-    SubstituteQuery = QSqlQuery()
-    SubstituteQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE match_id=? AND team_id=? AND NOT lp_starting")
-    SubstituteQuery.addBindValue(QVariant(match_id))
-    SubstituteQuery.addBindValue(QVariant(team_id))
-    SubstituteQuery.exec_()
-    
-    if SubstituteQuery.next():
-        return SubstituteQuery.value(0).toInt()[0]
-    else:
-        return 0
+    db = QSqlDatabase.database() if connectionName is None else QSqlDatabase.database(connectionName)
+    connName = unicode(db.connectionName())
+    if connName not in _childTables:
+        children = _readForeignKeys(db)
+        if children is None:
+            return None
+        _childTables[connName] = children
+    return _childTables[connName].get(unicode(parent), [])
 
-def CountCaptains(match_id, team_id):
-    """Counts number of captains for a team in Lineup table and returns an integer.
-    
-    Returns number of entries where captain = TRUE.
-    Arguments:
-        match_id - ID number from Matches table
-        team_id - ID number from Teams table
+def InvalidateChildTables(connectionName=None):
+    """Discards foreign key metadata of a database connection, or of all connections if no name is given.
     
+    Must be called when a connection is (re)opened.
     """
-    CaptainQuery = QSqlQuery()
-    CaptainQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE match_id=? AND team_id=? AND lp_starting AND lp_captain")
-    CaptainQuery.addBindValue(QVariant(match_id))
-    CaptainQuery.addBindValue(QVariant(team_id))
-    CaptainQuery.exec_()
-    
-    if CaptainQuery.next():
-        return CaptainQuery.value(0).toInt()[0]
+    if connectionName is None:
+        _childTables.clear()
     else:
-        return 0
+        _childTables.pop(unicode(connectionName), None)
 
-def CountGoalkeepers(match_id, team_id):
-    """Counts number of goalkeepers for a team in Lineup table and returns an integer.
+def HasChildRecords(parent, id, cascaded=()):
+    """Returns True if any record in a child table refers to a record of the parent table.
     
-    Returns number of entries where starter = TRUE and position ID corresponds to Goalkeeper.
+    All child tables are tested in one statement, a disjunction of EXISTS subqueries that stops
+    at the first reference found.  If the foreign keys cannot be read or the statement fails, 
+    True is returned so that the parent record is not deleted.
     Arguments:
-        match_id - ID number from Matches table
-        team_id - ID number from Teams table
+        parent - name of parent table (string)
+        id - ID number of parent record (string)
+        cascaded - child tables whose records are deleted along with parent record (list of strings)
         
     """
+    childTables = ChildTables(parent)
+    if childTables is None:
+        return True
+    children = [(table, column) for table, column in childTables if table not in cascaded]
+    if not children:
+        return False
     
-    GoalkeeperQuery = QSqlQuery()
-    GoalkeeperQuery.prepare("SELECT COUNT(*) FROM tbl_lineups WHERE match_id=? AND team_id=? AND lp_starting \
-                        AND position_id IN (SELECT position_id FROM positions_list WHERE position_name = ?)")
-    GoalkeeperQuery.addBindValue(QVariant(match_id))
-    GoalkeeperQuery.addBindValue(QVariant(team_id))
-    GoalkeeperQuery.addBindValue(QVariant("Goalkeeper"))                        
-    GoalkeeperQuery.exec_()
-    
-    if GoalkeeperQuery.next():
-        return GoalkeeperQuery.value(0).toInt()[0]
-    else:
-        return 0
+    sql = "SELECT CASE WHEN %s THEN 1 ELSE 0 END" % \
+          " OR ".join("EXISTS (SELECT 1 FROM %s WHERE %s = ?)" % child for child in children)
+    value = ScalarQuery(sql, (id, ) * len(children))
+    if not value.isValid():
+        return True
+    return value.toInt()[0] != 0
 
-def CountChildRecords(list, field, id):
-    """Counts number of records in child table that refer to a field ID belonging to a parent table and returns an integer.
+def ChildRecordCounts(parent, id, cascaded=()):
+    """Counts records in each child table that refer to a record of the parent table, with one statement.
     
+    Returns dictionary {child table: number of records} of the child tables that refer to the record, 
+    e.g. to preview a deletion, or None if the foreign keys cannot be read.
     Arguments:
-        list - list of tables (string)
-        field - name of foreign key field  (string)
-        id - ID number of foreign key field (string)
+        parent - name of parent table (string)
+        id - ID number of parent record (string)
+        cascaded - child tables whose records are deleted along with parent record (list of strings)
         
     """
-
-    numRecords = 0
-    query = QSqlQuery()
-    for table in list:
-        queryString = QString("SELECT COUNT(*) FROM %1 WHERE %2=?").arg(table).arg(field)
-        query.prepare(queryString)
-        query.addBindValue(id)
-        query.exec_()
-        if query.next():
-            numRecords += query.value(0).toInt()[0]
-        else:
-            return -1
-    return numRecords
+    childTables = ChildTables(parent)
+    if childTables is None:
+        return None
+    children = [(table, column) for table, column in childTables if table not in cascaded]
+    if not children:
+        return {}
+    
+    sql = " UNION ALL ".join("SELECT '%s', COUNT(*) FROM %s WHERE %s = ?" % (table, table, column) 
+                             for table, column in children)
+    counts = {}
+    for table, count in RowsQuery(sql, (id, ) * len(children)):
+        if count.toInt()[0]:
+            counts[unicode(table.toString())] = counts.get(unicode(table.toString()), 0) + count.toInt()[0]
+    return counts
 
 def CheckDuplicateRecords(field, table, desc):
     """Check for duplicate record before record is committed to database.
@@ -338,17 +281,8 @@ def CheckDuplicateRecords(field, table, desc):
     # trim whitespace from descriptor
     desc = desc.trimmed()
     
-    query = QSqlQuery()
-    queryString = QString("SELECT COUNT(*) FROM %1 WHERE %2=?").arg(table).arg(field)
-    query.prepare(queryString)
-    query.addBindValue(desc)
-    query.exec_()
-    if query.next():
-        if query.value(0).toInt()[0]:
-            return True
-        else:
-            return False
-    else:
+    count = CountRecords(QString("SELECT COUNT(*) FROM %1 WHERE %2=?").arg(table).arg(field), (desc, ))
+    if count:
         return True
-
-
+    else:
+        return False
@@ -74,6 +74,9 @@ MinRoundID          = "10"
 MinWeatherID       = "10"
 MinCountryID        = "100"
 
+# number of IDs reserved at a time by each session for match, event and personnel tables
+ID_BLOCK_SIZE = 20
+
 
 # #############
 # Constants
@@ -119,3 +122,6 @@ MAX_KO_MINUTES = 120
 
 # Define maximum participation in penalty shootout
 MAX_PARTICIPATION = 2
+
+# Define threshold (in milliseconds) of slow-query log
+SLOW_QUERY_MS = 250
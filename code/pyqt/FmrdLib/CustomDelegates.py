@@ -20,7 +20,8 @@
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 from PyQt4.QtSql import *
-from FmrdLib import Constants
+from FmrdLib import (Constants, RosterState)
+from FmrdLib.QueryCache import *
 
 """Contains custom and generic delegates used by various dialogs of FMRD tool.
 
@@ -65,8 +66,39 @@ ConfedComboBoxDelegateTemplate -- template class for Confederation comboboxes in
 MgrComboBoxDelegateTemplate -- template class for Manager comboboxes in Match dialog
 TeamComboBoxDelegateTemplate -- template class for Team comboboxes in Match dialog
 
+Functions:
+ComboBoxID -- return ID of current item in combobox
+ComboBoxIndex -- return index of combobox item with ID
+
 """
 
+# ID clause that restricts lineup entries to the team of another lineup entry
+LINEUP_TEAM_CLAUSE = "team_id IN (SELECT team_id FROM tbl_lineups WHERE lineup_id = %s)"
+
+def ComboBoxID(comboBox, field):
+    """Returns ID (QString) in field of current item in combobox, or "-1" if no item is selected.
+    
+    The ID is read from the record of the combobox's SQL model, so no query is made.
+    """
+    boxIndex = comboBox.currentIndex()
+    if boxIndex == -1:
+        return QString("-1")
+    return comboBox.model().record(boxIndex).value(field).toString()
+
+def ComboBoxIndex(comboBox, field, value):
+    """Returns index of combobox item whose ID in field equals value, or -1 if there is none.
+    
+    Unlike a search on the display text, this is unambiguous when two items share a name.
+    """
+    model = comboBox.model()
+    while model.canFetchMore():
+        model.fetchMore()
+    value = QString(value)
+    for row in range(model.rowCount()):
+        if model.record(row).value(field).toString() == value:
+            return row
+    return -1
+
 class NullLineEditDelegate(QSqlRelationalDelegate):
     """Implements custom delegate for LineEdit widgets.  
     
@@ -139,16 +171,8 @@ class EventTeamComboBoxDelegate(QSqlRelationalDelegate):
         teamModel = editor.model()
         teamModel.setFilter(QString())
 
-        # current matchup
-        matchup = self.matchSelect.currentText()
-        
-        # get match_id by making a query on match_list
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
 
         # filter team combobox
         # result: home and away teams for specific match
@@ -157,11 +181,11 @@ class EventTeamComboBoxDelegate(QSqlRelationalDelegate):
             "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1)").arg(match_id)
         teamModel.setFilter(teamQueryString)
         
-        # get team name from goals model
-        teamText = eventModel.data(index, Qt.DisplayRole).toString()
+        # get team_id from goals model
+        team_id = eventModel.foreignKey(index.row(), index.column())
             
         # set current index of team combobox
-        editor.setCurrentIndex(editor.findText(teamText, Qt.MatchExactly))
+        editor.setCurrentIndex(ComboBoxIndex(editor, "team_id", team_id))
 
 
 class EventPlayerComboBoxDelegate(QSqlRelationalDelegate):
@@ -202,48 +226,19 @@ class EventPlayerComboBoxDelegate(QSqlRelationalDelegate):
         lineupListModel = editor.model()
         lineupListModel.setFilter(QString())
         
-        # get current matchup
-        matchup = self.matchSelect.currentText()
-                
-        # get match_id by making a query on match_list with matchup
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
-        else:
-            match_id = "-1"
-        
-        # get player name from model
-        playerName = eventModel.data(index).toString()
-        
-        # make query on lineup_list to find lineup_id associated with player
-        lineupQuery = QSqlQuery()
-        lineupQuery.prepare("SELECT lineup_id FROM lineup_list WHERE player = ?")
-        lineupQuery.addBindValue(QVariant(playerName))
-        lineupQuery.exec_()
-        if lineupQuery.next():
-            lineup_id = lineupQuery.value(0).toString()
-        else:
-            lineup_id = "-1"
-       
-        # make query on tbl_lineups to find team
-        teamQuery = QSqlQuery()
-        teamQuery.prepare("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?")
-        teamQuery.addBindValue(QVariant(lineup_id))
-        teamQuery.exec_()        
-        if teamQuery.next():
-            team_id = teamQuery.value(0).toString()
-        else:
-            team_id = "-1"        
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
         
-        # filter lineup list model by match_id
+        # get lineup_id of player from event model
+        lineup_id = eventModel.foreignKey(index.row(), index.column())
+        
+        # filter lineup list model by match_id and team of player
         lineupListModel.setFilter(QString("lineup_id IN "
-                                                          "(SELECT lineup_id FROM tbl_lineups WHERE match_id = %1 AND team_id = %2)").arg(match_id, team_id))
+                                          "(SELECT lineup_id FROM tbl_lineups WHERE match_id = %1 AND %2)").arg(
+                                          match_id, LINEUP_TEAM_CLAUSE % lineup_id))
 
-        # set current index in player combobox by searching for player name
-        editor.setCurrentIndex(editor.findText(playerName, Qt.MatchExactly))
+        # set current index in player combobox by searching for lineup_id
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", lineup_id))
         
         editor.blockSignals(False)
 
@@ -306,53 +301,21 @@ class SwitchPlayerComboBoxDelegate(QSqlRelationalDelegate):
         lineupListModel = editor.model()
         lineupListModel.setFilter(QString())
         
-        # get current matchup
-        matchup = self.matchSelect.currentText()
-        
-        # get match_id by making a query on match_list with matchup
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
-        else:
-            match_id = "-1"
-        
-        # get player name from model
-        playerName = eventModel.data(index).toString()
-        
-        # make query on lineup_list to find player name
-        playerQuery = QSqlQuery()
-        playerQuery.prepare("SELECT lineup_id FROM lineup_list WHERE player = ?")
-        playerQuery.addBindValue(QVariant(playerName))
-        playerQuery.exec_()
-        if playerQuery.next():
-           lineup_id = playerQuery.value(0).toString()
-        else:
-           lineup_id = "-1"
-        
-       # make query on tbl_lineups to find team associated with player
-        teamQuery = QSqlQuery()
-        teamQuery.prepare("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?")
-        teamQuery.addBindValue(QVariant(lineup_id))
-        teamQuery.exec_()        
-        if teamQuery.next():
-            team_id = teamQuery.value(0).toString()
-        else:
-            team_id = "-1"        
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
         
-        filterString = QString("lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions) "
-                               "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %1 AND team_id = %2) "
-                               "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions) AND "
-                               "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %1 AND team_id = %2))"
-                               ).arg(match_id).arg(team_id)
+        # get lineup_id of player from event model
+        lineup_id = eventModel.foreignKey(index.row(), index.column())
+        
+        # players on the field for the same team and match
+        team_id = RosterState.LineupTeam(lineup_id)
+        filterString = RosterState.LineupFilter(RosterState.OnFieldPlayers(match_id, team_id))
 
         # filter Player combobox
         lineupListModel.setFilter(filterString)
 
-        # set current index in player combobox by searching for player name
-        editor.setCurrentIndex(editor.findText(playerName, Qt.MatchExactly))        
+        # set current index in player combobox by searching for lineup_id
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", lineup_id))
         editor.blockSignals(False)
 
     def setModelData(self, editor, model, index):
@@ -409,22 +372,12 @@ class SubOutComboBoxDelegate(QStyledItemDelegate):
         # linking table
         subsLinkingModel = index.model()
 
-        # get match_id from current text in matchSelect (main form)
-        matchup = self.match.currentText()
-       
         # lineup list model for combobox, reset filter on lineup list
         lineupListModel = editor.model()
         lineupListModel.setFilter(QString())
 
-        # get match_id by making a query on match_list with matchup
-        matchQuery = QSqlQuery()
-        matchQuery.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        matchQuery.addBindValue(QVariant(matchup))
-        matchQuery.exec_()
-        if matchQuery.next():
-            match_id = matchQuery.value(0).toString()
-        else:
-            match_id = "-1"
+        # get match_id from current item of matchSelect (main form)
+        match_id = ComboBoxID(self.match, "match_id")
 
         # get lineup_id from linking model
         # if there exists an entry, then find player name and set filter string for
@@ -432,57 +385,27 @@ class SubOutComboBoxDelegate(QStyledItemDelegate):
         #
         #    -- filter players who can be subbed out of match
         #    -- same match, same team, on lineup list, starting or already subbed in, not already subbed out
-        #    SELECT player FROM tbl_lineups WHERE lineup_id NOT IN
-        #        (SELECT lineup_id FROM tbl_outsubstitutions) AND lp_starting AND match_id = ? AND team_id = ?
-        #    UNION
-        #    SELECT player FROM tbl_lineups WHERE lineup_id IN
-        #        (SELECT lineup_id FROM tbl_insubstitutions) AND NOT lp_starting AND match_id = ? AND team_id = ?
+        #    (read from roster state of match and team)
 
 #        print "Index: %d" % index.row()
         if index.row() == -1:
             # no entry --> invalid index
-            playerName = "-1"
             lineup_id = "-1"
-            team_id = "-1"
         else:
             # entry --> valid index
             lineup_id = subsLinkingModel.record(index.row()).value("lineup_id").toString()
-            
-            # make query on lineup_list to find player name
-            playerQuery = QSqlQuery()
-            playerQuery.exec_(QString("SELECT player FROM lineup_list WHERE lineup_id = %1").arg(lineup_id))
-            if playerQuery.isActive():
-               playerQuery.next()
-               playerName = unicode(playerQuery.value(0).toString())
-            else:
-               playerName = "-1"
-               
-           # make query on tbl_lineups to find team associated with player
-            teamQuery = QSqlQuery()
-            teamQuery.prepare("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?")
-            teamQuery.addBindValue(QVariant(lineup_id))
-            teamQuery.exec_()        
-            if teamQuery.next():
-                team_id = teamQuery.value(0).toString()
-            else:
-                team_id = "-1"        
    
 #        print "Current (OUT) match ID: %s" % match_id   
 #        print "Current (OUT) lineup ID: %s" % lineup_id
-#        print "Current (OUT) team ID: %s" % team_id
-#        print "Current (OUT) player: %s" % playerName
         
-        filterString = QString("lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions WHERE lineup_id <> %1) "
-                               "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %2 AND team_id = %3) "
-                               "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions WHERE lineup_id <> %1) AND "
-                               "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %2 AND team_id = %3))"
-                               ).arg(lineup_id).arg(match_id).arg(team_id)
+        team_id = RosterState.LineupTeam(lineup_id)
+        filterString = RosterState.LineupFilter(RosterState.OnFieldPlayers(match_id, team_id, lineup_id))
 
         # filter Player combobox
         lineupListModel.setFilter(filterString)
 
         # set current index to item that matches data value
-        editor.setCurrentIndex(editor.findText(playerName, Qt.MatchExactly))
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", lineup_id))
         editor.blockSignals(False)
 
     def setModelData(self, editor, model, index):
@@ -535,22 +458,12 @@ class SubInComboBoxDelegate(QStyledItemDelegate):
         # linking table
         subsLinkingModel = index.model()
 
-        # get match_id from current text in matchSelect (main form)
-        matchup = self.match.currentText()
-       
         # lineup list model for combobox, reset filter on lineup list
         lineupListModel = editor.model()
         lineupListModel.setFilter(QString())        
             
-        # get match_id by making a query on match_list with matchup
-        matchQuery = QSqlQuery()
-        matchQuery.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        matchQuery.addBindValue(QVariant(matchup))
-        matchQuery.exec_()
-        if matchQuery.next():
-            match_id = matchQuery.value(0).toString()
-        else:
-            match_id = "-1"
+        # get match_id from current item of matchSelect (main form)
+        match_id = ComboBoxID(self.match, "match_id")
 
         # get lineup_id from linking model
         # if there exists an entry, then find player name and set filter string for
@@ -558,53 +471,26 @@ class SubInComboBoxDelegate(QStyledItemDelegate):
         #
         #    -- filter players who can be subbed into match
         #    -- same match, same team, not starting, not already subbed in
-        #    SELECT lineup_id FROM tbl_lineups WHERE lineup_id NOT IN
-        #        (SELECT lineup_id FROM tbl_insubstitutions) AND 
-        #        NOT lp_starting AND match_id = ? AND team_id = ?
+        #    (read from roster state of match and team)
         
         if index.row() == -1:
             # no entry --> invalid index
-            playerName = "-1"
             lineup_id = "-1"
-            team_id = "-1"
         else:
             # entry --> valid index
             lineup_id = subsLinkingModel.record(index.row()).value("lineup_id").toString()            
-            
-            # make query on lineup_list to find player name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT player FROM lineup_list WHERE lineup_id = %1").arg(lineup_id))
-            if query.isActive():
-               query.next()
-               playerName = unicode(query.value(0).toString())
-            else:
-               playerName = "-1"
-               
-           # make query on tbl_lineups to find team associated with player
-            teamQuery = QSqlQuery()
-            teamQuery.prepare("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?")
-            teamQuery.addBindValue(QVariant(lineup_id))
-            teamQuery.exec_()        
-            if teamQuery.next():
-                team_id = teamQuery.value(0).toString()
-            else:
-                team_id = "-1"        
 
 #        print "Current (IN) match ID: %s" % match_id
 #        print "Current (IN) lineup ID: %s" % lineup_id
-#        print "Current (IN) team ID: %s" % team_id
-#        print "Current (IN) player: %s" % playerName
         
-        filterString = QString("lineup_id NOT IN "
-                                   "(SELECT lineup_id FROM tbl_insubstitutions WHERE lineup_id <> %1) AND "
-                                   "lineup_id IN (SELECT lineup_id from tbl_lineups WHERE "
-                                   "NOT lp_starting AND match_id = %2 AND team_id = %3)").arg(lineup_id).arg(match_id).arg(team_id)
+        team_id = RosterState.LineupTeam(lineup_id)
+        filterString = RosterState.LineupFilter(RosterState.BenchPlayers(match_id, team_id, lineup_id))
 
         # filter Player combobox
         lineupListModel.setFilter(filterString)
 
         # set current index to item that matches data value
-        editor.setCurrentIndex(editor.findText(playerName, Qt.MatchExactly))
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", lineup_id))
         editor.blockSignals(False)
         
     def setModelData(self, editor, model, index):
@@ -639,6 +525,8 @@ class ShootoutPlayerComboBoxDelegate(QSqlRelationalDelegate):
         self.matchSelect = parent.matchSelect
         # shootout round
         self.roundSelect = parent.roundSelect
+        # shootout of selected match
+        self.shootout = parent.shootout
         
     def setEditorData(self, editor, index):
         """Writes current data from model into editor. 
@@ -669,25 +557,17 @@ class ShootoutPlayerComboBoxDelegate(QSqlRelationalDelegate):
         roundIndex = self.roundSelect.findText(roundName, Qt.MatchExactly)
         round_id = roundModel.record(roundIndex).value("round_id").toInt()[0]
 
-        # get player name from model
-        playerName = shootoutModel.data(index).toString()
-        playerIndex = editor.findText(playerName, Qt.MatchExactly)
-        lineup_id = lineupModel.record(playerIndex).value("lineup_id").toInt()[0]
+        # get lineup_id of player from model
+        lineup_id = shootoutModel.foreignKey(index.row(), index.column()).toInt()[0]
         
         # get team_id from lineup player
-        team_id = 0
-        query = QSqlQuery()
-        query.prepare(QString("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?"))
-        query.addBindValue(QVariant(lineup_id))
-        query.exec_()
-        if query.next():
-            team_id = query.value(0).toInt()[0]
+        team_id = RosterState.LineupTeam(lineup_id)
         
         editor.blockSignals(True)
         # get set of team players eligible to participate in penalty shootout
-        teamEligibleSet = set(self.getEligiblePlayers(match_id, team_id))
+        teamEligibleSet = set(RosterState.OnFieldPlayers(match_id, team_id))
         # get available players for current rotation of shootout round
-        playersUsedList = self.getUsedPlayers(match_id, team_id, round_id)
+        playersUsedList = self.shootout.usedPlayers(team_id, round_id)
         availableList = list(teamEligibleSet.difference(playersUsedList))
         availableList.append(lineup_id)
         availableList = list(set(availableList))
@@ -696,7 +576,7 @@ class ShootoutPlayerComboBoxDelegate(QSqlRelationalDelegate):
         filterString = "lineup_id IN (" + ",".join((str(n) for n in availableList)) + ")"
         lineupModel.setFilter(filterString)
         # set current index
-        editor.setCurrentIndex(editor.findText(playerName, Qt.MatchExactly))        
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", str(lineup_id)))        
         editor.blockSignals(False)
         
     def setModelData(self, editor, model, index):
@@ -712,72 +592,6 @@ class ShootoutPlayerComboBoxDelegate(QSqlRelationalDelegate):
         value = editor.model().record(boxIndex).value("lineup_id")
         
         model.setData(index, value)
-
-    def getEligiblePlayers(self, match_id, team_id):
-        """Returns list of players who are eligible to participate in penalty shootout.
-        
-        The list contains players who meet the following two criteria:
-            (1) Starting players on the same team who have not been substituted out of the match.
-            (2) Non-starting players on the same team who have been substituted into the match.
-        """
-        eligibleList = []
-        
-        lineupQuery = QSqlQuery()
-        eligibleQueryString = QString("SELECT lineup_id FROM tbl_lineups WHERE "
-                "lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions) "
-                "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %1 AND team_id = %2) "
-                "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions) AND "
-                "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %1 AND team_id = %2))"
-                ).arg(str(match_id)).arg(str(team_id))
-        lineupQuery.prepare(eligibleQueryString)
-        lineupQuery.exec_()
-        while lineupQuery.next():
-            eligibleList.append(lineupQuery.value(0).toInt()[0])
-            
-        return eligibleList
-        
-    def getUsedPlayers(self, match_id, team_id, round_id):
-        """Returns players who have already participated in current rotation (11 round period) of penalty shootout. """
-        usedList = []
-        
-        # get rotation that contains current shootout round
-        rotationList = self.getShootoutRotation(round_id)
-        
-        # query players in match lineup who have already participated in a round of penalty shootout
-        participateQuery = QSqlQuery()
-        participateQuery.prepare(QString("SELECT lineup_id FROM tbl_lineups WHERE match_id = %1 AND team_id = %2 "
-                                 "INTERSECT SELECT lineup_id FROM tbl_penaltyshootouts WHERE round_id = ?").arg(str(match_id), str(team_id)))
-        for round_id in rotationList:
-            participateQuery.addBindValue(round_id)
-            participateQuery.exec_()
-            while participateQuery.next():
-                usedList.append(participateQuery.value(0).toInt()[0])
-                
-        return usedList
-
-    def getShootoutRotation(self, round_id):
-        """Determine 11-round rotation in which current shootout round is a member."""
-        minRoundID = int(Constants.MinRoundID)
-        startRotationID = minRoundID
-
-        # get maximum Round ID
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(round_id) FROM tbl_rounds"))
-        if query.next():
-            maxRoundID = query.value(0).toInt()[0]
-        
-        if round_id < minRoundID:
-            if minRoundID + Constants.MAX_TEAM_STARTERS > maxRoundID:
-                endRotationID = maxRoundID + 1
-            else:
-                endRotationID = minRoundID + Constants.MAX_TEAM_STARTERS
-        else:
-            while round_id not in range(startRotationID, startRotationID+Constants.MAX_TEAM_STARTERS):
-                startRotationID += Constants.MAX_TEAM_STARTERS
-            endRotationID = startRotationID + Constants.MAX_TEAM_STARTERS
-        rotationList = range(startRotationID, endRotationID)
-
-        return rotationList
         
         
 class ShootoutRoundComboBoxDelegate(QSqlRelationalDelegate):
@@ -792,6 +606,8 @@ class ShootoutRoundComboBoxDelegate(QSqlRelationalDelegate):
         """Constructor for ShootoutRoundComboBoxDelegate class."""
         super(ShootoutRoundComboBoxDelegate, self).__init__(parent)
         self.matchSelect = parent.matchSelect
+        # shootout of selected match
+        self.shootout = parent.shootout
         
     def setEditorData(self, editor, index):
         """Writes current data from model into editor. 
@@ -806,7 +622,6 @@ class ShootoutRoundComboBoxDelegate(QSqlRelationalDelegate):
         """
         shootoutModel = index.model()
         roundModel = editor.model()
-        matchModel = self.matchSelect.model()
         
         # block signals from player combobox so that EnableWidget() is not called multiple times
         editor.blockSignals(True)
@@ -819,12 +634,8 @@ class ShootoutRoundComboBoxDelegate(QSqlRelationalDelegate):
         roundIndex = editor.findText(roundName, Qt.MatchExactly)
         round_id = roundModel.record(roundIndex).value("round_id").toInt()[0]
         
-        # get match_id
-        matchIndex = self.matchSelect.currentIndex()
-        match_id = matchModel.record(matchIndex).value("match_id").toString()
-                
         # create round filter
-        roundList = self.getAvailableRounds(match_id)
+        roundList = self.shootout.availableRounds()
         roundList.append(round_id)
         roundList = list(set(roundList))
         roundFilterString = "round_id IN (" + ",".join((str(n) for n in roundList)) + ")"
@@ -850,35 +661,6 @@ class ShootoutRoundComboBoxDelegate(QSqlRelationalDelegate):
         
         model.setData(index, value)
 
-    def getAvailableRounds(self, match_id):
-        """Returns rounds that have not had maximum participation in Penalty Shootout table.
-        
-        Argument:
-            match_id -- match ID from knockout_match_list"""
-        
-        roundIDList = []
-        roundStr = QString()
-        
-        # define min/max round ID in table
-        minRoundID = int(Constants.MinRoundID)
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(round_id) FROM tbl_rounds"))
-        if query.next():
-            maxRoundID = query.value(0).toInt()[0]
-            
-        # loop through round ID
-        # if round referenced less than twice in table, add it to list
-        for round_id in range(minRoundID, maxRoundID+1):
-            roundQuery = QSqlQuery()
-            roundStr.setNum(round_id)
-            roundQuery.exec_(QString("SELECT COUNT(*) FROM tbl_penaltyshootouts WHERE round_id = %1 "
-                                "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE match_id = %2)").arg(roundStr, match_id))
-            if roundQuery.next():
-                if roundQuery.value(0).toInt()[0] < Constants.MAX_PARTICIPATION:
-                    roundIDList.append(round_id)
-                    
-        return roundIDList
-
 class ShootoutOpenerComboBoxDelegate(QStyledItemDelegate):
     """Implements custom delegate for Teams ComboBox related to Shootout Openers table.
     
@@ -905,24 +687,11 @@ class ShootoutOpenerComboBoxDelegate(QStyledItemDelegate):
         # team model
         teamModel = editor.model()
 
-        # get team name from shootout opener model
+        # get team_id from shootout opener model
         team_id = eventModel.data(index, Qt.DisplayRole).toString()
-        query = QSqlQuery()
-        query.prepare("SELECT tm_name FROM tbl_teams WHERE team_id = ?")
-        query.addBindValue(QVariant(team_id))
-        query.exec_()
-        if query.next():
-            teamName = query.value(0).toString()
-        
-        # current matchup
-        matchup = self.matchSelect.currentText()
-        # get match_id by making a query on knockout_match_list
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM knockout_match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
+        
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
             
         # filter team combobox
         # result: home and away teams for specific match
@@ -933,7 +702,7 @@ class ShootoutOpenerComboBoxDelegate(QStyledItemDelegate):
         teamModel.setFilter(teamQueryString)
         
         # set current index of team combobox
-        editor.setCurrentIndex(editor.findText(teamName, Qt.MatchExactly))
+        editor.setCurrentIndex(ComboBoxIndex(editor, "team_id", team_id))
 
     def setModelData(self, editor, model, index):
         """Maps selected index in editor to its model field, and writes to the current entry in the database table.
@@ -988,33 +757,23 @@ class GoalPlayerComboBoxDelegate(QSqlRelationalDelegate):
         lineupListModel = editor.model()
         lineupListModel.setFilter(QString())
         
-        # get current matchup
-        matchup = self.matchSelect.currentText()
-        
-        # get match_id by making a query on match_list with matchup
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
-        else:
-            match_id = "-1"
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
             
         # filter lineup list model by match_id
         lineupListModel.setFilter(QString("lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE match_id = %1)").arg(match_id))
 
-        # get player from goals model
-        playerText = goalModel.data(index, Qt.DisplayRole).toString()
+        # get lineup_id of player from goals model
+        lineup_id = goalModel.foreignKey(index.row(), index.column())
         
-        # set current index in player combobox by searching for player name
-        editor.setCurrentIndex(editor.findText(playerText, Qt.MatchExactly))
+        # set current index in player combobox by searching for lineup_id
+        editor.setCurrentIndex(ComboBoxIndex(editor, "lineup_id", lineup_id))
 
 
 class LineupTeamDisplayDelegate(QSqlRelationalDelegate):
     """ Implements custom delegate template for Team LineEdit display in Lineup dialog.
     
-     Responsible for mapping displayed team name to team ID for insertion in Lineup table.
+     Displays team name, and writes team ID of Lineup dialog to Lineup table.
     
     Inherits QSqlRelationalDelegate.
     
@@ -1029,6 +788,7 @@ class LineupTeamDisplayDelegate(QSqlRelationalDelegate):
         """
         super(LineupTeamDisplayDelegate, self).__init__(parent)
         self.teamName = parent.teamName
+        self.team_id = parent.team_id
         
     def setEditorData(self, editor, index):
         """Writes team name into editor. 
@@ -1041,28 +801,15 @@ class LineupTeamDisplayDelegate(QSqlRelationalDelegate):
         editor.setText(self.teamName)
         
     def setModelData(self, editor, model, index):
-        """Maps team name to ID number in Teams model, and writes ID to the current entry in the database table.
+        """Writes team ID of Lineup dialog to the current entry in the database table.
         
         Arguments:
-            editor -- ComboBox widget
+            editor -- LineEdit widget (not used)
             model -- underlying database table model
             index -- current index of database table model
             
         """
-#        print "Calling setModelData() of LineupTeamDisplayDelegate"
-        # get team name
-        teamName = editor.text()
-        # get team ID from tbl_teams
-        query = QSqlQuery()
-        query.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        query.addBindValue(QVariant(teamName))
-        query.exec_()        
-        if query.next():
-            teamID = query.value(0).toString()
-        else:
-            teamID = "-1"
-        
-        model.setData(index, QVariant(teamID))
+        model.setData(index, QVariant(self.team_id))
 
 
 class LineupPlayerComboBoxDelegate(QSqlRelationalDelegate):
@@ -1187,12 +934,11 @@ class RoundsComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find round_id from linking table
             round_id = parentModel.record(index.row()).value("round_id") .toString()
             # make query on tbl_rounds to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT round_desc FROM tbl_rounds WHERE round_id = %1").arg(round_id))
-            if query.next():
-                roundDesc = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT round_desc FROM tbl_rounds WHERE round_id = ?", (round_id, ))
+            if value.isValid():
+                roundDesc = unicode(value.toString())
             else:
-               roundDesc = "-1"
+                roundDesc = "-1"
             currentIndex = editor.findText(roundDesc, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1248,12 +994,11 @@ class GroupsComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find group_id from linking table
             group_id = parentModel.record(index.row()).value("group_id") .toString()
             # make query on tbl_groups to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT group_desc FROM tbl_groups WHERE group_id = %1").arg(group_id))
-            if query.next():
-                groupDesc = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT group_desc FROM tbl_groups WHERE group_id = ?", (group_id, ))
+            if value.isValid():
+                groupDesc = unicode(value.toString())
             else:
-               groupDesc = "-1"
+                groupDesc = "-1"
             currentIndex = editor.findText(groupDesc, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1309,12 +1054,11 @@ class GroupRoundsComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find grpround_id from linking table
             grpround_id = parentModel.record(index.row()).value("grpround_id") .toString()
             # make query on tbl_grouprounds to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT grpround_desc FROM tbl_grouprounds WHERE grpround_id = %1").arg(grpround_id))
-            if query.next():
-                groupRoundDesc = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT grpround_desc FROM tbl_grouprounds WHERE grpround_id = ?", (grpround_id, ))
+            if value.isValid():
+                groupRoundDesc = unicode(value.toString())
             else:
-               groupRoundDesc = "-1"
+                groupRoundDesc = "-1"
             currentIndex = editor.findText(groupRoundDesc, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1370,12 +1114,11 @@ class KnockoutRoundsComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find koround_id from linking table
             koround_id = parentModel.record(index.row()).value("koround_id") .toString()
             # make query on tbl_knockoutrounds to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT koround_desc FROM tbl_knockoutrounds WHERE koround_id = %1").arg(koround_id))
-            if query.next():
-                knockoutRoundDesc = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT koround_desc FROM tbl_knockoutrounds WHERE koround_id = ?", (koround_id, ))
+            if value.isValid():
+                knockoutRoundDesc = unicode(value.toString())
             else:
-               knockoutRoundDesc = "-1"
+                knockoutRoundDesc = "-1"
             currentIndex = editor.findText(knockoutRoundDesc, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1431,12 +1174,11 @@ class KnockoutMatchdayComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find matchday_id from linking table
             matchday_id = parentModel.record(index.row()).value("matchday_id") .toString()
             # make query on tbl_matchdays to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT matchday_desc FROM tbl_matchdays WHERE matchday_id = %1").arg(matchday_id))
-            if query.next():
-                matchdayDesc = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT matchday_desc FROM tbl_matchdays WHERE matchday_id = ?", (matchday_id, ))
+            if value.isValid():
+                matchdayDesc = unicode(value.toString())
             else:
-               matchdayDesc = "-1"
+                matchdayDesc = "-1"
             currentIndex = editor.findText(matchdayDesc, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1590,20 +1332,9 @@ class ConfedComboBoxDelegateTemplate(QStyledItemDelegate):
         countryIndex = self.countryBox.currentIndex()
         countryModel = self.countryBox.model()
         id = countryModel.record(countryIndex).value("confed_id").toString()
-        
-        # make query on tbl_confederations to extract confederation name 
-        # corresponding to confederation ID
-        # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
-        else:
-            confedStr = "-1"
 
-        # search for confederation name in combobox, set index to current index
-        editor.setCurrentIndex(editor.findText(confedStr, Qt.MatchExactly))
+        # search for confederation ID in (cached) Confederation model, set index to current index
+        editor.setCurrentIndex(ComboBoxIndex(editor, "confed_id", id))
 
 
 class WeatherComboBoxDelegate(QStyledItemDelegate):
@@ -1636,12 +1367,11 @@ class WeatherComboBoxDelegate(QStyledItemDelegate):
             # if current index in model is nonzero, find weather_id from linking table
             weather_id = parentModel.record(index.row()).value("weather_id") .toString()
             # make query on tbl_weather to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT wx_conditiondesc FROM tbl_weather WHERE weather_id = %1").arg(weather_id))
-            if query.next():
-                wxCondition = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT wx_conditiondesc FROM tbl_weather WHERE weather_id = ?", (weather_id, ))
+            if value.isValid():
+                wxCondition = unicode(value.toString())
             else:
-               wxCondition = "-1"
+                wxCondition = "-1"
             currentIndex = editor.findText(wxCondition, Qt.MatchExactly)
                         
         # set current index to item that matches data value
@@ -1709,12 +1439,11 @@ class TeamComboBoxDelegateTemplate(QStyledItemDelegate):
             # if current index in model is nonzero, find team_id from linking table
             team_id = linkingModel.record(index.row()).value("team_id") .toString()
             # make query on tbl_teams to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT tm_name FROM tbl_teams WHERE team_id = %1").arg(team_id))
-            if query.next():
-                teamName = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT tm_name FROM tbl_teams WHERE team_id = ?", (team_id, ))
+            if value.isValid():
+                teamName = unicode(value.toString())
             else:
-               teamName = "-1"
+                teamName = "-1"
             
         # if opposingBox enabled, get id that corresponds to current item selected
         # otherwise, set id to -1
@@ -1787,13 +1516,11 @@ class MgrComboBoxDelegateTemplate(QStyledItemDelegate):
             # if current index in model is valid, find manager_id from linking table
             manager_id = linkingModel.record(index.row()).value("manager_id") .toString()
             # make query on tbl_teams to find team name
-            query = QSqlQuery()
-            query.exec_(QString("SELECT full_name FROM managers_list WHERE manager_id = %1").arg(manager_id))
-            if query.isActive():
-               query.next()
-               managerName = unicode(query.value(0).toString())
+            value = ScalarQuery("SELECT full_name FROM managers_list WHERE manager_id = ?", (manager_id, ))
+            if value.isValid():
+                managerName = unicode(value.toString())
             else:
-               managerName = "-1"
+                managerName = "-1"
 
         # if opposingBox enabled, get id that corresponds to current item selected
         # otherwise, set id to -1
@@ -2290,12 +2017,7 @@ class IDLineEditDelegate(QStyledItemDelegate):
         if not value.toInt()[0]:
             value = self.local_id
         
-        query = QSqlQuery()
-        query.prepare(QString("SELECT %1 FROM %2 WHERE %3=?").arg(self.display).arg(self.table).arg(self.field))
-        query.addBindValue(value)
-        query.exec_()
-        if query.next():
-            str = query.value(0).toString()
+        str = ScalarQuery(QString("SELECT %1 FROM %2 WHERE %3=?").arg(self.display).arg(self.table).arg(self.field), (value, )).toString()
         editor.setText(str)
         
     def setModelData(self, editor, model, index):
@@ -2307,12 +2029,7 @@ class IDLineEditDelegate(QStyledItemDelegate):
             index -- current index of database table model
             
         """
-        query = QSqlQuery()
-        query.prepare(QString("SELECT %1 FROM %2 WHERE %3=?").arg(self.field).arg(self.table).arg(self.display))
-        query.addBindValue(editor.text())
-        query.exec_()
-        if query.next():
-            value = query.value(0).toString()
+        value = ScalarQuery(QString("SELECT %1 FROM %2 WHERE %3=?").arg(self.field).arg(self.table).arg(self.display), (editor.text(), )).toString()
         
         model.setData(index, QVariant(value))
     
@@ -21,10 +21,15 @@ from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
+from FmrdLib import (Constants, QueryStats, RosterState)
+from FmrdLib.QueryCache import *
+
 """Contains generic classes that implement specialized models for use in FMRD tools.
 
 Classes:
 SqlRelationalProxyModel - proxy model for SQL relational table models
+RelationalIDTableModel -- SQL relational table model that keeps foreign key IDs
+PagedRelationalTableModel -- SQL relational table model that holds one page of records
 LinkingSqlModel -- base editable linking table model
 
 GroupLinkingModel -- implement GroupMatches table
@@ -73,47 +78,411 @@ class SqlRelationalProxyModel(QSortFilterProxyModel):
         return self.sourceModel().relation(column)
         
 
+class RelationalIDTableModel(QSqlRelationalTableModel):
+    """SQL relational table model that keeps the foreign key IDs of its relation columns.
+    
+    QSqlRelationalTableModel replaces foreign keys with the display values of the related
+    records.  This model also reads the foreign keys of a record, with one query by primary
+    key the first time they are asked for after a select(), so that delegates can locate the
+    related record by its ID instead of looking up its display text.
+    
+    Inherits QSqlRelationalTableModel.
+    """
+    
+    def __init__(self, parent=None):
+        """Constructor for RelationalIDTableModel class."""
+        super(RelationalIDTableModel, self).__init__(parent)
+        # foreign keys of records read since last select: {primary key: {column: foreign key}}
+        self.foreignKeys = {}
+        # foreign keys written since last select: {(row, column): foreign key}
+        self.editedKeys = {}
+        # statement that reads foreign keys of a record: (table name, relation columns, SQL text)
+        self.keyStatement = None
+        
+    def select(self):
+        """Populates model with records that satisfy filter, and discards foreign keys read before."""
+        self.foreignKeys = {}
+        self.editedKeys = {}
+        return super(RelationalIDTableModel, self).select()
+        
+    def readForeignKeys(self, key):
+        """Reads foreign keys of relation columns of record with primary key.  Returns {column: foreign key}."""
+        if self.keyStatement is None or self.keyStatement[0] != unicode(self.tableName()):
+            tableRecord = self.database().record(self.tableName())
+            columns = [column for column in range(tableRecord.count()) if self.relation(column).isValid()]
+            sql = QString("SELECT %1 FROM %2 WHERE %3 = ?").arg(
+                ",".join(unicode(tableRecord.fieldName(column)) for column in columns)).arg(
+                self.tableName()).arg(self.primaryKeyName())
+            self.keyStatement = (unicode(self.tableName()), columns, sql)
+        table, columns, sql = self.keyStatement
+        keys = {}
+        if columns:
+            rows = RowsQuery(sql, (key, ), self.database().connectionName())
+            if rows:
+                for pos, column in enumerate(columns):
+                    keys[column] = rows[0][pos].toString()
+        return keys
+        
+    def primaryKeyName(self):
+        """Returns name of primary key field, which is assumed to be the first column if the database does not report it."""
+        index = self.primaryKey()
+        if index.count():
+            return index.fieldName(0)
+        return self.database().record(self.tableName()).fieldName(0)
+        
+    def foreignKey(self, row, column):
+        """Returns foreign key ID (QString) in relation column of record, or "-1" if it is unknown.
+        
+        Arguments:
+            row -- row of record in model
+            column -- relation column
+            
+        """
+        if (row, column) in self.editedKeys:
+            return self.editedKeys[(row, column)]
+        key = unicode(self.record(row).value(self.primaryKeyName()).toString())
+        if not key:
+            return QString("-1")
+        if key not in self.foreignKeys:
+            self.foreignKeys[key] = self.readForeignKeys(key)
+        return self.foreignKeys[key].get(column, QString("-1"))
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        """Sets role data at index with value, and keeps foreign key if column is a relation column."""
+        ok = super(RelationalIDTableModel, self).setData(index, value, role)
+        if ok and role == Qt.EditRole and self.relation(index.column()).isValid():
+            self.editedKeys[(index.row(), index.column())] = value.toString()
+        return ok
+        
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """Removes rows from model.  Foreign keys written since last select are discarded, as their rows shift."""
+        self.editedKeys = {}
+        return super(RelationalIDTableModel, self).removeRows(row, count, parent)
+        
+
+class PagedRelationalTableModel(QSqlRelationalTableModel):
+    """SQL relational table model that holds one page of records of a large table.
+    
+    A page is a range of primary keys, located with keyset queries (ORDER BY key LIMIT 1 
+    OFFSET page size - 1) that use the primary key index, so that the first, last, previous, 
+    and next pages are selected in constant time regardless of the size of the table.  The
+    last page is open-ended, so that records added to the table remain in the model.
+    
+    Rows of the model are rows of the current page.  Data entry forms navigate with 
+    navigate(), hasPrevious() and hasNext() instead of the row count of the model.
+    
+    Inherits QSqlRelationalTableModel.
+    """
+    
+    PAGE_SIZE = 100
+    
+    def __init__(self, parent=None, pageSize=PAGE_SIZE):
+        """Constructor for PagedRelationalTableModel class."""
+        super(PagedRelationalTableModel, self).__init__(parent)
+        self.pageSize = pageSize
+        # smallest and largest keys of page (None if page is open-ended)
+        self.lowerKey = None
+        self.upperKey = None
+        # smallest and largest keys of table (empty if table has no records)
+        self.firstKey = QString()
+        self.lastKey = QString()
+        
+    def primaryKeyName(self):
+        """Returns name of primary key field, which is assumed to be the first column if the database does not report it."""
+        index = self.primaryKey()
+        if index.count():
+            return index.fieldName(0)
+        return self.database().record(self.tableName()).fieldName(0)
+        
+    def keyQuery(self, condition, descending, offset):
+        """Returns primary key of record at offset from start of key range (or from its end if descending), or None.
+        
+        Arguments:
+            condition -- (comparison operator, key) tuple that restricts primary key, or None for whole table
+            descending -- True to count offset from largest key
+            offset -- number of records to skip
+            
+        """
+        key = self.primaryKeyName()
+        sql = QString("SELECT %1 FROM %2").arg(key).arg(self.tableName())
+        params = ()
+        if condition is not None:
+            sql.append(QString(" WHERE %1 %2 ?").arg(key).arg(condition[0]))
+            params = (condition[1], )
+        sql.append(QString(" ORDER BY %1 %2 LIMIT 1 OFFSET %3").arg(key).arg("DESC" if descending else "ASC").arg(offset))
+        value = ScalarQuery(sql, params, self.database().connectionName())
+        if not value.isValid():
+            return None
+        return value.toString()
+        
+    def pageKey(self, row):
+        """Returns primary key (QString) of record in row of current page, empty if record is not yet saved."""
+        return self.record(row).value(self.primaryKeyName()).toString()
+        
+    def setPage(self, lowerKey, upperKey):
+        """Selects records with primary keys between lowerKey and upperKey (no bound if None)."""
+        self.lowerKey = lowerKey
+        self.upperKey = upperKey
+        key = QString("%1.%2").arg(self.tableName()).arg(self.primaryKeyName())
+        conditions = []
+        if lowerKey is not None:
+            conditions.append(QString("%1 >= %2").arg(key).arg(lowerKey))
+        if upperKey is not None:
+            conditions.append(QString("%1 <= %2").arg(key).arg(upperKey))
+        # setFilter() re-selects if model is populated
+        active = self.query().isActive()
+        self.setFilter(QStringList(conditions).join(" AND "))
+        if not active:
+            self.select()
+        
+    def selectFirst(self):
+        """Selects first page of table."""
+        self.setPage(None, self.keyQuery(None, False, self.pageSize - 1))
+        
+    def selectLast(self):
+        """Selects last page of table."""
+        self.setPage(self.keyQuery(None, True, self.pageSize - 1), None)
+        
+    def selectNext(self):
+        """Selects page that follows current page.  Returns False if there are no records after current page."""
+        key = self.upperKey
+        if key is None:
+            return False
+        lowerKey = self.keyQuery((">", key), False, 0)
+        if lowerKey is None:
+            return False
+        self.setPage(lowerKey, self.keyQuery((">", key), False, self.pageSize - 1))
+        return True
+        
+    def selectPrevious(self):
+        """Selects page that precedes current page.  Returns False if there are no records before current page."""
+        key = self.lowerKey
+        if key is None:
+            return False
+        upperKey = self.keyQuery(("<", key), True, 0)
+        if upperKey is None:
+            return False
+        self.setPage(self.keyQuery(("<", key), True, self.pageSize - 1), upperKey)
+        return True
+        
+    def select(self):
+        """Populates model with records of current page, and reads smallest and largest keys of table.
+        
+        If the page no longer has any records (e.g. after deletions), the last page is selected.
+        """
+        ok = super(PagedRelationalTableModel, self).select()
+        if ok and not self.rowCount() and not (self.lowerKey is None and self.upperKey is None):
+            self.selectLast()
+            return ok
+        firstKey = self.keyQuery(None, False, 0)
+        lastKey = self.keyQuery(None, True, 0)
+        self.firstKey = QString() if firstKey is None else firstKey
+        self.lastKey = QString() if lastKey is None else lastKey
+        return ok
+        
+    def hasPrevious(self, row):
+        """Returns True if there is a record before row."""
+        if row > 0:
+            return True
+        return self.rowCount() > 0 and self.pageKey(0) != self.firstKey
+        
+    def hasNext(self, row):
+        """Returns True if there is a record after row."""
+        if row < self.rowCount() - 1:
+            return True
+        if not self.rowCount():
+            return False
+        key = self.pageKey(self.rowCount() - 1)
+        return not key.isEmpty() and key != self.lastKey
+        
+    def navigate(self, where, row):
+        """Moves to first, previous, next or last record, selecting another page if necessary.
+        
+        Arguments:
+            where -- Constants.FIRST, Constants.PREV, Constants.NEXT, or Constants.LAST
+            row -- current row
+            
+        Returns row of record in (new) current page.
+        """
+        if where == Constants.FIRST:
+            self.selectFirst()
+            row = 0
+        elif where == Constants.PREV:
+            if row > 0:
+                row -= 1
+            elif self.selectPrevious():
+                row = self.rowCount() - 1
+        elif where == Constants.NEXT:
+            if row < self.rowCount() - 1:
+                row += 1
+            elif self.selectNext():
+                row = 0
+        elif where == Constants.LAST:
+            self.selectLast()
+            row = self.rowCount() - 1
+        return row
+        
+
 class LinkingSqlModel(QSqlQueryModel):
-    """Base editable linking table model."""
+    """Base editable linking table model.
+    
+    A linking model holds the linking table row (at most one) of its primary key.  A row is 
+    written with one INSERT or UPDATE statement of all of its fields, chosen from the row that 
+    the model holds, and the model's copy of the row is updated in place instead of being 
+    selected again.
+    
+    Subclasses call setLinkingTable() and set primary_id before calling refresh().
+    """
     
     def __init__(self, parent=None):
         """Constructor for LinkingSqlModel class."""
         super(LinkingSqlModel, self).__init__(parent)
+        self.selectQuery = None
+        self.table = QString()
+        self.keyField = None
+        self.fields = ()
+        self.fieldRecord = QSqlRecord()
+        # row of primary key loaded by last refresh() (list of QVariants), None if no row exists
+        self.rowValues = None
+        self.loadedID = None
+        
+    def setLinkingTable(self, table, keyField, fields):
+        """Sets linking table and its fields, and prepares SELECT statement that populates the model.
+        
+        Arguments:
+            table -- SQL table name
+            keyField -- primary key field, which links to parent table
+            fields -- list of other fields in linking table
+            
+        """
+        self.table = QString(table)
+        self.keyField = keyField
+        self.fields = tuple(fields)
+        self.fieldRecord = QSqlRecord()
+        for name in (keyField, ) + self.fields:
+            self.fieldRecord.append(QSqlField(name))
+        self.setSelectStatement(QString("SELECT %1 FROM %2 WHERE %3 = ?").arg(
+            ",".join((keyField, ) + self.fields)).arg(self.table).arg(keyField))
+        
+    def setSelectStatement(self, sql):
+        """Prepares SELECT statement that populates the model.
+        
+        The statement takes the primary key as its only bound parameter.  The prepared query
+        is owned by the model.
+        """
+        self.selectQuery = QSqlQuery()
+        self.selectQuery.setForwardOnly(True)
+        self.selectQuery.prepare(sql)
+        
+    def refresh(self):
+        """Refreshes model by re-executing prepared SELECT statement with current primary key."""
+        started = QueryStats.StartTimer()
+        self.selectQuery.bindValue(0, QVariant(self.primary_id))
+        values = None
+        if self.selectQuery.exec_() and self.selectQuery.next():
+            values = [self.selectQuery.value(k) for k in range(self.fieldRecord.count())]
+        self.selectQuery.finish()
+        self.beginResetModel()
+        self.rowValues = values
+        self.loadedID = unicode(QVariant(self.primary_id).toString())
+        self.endResetModel()
+        QueryStats.RecordQuery(self.selectQuery.lastQuery(), started, self.rowCount())
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.rowValues is None:
+            return 0
+        return 1
+        
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.fieldRecord.count()
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.rowValues is None or role not in (Qt.DisplayRole, Qt.EditRole):
+            return QVariant()
+        return self.rowValues[index.column()]
+        
+    def record(self, row=None):
+        """Returns record of row, or empty record with field names if row is invalid or not given."""
+        record = QSqlRecord(self.fieldRecord)
+        if row == 0 and self.rowValues is not None:
+            for column, value in enumerate(self.rowValues):
+                record.setValue(column, value)
+        return record
         
     def flags(self, index):
         """Defines item flags for index.  Make all columns besides first in database table editable. """
-        flags = QSqlQueryModel.flags(index)
+        flags = QSqlQueryModel.flags(self, index)
         if index.column() != 0:
             flags |= Qt.ItemIsEditable
         
         return flags
     
     def setID(self, value):
-        """Sets match_id member of class."""
+        """Sets primary key of linking row.  The row is loaded by refresh()."""
         self.primary_id = value
     
-    def setData(self, index, value):
-        """Sets role data at index with value.  Calls setCompositeKey()."""
+    def setData(self, index, value, role=Qt.EditRole):
+        """Sets role data at index with value.  Writes linking row with value as its only non-key field."""
+        return self.writeRow((value.toString(), ))
+        
+    def writeRow(self, values):
+        """Writes linking row of current primary key with one statement, and updates model's copy of the row.
+        
+        Inserts the row if the model holds no row for the primary key, otherwise updates all of 
+        its non-key fields, and inserts the row if the update finds it deleted.  The row is only read from the database if the primary key has changed
+        since the last refresh().
+        
+        Argument:
+            values -- values of non-key fields, in order of fields in setLinkingTable()
+            
+        Returns True if successful; otherwise the error is returned by lastError().
+        """
+        if self.loadedID != unicode(QVariant(self.primary_id).toString()):
+            self.refresh()
+        values = tuple(values)
         ok = False
-        ok = self.setCompositeKey(index,  self.primary_id, value.toString())
-        self.refresh()
+        if self.rowValues is not None:
+            sql = QString("UPDATE %1 SET %2 WHERE %3 = ?").arg(self.table).arg(
+                ",".join("%s = ?" % field for field in self.fields)).arg(self.keyField)
+            count = AffectedRowsQuery(sql, values + (self.primary_id, ))
+            ok = count > 0
+            if ok:
+                self.rowValues = [QVariant(value) for value in (self.primary_id, ) + values]
+                self.emit(SIGNAL("dataChanged(QModelIndex,QModelIndex)"), 
+                          self.index(0, 0), self.index(0, self.columnCount() - 1))
+            elif count == 0:
+                # row has been deleted since it was read (e.g. by another session), so insert it
+                self.beginRemoveRows(QModelIndex(), 0, 0)
+                self.rowValues = None
+                self.endRemoveRows()
+        if self.rowValues is None:
+            sql = QString("INSERT INTO %1 (%2) VALUES (%3)").arg(self.table).arg(
+                ",".join((self.keyField, ) + self.fields)).arg(",".join("?" * (len(self.fields) + 1)))
+            ok = ExecQuery(sql, (self.primary_id, ) + values)
+            if ok:
+                self.beginInsertRows(QModelIndex(), 0, 0)
+                self.rowValues = [QVariant(value) for value in (self.primary_id, ) + values]
+                self.endInsertRows()
+        # error of the statement is reported by lastError()
+        self.setLastError(QSqlError() if ok else QueryError(sql))
         return ok
         
     def delete(self, primary_id):
-        """Deletes row with primary_id from the linking model.
+        """Deletes linking row of primary_id from database, and from the model if it holds that row.
         
-        This function always returns False; must be implemented by subclass.
-        Arguments:
+        Argument:
             primary_id - key ID in linking table
+            
+        Returns True if successful.
         """
-        return False
-       
-    def setCompositeKey(self, index, primary_id, secondary_id):
-        """Inserts or updates entry in database.
-        This method returns false in class definition, must be implemented by subclass.
-        
-        """
-        return False
+        ok = ExecQuery(QString("DELETE FROM %1 WHERE %2 = ?").arg(self.table).arg(self.keyField), (primary_id, ))
+        if ok and self.rowValues is not None and self.loadedID == unicode(QVariant(primary_id).toString()):
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self.rowValues = None
+            self.endRemoveRows()
+        return ok
 
 
 class GroupLinkingModel(LinkingSqlModel):
@@ -128,20 +497,14 @@ class GroupLinkingModel(LinkingSqlModel):
         """Constructor for GroupLinkingModel class."""
         super(GroupLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.matchID_display.text()
         self.grpround_id = QString()
         self.group_id = QString()
         self.round_id = QString()
         self.calls = 0
-        self.setQuery(QString("SELECT match_id, grpround_id, group_id, round_id FROM %1 WHERE match_id = %2"
-                              ).arg(self.table).arg(self.primary_id))
+        self.setLinkingTable(tbl_name, "match_id", ("grpround_id", "group_id", "round_id"))
+        self.refresh()
         
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, grpround_id, group_id, round_id FROM %1 WHERE match_id = %2"
-                              ).arg(self.table).arg(self.primary_id))
-    
     def resetID(self):
         """Resets member variables in class."""
         self.grpround_id = QString()
@@ -149,8 +512,8 @@ class GroupLinkingModel(LinkingSqlModel):
         self.round_id = QString()
         self.calls = 0
         
-    def setData(self, index, value):
-        """Sets role data at index with value.  Calls setXXX().
+    def setData(self, index, value, role=Qt.EditRole):
+        """Sets role data at index with value.
         
         This function must be called in order of the fields defined
         in the database table.        
@@ -167,57 +530,10 @@ class GroupLinkingModel(LinkingSqlModel):
         return True
 
     def submit(self):
-        """Inserts new row into database if no prior record exists.  
-        
-        Updates row if record already exists..
-        """
-        insertString = QString("INSERT INTO %1 (match_id, grpround_id, group_id, round_id) VALUES (?,?,?,?)").arg(self.table)
-        
-        # test for already existing record in table
-        query = QSqlQuery()
-        query.prepare(QString("SELECT COUNT(*) FROM %1 WHERE match_id = ?").arg(self.table))
-        query.addBindValue(self.primary_id)
-        query.exec_()
-        if query.next():
-            if query.value(0).toInt()[0]:
-                # update current record
-                updateQuery = QSqlQuery()
-                varList = (self.grpround_id, self.group_id, self.round_id)
-                fieldList = ("grpround_id", "group_id", "round_id")
-                for field,  var in zip(fieldList, varList):
-                    updateString = QString("UPDATE %1 SET %2 = ? WHERE match_id = ?").arg(self.table, field)
-                    updateQuery.prepare(updateString)
-                    updateQuery.addBindValue(var)
-                    updateQuery.addBindValue(self.primary_id)
-                    updateQuery.exec_()
-                self.resetID()
-                return
-                
-        # no prior record...insert new row
-        insertQuery = QSqlQuery()
-        insertQuery.prepare(insertString)
-        insertQuery.addBindValue(self.primary_id)
-        insertQuery.addBindValue(self.grpround_id)
-        insertQuery.addBindValue(self.group_id)
-        insertQuery.addBindValue(self.round_id)
-        ok = insertQuery.exec_()
-        
+        """Writes linking row with the values set by setData().  Returns True if successful."""
+        ok = self.writeRow((self.grpround_id, self.group_id, self.round_id))
         self.resetID()
-
-        
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
+        return ok
 
 
 class KnockoutLinkingModel(LinkingSqlModel):
@@ -229,27 +545,23 @@ class KnockoutLinkingModel(LinkingSqlModel):
     """
     
     def __init__(self, tbl_name, parent=None):
-        """Constructor for LeagueLinkingModel class."""
+        """Constructor for KnockoutLinkingModel class."""
         super(KnockoutLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.matchID_display.text()
         self.koround_id = QString()
         self.matchday_id = QString()
         self.calls = 0
-        self.setQuery(QString("SELECT match_id, koround_id, matchday_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
+        self.setLinkingTable(tbl_name, "match_id", ("koround_id", "matchday_id"))
+        self.refresh()
         
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, koround_id, matchday_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-    
     def resetID(self):
         """Resets member variables in class."""
         self.koround_id = QString()
         self.matchday_id = QString()
         self.calls = 0
         
-    def setData(self, index, value):
+    def setData(self, index, value, role=Qt.EditRole):
         """Sets role data at index with value.
         
         This function must be called in order of the fields defined
@@ -264,53 +576,10 @@ class KnockoutLinkingModel(LinkingSqlModel):
         return True
 
     def submit(self):
-        """Inserts new row into database if no prior record exists.  
-        
-        Updates row if record already exists.
-        """
-        insertString = QString("INSERT INTO %1 (match_id, koround_id, matchday_id) VALUES (?,?,?)").arg(self.table)
-        
-        # test for already existing record in table
-        query = QSqlQuery()
-        query.prepare(QString("SELECT COUNT(*) FROM %1 WHERE match_id = ?").arg(self.table))
-        query.addBindValue(self.primary_id)
-        query.exec_()
-        if query.next():
-            if query.value(0).toInt()[0]:
-                updateQuery = QSqlQuery()
-                varList = (self.koround_id, self.matchday_id)
-                fieldList = ("koround_id", "matchday_id")
-                for field,  var in zip(fieldList, varList):
-                    updateString = QString("UPDATE %1 SET %2 = ? WHERE match_id = ?").arg(self.table, field)
-                    updateQuery.prepare(updateString)
-                    updateQuery.addBindValue(var)
-                    updateQuery.addBindValue(self.primary_id)
-                    updateQuery.exec_()
-                self.resetID()
-                return
-                
-        insertQuery = QSqlQuery()
-        insertQuery.prepare(insertString)
-        insertQuery.addBindValue(self.primary_id)
-        insertQuery.addBindValue(self.koround_id)
-        insertQuery.addBindValue(self.matchday_id)
-        insertQuery.exec_()
+        """Writes linking row with the values set by setData().  Returns True if successful."""
+        ok = self.writeRow((self.koround_id, self.matchday_id))
         self.resetID()
-
-        
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
+        return ok
     
     
 class LeagueLinkingModel(LinkingSqlModel):
@@ -325,51 +594,9 @@ class LeagueLinkingModel(LinkingSqlModel):
         """Constructor for LeagueLinkingModel class."""
         super(LeagueLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.matchID_display.text()
-        self.setQuery(QString("SELECT match_id, round_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, round_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def setCompositeKey(self, index, match_id, round_id):
-        """Inserts or updates entry in database."""
-        # setup SQL statements
-        insertString = QString("INSERT INTO %1 (match_id, round_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET round_id = ? WHERE match_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing match_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(match_id)
-            insertQuery.addBindValue(round_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists match_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(round_id)
-            updateQuery.addBindValue(match_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            return False
-        
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
+        self.setLinkingTable(tbl_name, "match_id", ("round_id", ))
+        self.refresh()
 
 
 class WeatherLinkingModel(LinkingSqlModel):
@@ -384,53 +611,11 @@ class WeatherLinkingModel(LinkingSqlModel):
         """Constructor for WeatherLinkingModel class."""
         super(WeatherLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.enviroID_display.text()
-        self.setQuery(QString("SELECT enviro_id, weather_id FROM %1 WHERE enviro_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT enviro_id, weather_id FROM %1 WHERE enviro_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def setCompositeKey(self, index, enviro_id, weather_id):
-        """Inserts or updates entry in database."""
-        # setup SQL statements
-        insertString = QString("INSERT INTO %1 (enviro_id, weather_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET weather_id = ? WHERE enviro_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing match_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(enviro_id)
-            insertQuery.addBindValue(weather_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists match_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(weather_id)
-            updateQuery.addBindValue(enviro_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            print "Error with entry Query"
-            return False
-        
-    def delete(self, enviro_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            enviro_id - primary key ID that links to Environments table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE enviro_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(enviro_id)
-        return deleteQuery.exec_()
+        self.setLinkingTable(tbl_name, "enviro_id", ("weather_id", ))
+        self.refresh()
         
+
 class TeamLinkingModel(LinkingSqlModel):
     """Implements linking models for home and away teams in a match.
     
@@ -443,56 +628,16 @@ class TeamLinkingModel(LinkingSqlModel):
         """Constructor for TeamLinkingModel class."""
         super(TeamLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.matchID_display.text()
-        self.setQuery(QString("SELECT match_id, team_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, team_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-     
-    def setCompositeKey(self, index,  match_id, team_id):
-        """Inserts or updates entry in database."""
-        # setup SQL statements
-        insertString = QString("INSERT INTO %1 (match_id,team_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET team_id = ? WHERE match_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing match_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(match_id)
-            insertQuery.addBindValue(team_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists match_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(team_id)
-            updateQuery.addBindValue(match_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            return False    
-
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
+        self.setLinkingTable(tbl_name, "match_id", ("team_id", ))
+        self.refresh()
 
 
 class SubstituteLinkingModel(LinkingSqlModel):
     """Implements linking models for players substituted in and out of a match.
     
+    Writes to the linking table are recorded in the roster state of the match (see RosterState).
+    
     Argument:
     tbl_name - SQL table name
     
@@ -502,58 +647,39 @@ class SubstituteLinkingModel(LinkingSqlModel):
         """Constructor for SubstituteLinkingModel class."""
         super(SubstituteLinkingModel, self).__init__(parent)
         
-        self.table = tbl_name
         self.primary_id = parent.subsID_display.text()
-        self.setQuery(QString("SELECT subs_id, lineup_id FROM %1 WHERE subs_id = %2").arg(self.table).arg(self.primary_id))
-     
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT subs_id, lineup_id FROM %1 WHERE subs_id = %2").arg(self.table).arg(self.primary_id))
-     
-    def setCompositeKey(self, index, subs_id, lineup_id):
-        """Inserts or updates entry in database.
-        
-        Arguments:
-        index - current index in model
-        subs_id - primary key ID to Substitutions table
-        lineup_id - secondary key ID in linking table
-        
-        """
-        # set up SQL statements
-        insertString = QString("INSERT INTO %1 (subs_id,lineup_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET lineup_id = ? WHERE subs_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing subs_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(subs_id)
-            insertQuery.addBindValue(lineup_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists subs_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(subs_id)
-            updateQuery.addBindValue(lineup_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            return False    
-            
-    def delete(self, subs_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            subs_id - primary key ID that links to Substitutions table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE subs_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(subs_id)
-        return deleteQuery.exec_()
+        self.setLinkingTable(tbl_name, "subs_id", ("lineup_id", ))
+        self.refresh()
+    
+    def heldLineupID(self, primary_id):
+        """Returns lineup ID of row of primary_id held by the model, or None if the model does not hold it."""
+        if self.rowValues is None or self.loadedID != unicode(QVariant(primary_id).toString()):
+            return None
+        return self.rowValues[1]
+    
+    def writeRow(self, values):
+        """Writes linking row, and moves substitution in roster state from previous to new lineup entry."""
+        if self.loadedID != unicode(QVariant(self.primary_id).toString()):
+            self.refresh()
+        previous = self.heldLineupID(self.primary_id)
+        ok = super(SubstituteLinkingModel, self).writeRow(values)
+        if ok:
+            if previous is not None:
+                RosterState.SetSubstituted(self.table, previous, False)
+            RosterState.SetSubstituted(self.table, values[0], True)
+        return ok
+    
+    def delete(self, primary_id):
+        """Deletes linking row, and removes substitution from roster state."""
+        previous = self.heldLineupID(primary_id)
+        ok = super(SubstituteLinkingModel, self).delete(primary_id)
+        if ok:
+            if previous is not None:
+                RosterState.SetSubstituted(self.table, previous, False)
+            else:
+                # lineup entry of deleted row is unknown
+                RosterState.InvalidateRosterState()
+        return ok
 
 
 class ManagerLinkingModel(LinkingSqlModel):
@@ -567,58 +693,10 @@ class ManagerLinkingModel(LinkingSqlModel):
         """Constructor for ManagerLinkingModel class."""
         super(ManagerLinkingModel, self).__init__(parent)
 
-        self.table = tbl_name
         self.primary_id = parent.matchID_display.text()
-        self.setQuery(QString("SELECT match_id, manager_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, manager_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-     
-    def setCompositeKey(self, index, match_id, manager_id):
-        """Inserts or updates entry in database.
-        
-        Arguments:
-        index - current index in model
-        match_id - primary key ID to Matches table
-        manager_id - secondary key ID in linking table
-        
-        """
-        # set up SQL statements
-        insertString = QString("INSERT INTO %1 (match_id,manager_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET manager_id = ? WHERE match_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing match_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(match_id)
-            insertQuery.addBindValue(manager_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists match_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(manager_id)
-            updateQuery.addBindValue(match_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            return False    
+        self.setLinkingTable(tbl_name, "match_id", ("manager_id", ))
+        self.refresh()
 
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
 
 class ShootoutLinkingModel(LinkingSqlModel):
     """Implements linking model for teams shooting first in the penalty shootout at the end of a football match.
@@ -635,48 +713,6 @@ class ShootoutLinkingModel(LinkingSqlModel):
         matchSelect = parent.matchSelect
         matchModel = matchSelect.model()
         
-        self.table = tbl_name
         self.primary_id = matchModel.record(matchSelect.currentIndex()).value("match_id").toString()
-        self.setQuery(QString("SELECT match_id, team_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def refresh(self):
-        """Refreshes query model."""
-        self.setQuery(QString("SELECT match_id, team_id FROM %1 WHERE match_id = %2").arg(self.table).arg(self.primary_id))
-        
-    def setCompositeKey(self, index, match_id, team_id):
-        """Inserts or updates entry in database."""
-        # setup SQL statements
-        insertString = QString("INSERT INTO %1 (match_id, team_id) VALUES (?,?)").arg(self.table)
-        updateString = QString("UPDATE %1 SET team_id = ? WHERE match_id = ?").arg(self.table)
-        
-        if index.row() == -1:
-            # insert into table if no existing match_id record in linking table
-            insertQuery = QSqlQuery()
-            insertQuery.prepare(insertString)
-            insertQuery.addBindValue(match_id)
-            insertQuery.addBindValue(team_id)
-            return insertQuery.exec_()
-        elif index.row() == 0:
-            # update into table if there exists match_id record in linking table
-            updateQuery = QSqlQuery()
-            updateQuery.prepare(updateString)
-            updateQuery.addBindValue(team_id)
-            updateQuery.addBindValue(match_id)
-            return updateQuery.exec_()
-        else:
-            # any other failure, return False
-            return False
-        
-    def delete(self, match_id):    
-        """Deletes entry in database.
-        
-        Argument:
-            match_id - primary key ID that links to Matches table
-            
-        """
-        deleteString = QString("DELETE FROM %1 WHERE match_id = ?").arg(self.table)
-        
-        deleteQuery = QSqlQuery()
-        deleteQuery.prepare(deleteString)
-        deleteQuery.addBindValue(match_id)
-        return deleteQuery.exec_()
+        self.setLinkingTable(tbl_name, "match_id", ("team_id", ))
+        self.refresh()
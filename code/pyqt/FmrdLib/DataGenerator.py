@@ -0,0 +1,680 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import random
+import sqlite3
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import Constants
+
+"""Contains classes that populate an FMRD database with synthetic, reproducible data.
+
+The generator fills an FMRD database that already contains the schema (tables and views of
+the fmrd-sql scripts).  Data are generated from a seed, so that a tier and seed always produce
+the same database.  Table IDs start at the minimum IDs in Constants, and every match is written
+to the team, manager and phase linking tables in the same way as the data entry dialogs.
+
+Columns are addressed by position, in the order used by the data entry dialogs, and their names
+are read from the database.  Rows are written with multi-row INSERT statements inside one
+transaction per table group.
+
+Classes:
+GeneratorError -- exception raised when database cannot be populated
+TableWriter -- write rows of a table with multi-row INSERT statements
+DataGenerator -- populate database with synthetic data of a size tier
+
+Functions:
+RunScript -- execute SQL script (e.g. schema definition) on a database connection
+"""
+
+# size tiers: number of entities, and fraction of matches with lineups and match events
+TIERS = {
+    "small": {"competitions": 4, "countries": 30, "teams": 40, "managers": 60, "referees": 40,
+              "matches": 600, "detailed": 0.55},
+    "medium": {"competitions": 12, "countries": 80, "teams": 200, "managers": 300, "referees": 200,
+               "matches": 6000, "detailed": 0.55},
+    "huge": {"competitions": 40, "countries": 150, "teams": 900, "managers": 1400, "referees": 700,
+             "matches": 52000, "detailed": 0.55},
+}
+
+SQUAD_SIZE = 28
+SQUAD_GOALKEEPERS = 3
+BENCH_SIZE = 7
+SEASONS = (1990, 2011)
+
+# lengths of regulation and extra time periods (minutes), and share of knockout matches that
+# go to extra time; every knockout match with a shootout has extra time
+HALF_LENGTH = 45
+EXTRA_LENGTH = 15
+EXTRA_TIME_RATE = 0.25
+
+# maximum number of bound values in one INSERT statement (SQLite host parameter limit)
+MAX_BOUND_VALUES = 999
+
+# mean number of events per team in a match with match events
+GOALS_PER_TEAM = 1.35
+OFFENSES_PER_TEAM = 1.8
+PENALTIES_PER_TEAM = 0.12
+SWITCHES_PER_TEAM = 0.4
+SHOOTOUT_RATE = 0.12
+
+# reference tables with one description column: (table, minimum ID, descriptions)
+_DESCRIPTION_TABLES = (
+    ("tbl_confederations", Constants.MinConfedID, ("AFC", "CAF", "CONCACAF", "CONMEBOL", "OFC", "UEFA")),
+    ("tbl_phases", Constants.MinPhaseID, ("League", "Group", "Knockout")),
+    ("tbl_rounds", Constants.MinRoundID, ["Round %d" % k for k in range(1, 47)]),
+    ("tbl_groups", Constants.MinGroupID, ("A", "B", "C", "D", "E", "F", "G", "H")),
+    ("tbl_grouprounds", Constants.MinGroupRoundID, ("First Group Stage", "Second Group Stage")),
+    ("tbl_knockoutrounds", Constants.MinKnockoutRoundID, ("Round of 64", "Round of 32", "Round of 16",
+                                                          "Quarterfinal", "Semifinal", "Final")),
+    ("tbl_matchdays", Constants.MinMatchdayID, ("First Leg", "Second Leg", "Replay")),
+    ("tbl_weather", Constants.MinWeatherID, ("Clear", "Partly Cloudy", "Overcast", "Light Rain",
+                                             "Heavy Rain", "Snow", "Windy")),
+    ("tbl_cards", Constants.MinCardID, ("Yellow", "Yellow/Red", "Red")),
+    ("tbl_fouls", Constants.MinFoulID, ("Handball", "Holding", "Tripping", "Dangerous Play",
+                                        "Unsporting Behavior", "Dissent", "Serious Foul Play")),
+    ("tbl_penoutcomes", Constants.MinPenOutcomeID, ("Goal", "Saved", "Wide of Goal")),
+    ("tbl_goalstrikes", Constants.MinGoalStrikeID, ("Right Foot", "Left Foot", "Head", "Other")),
+    ("tbl_goalevents", Constants.MinGoalEventID, ("Open Play", "Corner Kick", "Free Kick",
+                                                  "Penalty", "Counterattack")),
+    ("tbl_fieldnames", Constants.MinFieldID, ("Goalkeeper", "Defender", "Midfielder", "Forward")),
+    ("tbl_flanknames", Constants.MinFlankID, ("Left", "Central", "Right")),
+    ("tbl_venuesurfaces", Constants.MinSurfaceID, ("Natural Grass", "Artificial Turf", "Hybrid Grass")),
+)
+
+_FIRST_NAMES = ("Adam", "Bruno", "Carlos", "David", "Emil", "Fabio", "Gareth", "Hugo", "Ivan", "Jonas",
+                "Kevin", "Luis", "Marco", "Nils", "Oscar", "Pablo", "Rafael", "Stefan", "Tomas", "Victor")
+_LAST_NAMES = ("Almeida", "Berger", "Costa", "Dubois", "Eriksen", "Fischer", "Garcia", "Hansen",
+               "Ivanov", "Jansen", "Kowalski", "Larsen", "Moreau", "Novak", "Okafor", "Petrov",
+               "Rossi", "Silva", "Tanaka", "Weber")
+
+
+class GeneratorError(Exception):
+    """Exception raised when the generator cannot write to the database."""
+    pass
+
+
+class TableWriter(object):
+    """Writes rows of one table with multi-row INSERT statements.
+
+    Rows are buffered and written when a statement's worth of rows has accumulated.
+    """
+
+    def __init__(self, db, table, numColumns):
+        """Constructor for TableWriter class.
+
+        Arguments:
+            db -- database connection (QSqlDatabase)
+            table -- table name
+            numColumns -- number of values in every row
+
+        Raises GeneratorError if table does not exist or has a different number of columns.
+        """
+        record = db.record(table)
+        if record.count() != numColumns:
+            raise GeneratorError("Table %s has %d columns, expected %d.  Is the FMRD schema (version %s) loaded?" %
+                                 (table, record.count(), numColumns, Constants.SQL_VERSION))
+        self.db = db
+        self.table = table
+        self.fields = [unicode(record.fieldName(k)) for k in range(numColumns)]
+        self.rowsPerStatement = max(1, MAX_BOUND_VALUES // numColumns)
+        self.rows = []
+        self.statements = {}
+        self.count = 0
+
+    def add(self, *values):
+        """Adds row to buffer and writes buffer when it is full."""
+        self.rows.append(values)
+        if len(self.rows) == self.rowsPerStatement:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered rows to table."""
+        if not self.rows:
+            return
+        numRows = len(self.rows)
+        query = self.statements.get(numRows)
+        if query is None:
+            placeholders = "(%s)" % ", ".join(["?"] * len(self.fields))
+            query = QSqlQuery(self.db)
+            if not query.prepare("INSERT INTO %s (%s) VALUES %s" % (self.table, ", ".join(self.fields),
+                                                                     ", ".join([placeholders] * numRows))):
+                raise GeneratorError("Cannot prepare insert into %s: %s" %
+                                     (self.table, query.lastError().text()))
+            self.statements[numRows] = query
+        pos = 0
+        for row in self.rows:
+            for value in row:
+                if not isinstance(value, QVariant):
+                    value = QVariant(value)
+                query.bindValue(pos, value)
+                pos += 1
+        if not query.exec_():
+            raise GeneratorError("Cannot insert into %s: %s" % (self.table, query.lastError().text()))
+        query.finish()
+        self.count += numRows
+        self.rows = []
+
+
+class DataGenerator(object):
+    """Populates an FMRD database with synthetic data of a size tier.
+
+    Reference tables (confederations, phases, rounds, positions, ...) that already contain data
+    are used as they are; empty reference tables are filled.  Personnel, overview and match
+    tables must be empty.
+    """
+
+    def __init__(self, tier="small", seed=1, connectionName=None, progress=None):
+        """Constructor for DataGenerator class.
+
+        Arguments:
+            tier -- name of size tier in TIERS
+            seed -- seed of random number generator
+            connectionName -- name of database connection (default connection if None)
+            progress -- function called with a status message as each table group is written
+
+        """
+        if tier not in TIERS:
+            raise GeneratorError("Unknown tier '%s' (use %s)" % (tier, ", ".join(sorted(TIERS.keys()))))
+        self.tier = tier
+        self.size = TIERS[tier]
+        self.rng = random.Random(seed)
+        if connectionName is None:
+            self.db = QSqlDatabase.database()
+        else:
+            self.db = QSqlDatabase.database(connectionName)
+        self.progress = progress
+        self.counts = {}
+
+    def run(self):
+        """Generates all data and returns {table name: number of rows written}."""
+        if self._rowCount("tbl_matches") or self._rowCount("tbl_players"):
+            raise GeneratorError("Database already contains match or player data.")
+        if self.db.driverName() == "QSQLITE":
+            self._exec("PRAGMA synchronous = OFF")
+            self._exec("PRAGMA foreign_keys = ON")
+
+        self._stage("reference tables", self.generateReferenceData)
+        self._stage("personnel and overview tables", self.generateOverviewData)
+        self._stage("matches", self.generateMatches)
+        return self.counts
+
+    # ------------------------------------------------------------
+    # database helpers
+
+    def _exec(self, sql, params=()):
+        """Executes statement and returns executed query.  Raises GeneratorError on failure."""
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for pos, value in enumerate(params):
+            query.bindValue(pos, QVariant(value))
+        if not query.exec_():
+            raise GeneratorError("%s: %s" % (sql, query.lastError().text()))
+        return query
+
+    def _rowCount(self, table):
+        """Returns number of rows in table."""
+        query = self._exec("SELECT COUNT(*) FROM %s" % table)
+        query.next()
+        return query.value(0).toInt()[0]
+
+    def _rows(self, sql):
+        """Returns every row of SELECT statement as list of Python values."""
+        query = self._exec(sql)
+        numFields = query.record().count()
+        rows = []
+        while query.next():
+            rows.append([query.value(k).toPyObject() for k in range(numFields)])
+        return rows
+
+    def _stage(self, name, function):
+        """Runs one generation step inside a transaction."""
+        if self.progress:
+            self.progress("Generating %s..." % name)
+        if not self.db.transaction():
+            raise GeneratorError("Cannot start transaction: %s" % self.db.lastError().text())
+        try:
+            writers = function()
+            for writer in writers:
+                writer.flush()
+                self.counts[writer.table] = self.counts.get(writer.table, 0) + writer.count
+        except:
+            self.db.rollback()
+            raise
+        if not self.db.commit():
+            raise GeneratorError("Cannot commit %s: %s" % (name, self.db.lastError().text()))
+
+    def _writer(self, table, numColumns):
+        return TableWriter(self.db, table, numColumns)
+
+    def _referenceTable(self, table, minID, rows):
+        """Returns IDs of reference table, filling it with rows if it is empty.
+
+        Arguments:
+            table -- table name
+            minID -- minimum ID of table (string, from Constants)
+            rows -- tuples of non-ID column values
+
+        Returns writer (or None if table already populated) and {ID: first non-ID column}.
+        """
+        idField = unicode(self.db.record(table).fieldName(0))
+        existing = self._rows("SELECT * FROM %s ORDER BY %s" % (table, idField))
+        if existing:
+            return None, dict((row[0], row[1] if len(row) > 1 else None) for row in existing)
+        writer = self._writer(table, len(rows[0]) + 1)
+        ids = {}
+        for offset, values in enumerate(rows):
+            writer.add(int(minID) + offset, *values)
+            ids[int(minID) + offset] = values[0]
+        return writer, ids
+
+    # ------------------------------------------------------------
+    # random value helpers
+
+    def _poisson(self, mean):
+        """Returns Poisson-distributed random integer."""
+        limit = math.exp(-mean)
+        k, p = 0, self.rng.random()
+        while p > limit:
+            k += 1
+            p *= self.rng.random()
+        return k
+
+    def _date(self, year):
+        """Returns random date in year."""
+        return QDate(year, 1, 1).addDays(self.rng.randint(0, 364))
+
+    def _birthDate(self, minAge, maxAge):
+        """Returns random birth date for a person of given age range in the last season."""
+        return self._date(SEASONS[1] - self.rng.randint(minAge, maxAge))
+
+    def _name(self):
+        return self.rng.choice(_FIRST_NAMES), self.rng.choice(_LAST_NAMES)
+
+    def _matchTime(self):
+        """Returns (minute, stoppage time) of a match event."""
+        minute = self.rng.randint(1, Constants.MAX_MINUTES)
+        if minute in (45, Constants.MAX_MINUTES) and self.rng.random() < 0.3:
+            return minute, self.rng.randint(1, 4)
+        return minute, 0
+
+    # ------------------------------------------------------------
+    # generation steps
+
+    def generateReferenceData(self):
+        """Fills empty reference tables and records their IDs."""
+        writers = []
+        self.reference = {}
+        for table, minID, descriptions in _DESCRIPTION_TABLES:
+            writer, ids = self._referenceTable(table, minID, [(desc,) for desc in descriptions])
+            writers.append(writer)
+            self.reference[table] = ids
+
+        confeds = sorted(self.reference["tbl_confederations"].keys())
+        writer, ids = self._referenceTable("tbl_countries", Constants.MinCountryID,
+                                           [(confeds[k % len(confeds)], "Country %03d" % (k + 1))
+                                            for k in range(self.size["countries"])])
+        writers.append(writer)
+        self.countries = sorted(ids.keys())
+
+        writer, ids = self._referenceTable("tbl_timezones", Constants.MinTimeZoneID,
+                                           [(confeds[k % len(confeds)], "UTC%+03d:00" % (k - 11), float(k - 11))
+                                            for k in range(24)])
+        writers.append(writer)
+        self.timezones = sorted(ids.keys())
+
+        fields = self.reference["tbl_fieldnames"]
+        flanks = self.reference["tbl_flanknames"]
+        positions = []
+        for field_id in sorted(fields.keys()):
+            if fields[field_id] == "Goalkeeper":
+                positions.append((field_id, QVariant()))
+            else:
+                positions.extend([(field_id, flank_id) for flank_id in sorted(flanks.keys())])
+        writer, ids = self._referenceTable("tbl_positions", Constants.MinPositionID, positions)
+        writers.append(writer)
+
+        # goalkeeper and outfield positions are read back from the view used by the dialogs
+        writers = [w for w in writers if w is not None]
+        for w in writers:
+            w.flush()
+        self.goalkeeperPositions = []
+        self.outfieldPositions = []
+        for position_id, name in self._rows("SELECT position_id, position_name FROM positions_list ORDER BY position_id"):
+            if unicode(name) == "Goalkeeper":
+                self.goalkeeperPositions.append(position_id)
+            else:
+                self.outfieldPositions.append(position_id)
+        if not self.goalkeeperPositions or not self.outfieldPositions:
+            raise GeneratorError("Positions table must contain Goalkeeper and outfield positions.")
+
+        self.phases = dict((unicode(desc), phase_id) for phase_id, desc in self.reference["tbl_phases"].items())
+        for phase in ("League", "Group", "Knockout"):
+            if phase not in self.phases:
+                raise GeneratorError("Phases table must contain a '%s' phase." % phase)
+        outcomes = self.reference["tbl_penoutcomes"]
+        scored = [k for k in sorted(outcomes.keys()) if unicode(outcomes[k]) == "Goal"]
+        self.goalOutcome = scored[0] if scored else min(outcomes.keys())
+        self.missOutcomes = [k for k in sorted(outcomes.keys()) if k != self.goalOutcome]
+        cards = sorted(self.reference["tbl_cards"].keys())
+        self.cardWeights = zip(cards, (0.85, 0.05, 0.10)[:len(cards)])
+        return writers
+
+    def generateOverviewData(self):
+        """Generates competitions, teams, venues, managers, referees, players and their histories."""
+        competitions = self._writer("tbl_competitions", 2)
+        teams = self._writer("tbl_teams", 3)
+        venues = self._writer("tbl_venues", 9)
+        venueHistory = self._writer("tbl_venuehistory", 8)
+        managers = self._writer("tbl_managers", 6)
+        referees = self._writer("tbl_referees", 5)
+        players = self._writer("tbl_players", 7)
+        playerHistory = self._writer("tbl_playerhistory", 5)
+
+        self.competitions = []
+        for k in range(self.size["competitions"]):
+            competition_id = int(Constants.MinCompetitionID) + k
+            competitions.add(competition_id, "Competition %03d" % (k + 1))
+            self.competitions.append(competition_id)
+
+        surfaces = sorted(self.reference["tbl_venuesurfaces"].keys())
+        venuehistory_id = int(Constants.MinVenueHistoryID)
+        self.teams = []
+        for k in range(self.size["teams"]):
+            team_id = int(Constants.MinTeamID) + k
+            venue_id = int(Constants.MinVenueID) + k
+            country_id = self.rng.choice(self.countries)
+            teams.add(team_id, country_id, "Team %04d" % (k + 1))
+            venues.add(venue_id, team_id, country_id, self.rng.choice(self.timezones),
+                       "City %04d" % (k + 1), "Stadium %04d" % (k + 1), self.rng.randint(0, 2500),
+                       round(self.rng.uniform(-60.0, 70.0), 4), round(self.rng.uniform(-180.0, 180.0), 4))
+            capacity = self.rng.randrange(5000, 90000, 500)
+            for year in sorted(self.rng.sample(range(SEASONS[0], SEASONS[1]), self.rng.randint(1, 2))):
+                venueHistory.add(venuehistory_id, venue_id, QDate(year, 7, 1), self.rng.choice(surfaces),
+                                 self.rng.randint(100, 110), self.rng.randint(64, 75), capacity,
+                                 int(capacity * self.rng.uniform(0.6, 1.0)))
+                venuehistory_id += 1
+            self.teams.append((team_id, venue_id))
+
+        self.managers = []
+        for k in range(self.size["managers"]):
+            manager_id = int(Constants.MinManagerID) + k
+            first, last = self._name()
+            managers.add(manager_id, self.rng.choice(self.countries), self._birthDate(35, 70),
+                         first, last, QVariant())
+            self.managers.append(manager_id)
+
+        self.referees = []
+        for k in range(self.size["referees"]):
+            referee_id = int(Constants.MinRefereeID) + k
+            first, last = self._name()
+            referees.add(referee_id, self.rng.choice(self.countries), self._birthDate(28, 50), first, last)
+            self.referees.append(referee_id)
+
+        # squads: goalkeepers first, then outfield players
+        player_id = int(Constants.MinPlayerID)
+        playerhistory_id = int(Constants.MinPlayerHistoryID)
+        self.squads = []
+        for team_id, venue_id in self.teams:
+            squad = []
+            for k in range(SQUAD_SIZE):
+                if k < SQUAD_GOALKEEPERS:
+                    position_id = self.rng.choice(self.goalkeeperPositions)
+                else:
+                    position_id = self.rng.choice(self.outfieldPositions)
+                first, last = self._name()
+                players.add(player_id, self.rng.choice(self.countries), self._birthDate(17, 38),
+                            first, last, QVariant(), position_id)
+                for year in sorted(self.rng.sample(range(SEASONS[0], SEASONS[1]), self.rng.randint(1, 2))):
+                    playerHistory.add(playerhistory_id, player_id, QDate(year, 8, 1),
+                                      self.rng.randint(165, 200), self.rng.randint(60, 95))
+                    playerhistory_id += 1
+                squad.append((player_id, position_id))
+                player_id += 1
+            self.squads.append(squad)
+
+        return [competitions, teams, venues, venueHistory, managers, referees, players, playerHistory]
+
+    def generateMatches(self):
+        """Generates matches with linking tables, environments, lineups and match events."""
+        self.writers = {}
+        for table, numColumns in (("tbl_matches", 11), ("tbl_hometeams", 2), ("tbl_awayteams", 2),
+                                  ("tbl_homemanagers", 2), ("tbl_awaymanagers", 2),
+                                  ("tbl_leaguematches", 2), ("tbl_groupmatches", 4), ("tbl_knockoutmatches", 3),
+                                  ("tbl_environments", 4), ("tbl_weatherkickoff", 2),
+                                  ("tbl_weatherhalftime", 2), ("tbl_weatherfulltime", 2),
+                                  ("tbl_lineups", 7), ("tbl_goals", 7), ("tbl_offenses", 6), ("tbl_penalties", 6),
+                                  ("tbl_substitutions", 3), ("tbl_insubstitutions", 2), ("tbl_outsubstitutions", 2),
+                                  ("tbl_switchpositions", 5), ("tbl_penaltyshootouts", 4),
+                                  ("tbl_penshootoutopeners", 2)):
+            self.writers[table] = self._writer(table, numColumns)
+
+        self.nextID = {
+            "lineup": int(Constants.MinLineupID),
+            "enviro": int(Constants.MinEnviroID),
+            "goal": int(Constants.MinGoalID),
+            "offense": int(Constants.MinOffenseID),
+            "penalty": int(Constants.MinPenaltyID),
+            "subs": int(Constants.MinSubstitutionID),
+            "switch": int(Constants.MinSwitchID),
+            "shootout": int(Constants.MinShootoutID),
+        }
+
+        # each competition has a pool of teams and a phase structure
+        phaseList = ("League", "League", "League", "Group", "Knockout")
+        pools = []
+        for k, competition_id in enumerate(self.competitions):
+            poolSize = min(len(self.teams), self.rng.choice((16, 18, 20, 24, 32)))
+            pools.append((competition_id, phaseList[k % len(phaseList)],
+                          self.rng.sample(range(len(self.teams)), poolSize)))
+
+        for k in range(self.size["matches"]):
+            match_id = int(Constants.MinMatchID) + k
+            competition_id, phase, pool = pools[k % len(pools)]
+            if phase == "Group" and self.rng.random() < 0.3:
+                phase = "Knockout"
+            home, away = self.rng.sample(pool, 2)
+            self._match(match_id, competition_id, phase, home, away)
+
+        return [self.writers[table] for table in sorted(self.writers.keys())]
+
+    def _nextID(self, name):
+        value = self.nextID[name]
+        self.nextID[name] += 1
+        return value
+
+    def _match(self, match_id, competition_id, phase, home, away):
+        """Generates one match and, for a fraction of matches, its lineups and events."""
+        w = self.writers
+        rng = self.rng
+        year = rng.randint(SEASONS[0], SEASONS[1] - 1)
+        shootout = phase == "Knockout" and rng.random() < SHOOTOUT_RATE
+        extra = EXTRA_LENGTH if shootout or (phase == "Knockout" and rng.random() < EXTRA_TIME_RATE) else 0
+        w["tbl_matches"].add(match_id, self._date(year), HALF_LENGTH, HALF_LENGTH,
+                             extra, extra, rng.randrange(500, 80000, 10), competition_id, self.phases[phase],
+                             self.teams[home][1], rng.choice(self.referees))
+        w["tbl_hometeams"].add(match_id, self.teams[home][0])
+        w["tbl_awayteams"].add(match_id, self.teams[away][0])
+        # every tier has at least as many managers as teams, so each team has its own manager
+        w["tbl_homemanagers"].add(match_id, self.managers[home])
+        w["tbl_awaymanagers"].add(match_id, self.managers[away])
+
+        rounds = sorted(self.reference["tbl_rounds"].keys())
+        if phase == "League":
+            w["tbl_leaguematches"].add(match_id, rng.choice(rounds[:38]))
+        elif phase == "Group":
+            w["tbl_groupmatches"].add(match_id, rng.choice(sorted(self.reference["tbl_grouprounds"].keys())),
+                                      rng.choice(sorted(self.reference["tbl_groups"].keys())),
+                                      rng.choice(rounds[:6]))
+        else:
+            w["tbl_knockoutmatches"].add(match_id, rng.choice(sorted(self.reference["tbl_knockoutrounds"].keys())),
+                                         rng.choice(sorted(self.reference["tbl_matchdays"].keys())))
+
+        if rng.random() >= self.size["detailed"]:
+            return
+
+        weather = sorted(self.reference["tbl_weather"].keys())
+        enviro_id = self._nextID("enviro")
+        w["tbl_environments"].add(enviro_id, match_id, QTime(rng.choice((12, 14, 15, 17, 19, 20)), rng.choice((0, 30))),
+                                  round(rng.uniform(-5.0, 35.0), 1))
+        for table in ("tbl_weatherkickoff", "tbl_weatherhalftime", "tbl_weatherfulltime"):
+            w[table].add(enviro_id, rng.choice(weather))
+
+        lineups = [self._lineup(match_id, home), self._lineup(match_id, away)]
+        for team, (starters, bench) in zip((home, away), lineups):
+            self._events(self.teams[team][0], starters, bench)
+
+        if shootout:
+            self._shootout(match_id, (self.teams[home][0], self.teams[away][0]), lineups)
+
+    def _lineup(self, match_id, team):
+        """Writes lineup of 11 starters and 7 substitutes.  Returns (starters, bench) as lists of
+        (lineup ID, position ID)."""
+        rng = self.rng
+        team_id = self.teams[team][0]
+        squad = self.squads[team]
+        goalkeepers = rng.sample(squad[:SQUAD_GOALKEEPERS], 2)
+        outfield = rng.sample(squad[SQUAD_GOALKEEPERS:], Constants.MAX_TEAM_STARTERS - 1 + BENCH_SIZE - 1)
+        selected = [goalkeepers[0]] + outfield[:Constants.MAX_TEAM_STARTERS - 1] + \
+                   [goalkeepers[1]] + outfield[Constants.MAX_TEAM_STARTERS - 1:]
+        captain = rng.randint(1, Constants.MAX_TEAM_STARTERS - 1)
+        starters, bench = [], []
+        for k, (player_id, position_id) in enumerate(selected):
+            lineup_id = self._nextID("lineup")
+            starting = k < Constants.MAX_TEAM_STARTERS
+            self.writers["tbl_lineups"].add(lineup_id, match_id, team_id, player_id, position_id,
+                                            starting, k == captain)
+            if starting:
+                starters.append((lineup_id, position_id))
+            else:
+                bench.append((lineup_id, position_id))
+        return starters, bench
+
+    def _events(self, team_id, starters, bench):
+        """Writes goals, offenses, penalties, substitutions and position switches of one team."""
+        w = self.writers
+        rng = self.rng
+        outfield = starters[1:]
+        strikes = sorted(self.reference["tbl_goalstrikes"].keys())
+        events = sorted(self.reference["tbl_goalevents"].keys())
+        fouls = sorted(self.reference["tbl_fouls"].keys())
+
+        for k in range(self._poisson(GOALS_PER_TEAM)):
+            minute, stoppage = self._matchTime()
+            w["tbl_goals"].add(self._nextID("goal"), team_id, rng.choice(outfield)[0], rng.choice(strikes),
+                               rng.choice(events), minute, stoppage)
+        for k in range(self._poisson(OFFENSES_PER_TEAM)):
+            minute, stoppage = self._matchTime()
+            card = rng.random()
+            for card_id, weight in self.cardWeights:
+                if card < weight:
+                    break
+                card -= weight
+            w["tbl_offenses"].add(self._nextID("offense"), rng.choice(starters)[0], rng.choice(fouls),
+                                  card_id, minute, stoppage)
+        for k in range(self._poisson(PENALTIES_PER_TEAM)):
+            minute, stoppage = self._matchTime()
+            if rng.random() < 0.75:
+                outcome_id = self.goalOutcome
+            else:
+                outcome_id = rng.choice(self.missOutcomes)
+            w["tbl_penalties"].add(self._nextID("penalty"), rng.choice(outfield)[0], rng.choice(fouls),
+                                   outcome_id, minute, stoppage)
+
+        # substitutes replace outfield starters, so that each player is substituted at most once
+        numSubs = rng.choice((0, 1, 2, 2, 3, 3, 3))
+        for (out_id, position_id), (in_id, bench_position) in zip(rng.sample(outfield, numSubs),
+                                                                  rng.sample(bench[1:], numSubs)):
+            subs_id = self._nextID("subs")
+            w["tbl_substitutions"].add(subs_id, rng.randint(46, Constants.MAX_MINUTES), 0)
+            w["tbl_outsubstitutions"].add(subs_id, out_id)
+            w["tbl_insubstitutions"].add(subs_id, in_id)
+        for k in range(self._poisson(SWITCHES_PER_TEAM)):
+            minute, stoppage = self._matchTime()
+            w["tbl_switchpositions"].add(self._nextID("switch"), rng.choice(outfield)[0],
+                                         rng.choice(self.outfieldPositions), minute, stoppage)
+
+    def _shootout(self, match_id, teamIDs, lineups):
+        """Writes penalty shootout with five rounds and sudden death rounds until there is a winner."""
+        rng = self.rng
+        rounds = sorted(self.reference["tbl_rounds"].keys())[:Constants.MAX_TEAM_STARTERS]
+        first = rng.randint(0, 1)
+        self.writers["tbl_penshootoutopeners"].add(match_id, teamIDs[first])
+        order = (first, 1 - first)
+        takers = [rng.sample(starters, Constants.MAX_TEAM_STARTERS) for starters, bench in lineups]
+        score = [0, 0]
+        for k, round_id in enumerate(rounds):
+            for team in order:
+                if rng.random() < 0.75:
+                    outcome_id = self.goalOutcome
+                    score[team] += 1
+                else:
+                    outcome_id = rng.choice(self.missOutcomes)
+                self.writers["tbl_penaltyshootouts"].add(self._nextID("shootout"), takers[team][k][0],
+                                                         round_id, outcome_id)
+            if k >= 4 and score[0] != score[1]:
+                break
+
+
+def _SplitStatements(script):
+    """Splits SQL script into complete statements.
+
+    Uses SQLite's statement parser, so that trigger bodies are kept intact, and keeps
+    dollar-quoted (PostgreSQL function) bodies together.
+    """
+    statements = []
+    buf = ""
+    for line in script.splitlines(True):
+        buf += line
+        if buf.count("$$") % 2 == 0 and sqlite3.complete_statement(buf):
+            statement = buf.strip()
+            if statement.rstrip(";").strip():
+                statements.append(statement.rstrip(";"))
+            buf = ""
+    if buf.strip():
+        statements.append(buf.strip().rstrip(";"))
+    return statements
+
+def RunScript(fileName, connectionName=None):
+    """Executes SQL script (e.g. schema definition) statement by statement inside a transaction.
+
+    Raises GeneratorError if the file cannot be read or a statement fails.
+    """
+    try:
+        scriptFile = open(fileName)
+        try:
+            script = scriptFile.read()
+        finally:
+            scriptFile.close()
+    except IOError, e:
+        raise GeneratorError("Cannot read %s: %s" % (fileName, e))
+
+    if connectionName is None:
+        db = QSqlDatabase.database()
+    else:
+        db = QSqlDatabase.database(connectionName)
+    db.transaction()
+    for statement in _SplitStatements(script):
+        query = QSqlQuery(db)
+        if not query.exec_(statement):
+            db.rollback()
+            raise GeneratorError("%s: %s" % (statement.splitlines()[0], query.lastError().text()))
+    db.commit()
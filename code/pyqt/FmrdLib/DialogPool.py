@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+from PyQt4.QtSql import *
+from FmrdLib import TableChanges
+from FmrdLib.CustomModels import LinkingSqlModel
+from FmrdLib.DialogRegistry import CreateDialog
+from FmrdLib.QueryExecutor import QueryExecutor
+from FmrdLib.ReferenceData import ReferenceTableModel
+
+"""Contains the pool of data entry dialogs opened from the switchboards.
+
+A dialog is constructed the first time it is opened and kept, hidden, when it is closed, so
+that opening it again does not re-run its queries or re-create its delegates.  Unsaved edits
+are discarded when a dialog is closed, as they were when a closed dialog was discarded.
+
+The change counters of TableChanges are remembered when a dialog is closed.  When it is
+opened again, only the models whose tables have been written since are selected again;
+a data widget mapper of such a model is moved back onto a valid row.
+
+Closed dialogs are freed, least recently used first, when their estimated memory use (row
+and column counts of their models) exceeds the pool's budget.
+
+The pool emits dialogOpening(QString) with the class name before a dialog is opened, so that
+background work on the database (see Prewarm) can give way to the operator.
+
+Classes:
+DialogPool -- pool of dialogs kept alive between uses
+"""
+
+# memory budget of closed dialogs, in bytes
+MEMORY_BUDGET = 64 * 1048576
+# estimated memory of a dialog without its models, and of a cell held by a model
+DIALOG_BYTES = 512 * 1024
+CELL_BYTES = 64
+
+def _modelTables(model):
+    """Returns names of tables that a model reads."""
+    if isinstance(model, QSqlTableModel):
+        tables = [model.tableName()]
+        if isinstance(model, QSqlRelationalTableModel):
+            tables += [model.relation(k).tableName() for k in range(model.columnCount())
+                       if model.relation(k).isValid()]
+    elif isinstance(model, ReferenceTableModel):
+        tables = [model.tableName()]
+    elif isinstance(model, LinkingSqlModel):
+        tables = [model.table]
+    else:
+        tables = []
+    return [unicode(table) for table in tables if not QString(table).isEmpty()]
+
+def _reselect(model):
+    """Reads rows of a model from the database again.  Returns True if the model was repopulated."""
+    if isinstance(model, LinkingSqlModel):
+        if getattr(model, "primary_id", None) is None:
+            return False
+        model.refresh()
+        return True
+    return model.select()
+
+def _dialogBytes(dialog):
+    """Returns estimated memory use of a dialog and its models, in bytes."""
+    cells = 0
+    for model in dialog.findChildren(QAbstractItemModel):
+        cells += model.rowCount() * model.columnCount()
+    return DIALOG_BYTES + cells * CELL_BYTES
+
+
+class DialogPool(QObject):
+    """Pool of data entry dialogs, which are kept alive between uses and refreshed incrementally.
+
+    Dialogs are identified by class name (see DialogRegistry).
+
+    Arguments:
+        parent -- parent widget of the dialogs (e.g. switchboard)
+        budget -- memory budget of closed dialogs, in bytes
+
+    Inherits QObject.
+    """
+
+    def __init__(self, parent, budget=MEMORY_BUDGET):
+        """Constructor for DialogPool class."""
+        super(DialogPool, self).__init__(parent)
+        self.budget = budget
+        # closed dialogs: {class name: (dialog, change counters when closed)}
+        self.idle = {}
+        # class names of closed dialogs, least recently used first
+        self.lastUsed = []
+
+    def acquire(self, name):
+        """Returns dialog, constructing it or refreshing the pooled one.
+
+        Argument:
+            name -- class name of dialog, registered in DialogRegistry
+
+        """
+        self.emit(SIGNAL("dialogOpening(QString)"), QString(name))
+        if name in self.idle:
+            dialog, snapshot = self.idle.pop(name)
+            self.lastUsed.remove(name)
+            self.refresh(dialog, snapshot)
+            return dialog
+        dialog = CreateDialog(name, self.parent())
+        for model in dialog.findChildren(QSqlTableModel):
+            TableChanges.WatchTableChanges(model)
+        return dialog
+
+    def release(self, name, dialog):
+        """Returns closed dialog to the pool, discarding its unsaved edits and pending lookups."""
+        for executor in dialog.findChildren(QueryExecutor):
+            executor.cancel()
+        for mapper in dialog.findChildren(QDataWidgetMapper):
+            mapper.revert()
+        for model in dialog.findChildren(QSqlTableModel):
+            model.revertAll()
+        self.idle[name] = (dialog, TableChanges.Snapshot())
+        self.lastUsed.append(name)
+        self.trim()
+
+    def exec_(self, name):
+        """Opens dialog modally and returns it to the pool when it is closed.  Returns result code of dialog."""
+        dialog = self.acquire(name)
+        try:
+            return dialog.exec_()
+        finally:
+            self.release(name, dialog)
+
+    def refresh(self, dialog, snapshot):
+        """Selects again the models of a dialog whose tables have been written since snapshot was taken."""
+        refreshed = []
+        for model in dialog.findChildren(QAbstractItemModel):
+            tables = _modelTables(model)
+            if [table for table in tables if TableChanges.Changed(table, snapshot)] and _reselect(model):
+                refreshed.append(model)
+        for mapper in dialog.findChildren(QDataWidgetMapper):
+            model = mapper.model()
+            if [other for other in refreshed if other is model]:
+                row = min(mapper.currentIndex(), model.rowCount() - 1)
+                if row >= 0:
+                    mapper.setCurrentIndex(row)
+
+    def trim(self):
+        """Frees closed dialogs, least recently used first, until their memory use is within budget."""
+        sizes = dict((name, _dialogBytes(self.idle[name][0])) for name in self.lastUsed)
+        while self.lastUsed and sum(sizes.values()) > self.budget:
+            name = self.lastUsed.pop(0)
+            dialog, snapshot = self.idle.pop(name)
+            del sizes[name]
+            dialog.deleteLater()
+
+    def clear(self):
+        """Frees all closed dialogs, e.g. when the database connection is reopened."""
+        for dialog, snapshot in self.idle.values():
+            dialog.deleteLater()
+        self.idle.clear()
+        self.lastUsed = []
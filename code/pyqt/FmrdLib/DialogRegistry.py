@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from FmrdLib import StartupTimes
+
+"""Contains the registry of data entry dialogs opened from the switchboards.
+
+The switchboards open dialogs by class name, and the module that defines a dialog (with its
+generated user interface module) is imported the first time one of its dialogs is opened.
+The switchboard and login windows therefore appear without importing any dialog module.
+Import times are recorded in the startup report (see StartupTimes).
+
+Functions:
+DialogClass -- return class of a dialog, importing its module on first use
+CreateDialog -- construct a dialog
+"""
+
+# dialog modules and the dialogs opened from the switchboards: {module: (class name, ...)}
+DIALOG_MODULES = {
+    "fmrd_setup": ("CardSetupDlg", "FoulSetupDlg", "GroupSetupDlg", "MatchdaySetupDlg", "GroupRoundSetupDlg",
+                   "KnockoutRoundSetupDlg", "PhaseSetupDlg", "PenSetupDlg", "GoalEventSetupDlg",
+                   "GoalStrikeSetupDlg", "FieldPosSetupDlg", "FlankPosSetupDlg", "PosSetupDlg",
+                   "CountrySetupDlg", "ConfedSetupDlg", "TimeZoneSetupDlg", "VenueSurfaceSetupDlg",
+                   "RoundSetupDlg", "WxCondSetupDlg"),
+    "fmrd_overview": ("CompEntryDlg", "TeamEntryDlg", "VenueEntryDlg"),
+    "fmrd_personnel": ("ManagerEntryDlg", "RefereeEntryDlg", "PlayerEntryDlg"),
+    "fmrd_match": ("MatchEntryDlg", ),
+    "fmrd_goals": ("GoalEntryDlg", ),
+    "fmrd_penalties": ("PenaltyEntryDlg", ),
+    "fmrd_offenses": ("OffenseEntryDlg", ),
+    "fmrd_subs": ("SubsEntryDlg", "SwitchEntryDlg"),
+    "fmrd_shootouts": ("PenShootoutEntryDlg", ),
+}
+
+# module of each dialog: {class name: module}
+_modules = dict((name, module) for module, names in DIALOG_MODULES.items() for name in names)
+
+if False:
+    # never executed: lets executable builders (PyInstaller), which do not follow
+    # __import__ calls, find the dialog modules
+    import fmrd_setup, fmrd_overview, fmrd_personnel, fmrd_match, fmrd_goals
+    import fmrd_penalties, fmrd_offenses, fmrd_subs, fmrd_shootouts
+
+def DialogClass(name):
+    """Returns class of a dialog, importing its module on first use.
+
+    Raises KeyError if the dialog is not registered.
+    """
+    module = _modules[name]
+    if module not in sys.modules:
+        started = time.time()
+        __import__(module)
+        StartupTimes.RecordImport(module, time.time() - started)
+    return getattr(sys.modules[module], name)
+
+def CreateDialog(name, parent=None):
+    """Constructs a dialog and returns it.
+
+    Arguments:
+        name -- class name of dialog, registered in DIALOG_MODULES
+        parent -- parent widget (e.g. switchboard)
+
+    """
+    return DialogClass(name)(parent)
@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import json
+import os
+import sys
+from collections import OrderedDict
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib.FeedImporter import FEED_FIELDS, FEED_SECTIONS, NAME_INDEXES, FeedError, NameIndex
+
+"""Contains classes that export complete match records from an FMRD database as match feeds.
+
+Matches are written in the feed format read by FeedImporter: JSON Lines, with one match and
+its sections per line, or a directory of CSV files with one file per section.  Teams, players,
+venues and lookup values are written by name, or by ID if requested.
+
+Matches and each section are read with one forward-only query, ordered by match, and the
+section rows of a match are merged into it as the queries advance.  On PostgreSQL the queries
+run as server-side cursors that are fetched FETCH_SIZE rows at a time, because the QPSQL
+driver otherwise reads a whole result set into memory.  Memory use therefore does not grow
+with the size of the database.  All queries run in one read transaction, so that an export
+is consistent.
+
+Classes:
+FeedExporter -- export matches as a match feed
+"""
+
+# number of rows fetched at a time from a server-side cursor
+FETCH_SIZE = 500
+
+# output formats
+FORMATS = ("jsonl", "csv")
+
+# columns of tbl_matches, tbl_environments and event tables, by position
+MATCH_COLUMNS = {"date": 1, "first_half": 2, "second_half": 3, "first_extra": 4, "second_extra": 5,
+                 "attendance": 6, "competition": 7, "phase": 8, "venue": 9, "referee": 10}
+ENVIRO_COLUMNS = {"kickoff": 2, "temperature": 3}
+EVENT_COLUMNS = {
+    "tbl_goals": ("team", "lineup", "strike", "event", "minute", "stoppage"),
+    "tbl_penalties": ("lineup", "foul", "outcome", "minute", "stoppage"),
+    "tbl_offenses": ("lineup", "foul", "card", "minute", "stoppage"),
+    "tbl_substitutions": ("minute", "stoppage"),
+    "tbl_switchpositions": ("lineup", "position", "minute", "stoppage"),
+    "tbl_penaltyshootouts": ("lineup", "round", "outcome"),
+}
+
+
+class _Cursor(object):
+    """Forward-only stream over the rows of a query, each a list of Python values.
+
+    Arguments:
+        db -- database connection (QSqlDatabase) with an open transaction
+        name -- cursor name, unique within the export
+        sql -- SELECT statement
+
+    """
+
+    def __init__(self, db, name, sql):
+        """Constructor for _Cursor class.  Executes query or declares server-side cursor."""
+        self.db = db
+        self.name = name
+        self.serverSide = db.driverName() == "QPSQL"
+        self.query = QSqlQuery(db)
+        self.query.setForwardOnly(True)
+        if self.serverSide:
+            self._exec("DECLARE %s NO SCROLL CURSOR FOR %s" % (name, sql))
+            self._fetch()
+        else:
+            self._exec(sql)
+        self.advance()
+
+    def _exec(self, sql):
+        if not self.query.exec_(sql):
+            raise FeedError("%s: %s" % (sql, self.query.lastError().text()))
+
+    def _fetch(self):
+        """Fetches next rows of server-side cursor."""
+        self._exec("FETCH FORWARD %d FROM %s" % (FETCH_SIZE, self.name))
+        self.fetched = 0
+
+    def advance(self):
+        """Reads next row into row attribute, which is None at end of result set."""
+        self.row = None
+        if not self.query.next():
+            if not self.serverSide or self.fetched < FETCH_SIZE:
+                return
+            self._fetch()
+            if not self.query.next():
+                return
+        if self.serverSide:
+            self.fetched += 1
+        self.row = [_PythonValue(self.query.value(k)) for k in range(self.query.record().count())]
+
+    def take(self, match_id):
+        """Returns rows of match (without match ID column), skipping rows of earlier matches.
+
+        Rows must be ordered by match ID in the first column.
+        """
+        rows = []
+        while self.row is not None and self.row[0] <= match_id:
+            if self.row[0] == match_id:
+                rows.append(self.row[1:])
+            self.advance()
+        return rows
+
+    def close(self):
+        """Closes query and server-side cursor."""
+        self.query.finish()
+        if self.serverSide:
+            self.query.exec_("CLOSE %s" % self.name)
+            self.query.finish()
+
+
+def _PythonValue(value):
+    """Returns QVariant as Python value: unicode, int, float, ISO date string or None."""
+    if value.isNull():
+        return None
+    if value.type() in (QVariant.Date, QVariant.DateTime):
+        return unicode(value.toDate().toString(Qt.ISODate))
+    if value.type() == QVariant.Time:
+        return unicode(value.toTime().toString("hh:mm"))
+    if value.type() in (QVariant.Int, QVariant.UInt, QVariant.LongLong, QVariant.ULongLong):
+        return value.toLongLong()[0]
+    if value.type() == QVariant.Double:
+        return value.toDouble()[0]
+    if value.type() == QVariant.Bool:
+        return int(value.toBool())
+    return unicode(value.toString())
+
+def _Kickoff(value):
+    """Returns kickoff time as hh:mm string."""
+    if value is None:
+        return None
+    for format in ("hh:mm", "hh:mm:ss", "hh:mm:ss.zzz"):
+        time = QTime.fromString(unicode(value), format)
+        if time.isValid():
+            return unicode(time.toString("hh:mm"))
+    return value
+
+
+class FeedExporter(object):
+    """Exports complete match records of an FMRD database as a match feed.
+
+    Arguments:
+        connectionName -- name of database connection (default connection if None)
+        competitions -- names or IDs of competitions to export (all if empty)
+        firstDate -- first match date to export (QDate or ISO date string; no limit if None)
+        lastDate -- last match date to export (QDate or ISO date string; no limit if None)
+        ids -- write IDs instead of names of teams, players and lookup values (default False)
+
+    """
+
+    def __init__(self, connectionName=None, competitions=(), firstDate=None, lastDate=None, ids=False):
+        """Constructor for FeedExporter class.  Raises FeedError if a filter value is invalid."""
+        if connectionName is None:
+            self.db = QSqlDatabase.database()
+        else:
+            self.db = QSqlDatabase.database(connectionName)
+        self.ids = ids
+        self.cursorCount = 0
+
+        # filter on matches, built from validated values so that it can be used in cursor declarations
+        clauses = []
+        if competitions:
+            table, idColumn, nameColumn = NAME_INDEXES["competition"]
+            index = NameIndex("competition", table, idColumn, nameColumn, self.db.connectionName())
+            clauses.append("m.%s IN (%s)" % (self.column("tbl_matches", MATCH_COLUMNS["competition"]),
+                                            ",".join(str(index.resolve(name)) for name in competitions)))
+        for date, operator in ((firstDate, ">="), (lastDate, "<=")):
+            if date is not None:
+                date = QDate.fromString(date, Qt.ISODate) if not isinstance(date, QDate) else date
+                if not date.isValid():
+                    raise FeedError("invalid date (use YYYY-MM-DD)")
+                clauses.append("m.%s %s '%s'" % (self.column("tbl_matches", MATCH_COLUMNS["date"]),
+                                                 operator, date.toString(Qt.ISODate)))
+        self.filter = " AND ".join(clauses) or "1 = 1"
+
+    def column(self, table, position):
+        """Returns name of column of table at position."""
+        return unicode(self.db.record(table).fieldName(position))
+
+    def choose(self, idExpression, nameExpression):
+        """Returns ID or name expression, according to ids flag."""
+        if self.ids:
+            return idExpression
+        return nameExpression
+
+    # ------------------------------------------------------------
+    # queries
+
+    def matchQuery(self):
+        """Returns query of matches with their linking tables, environment and shootout opener."""
+        m = dict((field, "m.%s" % self.column("tbl_matches", position)) for field, position in MATCH_COLUMNS.items())
+        e = dict((field, "e.%s" % self.column("tbl_environments", position)) for field, position in ENVIRO_COLUMNS.items())
+        c = self.choose
+        fields = [
+            "m.match_id", m["date"], c(m["competition"], "cp.comp_name"), c(m["phase"], "ph.phase_desc"),
+            c("COALESCE(lm.round_id, gm.round_id)", "COALESCE(lr.round_desc, gr.round_desc)"),
+            c("gm.grpround_id", "grr.grpround_desc"), c("gm.group_id", "grp.group_desc"),
+            c("km.koround_id", "kr.koround_desc"), c("km.matchday_id", "md.matchday_desc"),
+            c(m["venue"], "v.ven_name"), c(m["referee"], "r.full_name"),
+            c("ht.team_id", "htn.tm_name"), c("awt.team_id", "awtn.tm_name"),
+            c("hm.manager_id", "hmn.full_name"), c("awm.manager_id", "awmn.full_name"),
+            m["attendance"], m["first_half"], m["second_half"], m["first_extra"], m["second_extra"],
+            e["kickoff"], e["temperature"],
+            c("wk.weather_id", "wkn.wx_conditiondesc"), c("wh.weather_id", "whn.wx_conditiondesc"),
+            c("wf.weather_id", "wfn.wx_conditiondesc"), c("so.team_id", "son.tm_name"),
+        ]
+        return ("SELECT %s FROM tbl_matches m "
+                "LEFT JOIN tbl_competitions cp ON cp.competition_id = %s "
+                "LEFT JOIN tbl_phases ph ON ph.phase_id = %s "
+                "LEFT JOIN tbl_venues v ON v.venue_id = %s "
+                "LEFT JOIN referees_list r ON r.referee_id = %s "
+                "LEFT JOIN tbl_hometeams ht ON ht.match_id = m.match_id "
+                "LEFT JOIN tbl_teams htn ON htn.team_id = ht.team_id "
+                "LEFT JOIN tbl_awayteams awt ON awt.match_id = m.match_id "
+                "LEFT JOIN tbl_teams awtn ON awtn.team_id = awt.team_id "
+                "LEFT JOIN tbl_homemanagers hm ON hm.match_id = m.match_id "
+                "LEFT JOIN managers_list hmn ON hmn.manager_id = hm.manager_id "
+                "LEFT JOIN tbl_awaymanagers awm ON awm.match_id = m.match_id "
+                "LEFT JOIN managers_list awmn ON awmn.manager_id = awm.manager_id "
+                "LEFT JOIN tbl_leaguematches lm ON lm.match_id = m.match_id "
+                "LEFT JOIN tbl_rounds lr ON lr.round_id = lm.round_id "
+                "LEFT JOIN tbl_groupmatches gm ON gm.match_id = m.match_id "
+                "LEFT JOIN tbl_rounds gr ON gr.round_id = gm.round_id "
+                "LEFT JOIN tbl_grouprounds grr ON grr.grpround_id = gm.grpround_id "
+                "LEFT JOIN tbl_groups grp ON grp.group_id = gm.group_id "
+                "LEFT JOIN tbl_knockoutmatches km ON km.match_id = m.match_id "
+                "LEFT JOIN tbl_knockoutrounds kr ON kr.koround_id = km.koround_id "
+                "LEFT JOIN tbl_matchdays md ON md.matchday_id = km.matchday_id "
+                "LEFT JOIN tbl_environments e ON e.match_id = m.match_id "
+                "LEFT JOIN tbl_weatherkickoff wk ON wk.enviro_id = e.enviro_id "
+                "LEFT JOIN tbl_weather wkn ON wkn.weather_id = wk.weather_id "
+                "LEFT JOIN tbl_weatherhalftime wh ON wh.enviro_id = e.enviro_id "
+                "LEFT JOIN tbl_weather whn ON whn.weather_id = wh.weather_id "
+                "LEFT JOIN tbl_weatherfulltime wf ON wf.enviro_id = e.enviro_id "
+                "LEFT JOIN tbl_weather wfn ON wfn.weather_id = wf.weather_id "
+                "LEFT JOIN tbl_penshootoutopeners so ON so.match_id = m.match_id "
+                "LEFT JOIN tbl_teams son ON son.team_id = so.team_id "
+                "WHERE %s ORDER BY m.match_id" %
+                (", ".join(fields), m["competition"], m["phase"], m["venue"], m["referee"], self.filter))
+
+    def sectionQuery(self, section):
+        """Returns query of section rows, with match ID in first column, in order of match."""
+        c = self.choose
+        player = lambda alias: c("%s.player_id" % alias, "(SELECT full_name FROM players_list "
+                                 "WHERE player_id = %s.player_id)" % alias)
+        team = lambda expression: c(expression, "(SELECT tm_name FROM tbl_teams WHERE team_id = %s)" % expression)
+        if section == "lineups":
+            return ("SELECT l.match_id, %s, %s, %s, CASE WHEN l.lp_starting THEN 1 ELSE 0 END, "
+                    "CASE WHEN l.lp_captain THEN 1 ELSE 0 END "
+                    "FROM tbl_lineups l JOIN tbl_matches m ON m.match_id = l.match_id "
+                    "LEFT JOIN positions_list ps ON ps.position_id = l.position_id "
+                    "WHERE %s ORDER BY l.match_id, l.lineup_id" %
+                    (team("l.team_id"), player("l"), c("l.position_id", "ps.position_name"), self.filter))
+        if section == "substitutions":
+            x = self.eventColumns("tbl_substitutions", "s")
+            return ("SELECT COALESCE(li.match_id, lo.match_id), %s, %s, %s, %s, %s "
+                    "FROM tbl_substitutions s "
+                    "LEFT JOIN tbl_insubstitutions i ON i.subs_id = s.subs_id "
+                    "LEFT JOIN tbl_lineups li ON li.lineup_id = i.lineup_id "
+                    "LEFT JOIN tbl_outsubstitutions o ON o.subs_id = s.subs_id "
+                    "LEFT JOIN tbl_lineups lo ON lo.lineup_id = o.lineup_id "
+                    "JOIN tbl_matches m ON m.match_id = COALESCE(li.match_id, lo.match_id) "
+                    "WHERE %s ORDER BY m.match_id, s.subs_id" %
+                    (team("COALESCE(li.team_id, lo.team_id)"), player("li"), player("lo"),
+                     x["minute"], x["stoppage"], self.filter))
+
+        table, alias, lookups = {
+            "goals": ("tbl_goals", "g",
+                      (("strike", "tbl_goalstrikes", "gtstype_id", "gts_desc"),
+                       ("event", "tbl_goalevents", "gtetype_id", "gte_desc"))),
+            "penalties": ("tbl_penalties", "pn",
+                          (("foul", "tbl_fouls", "foul_id", "foul_desc"),
+                           ("outcome", "tbl_penoutcomes", "penoutcome_id", "po_desc"))),
+            "offenses": ("tbl_offenses", "ofs",
+                         (("foul", "tbl_fouls", "foul_id", "foul_desc"),
+                          ("card", "tbl_cards", "card_id", "card_type"))),
+            "switches": ("tbl_switchpositions", "sw",
+                         (("position", "positions_list", "position_id", "position_name"), )),
+            "shootouts": ("tbl_penaltyshootouts", "pso",
+                          (("round", "tbl_rounds", "round_id", "round_desc"),
+                           ("outcome", "tbl_penoutcomes", "penoutcome_id", "po_desc"))),
+        }[section]
+        x = self.eventColumns(table, alias)
+        fields = [team("l.team_id"), player("l")]
+        if section == "goals":
+            # team credited with the goal, scorer, and scorer's team (differs for own goals)
+            fields = [team(x["team"]), player("l"), team("l.team_id")]
+        for name, lookupTable, idColumn, nameColumn in lookups:
+            fields.append(c(x[name], "(SELECT %s FROM %s WHERE %s = %s)" % (nameColumn, lookupTable, idColumn, x[name])))
+        if "minute" in x:
+            fields.extend([x["minute"], x["stoppage"]])
+        return ("SELECT l.match_id, %s FROM %s %s "
+                "JOIN tbl_lineups l ON l.lineup_id = %s "
+                "JOIN tbl_matches m ON m.match_id = l.match_id "
+                "WHERE %s ORDER BY l.match_id, %s.%s" %
+                (", ".join(fields), table, alias, x["lineup"], self.filter, alias, self.column(table, 0)))
+
+    def eventColumns(self, table, alias):
+        """Returns {event column: qualified column name} of an event table."""
+        return dict((name, "%s.%s" % (alias, self.column(table, position + 1)))
+                    for position, name in enumerate(EVENT_COLUMNS[table]))
+
+    def cursor(self, sql):
+        """Returns forward-only cursor over query."""
+        self.cursorCount += 1
+        return _Cursor(self.db, "fmrd_export_%d" % self.cursorCount, sql)
+
+    # ------------------------------------------------------------
+    # export
+
+    def matches(self):
+        """Generates matches as OrderedDicts of match fields, with a list of OrderedDicts per section.
+
+        Must be called inside a transaction (see run()).
+        """
+        cursors = [self.cursor(self.matchQuery())]
+        try:
+            for section in FEED_SECTIONS:
+                cursors.append(self.cursor(self.sectionQuery(section)))
+            matchCursor = cursors[0]
+            while matchCursor.row is not None:
+                row = matchCursor.row
+                record = OrderedDict(zip(FEED_FIELDS["matches"], row))
+                record["kickoff"] = _Kickoff(record["kickoff"])
+                for section, cursor in zip(FEED_SECTIONS, cursors[1:]):
+                    record[section] = [OrderedDict(zip(FEED_FIELDS[section], [row[0]] + values))
+                                       for values in cursor.take(row[0])]
+                yield record
+                matchCursor.advance()
+        finally:
+            for cursor in cursors:
+                cursor.close()
+
+    def run(self, path, format="jsonl"):
+        """Exports matches to a JSON Lines file or a directory of CSV files.
+
+        Arguments:
+            path -- output file (jsonl; standard output if '-') or directory (csv; created if needed)
+            format -- output format, one of FORMATS
+
+        Returns {section: number of rows written}, with matches in 'matches'.
+        Raises FeedError if the output cannot be written or a query fails.
+        """
+        if format not in FORMATS:
+            raise FeedError("Unknown format '%s' (use %s)" % (format, ", ".join(FORMATS)))
+        counts = dict((section, 0) for section in ("matches", ) + FEED_SECTIONS)
+        if not self.db.transaction():
+            raise FeedError("Cannot start transaction: %s" % self.db.lastError().text())
+        try:
+            if format == "jsonl":
+                self._writeJSONLines(path, counts)
+            else:
+                self._writeCSV(path, counts)
+        except (IOError, OSError, csv.Error), e:
+            raise FeedError("Cannot write %s: %s" % (path, e))
+        finally:
+            # read-only transaction: rollback releases cursors and locks
+            self.db.rollback()
+        return counts
+
+    def _writeJSONLines(self, path, counts):
+        """Writes one JSON object per match."""
+        output = sys.stdout if path == "-" else open(path, "w")
+        try:
+            for record in self.matches():
+                output.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + "\n")
+                counts["matches"] += 1
+                for section in FEED_SECTIONS:
+                    counts[section] += len(record[section])
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+    def _writeCSV(self, directory, counts):
+        """Writes matches.csv and one CSV file per section."""
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        files = []
+        writers = {}
+        try:
+            for section in ("matches", ) + FEED_SECTIONS:
+                files.append(open(os.path.join(directory, "%s.csv" % section), "wb"))
+                writers[section] = csv.writer(files[-1])
+                writers[section].writerow(FEED_FIELDS[section])
+            for record in self.matches():
+                writers["matches"].writerow([_CSVValue(record[field]) for field in FEED_FIELDS["matches"]])
+                counts["matches"] += 1
+                for section in FEED_SECTIONS:
+                    for row in record[section]:
+                        writers[section].writerow([_CSVValue(value) for value in row.values()])
+                    counts[section] += len(record[section])
+        finally:
+            for output in files:
+                output.close()
+
+
+def _CSVValue(value):
+    """Returns value as UTF-8 string for the csv module."""
+    if value is None:
+        return ""
+    return unicode(value).encode("utf-8")
@@ -0,0 +1,562 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import json
+import os
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import Constants
+from FmrdLib.DataGenerator import GeneratorError, TableWriter
+from FmrdLib.IDAllocator import (IDAllocationError, ReserveIDs)
+from FmrdLib.QueryCache import *
+
+"""Contains classes that import match feeds (fixtures, results and match events) in bulk.
+
+A feed is either a JSON file that holds a list of matches, each with its lineups and match
+events in lists named after FEED_SECTIONS, or a directory of CSV files: matches.csv with one
+row per match, and one file per section (e.g. goals.csv) whose rows refer to a match by the
+key in the 'match' column.  Column and attribute names are listed in FEED_FIELDS.
+
+Teams, players, venues, referees, managers, competitions and lookup values are given by name
+and resolved against existing rows through name indexes, each read with one query the first
+time it is needed; a numeric value is taken as an ID.  Players in match events are resolved
+through the lineups of the match.
+
+Matches are written to the same tables, with the same linking and event rows, as the match
+entry dialog and the event dialogs.  The whole feed is resolved before anything is written,
+so that a feed with an unknown name writes nothing.  New rows are numbered while the feed
+is resolved, and their IDs are reserved from the ID allocator only after it has resolved,
+one range per table.  Rows are then written with multi-row INSERT statements, one
+transaction per chunk of matches.  Matches that already exist (same date, home team and
+away team) are skipped.
+
+Classes:
+FeedError -- exception raised when a feed cannot be read, resolved or written
+NameIndex -- IDs of the rows of a table, indexed by name
+FeedImporter -- import matches of a feed
+
+Functions:
+ReadFeed -- read matches of a JSON or CSV feed
+"""
+
+# number of matches written in one transaction
+CHUNK_SIZE = 100
+
+# sections of a match: lists of a JSON match record, CSV files besides matches.csv
+FEED_SECTIONS = ("lineups", "goals", "penalties", "offenses", "substitutions", "switches", "shootouts")
+
+# fields of matches and of match sections; all others are ignored
+FEED_FIELDS = {
+    "matches": ("match", "date", "competition", "phase", "round", "group_round", "group", "knockout_round",
+                "matchday", "venue", "referee", "home_team", "away_team", "home_manager", "away_manager",
+                "attendance", "first_half", "second_half", "first_extra", "second_extra", "kickoff",
+                "temperature", "weather_kickoff", "weather_halftime", "weather_fulltime", "shootout_opener"),
+    "lineups": ("match", "team", "player", "position", "starting", "captain"),
+    "goals": ("match", "team", "player", "player_team", "strike", "event", "minute", "stoppage"),
+    "penalties": ("match", "team", "player", "foul", "outcome", "minute", "stoppage"),
+    "offenses": ("match", "team", "player", "foul", "card", "minute", "stoppage"),
+    "substitutions": ("match", "team", "player_in", "player_out", "minute", "stoppage"),
+    "switches": ("match", "team", "player", "position", "minute", "stoppage"),
+    "shootouts": ("match", "team", "player", "round", "outcome"),
+}
+
+# name indexes: {kind: (table or view, ID column, name column)}
+NAME_INDEXES = {
+    "competition": ("tbl_competitions", "competition_id", "comp_name"),
+    "phase": ("tbl_phases", "phase_id", "phase_desc"),
+    "round": ("tbl_rounds", "round_id", "round_desc"),
+    "group": ("tbl_groups", "group_id", "group_desc"),
+    "group round": ("tbl_grouprounds", "grpround_id", "grpround_desc"),
+    "knockout round": ("tbl_knockoutrounds", "koround_id", "koround_desc"),
+    "matchday": ("tbl_matchdays", "matchday_id", "matchday_desc"),
+    "venue": ("tbl_venues", "venue_id", "ven_name"),
+    "referee": ("referees_list", "referee_id", "full_name"),
+    "manager": ("managers_list", "manager_id", "full_name"),
+    "team": ("tbl_teams", "team_id", "tm_name"),
+    "player": ("players_list", "player_id", "full_name"),
+    "position": ("positions_list", "position_id", "position_name"),
+    "weather": ("tbl_weather", "weather_id", "wx_conditiondesc"),
+    "goal strike": ("tbl_goalstrikes", "gtstype_id", "gts_desc"),
+    "goal event": ("tbl_goalevents", "gtetype_id", "gte_desc"),
+    "foul": ("tbl_fouls", "foul_id", "foul_desc"),
+    "card": ("tbl_cards", "card_id", "card_type"),
+    "penalty outcome": ("tbl_penoutcomes", "penoutcome_id", "po_desc"),
+}
+
+# written tables and their number of columns, in order of writing (parents before children)
+WRITE_ORDER = (("tbl_matches", 11), ("tbl_hometeams", 2), ("tbl_awayteams", 2),
+               ("tbl_homemanagers", 2), ("tbl_awaymanagers", 2),
+               ("tbl_leaguematches", 2), ("tbl_groupmatches", 4), ("tbl_knockoutmatches", 3),
+               ("tbl_environments", 4), ("tbl_weatherkickoff", 2), ("tbl_weatherhalftime", 2),
+               ("tbl_weatherfulltime", 2), ("tbl_lineups", 7), ("tbl_goals", 7), ("tbl_penalties", 6),
+               ("tbl_offenses", 6), ("tbl_substitutions", 3), ("tbl_insubstitutions", 2),
+               ("tbl_outsubstitutions", 2), ("tbl_switchpositions", 5), ("tbl_penshootoutopeners", 2),
+               ("tbl_penaltyshootouts", 4))
+
+# default lengths of match periods, as in the match entry dialog
+DEFAULT_PERIODS = {"first_half": 45, "second_half": 45, "first_extra": 0, "second_extra": 0}
+
+# column of match date in tbl_matches
+MATCH_DATE_COLUMN = 1
+
+
+class FeedError(Exception):
+    """Exception raised when a feed cannot be read, resolved or written."""
+    pass
+
+
+def _text(value):
+    """Returns feed value as stripped unicode string, or None if it is missing or empty."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.decode("utf-8")
+    value = unicode(value).strip()
+    return value or None
+
+def _key(name):
+    """Returns name as index key (case-insensitive, single spaces)."""
+    return u" ".join(unicode(name).lower().split())
+
+def ReadFeed(path):
+    """Returns matches of a feed as a list of dictionaries, one per match, with a list per section.
+
+    Argument:
+        path -- JSON file, or directory of CSV files (or the matches.csv file in it)
+
+    Raises FeedError if the feed cannot be read.
+    """
+    if os.path.isdir(path) or os.path.basename(path).lower() == "matches.csv":
+        return _ReadCSVFeed(path if os.path.isdir(path) else os.path.dirname(path))
+    try:
+        feedFile = open(path)
+        try:
+            feed = json.load(feedFile)
+        finally:
+            feedFile.close()
+    except (IOError, ValueError), e:
+        raise FeedError("Cannot read %s: %s" % (path, e))
+    if isinstance(feed, dict):
+        feed = feed.get("matches")
+    if not isinstance(feed, list):
+        raise FeedError("%s does not contain a list of matches" % path)
+    for record in feed:
+        for section in FEED_SECTIONS:
+            record.setdefault(section, [])
+    return feed
+
+def _ReadCSVFeed(directory):
+    """Returns matches of a directory of CSV files, attaching section rows to their matches."""
+    matches = []
+    byKey = {}
+    for section in ("matches", ) + FEED_SECTIONS:
+        fileName = os.path.join(directory, "%s.csv" % section)
+        if not os.path.exists(fileName):
+            if section == "matches":
+                raise FeedError("%s not found" % fileName)
+            continue
+        try:
+            csvFile = open(fileName, "rb")
+            try:
+                for line, row in enumerate(csv.DictReader(csvFile)):
+                    match = _text(row.get("match"))
+                    if section == "matches":
+                        if match is None:
+                            raise FeedError("%s, line %d: missing match key" % (fileName, line + 2))
+                        if match in byKey:
+                            raise FeedError("%s, line %d: duplicate match key %s" % (fileName, line + 2, match))
+                        record = dict((field, row.get(field)) for field in FEED_FIELDS["matches"])
+                        for name in FEED_SECTIONS:
+                            record[name] = []
+                        matches.append(record)
+                        byKey[match] = record
+                    elif match not in byKey:
+                        raise FeedError("%s, line %d: unknown match key %s" % (fileName, line + 2, match))
+                    else:
+                        byKey[match][section].append(row)
+            finally:
+                csvFile.close()
+        except (IOError, csv.Error), e:
+            raise FeedError("Cannot read %s: %s" % (fileName, e))
+    return matches
+
+
+class NameIndex(object):
+    """IDs of the rows of a table or view, indexed by name.
+
+    Arguments:
+        kind -- kind of row, used in error messages
+        table -- name of table or view
+        idColumn -- name of ID column
+        nameColumn -- name of name column
+        connectionName -- name of database connection (default connection if None)
+
+    """
+
+    def __init__(self, kind, table, idColumn, nameColumn, connectionName=None):
+        """Constructor for NameIndex class.  Reads table with one query."""
+        self.kind = kind
+        # names of rows: {ID: name}
+        self.labels = {}
+        # IDs of names: {name key: [ID, ...]}
+        self.ids = {}
+        for row_id, name in RowsQuery("SELECT %s, %s FROM %s" % (idColumn, nameColumn, table), (), connectionName):
+            row_id = row_id.toInt()[0]
+            name = unicode(name.toString())
+            self.labels[row_id] = name
+            self.ids.setdefault(_key(name), []).append(row_id)
+
+    def resolve(self, value):
+        """Returns ID (integer) of a name or numeric ID.
+
+        Raises FeedError if there is no such row, or if more than one row has the name.
+        """
+        text = _text(value)
+        if text is None:
+            raise FeedError("missing %s" % self.kind)
+        if text.isdigit():
+            if int(text) not in self.labels:
+                raise FeedError("unknown %s ID %s" % (self.kind, text))
+            return int(text)
+        ids = self.ids.get(_key(text), [])
+        if not ids:
+            raise FeedError("unknown %s '%s'" % (self.kind, text))
+        if len(ids) > 1:
+            raise FeedError("%s '%s' is ambiguous (IDs %s); give the ID instead" %
+                            (self.kind, text, ", ".join(str(row_id) for row_id in sorted(ids))))
+        return ids[0]
+
+
+class _PendingID(object):
+    """ID of a new row of a table, which is assigned when the IDs of the feed are reserved."""
+
+    __slots__ = ("table", "offset")
+
+    def __init__(self, table, offset):
+        self.table = table
+        self.offset = offset
+
+
+class FeedImporter(object):
+    """Imports matches of a feed into an FMRD database.
+
+    Arguments:
+        connectionName -- name of database connection (default connection if None)
+        chunkSize -- number of matches written in one transaction
+        progress -- function called with a status message as each chunk is written
+
+    """
+
+    def __init__(self, connectionName=None, chunkSize=CHUNK_SIZE, progress=None):
+        """Constructor for FeedImporter class."""
+        if connectionName is None:
+            self.db = QSqlDatabase.database()
+        else:
+            self.db = QSqlDatabase.database(connectionName)
+        self.connectionName = self.db.connectionName()
+        self.chunkSize = max(1, chunkSize)
+        self.progress = progress
+        self.indexes = {}
+        # numbers of new rows of the feed being resolved: {table: count}
+        self.pending = {}
+        self.existing = None
+        self.skipped = 0
+
+    def run(self, matches):
+        """Resolves and writes matches of a feed, as returned by ReadFeed().
+
+        Returns {table name: number of rows written}.  The number of matches that already
+        existed is in the skipped attribute.  Raises FeedError if a match cannot be resolved
+        or IDs cannot be reserved (nothing is written), or if a chunk cannot be written (earlier
+        chunks remain written).
+        """
+        self.pending = {}
+        resolved = []
+        for number, record in enumerate(matches):
+            try:
+                rows = self.resolveMatch(record)
+            except FeedError, e:
+                raise FeedError(u"Match %s: %s" % (_text(record.get("match")) or number + 1, unicode(e)))
+            if rows is not None:
+                resolved.append(rows)
+        self.assignIDs(resolved)
+
+        counts = {}
+        for start in range(0, len(resolved), self.chunkSize):
+            chunk = resolved[start:start + self.chunkSize]
+            if self.progress:
+                self.progress("Writing matches %d-%d of %d..." % (start + 1, start + len(chunk), len(resolved)))
+            self.writeChunk(chunk, counts)
+        return counts
+
+    # ------------------------------------------------------------
+    # resolution helpers
+
+    def resolve(self, kind, value):
+        """Returns ID of a name of a kind in NAME_INDEXES, reading the index on first use."""
+        if kind not in self.indexes:
+            table, idColumn, nameColumn = NAME_INDEXES[kind]
+            self.indexes[kind] = NameIndex(kind, table, idColumn, nameColumn, self.connectionName)
+        return self.indexes[kind].resolve(value)
+
+    def optional(self, kind, value):
+        """Returns ID of a name, or None if value is missing."""
+        if _text(value) is None:
+            return None
+        return self.resolve(kind, value)
+
+    def nextID(self, table):
+        """Returns placeholder of the ID of a new row of table, which is replaced by assignIDs()."""
+        offset = self.pending.get(table, 0)
+        self.pending[table] = offset + 1
+        return _PendingID(table, offset)
+
+    def assignIDs(self, resolved):
+        """Reserves IDs of the new rows of resolved matches and replaces their placeholders.
+
+        Raises FeedError if the IDs cannot be reserved.
+        """
+        starts = {}
+        for table in sorted(self.pending.keys()):
+            try:
+                starts[table] = ReserveIDs(table, self.pending[table], self.connectionName)
+            except IDAllocationError, e:
+                raise FeedError(unicode(e))
+        for rows in resolved:
+            for table, tableRows in rows.items():
+                rows[table] = [tuple(starts[value.table] + value.offset if isinstance(value, _PendingID) else value
+                                     for value in values) for values in tableRows]
+
+    def existingMatches(self):
+        """Returns set of (ISO date, home team ID, away team ID) of matches in the database."""
+        if self.existing is None:
+            dateColumn = self.db.record("tbl_matches").fieldName(MATCH_DATE_COLUMN)
+            rows = RowsQuery("SELECT m.%s, h.team_id, a.team_id FROM tbl_matches m, tbl_hometeams h, tbl_awayteams a "
+                             "WHERE h.match_id = m.match_id AND a.match_id = m.match_id" % dateColumn,
+                             (), self.connectionName)
+            self.existing = set((unicode(date.toDate().toString(Qt.ISODate)), home.toInt()[0], away.toInt()[0])
+                                for date, home, away in rows)
+        return self.existing
+
+    # ------------------------------------------------------------
+    # resolution of matches
+
+    def resolveMatch(self, record):
+        """Resolves match and its sections into rows of the written tables.
+
+        Returns {table: [row values, ...]}, or None if the match already exists.
+        """
+        date = QDate.fromString(_text(record.get("date")) or "", Qt.ISODate)
+        if not date.isValid():
+            raise FeedError("missing or invalid date '%s' (use YYYY-MM-DD)" % _text(record.get("date")))
+        home_id = self.resolve("team", record.get("home_team"))
+        away_id = self.resolve("team", record.get("away_team"))
+        if home_id == away_id:
+            raise FeedError("home and away team are the same")
+        key = (unicode(date.toString(Qt.ISODate)), home_id, away_id)
+        if key in self.existingMatches():
+            self.skipped += 1
+            return None
+        self.existing.add(key)
+
+        rows = dict((table, []) for table, numColumns in WRITE_ORDER)
+        match_id = self.nextID("tbl_matches")
+        phase_id = self.resolve("phase", record.get("phase"))
+        periods = [self._integer(record.get(field), field, DEFAULT_PERIODS[field])
+                   for field in ("first_half", "second_half", "first_extra", "second_extra")]
+        rows["tbl_matches"].append([match_id, date] + periods +
+                                   [self._integer(record.get("attendance"), "attendance", 0),
+                                    self.resolve("competition", record.get("competition")), phase_id,
+                                    self.resolve("venue", record.get("venue")),
+                                    self.resolve("referee", record.get("referee"))])
+        rows["tbl_hometeams"].append((match_id, home_id))
+        rows["tbl_awayteams"].append((match_id, away_id))
+        for field, table in (("home_manager", "tbl_homemanagers"), ("away_manager", "tbl_awaymanagers")):
+            manager_id = self.optional("manager", record.get(field))
+            if manager_id is not None:
+                rows[table].append((match_id, manager_id))
+
+        phase = self.indexes["phase"].labels[phase_id]
+        if phase == "League":
+            rows["tbl_leaguematches"].append((match_id, self.resolve("round", record.get("round"))))
+        elif phase == "Group":
+            rows["tbl_groupmatches"].append((match_id, self.resolve("group round", record.get("group_round")),
+                                             self.resolve("group", record.get("group")),
+                                             self.resolve("round", record.get("round"))))
+        elif phase == "Knockout":
+            rows["tbl_knockoutmatches"].append((match_id, self.resolve("knockout round", record.get("knockout_round")),
+                                                self.resolve("matchday", record.get("matchday"))))
+
+        self.resolveEnvironment(match_id, record, rows)
+        lineups = self.resolveLineups(match_id, (home_id, away_id), record.get("lineups", []), rows)
+        self.resolveEvents(record, lineups, rows)
+        self.resolveShootout(match_id, (home_id, away_id), record, lineups, rows)
+        return rows
+
+    def resolveEnvironment(self, match_id, record, rows):
+        """Resolves kickoff time, temperature and weather conditions of match, if any are given."""
+        fields = ("kickoff", "temperature", "weather_kickoff", "weather_halftime", "weather_fulltime")
+        if not [field for field in fields if _text(record.get(field)) is not None]:
+            return
+        kickoff = QVariant()
+        if _text(record.get("kickoff")) is not None:
+            kickoff = QTime.fromString(_text(record.get("kickoff")), "hh:mm")
+            if not kickoff.isValid():
+                raise FeedError("invalid kickoff time '%s' (use hh:mm)" % _text(record.get("kickoff")))
+        temperature = QVariant()
+        if _text(record.get("temperature")) is not None:
+            try:
+                temperature = float(_text(record.get("temperature")))
+            except ValueError:
+                raise FeedError("invalid temperature '%s'" % _text(record.get("temperature")))
+        enviro_id = self.nextID("tbl_environments")
+        rows["tbl_environments"].append((enviro_id, match_id, kickoff, temperature))
+        for field, table in (("weather_kickoff", "tbl_weatherkickoff"), ("weather_halftime", "tbl_weatherhalftime"),
+                             ("weather_fulltime", "tbl_weatherfulltime")):
+            weather_id = self.optional("weather", record.get(field))
+            if weather_id is not None:
+                rows[table].append((enviro_id, weather_id))
+
+    def resolveLineups(self, match_id, teamIDs, entries, rows):
+        """Resolves lineup entries of match.  Returns {(team ID, player ID): lineup ID}."""
+        lineups = {}
+        for entry in entries:
+            team_id = self.resolve("team", entry.get("team"))
+            if team_id not in teamIDs:
+                raise FeedError("lineup team %s does not play in match" % _text(entry.get("team")))
+            player_id = self.resolve("player", entry.get("player"))
+            if (team_id, player_id) in lineups:
+                raise FeedError("player %s is in lineup of team %s twice" %
+                                (_text(entry.get("player")), _text(entry.get("team"))))
+            lineup_id = lineups[(team_id, player_id)] = self.nextID("tbl_lineups")
+            rows["tbl_lineups"].append((lineup_id, match_id, team_id, player_id,
+                                        self.resolve("position", entry.get("position")),
+                                        self._flag(entry.get("starting"), "starting"),
+                                        self._flag(entry.get("captain"), "captain")))
+        return lineups
+
+    def resolveEvents(self, record, lineups, rows):
+        """Resolves goals, penalties, offenses, substitutions and position switches of match."""
+        for goal in record.get("goals", []):
+            team_id = self.resolve("team", goal.get("team"))
+            playerTeam = goal.get("player_team") if _text(goal.get("player_team")) is not None else goal.get("team")
+            rows["tbl_goals"].append((self.nextID("tbl_goals"), team_id,
+                                      self._lineup(lineups, playerTeam, goal.get("player")),
+                                      self.resolve("goal strike", goal.get("strike")),
+                                      self.resolve("goal event", goal.get("event"))) + self._time(goal))
+        for penalty in record.get("penalties", []):
+            rows["tbl_penalties"].append((self.nextID("tbl_penalties"),
+                                          self._lineup(lineups, penalty.get("team"), penalty.get("player")),
+                                          self.resolve("foul", penalty.get("foul")),
+                                          self.resolve("penalty outcome", penalty.get("outcome"))) + self._time(penalty))
+        for offense in record.get("offenses", []):
+            rows["tbl_offenses"].append((self.nextID("tbl_offenses"),
+                                         self._lineup(lineups, offense.get("team"), offense.get("player")),
+                                         self.resolve("foul", offense.get("foul")),
+                                         self.resolve("card", offense.get("card"))) + self._time(offense))
+        for substitution in record.get("substitutions", []):
+            subs_id = self.nextID("tbl_substitutions")
+            rows["tbl_substitutions"].append((subs_id, ) + self._time(substitution))
+            for field, table in (("player_in", "tbl_insubstitutions"), ("player_out", "tbl_outsubstitutions")):
+                if _text(substitution.get(field)) is not None:
+                    rows[table].append((subs_id, self._lineup(lineups, substitution.get("team"),
+                                                              substitution.get(field))))
+        for switch in record.get("switches", []):
+            rows["tbl_switchpositions"].append((self.nextID("tbl_switchpositions"),
+                                                self._lineup(lineups, switch.get("team"), switch.get("player")),
+                                                self.resolve("position", switch.get("position"))) + self._time(switch))
+
+    def resolveShootout(self, match_id, teamIDs, record, lineups, rows):
+        """Resolves penalty shootout opener and kicks of match."""
+        opener_id = self.optional("team", record.get("shootout_opener"))
+        if opener_id is not None:
+            if opener_id not in teamIDs:
+                raise FeedError("shootout opener %s does not play in match" % _text(record.get("shootout_opener")))
+            rows["tbl_penshootoutopeners"].append((match_id, opener_id))
+        for kick in record.get("shootouts", []):
+            rows["tbl_penaltyshootouts"].append((self.nextID("tbl_penaltyshootouts"),
+                                                 self._lineup(lineups, kick.get("team"), kick.get("player")),
+                                                 self.resolve("round", kick.get("round")),
+                                                 self.resolve("penalty outcome", kick.get("outcome"))))
+
+    def _lineup(self, lineups, team, player):
+        """Returns lineup ID of a team's player in the match."""
+        team_id = self.resolve("team", team)
+        player_id = self.resolve("player", player)
+        if (team_id, player_id) not in lineups:
+            raise FeedError("player %s is not in lineup of team %s" % (_text(player), _text(team)))
+        return lineups[(team_id, player_id)]
+
+    def _time(self, event):
+        """Returns (minute, stoppage time) of a match event."""
+        minute = self._integer(event.get("minute"), "minute")
+        if not 0 <= minute <= Constants.MAX_KO_MINUTES:
+            raise FeedError("invalid minute %d" % minute)
+        return (minute, self._integer(event.get("stoppage"), "stoppage", 0))
+
+    def _integer(self, value, field, default=None):
+        """Returns integer value of a field, or default if it is missing."""
+        text = _text(value)
+        if text is None:
+            if default is None:
+                raise FeedError("missing %s" % field)
+            return default
+        try:
+            return int(text)
+        except ValueError:
+            raise FeedError("invalid %s '%s'" % (field, text))
+
+    def _flag(self, value, field):
+        """Returns boolean value of a field (true/false, yes/no or 1/0; false if missing)."""
+        if isinstance(value, bool):
+            return value
+        text = _text(value)
+        if text is None or text.lower() in ("0", "false", "no", "n", "f"):
+            return False
+        if text.lower() in ("1", "true", "yes", "y", "t"):
+            return True
+        raise FeedError("invalid %s flag '%s'" % (field, text))
+
+    # ------------------------------------------------------------
+    # writing
+
+    def writeChunk(self, chunk, counts):
+        """Writes resolved matches inside one transaction and adds numbers of rows to counts."""
+        if not self.db.transaction():
+            raise FeedError("Cannot start transaction: %s" % self.db.lastError().text())
+        try:
+            for table, numColumns in WRITE_ORDER:
+                writer = TableWriter(self.db, table, numColumns)
+                for rows in chunk:
+                    for values in rows[table]:
+                        writer.add(*values)
+                writer.flush()
+                counts[table] = counts.get(table, 0) + writer.count
+        except GeneratorError, e:
+            self.db.rollback()
+            raise FeedError(unicode(e))
+        except:
+            self.db.rollback()
+            raise
+        if not self.db.commit():
+            # read the error before rollback() replaces it
+            error = self.db.lastError().text()
+            self.db.rollback()
+            raise FeedError("Cannot commit matches: %s" % error)
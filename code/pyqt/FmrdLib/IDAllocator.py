@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import Constants
+from FmrdLib.QueryCache import *
+
+"""Contains functions that allocate primary key IDs for new records in FMRD tables.
+
+Each session reserves a block of IDs per table and hands them out without querying the
+table.  Blocks are reserved from a native sequence on PostgreSQL (one per table, named
+<table>_id_seq, created with INCREMENT BY the block size) and from the fmrd_idallocation
+table on other databases, so that two sessions never receive the same ID.  IDs that
+are reserved but not used are skipped.  A sequence that already exists keeps its own
+increment, and blocks are reserved in multiples of it.
+
+A sequence or allocation row is created the first time a table needs IDs, starting at the
+larger of the table's minimum ID (Constants.Min*ID) and one past its highest existing ID.
+Auxiliary tables are not allocated: their next ID is one past their highest existing ID, so
+that an ID taken by an add that is cancelled is handed out again.  Several dialogs rely on
+consecutive IDs in them (e.g. shootout rounds).
+
+Classes:
+IDAllocationError -- exception raised when IDs cannot be reserved
+
+Functions:
+NextID -- return next free ID of a table
+ReserveIDs -- reserve a contiguous range of IDs of a table
+SynchronizeIDs -- advance allocators past IDs written outside the allocator
+ResetIDAllocator -- discard reserved blocks of one or all connections
+"""
+
+ALLOCATION_TABLE = "fmrd_idallocation"
+
+# allocated tables: {table: (ID column, minimum ID, block size)}
+# (block size None: next ID is read from the table, not reserved)
+_tables = {
+    # match and event tables
+    "tbl_matches": ("match_id", Constants.MinMatchID, Constants.ID_BLOCK_SIZE),
+    "tbl_environments": ("enviro_id", Constants.MinEnviroID, Constants.ID_BLOCK_SIZE),
+    "tbl_lineups": ("lineup_id", Constants.MinLineupID, Constants.ID_BLOCK_SIZE),
+    "tbl_goals": ("goal_id", Constants.MinGoalID, Constants.ID_BLOCK_SIZE),
+    "tbl_offenses": ("offense_id", Constants.MinOffenseID, Constants.ID_BLOCK_SIZE),
+    "tbl_penalties": ("penalty_id", Constants.MinPenaltyID, Constants.ID_BLOCK_SIZE),
+    "tbl_penaltyshootouts": ("penshootout_id", Constants.MinShootoutID, Constants.ID_BLOCK_SIZE),
+    "tbl_substitutions": ("subs_id", Constants.MinSubstitutionID, Constants.ID_BLOCK_SIZE),
+    "tbl_switchpositions": ("switch_id", Constants.MinSwitchID, Constants.ID_BLOCK_SIZE),
+    # personnel and overview tables
+    "tbl_managers": ("manager_id", Constants.MinManagerID, Constants.ID_BLOCK_SIZE),
+    "tbl_referees": ("referee_id", Constants.MinRefereeID, Constants.ID_BLOCK_SIZE),
+    "tbl_players": ("player_id", Constants.MinPlayerID, Constants.ID_BLOCK_SIZE),
+    "tbl_playerhistory": ("playerhistory_id", Constants.MinPlayerHistoryID, Constants.ID_BLOCK_SIZE),
+    "tbl_competitions": ("competition_id", Constants.MinCompetitionID, Constants.ID_BLOCK_SIZE),
+    "tbl_teams": ("team_id", Constants.MinTeamID, Constants.ID_BLOCK_SIZE),
+    "tbl_venues": ("venue_id", Constants.MinVenueID, Constants.ID_BLOCK_SIZE),
+    "tbl_venuehistory": ("venuehistory_id", Constants.MinVenueHistoryID, Constants.ID_BLOCK_SIZE),
+    # auxiliary tables
+    "tbl_cards": ("card_id", Constants.MinCardID, None),
+    "tbl_fouls": ("foul_id", Constants.MinFoulID, None),
+    "tbl_groups": ("group_id", Constants.MinGroupID, None),
+    "tbl_matchdays": ("matchday_id", Constants.MinMatchdayID, None),
+    "tbl_grouprounds": ("grpround_id", Constants.MinGroupRoundID, None),
+    "tbl_knockoutrounds": ("koround_id", Constants.MinKnockoutRoundID, None),
+    "tbl_phases": ("phase_id", Constants.MinPhaseID, None),
+    "tbl_penoutcomes": ("penoutcome_id", Constants.MinPenOutcomeID, None),
+    "tbl_goalevents": ("gtetype_id", Constants.MinGoalEventID, None),
+    "tbl_goalstrikes": ("gtstype_id", Constants.MinGoalStrikeID, None),
+    "tbl_fieldnames": ("posfield_id", Constants.MinFieldID, None),
+    "tbl_flanknames": ("posflank_id", Constants.MinFlankID, None),
+    "tbl_positions": ("position_id", Constants.MinPositionID, None),
+    "tbl_countries": ("country_id", Constants.MinCountryID, None),
+    "tbl_confederations": ("confed_id", Constants.MinConfedID, None),
+    "tbl_timezones": ("timezone_id", Constants.MinTimeZoneID, None),
+    "tbl_venuesurfaces": ("venuesurface_id", Constants.MinSurfaceID, None),
+    "tbl_rounds": ("round_id", Constants.MinRoundID, None),
+    "tbl_weather": ("weather_id", Constants.MinWeatherID, None),
+}
+
+# attempts to take the allocation table's write lock while another session holds it
+BUSY_RETRIES = 3
+BUSY_WAIT = 0.2
+
+# SQLite result codes of a database locked by another connection (SQLITE_BUSY, SQLITE_LOCKED)
+_busyCodes = (5, 6)
+
+# attempts to reserve a contiguous range of several sequence blocks while other sessions reserve IDs
+SEQUENCE_RETRIES = 10
+
+# reserved blocks: {connection name: {table: [next ID, end of block]}}
+_blocks = {}
+# connections whose allocation table is known to exist: {connection name: set of tables}
+_initialized = {}
+# increments of sequences that are known to exist: {connection name: {table: increment}}
+_increments = {}
+
+class IDAllocationError(Exception):
+    """Exception raised when IDs of a table cannot be reserved.
+
+    The failure is also held as a QSqlError in its error attribute, for the dialogs' error prompts.
+
+    Arguments:
+        table -- table name
+        reason -- QSqlError of the failing statement, or description of the failure
+
+    """
+
+    def __init__(self, table, reason):
+        """Constructor for IDAllocationError class."""
+        number = -1
+        if isinstance(reason, QSqlError):
+            number, reason = reason.number(), reason.text()
+        message = u"Cannot reserve IDs of %s: %s" % (table, reason)
+        super(IDAllocationError, self).__init__(message)
+        self.error = QSqlError(message, QString(), QSqlError.UnknownError, number)
+
+
+def _connection(connectionName):
+    """Returns database connection object, using default connection if no name is given."""
+    if connectionName is None:
+        return QSqlDatabase.database()
+    return QSqlDatabase.database(connectionName)
+
+def _sequenceName(table):
+    return "%s_id_seq" % table
+
+def _firstFreeID(db, table):
+    """Returns larger of minimum ID and one past highest ID in table.
+
+    Called when an allocator is created, and for every new record of an auxiliary table.
+    """
+    column, minID, size = _tables[table]
+    maxID = ScalarQuery("SELECT MAX(%s) FROM %s" % (column, table), (), db.connectionName()).toInt()[0]
+    return max(int(minID), maxID + 1)
+
+def _reserveFromSequence(db, table, count):
+    """Reserves IDs from PostgreSQL sequence of table, creating the sequence on first use.
+
+    Returns first ID of a range of whole blocks of the sequence's increment.  Ranges larger
+    than the increment are reserved in several blocks, which are contiguous only if no other
+    session reserves IDs at the same time; they are retried SEQUENCE_RETRIES times.
+    """
+    connName = db.connectionName()
+    column, minID, size = _tables[table]
+    sequence = _sequenceName(table)
+    increments = _increments.setdefault(unicode(connName), {})
+    if table not in increments:
+        exists = ScalarQuery("SELECT COUNT(*) FROM pg_class WHERE relkind = 'S' AND relname = ?",
+                             (sequence, ), connName).toInt()[0]
+        if not exists:
+            # a concurrent session may create the sequence first; its increment is read below
+            ExecQuery("CREATE SEQUENCE %s INCREMENT BY %d MINVALUE %d START WITH %d" %
+                      (sequence, size, int(minID), _firstFreeID(db, table)), (), connName)
+        # the sequence may have been created with another block size, or by hand
+        increment = ScalarQuery("SELECT increment FROM information_schema.sequences WHERE sequence_name = ?",
+                                (sequence, ), connName).toInt()[0]
+        if increment <= 0:
+            raise IDAllocationError(table, "sequence %s has no positive increment" % sequence)
+        increments[table] = increment
+    increment = increments[table]
+
+    numBlocks = (count + increment - 1) // increment
+    nextval = "SELECT nextval('%s')" % sequence
+    for attempt in range(SEQUENCE_RETRIES):
+        values = [ScalarQuery(nextval, (), connName) for k in range(numBlocks)]
+        if [value for value in values if not value.isValid()]:
+            raise IDAllocationError(table, QueryError(nextval, connName))
+        starts = [value.toInt()[0] for value in values]
+        if starts == range(starts[0], starts[0] + numBlocks * increment, increment):
+            return starts[0]
+    raise IDAllocationError(table, "no %d consecutive IDs, as other sessions are reserving IDs" % count)
+
+def _beginImmediate(db, table):
+    """Takes the write lock with an immediate transaction before the allocation row is read.
+
+    Returns True if the transaction was started, or False inside an enclosing transaction, 
+    which holds the lock instead.  Retries while another session holds the lock, and raises
+    IDAllocationError if it is not released.
+    """
+    for attempt in range(BUSY_RETRIES + 1):
+        query = QSqlQuery(db)
+        if query.exec_("BEGIN IMMEDIATE"):
+            return True
+        error = query.lastError()
+        if unicode(error.databaseText()).find("within a transaction") >= 0:
+            return False
+        if error.number() not in _busyCodes:
+            raise IDAllocationError(table, error)
+        if attempt < BUSY_RETRIES:
+            time.sleep(BUSY_WAIT)
+    raise IDAllocationError(table, error)
+
+def _reserveFromTable(db, table, count):
+    """Reserves count IDs from allocation table, creating the table or the table's row on first use.
+
+    Returns first ID of the reserved range.
+    """
+    connName = db.connectionName()
+    known = _initialized.setdefault(unicode(connName), set())
+    if ALLOCATION_TABLE not in known:
+        ExecQuery("CREATE TABLE IF NOT EXISTS %s (table_name VARCHAR(64) PRIMARY KEY, next_id INTEGER NOT NULL)" %
+                  ALLOCATION_TABLE, (), connName)
+        known.add(ALLOCATION_TABLE)
+
+    began = _beginImmediate(db, table)
+    update = "UPDATE %s SET next_id = next_id + ? WHERE table_name = ?" % ALLOCATION_TABLE
+    select = "SELECT next_id FROM %s WHERE table_name = ?" % ALLOCATION_TABLE
+    insert = "INSERT INTO %s (table_name, next_id) VALUES (?, ?)" % ALLOCATION_TABLE
+    failed = None
+    if not ExecQuery(update, (count, table), connName):
+        failed = update
+    else:
+        value = ScalarQuery(select, (table, ), connName)
+        if value.isValid():
+            start = value.toInt()[0] - count
+        elif QueryError(select, connName).isValid():
+            failed = select
+        else:
+            start = _firstFreeID(db, table)
+            if not ExecQuery(insert, (table, start + count), connName):
+                failed = insert
+    if failed is None and began and not ExecQuery("COMMIT", (), connName):
+        failed = "COMMIT"
+    if failed is not None:
+        error = QueryError(failed, connName)
+        if began:
+            ExecQuery("ROLLBACK", (), connName)
+        raise IDAllocationError(table, error)
+    return start
+
+def ReserveIDs(table, count, connectionName=None):
+    """Reserves count consecutive IDs of table and returns the first one (integer).
+
+    The reserved IDs are not handed out by NextID.  Used for bulk inserts.  Raises 
+    IDAllocationError if the IDs cannot be reserved.
+    """
+    db = _connection(connectionName)
+    if table not in _tables or _tables[table][2] is None:
+        raise KeyError("No ID allocator for table %s" % table)
+    if db.driverName() == "QPSQL":
+        return _reserveFromSequence(db, table, count)
+    return _reserveFromTable(db, table, count)
+
+def NextID(table, connectionName=None):
+    """Returns next free ID of table as a QString.
+
+    Raises IDAllocationError if a block of IDs cannot be reserved.
+
+    Arguments:
+        table -- table name (one of the tables with an ID allocator)
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    db = _connection(connectionName)
+    size = _tables[table][2]
+    if size is None:
+        return QString.number(_firstFreeID(db, table))
+    blocks = _blocks.setdefault(unicode(db.connectionName()), {})
+    block = blocks.get(table)
+    if block is None or block[0] >= block[1]:
+        start = ReserveIDs(table, size, connectionName)
+        block = blocks[table] = [start, start + size]
+    value = block[0]
+    block[0] += 1
+    return QString.number(value)
+
+def SynchronizeIDs(connectionName=None):
+    """Advances allocators of all tables past their highest existing IDs.
+
+    Must be called after records have been written without the allocator (e.g. bulk loads
+    with explicit IDs).  Blocks reserved by this session are discarded.
+    """
+    db = _connection(connectionName)
+    connName = db.connectionName()
+    ResetIDAllocator(connName)
+    for table in sorted(_tables.keys()):
+        if _tables[table][2] is None:
+            continue
+        if db.driverName() == "QPSQL":
+            sequence = _sequenceName(table)
+            if ScalarQuery("SELECT COUNT(*) FROM pg_class WHERE relkind = 'S' AND relname = ?",
+                           (sequence, ), connName).toInt()[0]:
+                nextID = _firstFreeID(db, table)
+                current = ScalarQuery("SELECT last_value FROM %s" % sequence, (), connName).toInt()[0]
+                if current < nextID:
+                    ExecQuery("SELECT setval('%s', %d, false)" % (sequence, nextID), (), connName)
+        elif db.tables().contains(ALLOCATION_TABLE):
+            ExecQuery("UPDATE %s SET next_id = ? WHERE table_name = ? AND next_id < ?" % ALLOCATION_TABLE,
+                      (_firstFreeID(db, table), table, _firstFreeID(db, table)), connName)
+
+def ResetIDAllocator(connectionName=None):
+    """Discards reserved blocks of a database connection, or of all connections if no name is given.
+
+    Must be called when a connection is (re)opened.
+    """
+    if connectionName is None:
+        _blocks.clear()
+        _initialized.clear()
+        _increments.clear()
+    else:
+        _blocks.pop(unicode(connectionName), None)
+        _initialized.pop(unicode(connectionName), None)
+        _increments.pop(unicode(connectionName), None)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import Constants
+from FmrdLib.QueryCache import *
+
+"""Contains the readiness summary of match lineups.
+
+A lineup is ready for match event entry when it has exactly MAX_TEAM_STARTERS starting
+players, MAX_TEAM_STARTING_CAPTAINS starting captains and MAX_TEAM_STARTING_GOALKEEPERS
+starting goalkeepers.  The counts of a lineup are taken with one aggregate query, and are
+then adjusted in memory as lineup entries are saved or deleted.  The lineups of every
+match in the database are checked with one grouped query over the Lineups table.
+
+Classes:
+LineupSummary -- starter, substitute, captain and goalkeeper counts of a lineup
+ReadinessError -- exception raised when lineups of all matches cannot be checked
+
+Functions:
+LineupReadinessReport -- return lineups of all matches that are not ready
+ReadinessReportLines -- return report as lines of text
+"""
+
+# name of goalkeeper position in positions_list
+GOALKEEPER = "Goalkeeper"
+
+# aggregate columns of lineup counts, in order of LineupSummary.COUNTS
+SUMMARY_COLUMNS = ("SUM(CASE WHEN lp_starting THEN 1 ELSE 0 END) AS starters, "
+                   "SUM(CASE WHEN NOT lp_starting THEN 1 ELSE 0 END) AS substitutes, "
+                   "SUM(CASE WHEN lp_starting AND lp_captain THEN 1 ELSE 0 END) AS captains, "
+                   "SUM(CASE WHEN lp_starting AND position_id IN "
+                   "(SELECT position_id FROM positions_list WHERE position_name = ?) THEN 1 ELSE 0 END) AS goalkeepers")
+
+
+class ReadinessError(Exception):
+    """Exception raised when the lineup readiness query fails.  The QSqlError is held in its error attribute."""
+
+    def __init__(self, error):
+        """Constructor for ReadinessError class."""
+        super(ReadinessError, self).__init__(unicode(error.text()))
+        self.error = error
+
+
+class LineupSummary(object):
+    """Counts of starters, substitutes, starting captains and starting goalkeepers in the lineup of a team in a match.
+
+    Arguments:
+        match_id -- ID of match
+        team_id -- ID of team
+        connectionName -- name of database connection (default connection if None)
+
+    """
+
+    COUNTS = ("starters", "substitutes", "captains", "goalkeepers")
+
+    def __init__(self, match_id, team_id, connectionName=None):
+        """Constructor for LineupSummary class."""
+        self.match_id = match_id
+        self.team_id = team_id
+        self.connectionName = connectionName
+        self.load()
+
+    def load(self):
+        """Reads counts of lineup with one aggregate query."""
+        rows = RowsQuery("SELECT %s FROM tbl_lineups WHERE match_id = ? AND team_id = ?" % SUMMARY_COLUMNS,
+                         (GOALKEEPER, self.match_id, self.team_id), self.connectionName)
+        values = rows[0] if rows else [QVariant()] * len(LineupSummary.COUNTS)
+        for name, value in zip(LineupSummary.COUNTS, values):
+            setattr(self, name, value.toInt()[0])
+
+    def adjust(self, entry, delta):
+        """Adjusts counts for a lineup entry that has been written (delta 1) or removed (delta -1).
+
+        Argument:
+            entry -- (starting, captain, position name) of lineup entry, as returned by EntryFlags()
+
+        """
+        starting, captain, position = entry
+        if starting:
+            self.starters += delta
+            if captain:
+                self.captains += delta
+            if position == GOALKEEPER:
+                self.goalkeepers += delta
+        else:
+            self.substitutes += delta
+
+    def replace(self, previous, current):
+        """Adjusts counts for a lineup entry that has been saved.
+
+        Arguments:
+            previous -- entry before it was saved, or None if it was inserted
+            current -- entry after it was saved
+
+        """
+        if previous is not None:
+            self.adjust(previous, -1)
+        self.adjust(current, 1)
+
+    def isReady(self):
+        """Returns True if lineup has the required numbers of starters, captains and goalkeepers."""
+        return (self.starters == Constants.MAX_TEAM_STARTERS and
+                self.captains == Constants.MAX_TEAM_STARTING_CAPTAINS and
+                self.goalkeepers == Constants.MAX_TEAM_STARTING_GOALKEEPERS)
+
+    @staticmethod
+    def EntryFlags(starting, captain, position):
+        """Returns (starting, captain, position name) of a lineup entry as used by adjust().
+
+        Arguments:
+            starting -- starting player flag (QVariant or bool)
+            captain -- captain flag (QVariant or bool)
+            position -- name of position (QVariant, QString or string)
+
+        """
+        return (QVariant(starting).toBool(), QVariant(captain).toBool(), unicode(QVariant(position).toString()))
+
+
+def LineupReadinessReport(connectionName=None):
+    """Returns lineups of all matches that do not have the required numbers of starters, captains and goalkeepers.
+
+    Lineups are counted with one grouped query over the Lineups table.  Teams of a match 
+    (home or away) with no lineup entries are reported with zero counts.
+
+    Argument:
+        connectionName -- name of database connection (default connection if None)
+
+    Returns list of (match_id, team_id, team name, starters, substitutes, captains, goalkeepers),
+    in order of match and team.  Raises ReadinessError if the query fails, so that a database
+    that cannot be checked is not reported as ready.
+    """
+    sql = ("SELECT r.match_id, r.team_id, t.tm_name, r.starters, r.substitutes, r.captains, r.goalkeepers FROM "
+           "(SELECT match_id, team_id, %s FROM tbl_lineups GROUP BY match_id, team_id "
+           "UNION ALL "
+           "SELECT m.match_id, m.team_id, 0, 0, 0, 0 FROM "
+           "(SELECT match_id, team_id FROM tbl_hometeams UNION ALL SELECT match_id, team_id FROM tbl_awayteams) m "
+           "WHERE NOT EXISTS (SELECT 1 FROM tbl_lineups l WHERE l.match_id = m.match_id AND l.team_id = m.team_id)) r "
+           "JOIN tbl_teams t ON t.team_id = r.team_id "
+           "WHERE r.starters <> ? OR r.captains <> ? OR r.goalkeepers <> ? "
+           "ORDER BY r.match_id, r.team_id" % SUMMARY_COLUMNS)
+    params = (GOALKEEPER, Constants.MAX_TEAM_STARTERS, Constants.MAX_TEAM_STARTING_CAPTAINS,
+              Constants.MAX_TEAM_STARTING_GOALKEEPERS)
+    rows = RowsQuery(sql, params, connectionName)
+    error = QueryError(sql, connectionName)
+    if error.isValid():
+        raise ReadinessError(error)
+    report = []
+    for row in rows:
+        report.append((row[0].toInt()[0], row[1].toInt()[0], unicode(row[2].toString())) +
+                      tuple(value.toInt()[0] for value in row[3:]))
+    return report
+
+def ReadinessReportLines(report):
+    """Returns lineup readiness report as list of lines of text, one per lineup that is not ready."""
+    lines = []
+    for match_id, team_id, teamName, starters, substitutes, captains, goalkeepers in report:
+        lines.append(u"Match %d, %s (team %d): %d of %d starters, %d of %d captains, %d of %d goalkeepers, %d substitutes" %
+                     (match_id, teamName, team_id, starters, Constants.MAX_TEAM_STARTERS,
+                      captains, Constants.MAX_TEAM_STARTING_CAPTAINS,
+                      goalkeepers, Constants.MAX_TEAM_STARTING_GOALKEEPERS, substitutes))
+    return lines
@@ -82,17 +82,51 @@ def LineupErrorPrompt(parent):
                          <b>ONE</b> is designated captain<br>
                          <b>ONE</b> is designated goalkeeper""", QMessageBox.Close)
 
-def DeletionErrorPrompt(parent):
-    """Displays pop-up message box to alert user of existing records that depend on parent record to be deleted."""
+def LineupReadinessPrompt(parent, lines):
+    """Displays pop-up message box with lineup readiness report, listing lineups that are not ready in its details."""
+    box = QMessageBox(parent)
+    box.setWindowTitle("Lineup Readiness Report")
+    if lines:
+        box.setIcon(QMessageBox.Warning)
+        box.setText("""<b>%d</b> match lineups do not have exactly <b>11</b> starting players, of which<br>
+                    <b>ONE</b> is designated captain<br>
+                    <b>ONE</b> is designated goalkeeper""" % len(lines))
+        box.setDetailedText("\n".join(lines))
+    else:
+        box.setIcon(QMessageBox.Information)
+        box.setText("All match lineups are complete.")
+    box.setStandardButtons(QMessageBox.Close)
+    box.exec_()
+
+def DeletionErrorPrompt(parent, counts=None):
+    """Displays pop-up message box to alert user of existing records that depend on parent record to be deleted.
+    
+    If counts ({child table: number of records}) is given, the dependent records are listed by table.
+    If counts is None, the dependent records could not be checked and the user is told so.
+    """
+    if counts is None:
+        QMessageBox.critical(parent, "Cannot Delete Record", 
+                             """Records that depend on this record could not be checked, 
+                             as the foreign keys of the database could not be read.<br>
+                             The record has not been deleted.""", QMessageBox.Close)
+        return
+    details = ""
+    if counts:
+        details = "<br>" + "<br>".join("-- %d in %s" % (counts[table], table) for table in sorted(counts.keys()))
     QMessageBox.critical(parent, "Cannot Delete Record", 
-                         """There are records in child tables dependent on this record.<br>
-                         Please delete child records that refer to this record first.""", QMessageBox.Close)
+                         """There are records in child tables dependent on this record.%s<br>
+                         Please delete child records that refer to this record first.""" % details, QMessageBox.Close)
 
 def DatabaseCommitErrorPrompt(parent, error):
     """Displays pop-up message box to alert user of database record commit error."""
     QMessageBox.critical(parent, "Database Commit Error", 
                          """Error Code %d: %s""" % (error.number(), error.text()), QMessageBox.Close)
                          
+def DatabaseQueryErrorPrompt(parent, error):
+    """Displays pop-up message box to alert user of database query error."""
+    QMessageBox.critical(parent, "Database Query Error", 
+                         """Error Code %d: %s""" % (error.number(), error.text()), QMessageBox.Close)
+
 def DuplicateRecordErrorPrompt(parent, table, desc):
     """Displays pop-up message box to alert user of identical record already in database."""
     QMessageBox.critical(parent, "Identical Record in Database", 
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import TableChanges
+from FmrdLib.QueryExecutor import (ConnectionSettings, OpenConnection)
+from FmrdLib.ReferenceData import (ReferenceQuery, StoreReferenceData)
+
+"""Contains the thread that loads reference data in the background after login.
+
+While the switchboard waits for the operator, a worker thread opens its own connection to
+the database (Qt connections may only be used by the thread that created them) and reads
+the tables that data entry dialogs list in their comboboxes.  Reference tables are handed
+to the GUI thread and stored in the reference data cache (see ReferenceData), so the first
+dialog opened finds them there.  Tables that dialogs read through their own SQL models
+(referees, venues and match lists) are read through once, which warms the database's caches.
+
+Progress is reported with the progress(QString) signal and completion with the
+done(QString) signal.  cancel() stops the thread at the next table, or within a table after
+a batch of rows; it is called when the operator opens a dialog.
+
+Classes:
+Prewarmer -- thread that loads reference data on a background connection
+"""
+
+CONNECTION_NAME = "fmrd_prewarm"
+
+# tables stored in reference data cache: [(table, sort column used by dialogs)]
+REFERENCE_TABLES = [
+    ("tbl_competitions", 0),
+    ("tbl_teams", 1),
+    ("managers_list", 2),
+    ("tbl_phases", 0),
+    ("tbl_rounds", 1),
+    ("tbl_grouprounds", 0),
+    ("tbl_groups", 1),
+    ("tbl_knockoutrounds", 0),
+    ("tbl_matchdays", 1),
+    ("tbl_confederations", 0),
+    ("tbl_weather", 1),
+]
+
+# tables and views read through to warm database caches
+WARM_TABLES = ["referees_list", "tbl_venues", "league_match_list", "group_match_list", "knockout_match_list"]
+
+# rows read between checks for cancellation
+BATCH_SIZE = 200
+
+def _label(table):
+    """Returns name of table as shown to operator, e.g. "managers" for managers_list."""
+    label = unicode(table)
+    if label.startswith("tbl_"):
+        label = label[4:]
+    if label.endswith("_list"):
+        label = label[:-5]
+    return label.replace("_", " ")
+
+
+class Prewarmer(QThread):
+    """Thread that loads reference data on its own database connection.
+
+    The connection is opened with the settings of the default connection.
+
+    Arguments:
+        parent -- parent object (e.g. switchboard)
+
+    Inherits QThread.
+    """
+
+    def __init__(self, parent=None):
+        """Constructor for Prewarmer class."""
+        super(Prewarmer, self).__init__(parent)
+        # settings of the default connection, which must only be read in the GUI thread
+        self.settings = ConnectionSettings()
+        self.cancelled = False
+        self.snapshot = None
+        self.connect(self, SIGNAL("tableLoaded(PyQt_PyObject)"), self.storeTable)
+
+    def start(self):
+        """Starts loading reference data, unless it has been cancelled."""
+        if self.cancelled or self.isRunning():
+            return
+        # tables written while they are loaded are read again on use
+        self.snapshot = TableChanges.Snapshot()
+        QThread.start(self, QThread.LowPriority)
+
+    def cancel(self, *args):
+        """Stops loading reference data as soon as possible.  Tables already loaded are kept."""
+        self.cancelled = True
+
+    def stop(self):
+        """Cancels loading and waits for the thread to finish (e.g. when the application exits)."""
+        self.cancel()
+        self.wait()
+
+    def storeTable(self, loaded):
+        """Stores a table loaded by the thread in the reference data cache.  Runs in the GUI thread."""
+        table, sortColumn, fields, rows = loaded
+        StoreReferenceData(table, sortColumn, fields, rows, self.snapshot)
+
+    def run(self):
+        """Loads tables on a background connection, which is removed when done."""
+        started = time.time()
+        try:
+            message = self.load()
+        finally:
+            QSqlDatabase.removeDatabase(CONNECTION_NAME)
+        if message is None:
+            message = QString("Reference data loaded (%1 s)").arg(time.time() - started, 0, "f", 1)
+        self.emit(SIGNAL("done(QString)"), message)
+
+    def load(self):
+        """Reads tables.  Returns message if loading did not complete, None otherwise."""
+        db = OpenConnection(self.settings, CONNECTION_NAME)
+        if not db.isOpen():
+            return QString("Reference data not loaded: %1").arg(db.lastError().text())
+        try:
+            steps = len(REFERENCE_TABLES) + len(WARM_TABLES)
+            for step, (table, sortColumn) in enumerate(REFERENCE_TABLES):
+                self.emit(SIGNAL("progress(QString)"), QString("Loading %1 (%2 of %3)...").arg(
+                    _label(table)).arg(step + 1).arg(steps))
+                if db.record(table).count() <= sortColumn:
+                    # missing table or view: nothing to load
+                    continue
+                fields, sql = ReferenceQuery(db, table, sortColumn)
+                rows = self.readRows(db, sql, fields.count())
+                if rows is None:
+                    return QString()
+                self.emit(SIGNAL("tableLoaded(PyQt_PyObject)"), (table, sortColumn, fields, rows))
+            for step, table in enumerate(WARM_TABLES):
+                self.emit(SIGNAL("progress(QString)"), QString("Loading %1 (%2 of %3)...").arg(
+                    _label(table)).arg(len(REFERENCE_TABLES) + step + 1).arg(steps))
+                if self.readRows(db, "SELECT * FROM %s" % table, 0) is None:
+                    return QString()
+        finally:
+            db.close()
+        return None
+
+    def readRows(self, db, sql, columns):
+        """Returns rows of SELECT statement, or None if cancelled.
+
+        Arguments:
+            db -- database connection of thread
+            sql -- SELECT statement
+            columns -- number of columns kept in each row (list of QVariants); rows are only
+                       read through if zero, and an empty list is returned
+
+        """
+        rows = []
+        if self.cancelled:
+            return None
+        query = QSqlQuery(db)
+        query.setForwardOnly(True)
+        if not query.exec_(sql):
+            # missing table or view: nothing to load
+            return rows
+        count = 0
+        while query.next():
+            if columns:
+                rows.append([query.value(k) for k in range(columns)])
+            count += 1
+            if count % BATCH_SIZE == 0 and self.cancelled:
+                query.finish()
+                return None
+        query.finish()
+        return rows
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import (QueryStats, TableChanges)
+
+"""Contains functions that execute parameterized SQL statements through a cache of prepared queries.
+
+Prepared statements are held per database connection and keyed by their SQL text, so a
+lookup that is repeated (e.g. in a delegate's setEditorData) is parsed once and afterwards
+costs only an execute.  All values are passed as bound parameters.
+
+Results are read in full before a function returns, because the same prepared statement
+may be re-executed by the next caller.  Execution time and row counts are passed to
+QueryStats when query instrumentation is switched on, and successful writes are counted by
+TableChanges.
+
+Functions:
+PreparedQuery -- return cached prepared query for SQL text
+ExecQuery -- execute statement that returns no rows (INSERT/UPDATE/DELETE)
+AffectedRowsQuery -- execute statement that returns no rows and return number of rows it changed
+ScalarQuery -- execute statement and return first column of first row
+ColumnQuery -- execute statement and return first column of all rows
+RowsQuery -- execute statement and return all rows
+QueryError -- return error of last execution of a statement
+ClearQueryCache -- discard prepared queries of one or all connections
+"""
+
+# prepared queries: {connection name: {SQL text: QSqlQuery}}
+_statementCache = {}
+
+def _connection(connectionName):
+    """Returns database connection object, using default connection if no name is given."""
+    if connectionName is None:
+        return QSqlDatabase.database()
+    return QSqlDatabase.database(connectionName)
+
+def PreparedQuery(sql, connectionName=None):
+    """Returns prepared QSqlQuery object for SQL statement, preparing it on first use.
+
+    Arguments:
+        sql -- SQL statement with positional (?) placeholders (string)
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    db = _connection(connectionName)
+    statements = _statementCache.setdefault(unicode(db.connectionName()), {})
+    key = unicode(sql)
+    query = statements.get(key)
+    if query is None:
+        query = QSqlQuery(db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            return query
+        statements[key] = query
+    return query
+
+def _execute(sql, params, connectionName):
+    """Binds parameters to cached query and executes it.  Returns executed query, or None on failure."""
+    query = PreparedQuery(sql, connectionName)
+    for pos, value in enumerate(params):
+        if not isinstance(value, QVariant):
+            value = QVariant(value)
+        query.bindValue(pos, value)
+    if not query.exec_():
+        query.finish()
+        return None
+    return query
+
+def ExecQuery(sql, params=(), connectionName=None):
+    """Executes SQL statement that returns no rows.  Returns True if successful."""
+    return AffectedRowsQuery(sql, params, connectionName) >= 0
+
+def AffectedRowsQuery(sql, params=(), connectionName=None):
+    """Executes SQL statement that returns no rows.  Returns number of rows affected, or -1 if it fails."""
+    started = QueryStats.StartTimer()
+    query = _execute(sql, params, connectionName)
+    if query is None:
+        QueryStats.RecordQuery(sql, started, 0)
+        return -1
+    count = max(query.numRowsAffected(), 0)
+    QueryStats.RecordQuery(sql, started, count)
+    query.finish()
+    TableChanges.RecordStatement(sql)
+    return count
+
+def ScalarQuery(sql, params=(), connectionName=None):
+    """Executes SQL statement and returns first column of first row as QVariant.
+
+    Returns an invalid QVariant if the statement fails or returns no rows.
+    """
+    started = QueryStats.StartTimer()
+    value = QVariant()
+    query = _execute(sql, params, connectionName)
+    if query is not None:
+        if query.next():
+            value = query.value(0)
+        query.finish()
+    QueryStats.RecordQuery(sql, started, int(value.isValid()))
+    return value
+
+def ColumnQuery(sql, params=(), connectionName=None):
+    """Executes SQL statement and returns first column of every row as a list of QVariants."""
+    started = QueryStats.StartTimer()
+    values = []
+    query = _execute(sql, params, connectionName)
+    if query is not None:
+        while query.next():
+            values.append(query.value(0))
+        query.finish()
+    QueryStats.RecordQuery(sql, started, len(values))
+    return values
+
+def RowsQuery(sql, params=(), connectionName=None):
+    """Executes SQL statement and returns every row as a list of QVariants."""
+    started = QueryStats.StartTimer()
+    rows = []
+    query = _execute(sql, params, connectionName)
+    if query is not None:
+        numFields = query.record().count()
+        while query.next():
+            rows.append([query.value(k) for k in range(numFields)])
+        query.finish()
+    QueryStats.RecordQuery(sql, started, len(rows))
+    return rows
+
+def QueryError(sql, connectionName=None):
+    """Returns error of last execution of SQL statement through the query cache (QSqlError).
+
+    Called after ExecQuery, ScalarQuery, ColumnQuery or RowsQuery reports a failure, to tell
+    the user why the statement failed; the error of the connection is not set by it.
+    """
+    return PreparedQuery(sql, connectionName).lastError()
+
+def ClearQueryCache(connectionName=None):
+    """Discards prepared queries of a database connection, or of all connections if no name is given.
+
+    Must be called when a connection is (re)opened, as prepared statements do not survive it.
+    """
+    if connectionName is None:
+        _statementCache.clear()
+    else:
+        _statementCache.pop(unicode(connectionName), None)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import Queue
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+from PyQt4.QtSql import *
+from FmrdLib import QueryStats
+
+"""Contains the executor that runs long read queries off the GUI thread.
+
+A dialog submits the statements that resolve a selection (e.g. the substitutions of a
+match) under a key, and continues to handle events while worker threads execute them.
+Each worker thread opens its own named connection with the settings of the dialog's
+connection, as Qt connections may only be used by the thread that created them.  Results
+are delivered to the GUI thread with the resultReady(QString, PyQt_PyObject) signal (key,
+list of rows of each statement), and errors with the queryFailed(QString, PyQt_PyObject)
+signal (key, QSqlError).
+
+Submitting a request under a key that has a request pending makes the earlier request
+stale: its result is dropped, and it is not executed if it has not started.  cancel() drops
+pending requests in the same way.  A statement that is executing is not interrupted, but
+stops fetching rows at the next batch.
+
+Worker threads are started on the first request and stopped when the executor's parent
+is destroyed or the application quits.
+
+Classes:
+QueryExecutor -- run read queries on worker threads
+
+Functions:
+ConnectionSettings -- return settings of a database connection
+OpenConnection -- open a named connection with settings of another connection
+KeyFilter -- return model filter that selects rows by key
+"""
+
+THREAD_COUNT = 2
+CONNECTION_PREFIX = "fmrd_query"
+
+# rows fetched between checks for stale requests
+BATCH_SIZE = 200
+
+def ConnectionSettings(connectionName=None):
+    """Returns (driver, database, host, port, user, password, options) of a connection (default connection if None).
+
+    Must be called in the thread that owns the connection.
+    """
+    if connectionName is None:
+        db = QSqlDatabase.database()
+    else:
+        db = QSqlDatabase.database(connectionName)
+    return (db.driverName(), db.databaseName(), db.hostName(), db.port(),
+            db.userName(), db.password(), db.connectOptions())
+
+def OpenConnection(settings, connectionName):
+    """Adds and opens a named connection with settings from ConnectionSettings().
+
+    Returns the connection, which must be used only in the calling thread; it is not open if
+    the database cannot be opened (see lastError()).
+    """
+    driver, name, host, port, user, password, options = settings
+    db = QSqlDatabase.addDatabase(driver, connectionName)
+    db.setDatabaseName(name)
+    db.setHostName(host)
+    db.setPort(port)
+    db.setUserName(user)
+    db.setPassword(password)
+    db.setConnectOptions(options)
+    db.open()
+    return db
+
+def KeyFilter(column, rows):
+    """Returns model filter that selects rows whose column is one of the keys in the first column of rows.
+
+    Arguments:
+        column -- key column, qualified with its table if a relational model joins it
+        rows -- rows delivered by QueryExecutor for one statement
+
+    """
+    keys = []
+    for row in rows:
+        key = unicode(row[0].toString())
+        if key.isdigit():
+            keys.append(key)
+        elif not row[0].isNull():
+            keys.append("'%s'" % key.replace("'", "''"))
+    if not keys:
+        return QString("1 = 0")
+    return QString("%1 IN (%2)").arg(column).arg(",".join(keys))
+
+
+class _Worker(QThread):
+    """Worker thread of QueryExecutor, which executes requests on its own connection."""
+
+    def __init__(self, executor, connectionName):
+        super(_Worker, self).__init__(executor)
+        self.executor = executor
+        self.connectionName = connectionName
+
+    def run(self):
+        try:
+            self.serve()
+        finally:
+            QSqlDatabase.removeDatabase(self.connectionName)
+
+    def serve(self):
+        """Executes requests until a None request is queued."""
+        db = OpenConnection(self.executor.settings, self.connectionName)
+        while True:
+            request = self.executor.requests.get()
+            if request is None:
+                break
+            ticket, key, statements = request
+            results, error = None, None
+            if not self.executor.isCurrent(key, ticket):
+                pass
+            elif not db.isOpen():
+                error = db.lastError()
+            else:
+                results, error = self.execute(db, key, ticket, statements)
+            self.emit(SIGNAL("requestDone(PyQt_PyObject)"), (ticket, key, results, error))
+        db.close()
+
+    def execute(self, db, key, ticket, statements):
+        """Executes statements of a request.  Returns (list of rows of each statement, None), or (None, QSqlError).
+
+        Returns (None, None) if the request becomes stale while rows are fetched.
+        """
+        results = []
+        for sql, params in statements:
+            query = QSqlQuery(db)
+            query.setForwardOnly(True)
+            query.prepare(sql)
+            for pos, value in enumerate(params):
+                if not isinstance(value, QVariant):
+                    value = QVariant(value)
+                query.bindValue(pos, value)
+            if not query.exec_():
+                return None, query.lastError()
+            columns = query.record().count()
+            rows = []
+            while query.next():
+                rows.append([query.value(k) for k in range(columns)])
+                if len(rows) % BATCH_SIZE == 0 and not self.executor.isCurrent(key, ticket):
+                    query.finish()
+                    return None, None
+            query.finish()
+            results.append(rows)
+        return results, None
+
+
+class QueryExecutor(QObject):
+    """Runs read queries on worker threads, each with its own database connection.
+
+    Arguments:
+        parent -- parent object (e.g. dialog); worker threads are stopped when it is destroyed
+        connectionName -- name of connection whose settings the worker connections use
+                          (default connection if None)
+        threads -- number of worker threads
+
+    Inherits QObject.
+    """
+
+    def __init__(self, parent=None, connectionName=None, threads=THREAD_COUNT):
+        """Constructor for QueryExecutor class."""
+        super(QueryExecutor, self).__init__(parent)
+        self.settings = ConnectionSettings(connectionName)
+        self.threads = threads
+        self.workers = []
+        # queued requests: (ticket, key, [(SQL text, parameters), ...]), None to stop a worker
+        self.requests = Queue.Queue()
+        # current request of each key: {key: ticket}
+        self.tickets = {}
+        self.nextTicket = 0
+        # statements and start times of requests: {ticket: ([(SQL text, parameters), ...], start time)}
+        self.pending = {}
+        if parent is not None:
+            self.connect(parent, SIGNAL("destroyed()"), self.shutdown)
+        self.connect(QApplication.instance(), SIGNAL("aboutToQuit()"), self.shutdown)
+
+    def submit(self, key, statements):
+        """Queues a request, which makes any pending request with the same key stale.  Returns ticket of request.
+
+        Arguments:
+            key -- name of request, e.g. "match"
+            statements -- list of (SELECT statement, parameters) tuples, executed in order
+
+        """
+        self.nextTicket += 1
+        ticket = self.nextTicket
+        statements = [(unicode(sql), tuple(params)) for sql, params in statements]
+        self.tickets[unicode(key)] = ticket
+        self.pending[ticket] = (statements, QueryStats.StartTimer())
+        if not self.workers:
+            self.startWorkers()
+        self.requests.put((ticket, unicode(key), statements))
+        return ticket
+
+    def cancel(self, key=None):
+        """Drops pending request of a key, or all pending requests if no key is given."""
+        if key is None:
+            self.tickets.clear()
+        else:
+            self.tickets.pop(unicode(key), None)
+
+    def isCurrent(self, key, ticket):
+        """Returns True if request is the latest of its key and has not been cancelled.  Called by worker threads."""
+        return self.tickets.get(key) == ticket
+
+    def isPending(self, key):
+        """Returns True if a request of key has not been delivered yet."""
+        return unicode(key) in self.tickets
+
+    def startWorkers(self):
+        """Starts worker threads, each of which opens its own connection."""
+        for index in range(self.threads):
+            worker = _Worker(self, "%s_%d_%d" % (CONNECTION_PREFIX, id(self), index))
+            self.connect(worker, SIGNAL("requestDone(PyQt_PyObject)"), self.deliver)
+            worker.start()
+            self.workers.append(worker)
+
+    def deliver(self, done):
+        """Emits result or error of a request that is still current, and drops stale results.  Runs in the GUI thread."""
+        ticket, key, results, error = done
+        statements, started = self.pending.pop(ticket, ((), None))
+        if not self.isCurrent(key, ticket):
+            return
+        del self.tickets[key]
+        if error is not None:
+            self.emit(SIGNAL("queryFailed(QString,PyQt_PyObject)"), QString(key), error)
+            return
+        for (sql, params), rows in zip(statements, results):
+            QueryStats.RecordQuery(sql, started, len(rows))
+        self.emit(SIGNAL("resultReady(QString,PyQt_PyObject)"), QString(key), results)
+
+    def shutdown(self):
+        """Drops pending requests and stops worker threads, waiting for statements being executed."""
+        self.cancel()
+        for worker in self.workers:
+            self.requests.put(None)
+        for worker in self.workers:
+            worker.wait()
+        self.workers = []
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import time
+import atexit
+from PyQt4.QtCore import *
+from FmrdLib import Constants
+
+"""Contains functions that collect timing statistics on SQL statements executed by FMRD tool.
+
+Instrumentation is off by default.  It is switched on by setting the FMRD_QUERY_STATS
+environment variable to a non-zero value, or from the Main Switchboard menu.  Statistics are
+grouped by the dialog (or other class) and method that issued the statement.
+
+Statements slower than FMRD_SLOW_QUERY_MS milliseconds (default Constants.SLOW_QUERY_MS) are
+appended to the slow-query log.  A summary of the session is written when instrumentation is
+switched off or the application exits.  Both files are written to the FMRD_QUERY_LOG_DIR
+directory, or the current directory if it is not set.
+
+Functions:
+IsEnabled -- return True if instrumentation is on
+SetEnabled -- switch instrumentation on or off
+StartTimer -- return start time of a statement, or None if instrumentation is off
+RecordQuery -- record execution time and row count of a statement
+Statistics -- return collected statistics
+ResetStatistics -- discard collected statistics
+WriteSummary -- write session summary file
+"""
+
+SLOW_QUERY_LOG = "fmrd_slowqueries.log"
+SUMMARY_FILE = "fmrd_querystats_%s.txt"
+
+# modules that execute statements on behalf of their callers
+_infrastructure = ("QueryCache", "QueryStats")
+
+_enabled = os.environ.get("FMRD_QUERY_STATS", "0") not in ("", "0")
+_slowQueryMs = float(os.environ.get("FMRD_SLOW_QUERY_MS", Constants.SLOW_QUERY_MS))
+_logDir = os.environ.get("FMRD_QUERY_LOG_DIR", os.curdir)
+_sessionStart = time.time()
+
+# statistics: {caller: {SQL text: [calls, total ms, maximum ms, rows]}}
+_statistics = {}
+
+def IsEnabled():
+    """Returns True if query instrumentation is switched on."""
+    return _enabled
+
+def SetEnabled(flag):
+    """Switches query instrumentation on or off.
+
+    Switching instrumentation off writes the session summary and discards the statistics.
+    Returns name of summary file, or None if no summary was written.
+    """
+    global _enabled, _sessionStart
+    fileName = None
+    if flag and not _enabled:
+        _sessionStart = time.time()
+    elif not flag and _enabled:
+        fileName = WriteSummary()
+        ResetStatistics()
+    _enabled = bool(flag)
+    return fileName
+
+def StartTimer():
+    """Returns start time of a statement, or None if instrumentation is off."""
+    if not _enabled:
+        return None
+    return time.time()
+
+def _caller():
+    """Returns "Class.method" label of the code that issued the current statement.
+
+    The innermost dialog or window method on the call stack is preferred, so that statements
+    issued by helper functions and delegates are attributed to the dialog that triggered them.
+    """
+    frame = sys._getframe(2)
+    label = None
+    while frame is not None:
+        module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+        if module not in _infrastructure:
+            obj = frame.f_locals.get("self")
+            # dialogs and main windows, tested without importing QtGui (see fmrd.py)
+            if isinstance(obj, QObject) and obj.isWidgetType() and obj.isWindow():
+                return "%s.%s" % (obj.__class__.__name__, frame.f_code.co_name)
+            if label is None:
+                if obj is not None:
+                    label = "%s.%s" % (obj.__class__.__name__, frame.f_code.co_name)
+                else:
+                    label = "%s.%s" % (module, frame.f_code.co_name)
+        frame = frame.f_back
+    return label or "<unknown>"
+
+def RecordQuery(sql, started, rows):
+    """Records execution time and row count of a statement.
+
+    Arguments:
+        sql -- SQL statement (string)
+        started -- start time returned by StartTimer(), no-op if None
+        rows -- number of rows returned or affected by statement
+
+    """
+    if started is None or not _enabled:
+        return
+    elapsed = (time.time() - started) * 1000.0
+    caller = _caller()
+    sql = u" ".join(unicode(sql).split())
+
+    entry = _statistics.setdefault(caller, {}).setdefault(sql, [0, 0.0, 0.0, 0])
+    entry[0] += 1
+    entry[1] += elapsed
+    entry[2] = max(entry[2], elapsed)
+    entry[3] += max(rows, 0)
+
+    if elapsed >= _slowQueryMs:
+        try:
+            log = open(os.path.join(_logDir, SLOW_QUERY_LOG), "a")
+            try:
+                log.write("%s\t%.1f ms\t%d rows\t%s\t%s\n" % (time.strftime("%Y-%m-%d %H:%M:%S"),
+                                                               elapsed, rows, caller, sql.encode("utf-8")))
+            finally:
+                log.close()
+        except IOError:
+            pass
+
+def Statistics():
+    """Returns collected statistics as {caller: {SQL text: [calls, total ms, maximum ms, rows]}}."""
+    return _statistics
+
+def ResetStatistics():
+    """Discards collected statistics."""
+    _statistics.clear()
+
+def WriteSummary(fileName=None):
+    """Writes summary of collected statistics, grouped by caller, and returns file name.
+
+    Returns None if there are no statistics or the file cannot be written.
+    """
+    if not _statistics:
+        return None
+    if fileName is None:
+        fileName = os.path.join(_logDir, SUMMARY_FILE % time.strftime("%Y%m%d_%H%M%S"))
+
+    totals = []
+    for caller, statements in _statistics.items():
+        calls = sum(entry[0] for entry in statements.values())
+        elapsed = sum(entry[1] for entry in statements.values())
+        rows = sum(entry[3] for entry in statements.values())
+        totals.append((elapsed, caller, calls, rows))
+    totals.sort(reverse=True)
+
+    try:
+        summary = open(fileName, "w")
+    except IOError:
+        return None
+    try:
+        summary.write("FMRD query statistics\n")
+        summary.write("Session: %s to %s\n" % (time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(_sessionStart)),
+                                               time.strftime("%Y-%m-%d %H:%M:%S")))
+        summary.write("Slow query threshold: %.0f ms\n\n" % _slowQueryMs)
+        for elapsed, caller, calls, rows in totals:
+            summary.write("%s: %d round trips, %.1f ms, %d rows\n" % (caller, calls, elapsed, rows))
+            statements = sorted(_statistics[caller].items(), key=lambda item: item[1][1], reverse=True)
+            for sql, entry in statements:
+                summary.write("    %6d x %9.1f ms (max %7.1f ms) %7d rows  %s\n" %
+                              (entry[0], entry[1], entry[2], entry[3], sql.encode("utf-8")))
+            summary.write("\n")
+    finally:
+        summary.close()
+    return fileName
+
+def _writeSummaryAtExit():
+    """Writes session summary when application exits with instrumentation on."""
+    if _enabled:
+        WriteSummary()
+
+atexit.register(_writeSummaryAtExit)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import (QueryStats, TableChanges)
+from FmrdLib.QueryCache import *
+
+"""Contains a session-wide cache of reference (lookup) tables and the models that serve it to comboboxes.
+
+Small lookup tables such as rounds, phases, groups and confederations are read once per
+session and sort order, and every dialog that lists them shares the cached rows.  Opening a
+dialog therefore does not query these tables.  A filter that restricts a model to some of
+the rows is evaluated by the database, but only the primary keys of the matching rows are
+read.
+
+The cache of a table is discarded when a setup dialog writes to it: setup dialogs pass their
+table model to WatchReferenceTable(), which invalidates the table before any row is
+inserted, updated or deleted.  A cached table is also read again once its change counter
+(see TableChanges) has moved, so views such as managers_list can be cached as well.  Tables
+may be loaded ahead of use, e.g. by a background thread, with StoreReferenceData().
+
+Classes:
+ReferenceTableModel -- read-only table model of a cached reference table
+
+Functions:
+ReferenceColumn -- return values of a column of a cached reference table
+ReferenceQuery -- return fields and SELECT statement that reads a reference table
+StoreReferenceData -- add a table read elsewhere to the cache
+WatchReferenceTable -- invalidate cache of a table when a model writes to it
+InvalidateReferenceData -- discard cached reference tables
+"""
+
+# cached tables: {connection name: {(table, sort column): (field record, [row values, ...], change counters)}}
+_cache = {}
+
+def _connection(connectionName):
+    """Returns database connection object, using default connection if no name is given."""
+    if connectionName is None:
+        return QSqlDatabase.database()
+    return QSqlDatabase.database(connectionName)
+
+def ReferenceQuery(db, table, sortColumn):
+    """Returns (field record, SELECT statement) that reads all rows of a table sorted on a column."""
+    fields = db.record(table)
+    names = [unicode(fields.fieldName(k)) for k in range(fields.count())]
+    return fields, "SELECT %s FROM %s ORDER BY %s" % (",".join(names), table, names[sortColumn])
+
+def _tableData(db, table, sortColumn):
+    """Returns cached (field record, rows) of table sorted on column, reading the table on first use or after it has changed."""
+    tables = _cache.setdefault(unicode(db.connectionName()), {})
+    key = (unicode(table), sortColumn)
+    if key not in tables or TableChanges.Changed(table, tables[key][2]):
+        snapshot = TableChanges.Snapshot()
+        fields, sql = ReferenceQuery(db, table, sortColumn)
+        tables[key] = (fields, RowsQuery(sql, (), db.connectionName()), snapshot)
+    return tables[key][:2]
+
+def StoreReferenceData(table, sortColumn, fields, rows, snapshot, connectionName=None):
+    """Adds a table read elsewhere (e.g. on another connection) to the cache, unless a current copy is cached.
+
+    Arguments:
+        table -- name of reference table
+        sortColumn -- column on which rows are sorted
+        fields -- field record of table
+        rows -- row values (lists of QVariants), in order of sort column
+        snapshot -- change counters (TableChanges.Snapshot()) taken before the table was read
+        connectionName -- name of database connection whose cache is filled (default connection if None)
+
+    """
+    tables = _cache.setdefault(unicode(_connection(connectionName).connectionName()), {})
+    key = (unicode(table), sortColumn)
+    if key not in tables or TableChanges.Changed(table, tables[key][2]):
+        tables[key] = (fields, rows, snapshot)
+
+def ReferenceColumn(table, column, sortColumn=0, connectionName=None):
+    """Returns values (QVariants) of a column of a reference table, in order of sort column.
+
+    Arguments:
+        table -- name of reference table
+        column -- name of column
+        sortColumn -- column on which rows are sorted (default 0, the primary key)
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    fields, rows = _tableData(_connection(connectionName), QString(table), sortColumn)
+    index = fields.indexOf(column)
+    return [row[index] for row in rows]
+
+def WatchReferenceTable(model):
+    """Connects signals of an editable table model so that the cache of its table is invalidated before it is written.
+
+    Argument:
+        model -- QSqlTableModel of a reference table (e.g. in a setup dialog)
+
+    """
+    table = model.tableName()
+    connName = model.database().connectionName()
+    invalidate = lambda *args: InvalidateReferenceData(table, connName)
+    model.connect(model, SIGNAL("beforeInsert(QSqlRecord&)"), invalidate)
+    model.connect(model, SIGNAL("beforeUpdate(int,QSqlRecord&)"), invalidate)
+    model.connect(model, SIGNAL("beforeDelete(int)"), invalidate)
+
+def InvalidateReferenceData(table=None, connectionName=None):
+    """Discards cached reference tables.
+
+    Arguments:
+        table -- name of table to discard (all tables if None)
+        connectionName -- name of database connection (all connections if None)
+
+    Must be called with no table when a connection is (re)opened.
+    """
+    if connectionName is None:
+        connections = _cache.values()
+    else:
+        connections = [_cache.get(unicode(connectionName), {})]
+    for tables in connections:
+        if table is None:
+            tables.clear()
+        else:
+            for key in [key for key in tables if key[0] == unicode(table)]:
+                del tables[key]
+
+
+class ReferenceTableModel(QAbstractTableModel):
+    """Read-only model of a reference table, served from the session cache.
+
+    Provides the subset of the QSqlTableModel interface used by comboboxes and delegates:
+    tableName(), fieldIndex(), record(), filter() and setFilter().
+
+    Arguments:
+        table -- name of reference table
+        sortColumn -- column on which rows are sorted (ascending)
+        parent -- parent object (default None)
+
+    Inherits QAbstractTableModel.
+    """
+
+    def __init__(self, table, sortColumn, parent=None, connectionName=None):
+        """Constructor for ReferenceTableModel class."""
+        super(ReferenceTableModel, self).__init__(parent)
+        self.db = _connection(connectionName)
+        self.table = QString(table)
+        self.sortColumn = sortColumn
+        self.filterString = QString()
+        self.fields, self.allRows = _tableData(self.db, self.table, self.sortColumn)
+        self.rows = self.allRows
+
+    def tableName(self):
+        """Returns name of reference table."""
+        return self.table
+
+    def fieldIndex(self, fieldName):
+        """Returns column of field, or -1 if the table has no such field."""
+        return self.fields.indexOf(fieldName)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.fields.count()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return QVariant()
+        return self.rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return QVariant(self.fields.fieldName(section))
+        return QVariant()
+
+    def record(self, row=None):
+        """Returns record of row, or empty record with field names if row is invalid or not given."""
+        record = QSqlRecord(self.fields)
+        if row is not None and 0 <= row < len(self.rows):
+            for column, value in enumerate(self.rows[row]):
+                record.setValue(column, value)
+        return record
+
+    def filter(self):
+        """Returns current filter."""
+        return self.filterString
+
+    def setFilter(self, filterString):
+        """Restricts model to rows that satisfy filter (SQL WHERE clause without WHERE keyword).
+
+        Rows are taken from the cache; the database only returns the primary keys of the rows
+        that satisfy the filter.  An empty filter restores all rows without a query.
+        """
+        self.filterString = QString(filterString)
+        self.select()
+
+    def select(self):
+        """Repopulates model from the cache, re-reading the table if its cache has been invalidated."""
+        self.beginResetModel()
+        self.fields, self.allRows = _tableData(self.db, self.table, self.sortColumn)
+        if self.filterString.isEmpty():
+            self.rows = self.allRows
+        else:
+            sql = QString("SELECT %1 FROM %2 WHERE %3").arg(self.fields.fieldName(0)).arg(self.table).arg(self.filterString)
+            started = QueryStats.StartTimer()
+            query = QSqlQuery(self.db)
+            query.setForwardOnly(True)
+            keys = set()
+            if query.exec_(sql):
+                while query.next():
+                    keys.add(unicode(query.value(0).toString()))
+            QueryStats.RecordQuery(sql, started, len(keys))
+            self.rows = [row for row in self.allRows if unicode(row[0].toString()) in keys]
+        self.endResetModel()
+        return True
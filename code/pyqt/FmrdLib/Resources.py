@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from PyQt4.QtCore import *
+from FmrdLib import StartupTimes
+
+"""Contains the function that registers the Qt resources (navigation and editing icons) of the FMRD data entry tool.
+
+The icons are compiled once, by pyrcc4, into fmrd_resources_data.  That module is imported
+(which registers its data with Qt) the first time a window that uses the icons is created,
+i.e. when the generated user interface module of a data entry dialog imports
+fmrd_resources_rc.  The driver, login and switchboard windows use no icons, so the
+resource data is not loaded at startup.  The time taken and the resident memory are
+recorded in the startup report (see StartupTimes).
+
+Functions:
+RegisterResources -- register resources with Qt, once
+"""
+
+# resource that is present once the resources are registered
+PROBE_RESOURCE = ":/images/first.png"
+
+_registered = False
+
+def RegisterResources():
+    """Registers resources with Qt, unless they have already been registered.
+
+    Returns True if the resources were registered by this call.
+    """
+    global _registered
+    if _registered:
+        return False
+    _registered = True
+    if QFile.exists(PROBE_RESOURCE):
+        # registered by another copy of the resource module
+        return False
+    started = time.time()
+    from FmrdLib import fmrd_resources_data
+    StartupTimes.RecordImport("fmrd_resources_data", time.time() - started)
+    return True
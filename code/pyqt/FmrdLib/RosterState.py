@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib.QueryCache import *
+
+"""Contains the roster state of match lineups, from which substitution and shootout eligibility is decided.
+
+The roster of a team in a match records, for every lineup entry, whether the player started
+the match and whether he has been substituted in or out.  A roster is read with one query
+over the lineup entries of the match and team the first time it is needed, and is then kept
+current as substitutions are written: SubstituteLinkingModel calls SetSubstituted() after
+every insert, update or delete.  Eligibility lists are therefore computed from a few cached
+rows instead of subqueries over the substitution tables of every match in the database.
+
+Rosters of a match and team are discarded when its lineup is edited: the lineup dialog
+passes its table model to WatchLineupTable().
+
+Functions:
+Roster -- return roster state of a team in a match
+LineupTeam -- return team of a lineup entry
+OnFieldPlayers -- return lineup entries on the field
+BenchPlayers -- return lineup entries that may be substituted into the match
+LineupFilter -- return filter that restricts a lineup list to lineup entries
+SetSubstituted -- record that a lineup entry has been substituted in or out
+WatchLineupTable -- discard roster of a lineup when a model writes to it
+InvalidateRosterState -- discard cached rosters
+"""
+
+# substitution table of each roster flag
+SUBSTITUTION_TABLES = {"tbl_insubstitutions": 1, "tbl_outsubstitutions": 2}
+
+# cached rosters: {connection name: {(match_id, team_id): {lineup_id: [starting, subbed in, subbed out]}}}
+_cache = {}
+# team of cached lineup entries: {connection name: {lineup_id: (match_id, team_id)}}
+_lineups = {}
+
+def _connectionName(connectionName):
+    """Returns name of database connection, using default connection if no name is given."""
+    if connectionName is None:
+        return unicode(QSqlDatabase.database().connectionName())
+    return unicode(connectionName)
+
+def _id(value):
+    """Returns integer ID of a QString, QVariant, string or integer, or -1 if it is not an integer."""
+    number, ok = QVariant(value).toInt()
+    if not ok:
+        return -1
+    return number
+
+def Roster(match_id, team_id, connectionName=None):
+    """Returns roster state of team in match, reading it from the database on first use.
+
+    Arguments:
+        match_id -- ID of match
+        team_id -- ID of team
+        connectionName -- name of database connection (default connection if None)
+
+    Returns {lineup_id: [starting, subbed in, subbed out]}, which must not be modified.
+    """
+    connName = _connectionName(connectionName)
+    rosters = _cache.setdefault(connName, {})
+    key = (_id(match_id), _id(team_id))
+    if key not in rosters:
+        roster = {}
+        rows = RowsQuery("SELECT l.lineup_id, CASE WHEN l.lp_starting THEN 1 ELSE 0 END, "
+                         "(SELECT COUNT(*) FROM tbl_insubstitutions i WHERE i.lineup_id = l.lineup_id), "
+                         "(SELECT COUNT(*) FROM tbl_outsubstitutions o WHERE o.lineup_id = l.lineup_id) "
+                         "FROM tbl_lineups l WHERE l.match_id = ? AND l.team_id = ?", key, connName)
+        lineups = _lineups.setdefault(connName, {})
+        for lineup_id, starting, subbedIn, subbedOut in rows:
+            lineup_id = lineup_id.toInt()[0]
+            roster[lineup_id] = [starting.toInt()[0] > 0, subbedIn.toInt()[0] > 0, subbedOut.toInt()[0] > 0]
+            lineups[lineup_id] = key
+        rosters[key] = roster
+    return rosters[key]
+
+def LineupTeam(lineup_id, connectionName=None):
+    """Returns team ID (integer) of lineup entry, or -1 if there is no such entry."""
+    connName = _connectionName(connectionName)
+    lineup_id = _id(lineup_id)
+    key = _lineups.get(connName, {}).get(lineup_id)
+    if key is not None:
+        return key[1]
+    value = ScalarQuery("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?", (lineup_id, ), connName)
+    if not value.isValid():
+        return -1
+    return value.toInt()[0]
+
+def OnFieldPlayers(match_id, team_id, exclude=None, connectionName=None):
+    """Returns lineup IDs of players on the field, in ascending order.
+
+    These are starting players and substitutes who have been substituted in, who have not
+    been substituted out of the match.
+
+    Arguments:
+        match_id -- ID of match
+        team_id -- ID of team
+        exclude -- lineup ID whose substitution out is disregarded, e.g. the entry being edited
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    exclude = _id(exclude)
+    return sorted(lineup_id for lineup_id, (starting, subbedIn, subbedOut)
+                  in Roster(match_id, team_id, connectionName).items()
+                  if (starting or subbedIn) and (not subbedOut or lineup_id == exclude))
+
+def BenchPlayers(match_id, team_id, exclude=None, connectionName=None):
+    """Returns lineup IDs of substitutes who have not been substituted into the match, in ascending order.
+
+    Arguments:
+        match_id -- ID of match
+        team_id -- ID of team
+        exclude -- lineup ID whose substitution in is disregarded, e.g. the entry being edited
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    exclude = _id(exclude)
+    return sorted(lineup_id for lineup_id, (starting, subbedIn, subbedOut)
+                  in Roster(match_id, team_id, connectionName).items()
+                  if not starting and (not subbedIn or lineup_id == exclude))
+
+def LineupFilter(lineupIDs):
+    """Returns filter (QString) that restricts a lineup list model to lineup IDs."""
+    if not lineupIDs:
+        return QString("lineup_id IN (-1)")
+    return QString("lineup_id IN (%1)").arg(",".join(str(lineup_id) for lineup_id in lineupIDs))
+
+def SetSubstituted(table, lineup_id, substituted, connectionName=None):
+    """Records in cached roster that a lineup entry has been written to or removed from a substitution table.
+
+    Arguments:
+        table -- substitution table (tbl_insubstitutions or tbl_outsubstitutions)
+        lineup_id -- ID of lineup entry
+        substituted -- True if entry was written to table, False if removed
+        connectionName -- name of database connection (default connection if None)
+
+    Rosters that have not been read yet are not affected.
+    """
+    connName = _connectionName(connectionName)
+    lineup_id = _id(lineup_id)
+    key = _lineups.get(connName, {}).get(lineup_id)
+    roster = _cache.get(connName, {}).get(key)
+    if roster is not None and lineup_id in roster:
+        roster[lineup_id][SUBSTITUTION_TABLES[unicode(table)]] = substituted
+
+def WatchLineupTable(model, match_id, team_id):
+    """Connects signals of a lineup table model so that the roster of its lineup is discarded before it is written.
+
+    Arguments:
+        model -- QSqlTableModel of tbl_lineups, filtered on one match and team
+        match_id -- ID of match
+        team_id -- ID of team
+
+    """
+    connName = model.database().connectionName()
+    invalidate = lambda *args: InvalidateRosterState(match_id, team_id, connName)
+    model.connect(model, SIGNAL("beforeInsert(QSqlRecord&)"), invalidate)
+    model.connect(model, SIGNAL("beforeUpdate(int,QSqlRecord&)"), invalidate)
+    model.connect(model, SIGNAL("beforeDelete(int)"), invalidate)
+
+def InvalidateRosterState(match_id=None, team_id=None, connectionName=None):
+    """Discards cached rosters.
+
+    Arguments:
+        match_id -- ID of match (all matches if None)
+        team_id -- ID of team (all teams of match if None)
+        connectionName -- name of database connection (all connections if None)
+
+    Must be called with no match when a connection is (re)opened.
+    """
+    if connectionName is None:
+        names = _cache.keys()
+    else:
+        names = [unicode(connectionName)]
+    for connName in names:
+        rosters = _cache.get(connName, {})
+        lineups = _lineups.get(connName, {})
+        for key in rosters.keys():
+            if match_id is not None and key[0] != _id(match_id):
+                continue
+            if team_id is not None and key[1] != _id(team_id):
+                continue
+            for lineup_id in rosters.pop(key):
+                lineups.pop(lineup_id, None)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib import Constants
+from FmrdLib.QueryCache import *
+from FmrdLib.ReferenceData import ReferenceColumn
+
+"""Contains the state of the penalty shootout of a match, from which shootout entry forms are filtered.
+
+The kicks of a match's shootout are read with one query, grouped by round and team, when a
+match is selected and again after the shootout has been written.  Available rounds, available
+teams, players used in a rotation and the next kick are then determined without further queries.
+
+Classes:
+ShootoutState -- penalty shootout of a match
+"""
+
+class ShootoutState(object):
+    """Penalty shootout of a match.
+
+    A round of the shootout consists of one kick by each team.  Players of a team may not kick
+    again until every eligible player of the team has kicked, which is enforced per rotation
+    of MAX_TEAM_STARTERS rounds.
+    """
+
+    def __init__(self, connectionName=None):
+        """Constructor for ShootoutState class."""
+        self.connectionName = connectionName
+        self.match_id = -1
+        # teams of match, in ascending order of ID
+        self.teams = []
+        # kicks of shootout: {round_id: {team_id: [lineup_id, ...]}}
+        self.kicks = {}
+
+    def setMatch(self, match_id):
+        """Sets match of shootout and loads its teams and kicks."""
+        self.match_id = QVariant(match_id).toInt()[0]
+        self.teams = sorted(value.toInt()[0] for value in ColumnQuery(
+            "SELECT team_id FROM tbl_hometeams WHERE match_id = ? "
+            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = ?", (self.match_id, self.match_id),
+            self.connectionName))
+        self.load()
+
+    def load(self):
+        """Reloads kicks of shootout.  Must be called after shootout records of the match are written."""
+        self.kicks = {}
+        rows = RowsQuery("SELECT p.round_id, l.team_id, p.lineup_id FROM tbl_penaltyshootouts p, tbl_lineups l "
+                         "WHERE p.lineup_id = l.lineup_id AND l.match_id = ? "
+                         "ORDER BY p.round_id, l.team_id, p.penshootout_id", (self.match_id, ), self.connectionName)
+        for round_id, team_id, lineup_id in rows:
+            teams = self.kicks.setdefault(round_id.toInt()[0], {})
+            teams.setdefault(team_id.toInt()[0], []).append(lineup_id.toInt()[0])
+
+    def roundIDs(self):
+        """Returns IDs of shootout rounds, in ascending order."""
+        minRoundID = int(Constants.MinRoundID)
+        return [round_id for round_id in sorted(value.toInt()[0] for value in
+                                                ReferenceColumn("tbl_rounds", "round_id", 0, self.connectionName))
+                if round_id >= minRoundID]
+
+    def kickCount(self, round_id):
+        """Returns number of kicks taken in shootout round."""
+        return sum(len(players) for players in self.kicks.get(round_id, {}).values())
+
+    def rotation(self, round_id):
+        """Returns round IDs of the rotation (MAX_TEAM_STARTERS rounds) of which shootout round is a member."""
+        minRoundID = int(Constants.MinRoundID)
+        if round_id < minRoundID:
+            # no round selected: first rotation
+            roundIDs = self.roundIDs()
+            maxRoundID = roundIDs[-1] if roundIDs else minRoundID - 1
+            return range(minRoundID, min(maxRoundID + 1, minRoundID + Constants.MAX_TEAM_STARTERS))
+        startRotationID = minRoundID + (round_id - minRoundID) // Constants.MAX_TEAM_STARTERS * Constants.MAX_TEAM_STARTERS
+        return range(startRotationID, startRotationID + Constants.MAX_TEAM_STARTERS)
+
+    def availableRounds(self):
+        """Returns IDs of shootout rounds in which fewer than MAX_PARTICIPATION kicks have been taken."""
+        return [round_id for round_id in self.roundIDs() if self.kickCount(round_id) < Constants.MAX_PARTICIPATION]
+
+    def availableTeams(self, round_id):
+        """Returns IDs of teams that have not taken a kick in shootout round."""
+        teams = self.kicks.get(round_id, {})
+        return [team_id for team_id in self.teams if not teams.get(team_id)]
+
+    def usedPlayers(self, team_id, round_id):
+        """Returns lineup IDs of team's players who have kicked in the rotation of shootout round."""
+        used = []
+        for rotation_id in self.rotation(round_id):
+            used.extend(self.kicks.get(rotation_id, {}).get(team_id, []))
+        return used
+
+    def nextKick(self, opener_id=None):
+        """Returns (round ID, team ID) of the next kick of the shootout.
+
+        The next kick is taken in the first round that is not complete.  In a round with no
+        kicks, the opening team kicks first; the team ID is -1 if the opener is unknown.
+        Returns (-1, -1) if every round is complete.
+
+        Argument:
+            opener_id -- ID of team that kicked first in the shootout (default None)
+
+        """
+        rounds = self.availableRounds()
+        if not rounds:
+            return (-1, -1)
+        teams = self.availableTeams(rounds[0])
+        if len(teams) == 1:
+            return (rounds[0], teams[0])
+        opener_id = QVariant(opener_id).toInt()[0] if opener_id is not None else -1
+        return (rounds[0], opener_id if opener_id in teams else -1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import time
+from PyQt4.QtCore import *
+
+"""Contains functions that measure the startup time of the FMRD data entry tool.
+
+The entry point marks the end of each startup stage (module imports, first paint of the
+driver, login and switchboard windows), measured from the import of this module, which is
+imported first.  The time taken to import a dialog module on first use is recorded as well.
+The stages that wait for the operator (driver and login dialogs) are reported separately, so
+that import and first-paint times can be compared between builds.  The resident memory of
+the process (where /proc is available) is reported at the end of each stage and after each
+import.
+
+Reporting is off by default.  It is switched on by setting the FMRD_STARTUP_LOG environment
+variable to the name of a file to which the report is appended, or to '-' for standard error.
+The report is written when the switchboard is first painted; imports of dialog modules are
+appended as they happen.
+
+Functions:
+Mark -- record end of a startup stage
+RecordImport -- record time taken to import a module
+WatchFirstPaint -- mark a stage when a window is first painted
+StartupReport -- return startup report as lines of text
+"""
+
+_started = time.time()
+_logName = os.environ.get("FMRD_STARTUP_LOG", "")
+
+# end of startup stages: [(label, seconds since start, True if stage waited for operator, resident MB)]
+_marks = []
+# keeps paint watchers alive until they fire
+_watchers = []
+
+def _write(lines):
+    """Appends lines to startup log, if reporting is on."""
+    if not _logName:
+        return
+    text = "".join("%s\n" % line for line in lines)
+    if _logName == "-":
+        sys.stderr.write(text)
+    else:
+        try:
+            log = open(_logName, "a")
+            try:
+                log.write(text)
+            finally:
+                log.close()
+        except IOError:
+            pass
+
+def _residentMemory():
+    """Returns resident memory of process in MB, or None if it is not available."""
+    try:
+        statm = open("/proc/self/statm")
+        try:
+            pages = int(statm.read().split()[1])
+        finally:
+            statm.close()
+    except (IOError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1048576.0
+
+def _memoryText(megabytes):
+    """Returns resident memory as text."""
+    if megabytes is None:
+        return "       -"
+    return "%5.1f MB" % megabytes
+
+def Mark(label, interactive=False):
+    """Records end of a startup stage.
+
+    Arguments:
+        label -- name of stage, e.g. "imports"
+        interactive -- True if the stage waited for the operator (e.g. a login dialog)
+
+    """
+    _marks.append((label, time.time() - _started, interactive, _residentMemory()))
+
+def RecordImport(module, seconds):
+    """Records time taken to import a module on first use (e.g. a dialog module)."""
+    _write(["import %-24s %8.1f ms %s" % (module, seconds * 1000.0, _memoryText(_residentMemory()))])
+
+
+class _PaintWatcher(QObject):
+    """Event filter that marks a startup stage on the first paint event of a window."""
+
+    def __init__(self, window, label, report):
+        super(_PaintWatcher, self).__init__(window)
+        self.label = label
+        self.report = report
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            _watchers.remove(self)
+            Mark(self.label)
+            if self.report:
+                _write(StartupReport())
+        return False
+
+
+def WatchFirstPaint(window, label, report=False):
+    """Marks a startup stage when a window is first painted.
+
+    Arguments:
+        window -- top-level widget, before it is shown
+        label -- name of stage, e.g. "switchboard painted"
+        report -- True to write the startup report at that time
+
+    """
+    _watchers.append(_PaintWatcher(window, label, report))
+
+def StartupReport():
+    """Returns startup report as lines of text.
+
+    Every stage is listed with its duration, its end time since start and the resident memory
+    at its end.  The total excludes stages that waited for the operator.
+    """
+    lines = ["FMRD startup (%s)" % time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(_started))]
+    previous = 0.0
+    waited = 0.0
+    for label, seconds, interactive, memory in _marks:
+        lines.append("  %-32s %8.1f ms %8.1f ms %s%s" % (label, (seconds - previous) * 1000.0, seconds * 1000.0,
+                                                         _memoryText(memory), " (operator)" if interactive else ""))
+        if interactive:
+            waited += seconds - previous
+        previous = seconds
+    lines.append("  %-32s %8.1f ms" % ("total without operator", (previous - waited) * 1000.0))
+    return lines
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from PyQt4.QtCore import *
+
+"""Contains session-wide change counters of FMRD tables.
+
+Every write to a table made in this session increments the table's counter and the total
+counter.  A component that holds rows of a table (e.g. a pooled dialog) remembers the counters
+when it reads the table, and re-reads only the tables whose counters have moved since.
+
+Writes are counted when a statement is executed with QueryCache.ExecQuery(), and when a table
+model passed to WatchTableChanges() inserts, updates or deletes a row.  Writes made outside
+the session (e.g. by another client of a PostgreSQL server) are not counted.
+
+Functions:
+RecordChange -- increment change counter of a table
+RecordStatement -- increment change counter of table written by an SQL statement
+ChangeCount -- return change counter of a table, or total counter
+Snapshot -- return current change counters
+Changed -- return True if a table may have been written since a snapshot
+WatchTableChanges -- count writes of an editable table model
+"""
+
+# table written by INSERT, UPDATE or DELETE statement
+_writePattern = re.compile(r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(\w+)", re.IGNORECASE)
+
+# change counters: {table name: count}
+_counts = {}
+_total = [0]
+
+def RecordChange(table):
+    """Increments change counter of a table and total counter."""
+    table = unicode(table)
+    _counts[table] = _counts.get(table, 0) + 1
+    _total[0] += 1
+
+def RecordStatement(sql):
+    """Increments change counter of table written by SQL statement; other statements are ignored."""
+    match = _writePattern.match(unicode(sql))
+    if match:
+        RecordChange(match.group(1).lower())
+
+def ChangeCount(table=None):
+    """Returns change counter of a table, or total counter of all tables if no table is given."""
+    if table is None:
+        return _total[0]
+    return _counts.get(unicode(table), 0)
+
+def Snapshot():
+    """Returns current change counters, to be passed to Changed() later."""
+    return (_total[0], dict(_counts))
+
+def Changed(table, snapshot):
+    """Returns True if a table may have been written since snapshot was taken.
+
+    Tables whose names do not begin with tbl_ are views over several tables (e.g. lineup_list),
+    and count as changed after a write to any table.
+    """
+    total, counts = snapshot
+    table = unicode(table)
+    if not table.startswith("tbl_"):
+        return _total[0] != total
+    return _counts.get(table, 0) != counts.get(table, 0)
+
+def WatchTableChanges(model):
+    """Connects signals of an editable table model so that its writes are counted.
+
+    Argument:
+        model -- QSqlTableModel (e.g. data entry model of a dialog)
+
+    """
+    table = unicode(model.tableName())
+    if not table:
+        return
+    record = lambda *args: RecordChange(table)
+    model.connect(model, SIGNAL("beforeInsert(QSqlRecord&)"), record)
+    model.connect(model, SIGNAL("beforeUpdate(int,QSqlRecord&)"), record)
+    model.connect(model, SIGNAL("beforeDelete(int)"), record)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+from FmrdLib.QueryCache import *
+
+"""Contains functions that return record counts of FMRD tables from trigger-maintained counters.
+
+The counts used to decide whether data entry windows may be opened are kept in the
+fmrd_counters table, which insert, update and delete triggers on the counted tables keep
+current.  Reading a count is a single-row lookup instead of a scan of the table.  The
+counters table and triggers are installed the first time a count is needed; if they cannot
+be installed (e.g. insufficient privileges), counts are taken with SELECT COUNT(*) as before.
+
+Counter values are cached per connection until InvalidateCounters() is called, which the
+switchboards do after a window that writes to a counted table is closed.
+
+Functions:
+CounterValue -- return value of a record counter
+InstallCounters -- create counters table and triggers, and initialize counters
+RefreshCounters -- recount counters from their tables
+InvalidateCounters -- discard cached counter values
+"""
+
+COUNTER_TABLE = "fmrd_counters"
+
+# counters: {counter name: (table, condition on row alias "r", or None to count all rows)}
+_counters = {
+    "competitions": ("tbl_competitions", None),
+    "teams": ("tbl_teams", None),
+    "venues": ("tbl_venues", None),
+    "managers": ("tbl_managers", None),
+    "referees": ("tbl_referees", None),
+    "knockoutmatches": ("tbl_knockoutmatches", None),
+    "starters": ("tbl_lineups", "r.lp_starting"),
+    "substitutes": ("tbl_lineups", "NOT r.lp_starting"),
+    "captains": ("tbl_lineups", "r.lp_starting AND r.lp_captain"),
+    "goalkeepers": ("tbl_lineups", "r.lp_starting AND r.position_id IN "
+                                   "(SELECT position_id FROM positions_list WHERE position_name = 'Goalkeeper')"),
+}
+
+# cached counter values: {connection name: {counter name: value}}
+# a value of None for a connection means the counters are not available there
+_cache = {}
+
+def _connection(connectionName):
+    """Returns database connection object, using default connection if no name is given."""
+    if connectionName is None:
+        return QSqlDatabase.database()
+    return QSqlDatabase.database(connectionName)
+
+def _countQuery(name):
+    """Returns SELECT COUNT(*) statement of a counter."""
+    table, condition = _counters[name]
+    if condition is None:
+        return "SELECT COUNT(*) FROM %s AS r" % table
+    return "SELECT COUNT(*) FROM %s AS r WHERE %s" % (table, condition)
+
+def _adjustStatements(table, row, delta):
+    """Returns UPDATE statements that adjust counters of table for a NEW or OLD row."""
+    statements = []
+    for name in sorted(_counters.keys()):
+        counterTable, condition = _counters[name]
+        if counterTable != table:
+            continue
+        sql = "UPDATE %s SET counter_value = counter_value %s 1 WHERE counter_name = '%s'" % \
+              (COUNTER_TABLE, delta, name)
+        if condition is not None:
+            sql += " AND (%s)" % condition.replace("r.", row + ".")
+        statements.append(sql + ";")
+    return statements
+
+def _triggerStatements(db):
+    """Returns DDL statements that create counter triggers for the connection's database."""
+    statements = []
+    tables = sorted(set(table for table, condition in _counters.values()))
+    for table in tables:
+        inserted = _adjustStatements(table, "NEW", "+")
+        deleted = _adjustStatements(table, "OLD", "-")
+        if db.driverName() == "QPSQL":
+            statements.append("CREATE OR REPLACE FUNCTION fmrd_count_%s() RETURNS trigger AS $$\n"
+                              "BEGIN\n"
+                              "    IF TG_OP = 'DELETE' OR TG_OP = 'UPDATE' THEN\n        %s\n    END IF;\n"
+                              "    IF TG_OP = 'INSERT' OR TG_OP = 'UPDATE' THEN\n        %s\n    END IF;\n"
+                              "    RETURN NULL;\n"
+                              "END;\n"
+                              "$$ LANGUAGE plpgsql" %
+                              (table, "\n        ".join(deleted), "\n        ".join(inserted)))
+            statements.append("DROP TRIGGER IF EXISTS fmrd_count_%s ON %s" % (table, table))
+            statements.append("CREATE TRIGGER fmrd_count_%s AFTER INSERT OR UPDATE OR DELETE ON %s "
+                              "FOR EACH ROW EXECUTE PROCEDURE fmrd_count_%s()" % (table, table, table))
+        else:
+            statements.append("CREATE TRIGGER IF NOT EXISTS fmrd_count_%s_insert AFTER INSERT ON %s "
+                              "BEGIN %s END" % (table, table, " ".join(inserted)))
+            statements.append("CREATE TRIGGER IF NOT EXISTS fmrd_count_%s_delete AFTER DELETE ON %s "
+                              "BEGIN %s END" % (table, table, " ".join(deleted)))
+            statements.append("CREATE TRIGGER IF NOT EXISTS fmrd_count_%s_update AFTER UPDATE ON %s "
+                              "BEGIN %s END" % (table, table, " ".join(deleted + inserted)))
+    return statements
+
+def InstallCounters(connectionName=None):
+    """Creates counters table and triggers, and initializes every counter from its table.
+
+    Runs in one transaction, so that no record written meanwhile is missed.
+    Returns True if successful.
+    """
+    db = _connection(connectionName)
+    connName = db.connectionName()
+    InvalidateCounters(connName)
+    if not db.transaction():
+        return False
+    ok = ExecQuery("CREATE TABLE IF NOT EXISTS %s (counter_name VARCHAR(64) PRIMARY KEY, "
+                   "counter_value INTEGER NOT NULL)" % COUNTER_TABLE, (), connName)
+    for sql in _triggerStatements(db):
+        if not ok:
+            break
+        query = QSqlQuery(db)
+        ok = query.exec_(sql)
+    if ok:
+        ok = ExecQuery("DELETE FROM %s" % COUNTER_TABLE, (), connName)
+    for name in sorted(_counters.keys()):
+        if not ok:
+            break
+        ok = ExecQuery("INSERT INTO %s (counter_name, counter_value) %s" %
+                       (COUNTER_TABLE, _countQuery(name).replace("COUNT(*)", "'%s', COUNT(*)" % name)),
+                       (), connName)
+    if not ok:
+        db.rollback()
+        return False
+    return db.commit()
+
+def RefreshCounters(names=None, connectionName=None):
+    """Recounts counters from their tables, e.g. after positions have been renamed.
+
+    Arguments:
+        names -- list of counter names (all counters if None)
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    db = _connection(connectionName)
+    connName = db.connectionName()
+    if not db.tables().contains(COUNTER_TABLE):
+        return
+    for name in sorted(names or _counters.keys()):
+        ExecQuery("UPDATE %s SET counter_value = (%s) WHERE counter_name = ?" % (COUNTER_TABLE, _countQuery(name)),
+                  (name, ), connName)
+    InvalidateCounters(connName)
+
+def _readCounters(db):
+    """Returns {counter name: value} of all rows of counters table."""
+    counters = {}
+    if db.tables().contains(COUNTER_TABLE):
+        rows = RowsQuery("SELECT counter_name, counter_value FROM %s" % COUNTER_TABLE, (), db.connectionName())
+        for name, value in rows:
+            counters[unicode(name.toString())] = value.toInt()[0]
+    return counters
+
+def _loadCounters(db):
+    """Reads all counters, installing them if any is missing.  Returns dict, or None if counters are unavailable."""
+    counters = _readCounters(db)
+    if set(counters.keys()) != set(_counters.keys()):
+        if not InstallCounters(db.connectionName()):
+            return None
+        counters = _readCounters(db)
+        if set(counters.keys()) != set(_counters.keys()):
+            return None
+    return counters
+
+def CounterValue(name, connectionName=None):
+    """Returns value of record counter, or -1 if it cannot be determined.
+
+    Arguments:
+        name -- counter name (e.g. "teams", "starters")
+        connectionName -- name of database connection (default connection if None)
+
+    """
+    db = _connection(connectionName)
+    connName = unicode(db.connectionName())
+    if connName not in _cache:
+        _cache[connName] = _loadCounters(db)
+    counters = _cache[connName]
+    if counters is None:
+        # counters unavailable: count table rows directly
+        value = ScalarQuery(_countQuery(name), (), connName)
+        if not value.isValid():
+            return -1
+        return value.toInt()[0]
+    return counters[name]
+
+def InvalidateCounters(connectionName=None):
+    """Discards cached counter values of a database connection, or of all connections if no name is given.
+
+    Must be called after records of a counted table have been written, and when a connection
+    is (re)opened.
+    """
+    if connectionName is None:
+        _cache.clear()
+    else:
+        _cache.pop(unicode(connectionName), None)
@@ -1,4 +1,23 @@
-__all__ = ["CheckTables", 
+__all__ = ["Benchmark", 
+               "CheckTables", 
                "CustomDelegates", 
                "CustomModels", 
-               "MsgPrompts"]
+               "DataGenerator", 
+               "DialogPool", 
+               "DialogRegistry", 
+               "FeedExporter", 
+               "FeedImporter", 
+               "IDAllocator", 
+               "LineupReadiness", 
+               "MsgPrompts", 
+               "Prewarm", 
+               "QueryCache", 
+               "QueryExecutor", 
+               "QueryStats", 
+               "ReferenceData", 
+               "Resources", 
+               "RosterState", 
+               "ShootoutState", 
+               "StartupTimes", 
+               "TableChanges", 
+               "TableCounters"]
@@ -1,862 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: Mon Aug 8 00:36:24 2011
-#      by: The Resource Compiler for PyQt (Qt v4.6.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt4 import QtCore
-
-qt_resource_data = "\
-\x00\x00\x05\xbc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x05\x4e\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\xc3\x40\x02\x80\x00\x62\xc0\xe6\x80\xc7\xe6\x0c\
-\x89\x4f\xcc\x19\x3e\xec\xd7\x65\xb0\x04\x72\xd9\x80\x98\x91\x5c\
-\xf3\x4f\x8a\x33\x18\x9e\x16\x67\x38\xb0\x5f\x94\x21\x0d\xc8\x65\
-\x07\x62\x26\x64\x79\x80\x00\x62\xc2\x66\x39\x50\x70\x1e\x9b\xaa\
-\x02\xbf\x3c\x2b\xc3\xce\x59\x4a\x0c\x0e\x50\x8d\x8c\xe4\x58\x0e\
-\x34\x6b\x3f\xaf\x94\x80\x3d\x0f\x03\xc3\xcc\x95\xfc\x0c\x39\x40\
-\x61\x2e\x64\x7b\x01\x02\x08\x25\x04\x40\x96\x3f\x35\x67\xf8\xff\
-\x75\x4a\xda\xff\x7f\xc7\xb7\xfe\x7f\x93\x65\xf2\xff\x8e\x1e\xc3\
-\xa7\x69\x72\x0c\xee\x40\x69\x0e\x52\x1c\x01\xf5\xf9\x87\xfb\xb6\
-\x52\xff\xff\x95\x47\xfe\x7f\x1d\xa0\xf7\xff\xa4\x20\xc3\xff\x45\
-\xbc\x0c\x65\x40\x69\x1e\x98\x23\x00\x02\x88\x09\xdd\xe7\x02\xb1\
-\x69\x0c\x9c\xc6\xfe\x0c\x0c\x7f\xff\x30\x08\x85\x55\x30\xf0\x99\
-\x1b\xf2\x3a\xf3\x30\xac\x9e\x22\xc3\x60\x4f\x6c\x48\xc0\x7c\x2e\
-\xa2\x26\xc5\x2f\x6f\x05\xd4\xf6\xeb\x17\x83\xb0\x8c\x02\x83\x92\
-\xb9\x06\x83\x2a\x23\x43\xe7\x42\x6e\x86\x2c\x58\x48\x00\x04\x10\
-\x13\x2e\xcb\x19\xfe\xfc\x06\xd3\x22\x21\x45\x0c\xfc\x66\xfa\xbc\
-\x4e\x40\x47\x4c\x92\x22\xec\x08\x6c\x96\x33\xfc\xfe\x0d\x71\x84\
-\xa4\x34\x83\xb2\xa1\x12\x83\x2a\x13\x43\xe7\x02\x2e\x88\x23\x00\
-\x02\x08\xec\x00\xa0\x69\xfd\xac\xaa\x0a\x18\x96\x83\xe9\x3f\x7f\
-\x18\xc4\x02\xb3\x19\x04\x8d\x75\x78\x9d\xb8\x19\x56\x4f\x90\xc0\
-\xed\x08\x7c\x96\xc3\x68\x11\x31\x31\x06\x3e\x21\x4e\x06\x45\x46\
-\x86\x5a\xa0\x16\x11\x80\x00\x02\x3b\xe0\xf6\x37\x06\xcf\x2f\xd7\
-\x1e\x7c\x7e\xb7\xb8\x1e\xc3\x72\x18\x5f\xdc\x3f\x95\x41\xd0\x50\
-\x83\xd7\x89\x93\x61\x75\x9f\x18\xa6\x23\x88\xb1\x9c\xe1\xd7\x6f\
-\x86\x3b\x97\xaf\x33\xbc\x79\xf3\xfd\xeb\xac\x9f\x0c\xa5\xa0\x10\
-\x00\x08\x20\xb0\x03\x1c\x2f\x33\x9c\xdd\xf3\x81\x21\xe4\xc3\x91\
-\x33\x9f\xdf\x2c\x6d\xc5\xb0\x1c\x4c\x03\x0d\x91\xf4\x8e\x67\x10\
-\x34\x50\xe3\x75\xe2\x60\x58\xdd\x2b\x82\x70\x04\x29\x96\x3f\x7b\
-\xfc\xf1\xeb\x8c\x9f\x0c\x65\x4b\xff\x30\x9c\x07\xea\xfd\x08\x10\
-\x40\x8c\xa0\x5c\xc0\x08\x04\x20\xc3\x80\xa9\xdd\x1e\x94\xe0\x40\
-\x71\x0e\x0a\x76\x64\xcb\x21\x8e\x82\xe0\x27\x9b\x97\x32\xbc\xb9\
-\x70\xef\xf3\xbe\xaf\x0c\xa1\xea\xcc\x0c\x1f\x24\x98\x19\x76\x92\
-\x62\xf9\x8a\x3f\x0c\x67\x81\xf6\x3d\x05\xe2\x37\x00\x01\x04\x73\
-\x00\x34\x29\x30\xb0\x83\x52\x3b\x28\xc1\x81\xe2\x1c\x14\xec\xe8\
-\x96\x83\xf9\x40\xfc\x78\xc7\x5a\x86\x57\x17\x1f\x7c\x06\x6a\xff\
-\x2f\xaa\x26\xc5\x47\x8e\xe5\x40\xfc\x13\x20\x80\x90\x1d\x00\x77\
-\x04\x28\xb5\x83\x12\x1c\x28\xce\x41\xc1\x8e\x6e\x39\xc3\xef\x5f\
-\x90\x90\x38\xb8\x0b\x18\x4a\xff\x19\x64\x8c\x2d\xc8\xb2\x1c\x88\
-\xff\x03\x04\x10\xba\x03\xe0\x8e\x00\xa5\x76\x50\x82\x03\xc5\xb9\
-\xb4\x47\x38\x86\xe5\x08\xfe\x6f\xb2\x2d\x07\x59\x06\x10\x40\xd8\
-\x1c\x00\x77\x04\x28\xb5\x83\x12\x9c\x90\x9e\x12\xaf\x8c\x73\x20\
-\xd5\x2d\x07\x01\x80\x00\xc2\xe5\x00\xb8\x23\x40\xa9\xdd\x11\xe8\
-\x08\x61\x6d\x05\x5e\x59\x7b\x0f\xaa\x5a\x0e\x02\x00\x01\x84\xcf\
-\x01\x70\x47\xf4\x08\x32\xd8\xdb\xb3\x33\xac\x16\xd5\x94\xe5\x95\
-\xb3\x76\xa4\x9a\xe5\x20\x00\x10\x40\x4c\x84\x6a\x6b\x90\x46\x50\
-\x56\x03\xa5\xf6\xff\x7f\xfe\xe2\xb5\x1c\x12\x32\xff\x18\xfe\xff\
-\x03\x17\x10\x20\x0b\x5f\x03\xf1\x5b\x5c\x96\x83\x00\x40\x00\x11\
-\x0a\x01\xa2\x4b\x38\x08\x1b\xc2\xbf\x7d\xeb\x11\xc3\xb3\x57\xdf\
-\xbe\xec\xfe\xc3\x10\xd9\xf6\x87\x61\x2f\xd0\x98\x1f\xb8\x1c\x00\
-\x10\x40\x4c\xa4\xd6\x6a\x84\x2c\x67\xf8\xf9\x9b\x41\x55\x42\x98\
-\x41\x92\x9f\x9d\xc7\x95\x89\x61\x59\x13\x0b\x83\x1d\xbe\x0a\x0c\
-\x20\x80\x98\xa8\x6d\x39\xc3\x4f\x10\xfd\x87\x41\x4d\x88\x97\x41\
-\x92\x9b\x85\xd7\x86\x81\x61\x75\x23\x33\xee\x0a\x0c\x20\x80\x98\
-\x28\xb1\x1c\x94\xe0\xee\x5c\xbe\x85\x61\x39\xd8\x41\x3f\x7e\x33\
-\xa8\x71\xb2\x33\x48\xb2\x32\x82\x1d\xd1\xc0\x84\xdd\x11\x00\x01\
-\x84\x91\x06\x48\xad\x58\x40\x09\x4e\x4a\x94\x8b\x1b\x14\xec\xc8\
-\x96\x83\xd9\x20\xfa\xfb\x1f\x86\x9b\xbf\xfe\x31\x3c\xfd\xc7\xf0\
-\xf9\x08\x03\x43\x68\xc3\x7f\x86\x83\xc8\x89\x12\x20\x80\x50\x1c\
-\x40\x4e\xad\x06\x4a\xed\x09\x2c\x0c\x13\x40\x71\x0e\x0a\x76\x74\
-\xcb\x19\x80\x96\x33\x00\x33\xcf\x4d\x46\x70\x7e\xfc\x7c\xe4\x3f\
-\xd0\x11\x0c\x08\x47\x00\x04\x10\xdc\x01\xe4\x58\x0e\xcd\xe7\xaf\
-\xab\x58\x18\xb4\x40\x09\x0e\x14\xe7\xa0\x60\x47\xb7\x1c\x06\x6e\
-\x32\x40\x1d\xc1\x80\x70\x04\x40\x00\x81\x1d\x70\x4a\x82\x91\x5c\
-\xcb\x9f\x42\xf3\x39\x03\x28\xb5\x83\xe2\x1a\x14\xe7\xea\xa0\x68\
-\x46\xb3\x1c\x97\x23\x00\x02\x08\xec\x80\xb3\x12\x8c\xef\x79\xa4\
-\x04\x04\xd4\xdc\x3c\xc9\x2d\xe1\x40\x80\x1d\x94\xda\x41\x8e\x90\
-\x62\x60\xe0\x55\xff\x8b\x3b\x7b\x5f\x00\xe2\x77\x40\x47\xb8\x30\
-\x30\x68\x02\x04\x10\x38\x17\x7c\xfc\xc7\x50\xf1\xf9\xc9\x07\x86\
-\xb7\x37\xaf\x92\x5b\xbc\x82\x4b\xcc\xfa\xbf\x0c\x07\x0f\x03\xe3\
-\x18\x94\xe0\x6e\xe2\x28\xdb\x5e\x00\xf1\x07\x20\x3e\x0e\xec\x27\
-\x00\x29\x7e\x80\x00\x02\x3b\xc0\xf9\x35\xc3\xc2\x3b\xbf\x18\x4a\
-\xef\x1d\xbc\xc4\xf0\xf6\xce\x2d\x72\xcb\x76\xb0\x23\x1a\xfe\x31\
-\x1c\x04\x05\x2f\x28\x98\x6f\x62\xb1\xfc\x06\x10\x1f\x02\x36\x82\
-\x81\x2d\xd2\x8d\x40\xe6\x37\x80\x00\x82\x75\x4c\x40\x0e\xe1\x01\
-\x75\x1a\x8e\xf3\x31\xfc\x7f\x65\xaf\xf4\xff\x5f\xa8\xc5\xff\x5b\
-\x1a\xfc\xff\x0f\x70\x33\x7c\x89\x60\x01\x37\xa1\xcd\x81\x58\x86\
-\x88\x0e\x0a\x48\x8e\x03\x18\xbf\xee\x7b\x18\x18\x3e\x5d\x67\x00\
-\x57\x0d\xff\x9f\x01\xf1\x3e\x20\x06\x8a\xf7\x01\xe5\x81\x31\xc5\
-\xa0\x0c\xb2\x13\x20\x80\x90\x7b\x46\x60\x47\x00\x3b\x0d\x65\xc7\
-\x78\x19\xfe\x5f\x91\xe7\x24\xc7\x72\xac\x8e\x38\x87\xcb\x72\xa0\
-\x9d\x00\x01\x84\xde\x39\x05\x3b\x02\xd8\x69\x28\x3b\xc8\xcd\xf0\
-\x39\x9a\x85\x21\x83\x0c\xcb\xb1\x3a\xa2\x99\x81\xa1\x1b\xc3\x72\
-\x20\x00\x08\x20\x6c\xb5\x21\x13\xb4\xdb\x24\x02\xa5\x3f\x12\xaa\
-\x52\x09\x38\x02\x54\xfc\x0a\x83\x12\x1c\x38\xce\x21\xe9\x07\x44\
-\xff\x03\x29\x00\x08\x30\x00\x05\x83\x27\x45\xc2\x6d\x4e\xf3\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\x6f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x0d\x00\x00\
-\x0b\x0d\x01\xed\x07\xc0\x2c\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xd3\x09\x09\x14\x14\x16\xe9\x33\x80\x72\x00\x00\x05\xfc\x49\x44\
-\x41\x54\x78\xda\xc5\x97\x5d\x6c\x1c\x57\x15\xc7\x7f\xf3\xb5\xbb\
-\x63\xc7\x6b\xef\x66\x69\x12\x3b\xa9\x93\xe2\x56\x0e\x21\x91\xe3\
-\x81\x08\x11\x12\x1a\x20\x54\x8d\x22\x22\xaa\x4a\x7d\x69\xa1\x1f\
-\x58\x60\xc9\xad\xfa\x50\x55\x08\x24\xa4\x20\x40\x48\x3c\x14\x09\
-\x1e\x4a\x57\x4e\x09\xa4\x42\xed\x43\x0b\x08\xf5\x21\x25\x4a\x95\
-\xb6\x29\x95\xea\x49\x6d\xb7\x29\x5f\x8b\x92\xa6\xce\xba\xf1\xc7\
-\xee\xba\xbb\x3b\xb3\x3b\x33\xf7\xf2\xb0\xb3\xf6\x6e\xbd\x6b\xa7\
-\x10\xc4\x95\xfe\x5a\xcd\x9e\x73\xe7\xfc\xcf\xb9\x67\xce\x39\x17\
-\xfe\xcf\x4b\xf9\x38\xca\xc3\xa3\x93\x3b\x40\x1e\x02\x31\x04\x0c\
-\x21\x45\xc3\x3b\xe4\x14\x52\x4c\x21\xbc\xb3\x16\x27\x33\x80\x48\
-\xa7\xd3\xf2\x86\x10\x18\x1e\x9d\x7c\x00\xb8\x1f\x38\x08\x12\x10\
-\xa0\x46\x40\x8d\xd5\x14\x84\x0b\x81\xdb\xb8\xe5\x3c\xc2\x3f\x65\
-\xc9\xf1\x13\x80\x97\x4e\xa7\xc5\x7f\x44\x60\x78\x74\x72\x2f\x8a\
-\xfa\x04\x52\x7c\x11\x55\x83\x48\x0f\x44\x92\x44\xa2\x26\xdb\xe2\
-\x4b\x7c\x76\x6b\x0e\x80\xa2\x0b\x67\x2e\xf5\xe3\xb8\x55\xa8\xcc\
-\x81\xbb\x00\xd2\x03\xa4\x43\xe0\x3e\x66\xf1\x9b\x5f\x03\x6e\x2b\
-\x22\xca\x3a\x5e\x9f\x00\xc0\xdc\x4c\x64\xc3\x4d\x3c\xb4\x6f\x86\
-\xdd\xb7\x6c\xe0\xb6\xad\x1d\xc4\x22\xea\xaa\x3d\x33\xf3\x15\xfe\
-\xf2\x6e\x81\x57\xfe\x0a\x6f\x5e\x32\xa0\x74\xb9\x26\x08\xaa\x2f\
-\x58\x3c\xfd\x2d\x60\x29\x9d\x4e\xfb\xeb\x12\x58\x36\xae\x45\x21\
-\x7e\x1b\xf7\xee\x7d\x9f\x63\xfb\x53\x24\x36\xe8\x6d\xa3\x25\x3f\
-\xf2\xaa\x57\xa6\xf3\xfc\xea\xac\xc1\x07\xb3\xb3\xe0\x17\x41\x78\
-\x53\x96\x3c\xf1\x55\x60\xae\x31\x12\x5a\x5b\xe3\x7a\x07\xdb\xb6\
-\x6d\xe1\xb1\x3b\x8a\x1c\xfe\x4c\x12\x43\x57\xf1\x05\x4d\xf8\xee\
-\xa9\x22\xa7\x27\xab\x1c\xdc\x15\x21\x10\xb2\x09\x7d\xa9\x28\x07\
-\x06\x21\x57\xf4\xb9\x34\xa7\x80\x0c\x36\x65\xe5\xae\x4f\xf5\x32\
-\xf9\x07\xcb\xb2\x7c\xdb\xb6\xe5\x2a\x02\xc3\xa3\x6f\xed\x05\xe5\
-\x45\x34\x83\xbe\xbe\x3e\x1e\x3f\x2a\xd9\xbe\x29\x86\xe7\xcb\x55\
-\x38\xfe\x5c\x99\xf1\xb1\x24\xc7\xf6\x99\x3c\x3a\x5e\xe0\x73\xb7\
-\x6a\xab\x74\x74\x4d\x61\xf7\x76\x93\x6b\x4b\x82\x2b\x0b\x00\xf2\
-\xd6\xac\xb7\xe3\xf5\x5e\xf5\xe2\x95\x90\x04\x1f\x3d\xc8\xa7\x21\
-\x80\xf8\x20\x0f\x1e\x70\x89\x77\xe8\x94\x2b\xb2\x25\xc6\xc7\x92\
-\xcb\x9b\xc6\xc7\x92\xfc\xe4\x79\xa7\xa5\x9e\x90\xf0\x8d\x43\x71\
-\x06\x6e\x4e\xd4\x94\x23\x3d\xc7\x81\x04\xa0\x37\x45\x60\x78\xd4\
-\x7e\x00\xe4\xb7\x31\x7b\xb9\x6f\x5f\x8e\x9d\xfd\x1b\xf0\x02\xd9\
-\x16\x5b\x53\xd1\x26\xe6\xc7\xf6\x99\x7c\xef\x99\x0f\xd9\xd3\xaf\
-\xac\xd2\x95\xc0\xf6\x94\xe0\x5c\xa6\x07\xbc\xa5\x2d\x59\xb1\x33\
-\xdf\xab\x4c\x5d\xb0\x2c\xab\xba\x12\x01\x29\xee\x07\x8d\x4d\xa9\
-\x2e\x06\xfb\x3b\x29\xb9\x62\x4d\xb4\x5a\xe3\x63\x49\x9e\xfa\xb3\
-\xd7\x52\x3f\xde\x69\xf0\xf5\xa1\x02\x28\x06\x68\xb1\xbb\x80\x1e\
-\xc0\x50\x01\x86\xbf\xf3\xe6\x0e\xe0\x20\xb1\x8d\x7c\x69\x60\x01\
-\x3f\x80\x72\x25\x58\x13\x7f\x7a\x63\xb1\x2d\x89\x67\x5e\x6d\xd6\
-\x2d\x94\x7c\xfe\x95\x2d\x23\xd1\x20\xb6\x11\x14\x6d\x68\xa2\x72\
-\x64\x27\x10\xab\x7f\x57\x87\x6a\xe7\x93\x24\x15\x5f\xa2\xe4\x88\
-\xeb\x2a\xcd\xcf\xbe\x3c\xcf\x3d\xb7\xa7\x5a\x92\x78\xe8\x97\x8b\
-\xec\xe9\x2d\xf3\xde\xa2\xc2\x1b\x33\x7d\x2b\xc2\x88\x03\xce\x2c\
-\x18\xdd\xfb\x81\x0b\x75\x02\x43\x00\x9b\xbb\x05\x92\x9a\xf7\x00\
-\xaf\xfe\xc3\x58\x97\xc4\xe9\xb7\x17\x9b\x12\xb2\x99\x04\xfc\x6d\
-\xa1\x59\x16\x89\x9a\x54\x01\xd4\xc8\x20\x60\xae\x10\xd0\x62\x24\
-\xcc\x2a\xc5\xd0\xfb\xb7\xde\x8f\xb6\x7c\xf1\xc7\x59\xe3\x63\x49\
-\x0e\xfc\x30\x4c\xb1\xb0\x2d\x69\x2a\xb5\x3c\x50\x83\x01\x04\xb1\
-\x95\x24\x54\x63\xc4\xa3\x55\x4a\x15\x41\xa9\x22\xfe\x6b\xe3\xcb\
-\x15\xf1\x07\x35\xe3\x4a\x63\xa1\xd4\x3b\x41\x4a\x05\x30\xf4\xc6\
-\x92\x5c\xf2\x22\x7c\xe8\xf8\x37\xbe\xe7\xb7\x6f\x79\xea\x4a\x71\
-\x17\x2e\x39\x27\x86\xae\xca\xff\xdd\xf0\x51\x27\xe2\x97\x56\x18\
-\x2c\x0f\x13\x81\x4b\xbe\x12\x25\x5b\xec\x22\x5b\xec\xe2\xc8\x4f\
-\xbd\x1b\x62\xb4\x9e\x03\x00\xba\x1a\xe6\x82\xf4\x40\x7a\x19\x40\
-\xe8\x61\x11\x9a\x42\xd1\x28\x39\x3e\x86\xb6\x12\x94\x2f\xff\x58\
-\x34\x74\xbb\xe6\xaa\xed\x05\xcd\xe7\xbc\x96\x71\xa3\xa1\xe3\x38\
-\x6e\x35\x6c\xd1\x95\x0c\x1a\x5e\xcd\x9a\xf0\xce\xa2\x69\x50\x5d\
-\x40\x55\xb7\x5c\x97\x67\x75\x02\xeb\x19\x5f\xce\xfc\xfa\xaa\x2e\
-\x84\xbf\x39\x1b\x13\x57\x05\x08\x67\xb8\xf3\x38\x73\x18\x8a\x87\
-\xa9\xb7\x87\xeb\x81\xeb\xad\x6d\xfc\x6b\x3f\xf3\x48\x98\x2b\xa8\
-\xef\x35\x14\x0f\x9c\x39\x10\xfe\xb4\x65\x9e\xbe\x0c\x38\xf5\x78\
-\x0b\x84\x7f\x0a\x95\xcf\x2f\xe5\xe7\xf9\x64\x5f\x67\x5b\xcf\x13\
-\x31\x07\x80\x93\x0f\xc7\x5b\xca\xbf\xf9\x8b\x25\x12\xb1\xd6\x7b\
-\x33\x33\xa5\xda\xf9\xfb\xc5\x97\xd0\x28\x01\x8e\x06\x60\xdb\x36\
-\x47\x87\x95\xe9\xac\x6a\x7d\xc5\xaf\x14\xb7\xa6\x12\x71\x7a\xcc\
-\x80\x98\xde\x1e\x77\x5a\x1d\xab\x0c\x3c\xf2\xd4\x7c\x5b\x7d\xa7\
-\x22\xc8\x5e\xbd\x52\xf3\x5e\xf9\xed\xcf\x81\x0f\x80\x7c\xe3\x8c\
-\xe5\x11\xb8\x8f\xa3\x99\xe7\x32\x97\x67\xf8\xc2\x9e\x4f\x60\x68\
-\xd7\xff\x49\x7e\xff\xe4\x55\xba\xa2\xed\xf2\x45\x21\x73\x79\xae\
-\xf6\xe0\x66\x9f\x24\x4a\x1e\xc8\x03\xde\x72\x7e\xda\xb6\x2d\x8f\
-\x5a\x7a\x36\x2b\x3f\x9d\x0b\x84\x7a\xc7\x7c\xbe\xc2\x40\x6f\x84\
-\x88\xa1\x61\x68\xca\x2a\x9c\x7b\xbb\xc8\xc1\xdd\x5d\x00\xfc\xe8\
-\x77\xd9\x96\x3a\x86\xa6\xa0\xe2\xf3\xda\x54\x8e\xb2\xeb\x41\x35\
-\xf7\x84\x65\xfc\xfe\x0c\x90\x05\xf2\xe9\x74\x3a\x68\x1a\xc9\x2c\
-\xcb\x92\xbd\x4c\x4e\x66\xe5\xae\x42\x35\x50\x0f\x5f\x99\xab\xd2\
-\x9f\x52\xe9\x30\xa3\xe8\x9a\xb2\x0a\xe7\x2f\x96\x38\x7f\xb1\xd4\
-\x52\xa6\x6b\x0a\xae\x53\xe6\xcc\x85\x02\x25\x27\x34\xae\x3d\xf7\
-\x3c\x30\x0b\xcc\x03\x55\xdb\xb6\x9b\x67\x42\xdb\xb6\xb1\x2c\x2b\
-\xa8\x93\xf0\x84\x76\xf8\xef\x33\x2e\x9e\x50\xd9\xb6\x51\xc5\xd0\
-\x55\x74\x95\x75\xa1\x48\x9f\x89\x7f\x96\x79\xfd\x9d\x3c\x9e\x2f\
-\x1a\x8d\x67\x81\x6b\x80\x53\xbf\x35\xb5\xac\xd2\x23\x23\x23\x2a\
-\xd0\x31\xe1\xdf\x7d\x3b\x91\x9e\xe3\x28\xda\x70\xd4\x50\xb9\x79\
-\x73\x07\xbb\x7a\x05\xc9\x64\x37\x9a\xd6\xdc\xaa\x83\xc0\x63\x71\
-\xb1\xc0\x3b\x57\x55\xde\x9b\x2d\x53\xf1\x04\x08\x7f\x1a\x37\xfb\
-\xa4\x15\x7d\xf1\x42\x98\x74\xd7\x80\x72\xe3\x58\xde\xb6\x4d\x84\
-\x24\x62\x40\x62\x42\xde\xfb\x20\x5a\xec\x2e\x14\x6d\xa8\x2e\x37\
-\x23\x90\xea\xae\xe5\xf0\x7c\xc1\xc7\xa9\x36\x6c\x16\xfe\x34\x7e\
-\xf1\x25\x4b\x7b\xf6\x8f\x61\xb2\xcd\x03\xb9\x56\xb7\xa3\x35\xaf\
-\x66\x23\x23\x23\x4a\x38\xbd\x76\x02\x3d\x13\x95\x23\x3b\x31\xba\
-\xf7\xa3\x46\x06\x51\x8d\x81\xb0\xa5\x86\xb5\xda\xcb\x10\x54\x32\
-\x54\x73\x76\x58\x64\x4a\x40\x21\x24\x50\x02\xfc\x56\x97\xd5\xeb\
-\xba\x9c\x86\xd1\x30\xc2\x88\x98\x21\x62\xe1\x7f\xea\x72\x31\x03\
-\x0f\x70\x01\x27\x84\xbb\xde\xe5\xf4\xdf\xbb\x32\x46\xa9\x19\x56\
-\x7e\x4c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\xff\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
-\x67\x9b\xee\x3c\x1a\x00\x00\x04\x91\x49\x44\x41\x54\x58\x85\xb5\
-\x97\xcd\x8b\x1c\x45\x18\x87\x9f\xb7\xba\xba\x7b\xa6\x67\xe7\x63\
-\x37\x2c\x09\x78\x30\x18\xd4\x9b\x91\x48\x6e\xf1\xe3\x5f\xc8\x31\
-\x7f\x80\x82\x07\xcf\x09\xe2\x41\x41\xd4\x15\xa2\x08\x9e\x14\x04\
-\x3d\x8b\x39\xe8\x41\xcc\xd5\xb8\x89\x18\xc8\x42\x44\x8c\x21\x64\
-\x51\x31\xee\x46\xd7\x9d\xc9\xec\xc7\x74\x55\xbd\x1e\xba\xe7\x2b\
-\x6e\xb2\x3d\x92\xd4\x30\x5d\x45\xd1\xbc\xbf\xe7\xfd\xbd\x55\xd5\
-\xdd\xa2\xaa\x54\x6d\xe9\x67\xf1\x29\x44\x5e\x14\x15\x11\x05\x13\
-\x0c\x06\x23\x31\x56\x2c\x31\x91\x46\x72\xa7\xdf\xfb\xaa\xf7\xca\
-\xd6\xbb\x55\x63\xda\xaa\x37\xc6\x9f\xda\xc6\xc9\x23\x27\x3f\x38\
-\x7d\xf4\xf4\x62\x62\x12\x02\x4a\xc0\xe3\xf0\x38\x1c\x4e\x1c\x1e\
-\xcf\x85\x9b\xdf\x3e\xd3\x7e\xb3\xf1\xe5\xe6\x6b\xfd\x9f\xaa\xc4\
-\x35\x55\x01\x10\x16\x8f\x1d\x38\x56\xaf\x49\x8d\xa0\x01\xa7\x39\
-\xb9\xe6\xe4\x3a\x20\x0f\x03\x5c\xc8\xc9\xc3\x80\xc3\x0b\x87\x6b\
-\xc0\xa3\x55\xc3\x56\x76\x40\x81\xa0\x81\x41\x18\xe0\x70\x78\x02\
-\x8e\x7c\xd4\x3b\xf5\x85\x17\xc1\x55\xce\x69\x26\x00\x01\x7c\xf0\
-\xb8\xe0\x18\xfe\x4a\x49\x72\x1c\x01\x5f\xf4\x21\x3c\x1c\x00\xb4\
-\x00\x18\x3b\xe0\x71\xea\xf0\xe2\xa7\x80\xbc\xfa\x87\x05\x20\xf8\
-\xe0\x35\x0f\x39\x4e\xa7\x1d\x08\x12\xc8\xc9\x0b\x80\xe0\x91\xea\
-\x1b\x6b\x86\x12\x04\x08\xc1\x93\xfb\x7c\x4a\x7c\xd4\x97\x4e\x78\
-\xef\x28\x0a\xf6\xc0\x01\x04\xe7\x3d\x43\x07\x82\x78\xf2\xa1\x13\
-\x32\x86\xf0\xea\x8b\x15\xfb\xe0\x01\x20\x78\xaf\xb9\x1f\x4c\x64\
-\x5f\xee\x80\xe1\x8c\x94\xbb\x60\x16\x80\xfa\x87\xe9\x93\xad\xb4\
-\xf9\xd1\x89\x47\x9e\x5d\x54\x54\x95\x40\xa0\x18\x29\x4a\xd0\xa0\
-\x01\xe5\xf9\x43\x2f\x44\x0b\xe9\x42\x92\x7b\x57\x1e\x3f\xbe\x94\
-\x76\xe3\xab\x78\xba\xbe\x07\x73\xfa\x4e\xe7\xfd\xb9\xd7\x45\x81\
-\x00\x20\x48\x00\x04\xb4\x5c\x20\xe2\x64\xcb\xfc\x23\x2f\x5b\xa3\
-\x66\xe9\xec\x89\xf7\x9e\x7b\x7c\xfe\x09\x7c\xf0\x78\x2d\xb2\xf0\
-\x1a\xf0\xc1\xe1\xb5\x0c\x5e\xf6\xd3\x0e\x4c\xec\x00\xf1\x38\x71\
-\x2c\x6f\x5d\x30\xfe\xb8\x1e\xd5\x28\x40\x04\x1a\x01\x91\xa2\x11\
-\xa8\xd5\x72\x4e\x51\x07\x8d\x73\xe9\x92\x8d\xd5\x76\x1e\x6b\x1f\
-\xc1\x85\xbc\x14\xf6\xb8\x12\xc4\x87\x72\xab\x69\x51\xdb\x29\xc1\
-\xd1\xb8\x3c\x05\xc4\x71\xb9\xf7\x03\x97\x36\x2e\x21\xa6\xc8\x5a\
-\x51\x04\xc6\x57\x19\xce\x09\x58\x05\x43\xdb\xa2\xfc\x27\xeb\x91\
-\xe8\xc8\x91\x21\xc0\x54\xc5\x47\x7d\x3f\xdc\xe1\xfc\xfa\x37\xac\
-\xf4\x57\xd0\x48\x21\x12\x04\x9d\x82\x00\x41\xa5\x10\x1f\x41\x00\
-\x56\x9d\xea\xc0\x0f\x0a\xf1\xbb\xb3\x2e\x4f\xbe\x62\x3c\x2c\xc3\
-\x58\x7c\x6d\xf7\x4f\x2e\xfe\xbd\xcc\x4a\x77\x05\x67\x72\x88\x28\
-\x03\x0f\x25\xee\x82\x98\x70\x40\x51\x50\xb0\xa8\x92\x87\x7c\x64\
-\xb3\x0b\x8e\x30\x2a\x83\x1f\x3b\x12\x7c\x71\xde\xab\xe3\x97\xee\
-\x35\x2e\xae\x2f\x73\xbd\x7f\x7d\x54\xd3\x61\xd6\x2a\xf7\x81\x90\
-\xc9\xd2\x48\x09\xe0\x61\xc7\xef\x00\xec\x99\x75\xe1\x46\xe0\xf6\
-\xf6\x3a\xd7\x36\x7e\xe6\xfb\x5b\x17\xb9\xbd\x7b\xbb\xc8\x36\xa2\
-\x0c\x3f\x21\x28\x5a\xce\x15\x6d\x0a\x42\x26\xca\x51\xee\x55\x2b\
-\x0a\xcb\x7f\x7c\xc7\xf1\x83\xc7\x71\xa5\xfd\x5b\xf9\x16\x37\xbb\
-\x37\x58\xed\xde\x64\xb5\xb7\xca\x6f\xbd\x5f\xe9\xbb\xfe\xf4\x06\
-\xf6\x93\xc2\x13\x63\x11\xf6\x58\x7e\x7b\xae\x09\x14\xac\x78\xe1\
-\x93\x1f\x3f\xe6\xdc\xf5\xcf\x49\xa3\x1a\x41\x3d\x6b\xdb\x6b\xfb\
-\x9f\x20\x7a\x0f\x08\xd9\xbb\xfe\xa3\x39\x99\x84\x00\x8b\x16\xc3\
-\x8d\xdd\x8d\xfd\x45\xab\x40\xc8\xbd\x17\xe1\xb0\x44\xa3\xb9\x00\
-\x56\x1c\xe7\xc3\x66\x78\x4a\x12\x69\xde\xef\x04\x15\x80\x18\x2b\
-\x56\xa6\x9f\x34\x77\x43\x04\x90\xbe\xe4\x18\x05\x23\x88\x51\xd4\
-\x08\x6a\x28\xce\x87\x48\x50\xa3\x98\x9e\xe9\x91\xcb\x79\x51\x55\
-\x0e\xbc\xda\x7a\x5a\x45\x0f\x8d\x95\xf6\xc8\x14\x0e\xca\x9c\x2c\
-\x99\x05\x39\xb8\x17\x60\x6a\x53\xe2\x38\xc1\x6c\x4b\xde\xbd\xd6\
-\x7d\x03\xb8\xbc\x8f\x7f\xb7\xd6\xcf\x6e\x5e\xb1\x00\x7f\xbd\xd5\
-\xbd\xb2\xcf\xcd\x1c\x38\xd3\x3a\xbc\xd7\x73\x3e\xb3\x19\x99\xcd\
-\xa8\xdb\x8c\xc4\xc6\x68\x10\xe9\xd2\xbd\xbc\x7e\x76\xf3\xeb\xfd\
-\x62\xc2\x8c\x8f\xe3\x49\x00\x41\x68\x25\x6d\x5a\x49\x8b\x46\xdc\
-\x20\x8b\x33\xd2\x28\xc5\x05\xc7\x8d\xaa\x41\x67\x02\xf0\x94\x4f\
-\xb6\xa2\x75\xd2\x0e\x9d\x74\x9e\x56\xda\xa6\x19\x37\xc9\xe2\x8c\
-\x7a\x54\x67\xc7\x6f\xcf\x20\x3f\xcb\x2b\xd9\x44\x6b\x26\x2d\xda\
-\x25\x40\x27\xed\xd0\x4e\xdb\x34\x6c\x83\x7a\x9c\xd1\x73\xdd\xea\
-\xaf\x43\xff\x07\x20\x31\x09\xcd\xb8\x49\x2b\x69\xd1\x4e\xdb\x63\
-\x27\x92\x16\x59\x9c\x11\x0d\xa2\x99\xe2\xcd\x0c\x50\xb7\x19\x59\
-\x9c\xd1\x88\x1b\x05\xc8\x04\x44\x33\x69\xe2\x77\x1e\xd6\x5b\x71\
-\xd9\x6a\x36\xa5\x1e\xd5\x47\x20\x73\xf1\x1c\xad\xa4\x55\x42\x74\
-\xe8\x27\x77\x66\x2a\x41\xf5\x4f\x33\xc0\x88\xc1\x9a\x98\x38\x8a\
-\x49\x4c\x42\x1a\xd5\xa8\x47\xf5\xc2\x8d\xa4\x49\x27\x9d\x27\x8b\
-\xb3\x99\x12\x9a\x05\x60\x9d\x9c\x5d\x83\x21\x92\x08\x6b\xec\xe8\
-\x1f\x47\x05\x4c\x23\xce\x58\xeb\xae\xed\x00\xab\x55\x83\xca\x2c\
-\x9f\xe7\x8b\x67\xda\xa7\x4c\x64\x5e\x4a\x6d\x6a\xe2\x28\x96\x24\
-\x4a\x24\xb5\x35\x93\xda\x54\x6a\x71\xcd\x44\x26\x92\xab\xbf\x5f\
-\xfd\x62\xed\xed\x8d\xa5\xaa\x31\xff\x05\x9e\x1b\x29\x6a\xf7\x59\
-\xb1\xc0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\x59\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x0d\x00\x00\
-\x0b\x0d\x01\xed\x07\xc0\x2c\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xd3\x09\x09\x13\x12\x2a\x95\x49\x4d\xf6\x00\x00\x05\xe6\x49\x44\
-\x41\x54\x78\xda\xc5\x97\x5d\x8c\x5b\x47\x15\xc7\x7f\x77\xee\xbd\
-\xfe\xda\xac\xf7\x23\x2e\x49\x76\x13\x36\x81\x50\x25\xa4\x91\x36\
-\x7b\xa1\x0f\x44\x09\x09\x10\x22\xa2\x88\x96\x0a\x29\x2f\x2d\x6d\
-\x0a\x2b\xc8\x43\xdf\xaa\xbe\x54\x42\x4a\x05\x02\x89\x87\x22\xf5\
-\xa5\xc8\x22\x25\xb4\x12\x2a\x0f\x14\x10\x0a\x12\x55\x1a\xd4\x88\
-\x0d\x91\xba\xde\xee\x2e\x5d\xaa\xb6\x86\x6c\x83\xe3\x4d\xf6\xc3\
-\x5e\xc7\xf6\xbd\xbe\x1f\x33\x3c\xf8\xee\xda\x8e\xed\x6c\x8a\x0a\
-\x8c\xf4\x7f\xf0\x9d\x33\xf3\xff\x9f\xe3\x99\x33\xe7\xc0\xff\x79\
-\x68\x1f\xc5\x78\xec\xcc\xf4\x2e\x50\x47\x41\x8e\x02\xa3\x28\xd9\
-\xb4\x87\x9a\x41\xc9\x19\xa4\x77\xc9\xe2\x7c\x16\x90\xe9\x74\x5a\
-\x7d\x2c\x02\xc6\xce\x4c\x9f\x06\x9e\x00\x0e\x83\x02\x24\x88\x08\
-\x88\x58\xdd\x40\x3a\x10\x38\xcd\x4b\x26\x90\xfe\x2b\x96\xfa\xf9\
-\x39\xc0\x4b\xa7\xd3\xf2\x3f\x12\x30\x76\x66\xfa\x00\x9a\x78\x1e\
-\x25\xbf\x88\xd0\x21\xd2\x0f\x91\x41\x22\xd1\x38\x3b\x92\x25\x3e\
-\xbf\xbd\x00\x40\xd9\x81\x8b\xd7\x46\xb0\x1d\x17\x6a\x8b\xe0\x2c\
-\x83\xf2\x00\x65\x13\x38\x4f\x5b\xfc\xf2\x17\x80\xd3\x49\x88\xb6\
-\x81\xd7\xe7\x00\x88\x6f\x25\xb2\xe9\x13\x7c\xfb\xc1\x1c\xfb\x3f\
-\xb5\x89\xfb\xb7\x27\x88\x45\x44\xdb\x9a\xdc\x52\x8d\xbf\xfe\x7d\
-\x95\xcb\xef\xc2\x5b\xd7\x4c\xa8\xcc\xd7\x27\x02\xf7\x35\x8b\x97\
-\xbe\x03\x94\xd2\xe9\xb4\xbf\xa1\x80\x75\x72\x3d\x0a\xc9\xfb\x79\
-\xf4\xc0\xbf\x78\xe8\x60\x8a\x81\x4d\x46\xd7\x68\xa9\x3b\xb6\xba\
-\x3c\x5b\xe4\x67\x97\x4c\x6e\x2e\x2c\x80\x5f\x06\xe9\xcd\x58\xea\
-\xdc\x57\x81\xc5\xe6\x48\xe8\x5d\xc9\x8d\x04\x3b\x76\x6c\xe3\xe9\
-\xe3\x65\x8e\x7d\x6e\x10\xd3\x10\xf8\x92\x16\xbc\xf1\x76\x89\x6c\
-\xbe\xc6\xf0\x7d\x51\x02\xa9\x5a\x30\x9c\x8a\x72\x68\x0f\x14\xca\
-\x3e\xd7\x16\x35\x50\xc1\x96\xbc\xda\xf7\xd9\x21\xa6\x7f\x67\x59\
-\x96\x9f\xc9\x64\x54\x9b\x80\xb1\x33\x6f\x1f\x00\xed\x02\xba\xc9\
-\xf0\xf0\x30\xcf\x9c\x54\xec\xdc\x12\xc3\xf3\x55\x1b\xae\xcc\x95\
-\x39\x75\x24\xc5\x03\x3b\x13\x5c\xb8\x5a\xe0\xbe\x3e\xa3\xcd\xc6\
-\xd0\x35\xf6\xef\x8c\x73\xab\x24\xb9\xbe\x0c\xa0\x3e\x93\xf7\x76\
-\x5d\x19\x12\x73\xd7\x43\x11\xdc\x19\xd3\x97\x20\x80\xe4\x7e\x9e\
-\x3c\xb4\x4c\x32\x91\xa0\x5a\x6b\xbf\x49\x73\xf3\x55\x4e\x1d\x49\
-\xad\xff\x3e\x75\x24\xc5\xec\x3f\xab\x5d\xff\x9e\x6f\x1d\x4d\x72\
-\xf3\xb6\xc9\x07\xff\x28\x43\xa4\xff\x2c\x92\x29\xc0\x03\x3c\xbd\
-\xe1\x7d\xe6\x34\xa8\xef\x12\x1f\xe2\xb1\x07\x0b\xec\x1d\xd9\x84\
-\x17\xa8\x36\xbc\x9f\x73\x5a\xc8\xd7\xc6\xb5\x9b\x4e\x47\x7b\x2f\
-\x50\x28\x60\x67\x4a\xf2\x66\xb6\x1f\xbc\xd2\xb6\xbc\xdc\x5b\x1c\
-\xd2\x66\xa6\x2c\xcb\x72\x1b\x11\x50\xf2\x09\x34\x93\x2d\xa9\x5e\
-\xf6\x8c\x38\x54\x9c\xf6\xab\xbb\x58\xf4\x3a\x92\x03\x1d\xed\x9b\
-\x47\xb2\xc7\xe4\x1b\xa3\x4b\xbc\x36\x61\x82\x1e\x7b\x04\xc9\xcb\
-\x80\x6d\x00\x8c\x7d\xef\xad\x5d\xc0\x61\x62\x9b\xf9\xd2\xee\x65\
-\xfc\xa0\x07\x3f\x08\x5a\x09\x6c\xd9\x95\xfc\x0f\x57\x57\xee\x4a\
-\xee\xf9\x8a\xe5\x92\x8b\x42\x87\xd8\x66\xb0\x17\x46\x27\x6b\x27\
-\xf6\x5a\xd1\x0b\x85\xb5\x08\x1c\x05\x20\x32\x48\x2a\x59\xa2\x62\
-\xb7\x7b\xd3\x8d\xfc\xd5\x3f\x2f\x75\x25\x5e\x58\x71\xf8\x70\x45\
-\xe3\x6a\x6e\xb8\xf1\x31\x62\x83\xbd\x00\x66\xdf\x41\x60\x6a\x4d\
-\xc0\x28\xc0\xd6\x3e\x89\x02\xaa\xb5\x56\xef\x4f\x1f\xdf\x72\xcf\
-\xe4\xcd\x6b\x57\xca\x01\x57\x73\x23\x2d\xf3\x91\x68\x1c\x17\x40\
-\x44\xf6\x00\xf1\x86\x00\x3d\xc6\x40\xdc\xa5\x7c\x87\xf7\x4f\x3d\
-\xbc\xad\xab\x87\xdd\xa2\xd2\x3c\xce\x02\x87\x9e\x03\x15\x5e\x26\
-\x5d\x00\x9a\x09\x22\xd8\x8d\x24\xd6\xc8\xa7\x22\x46\x32\xea\x52\
-\xa9\xc9\x75\xdc\x8d\xfc\xa3\x8c\xcb\xdf\x07\xad\x39\x51\x1a\x3d\
-\xa0\x94\x06\x98\x46\x73\x4a\xae\x78\x11\x6e\xdb\xfe\xff\xb2\x1c\
-\x10\x8d\x6b\x28\x1d\x0a\x76\x0c\x43\xa8\xff\x1a\xdb\x7a\x14\xfc\
-\x4a\x43\xc1\x7a\x31\x11\x38\x14\x6b\x51\xf2\xe5\xde\x75\x9c\xf8\
-\xb1\xf7\xb1\x10\x1f\x7a\x2e\x8c\xbc\x08\xcf\x82\xf2\x40\x79\x59\
-\x40\x1a\x61\x12\x9a\x41\xd3\xa9\xd8\x3e\xa6\xde\x9a\x9d\xbf\xfc\
-\x43\xc9\xc5\x67\xc5\x5d\x37\xde\x68\x98\x4d\x2f\x8e\xed\xb8\xe1\
-\x13\x5d\xcb\xa2\xe3\xd5\x77\x96\xde\x25\x00\xdc\x65\x84\x10\x6d\
-\x38\xf6\xa3\xee\x87\xeb\x5e\x86\x2e\x1a\xc0\x5d\xae\x7f\x74\x0b\
-\x19\xc0\x11\x00\x61\x0d\x37\x81\xbd\x88\xa9\x79\xc4\x8d\x76\x7c\
-\xfd\x27\xde\x3d\x8b\x18\x88\x7b\x2d\x58\xdb\xc3\xd4\x3c\xb0\x17\
-\x41\xfa\xb3\x56\xfc\x4f\xf3\xeb\xa9\x18\x90\x48\xff\x15\x04\x5f\
-\x28\x15\x97\xf8\xf4\x70\x4f\x47\xb2\xc7\x5f\xb0\x39\xff\x54\xb2\
-\xa3\x88\xc7\x5f\x28\x6d\x18\x89\x6c\xae\x52\xff\xff\xfd\xf2\xeb\
-\xe8\x54\x00\x5b\x07\xc8\x64\x32\x9c\x1c\xd3\x66\xf3\xc2\xfa\x8a\
-\x5f\x2b\x6f\x4f\x0d\x24\xe9\x8f\x07\xc4\x8c\x76\xfc\x71\xb2\xca\
-\xd7\xac\x44\xdb\xe6\x97\xa6\x6f\x77\xb4\x5f\x83\x5d\x93\xe4\x6f\
-\x5c\xaf\x7b\xaf\xbd\xfc\x53\xe0\x26\x50\x6c\x3e\x5d\x1e\x81\xf3\
-\x0c\x40\x76\x3e\x47\xcc\xf0\xe8\x8d\xba\x1d\xf1\xec\xf9\x1b\x6d\
-\x02\xba\xd9\xf6\x46\x5d\x62\x86\x47\x76\x3e\x57\x37\x74\xf2\x2f\
-\x02\xc5\x10\x8d\x7a\x20\x93\xc9\xa8\x93\x96\x91\xcf\xab\x07\x0a\
-\x81\x14\xc7\x97\x8a\x35\x76\x0f\x45\x88\x98\x3a\xa6\xae\xb5\xe1\
-\xcd\xbf\x95\x39\xbc\xbf\x17\x80\x1f\xfc\x2a\xdf\xd1\xc6\xd4\x35\
-\x04\x3e\x7f\x99\x29\x50\x75\x3c\x70\x0b\xcf\x5b\xe6\x6f\x2f\x02\
-\x79\xa0\x98\x4e\xa7\x83\x96\x92\xcc\xb2\x2c\x35\xc4\xf4\x74\x5e\
-\xed\x5b\x75\x03\x71\xec\xfa\xa2\xcb\x48\x4a\x90\x88\x47\x31\x74\
-\xad\x0d\x13\x73\x15\x26\xe6\x2a\x1d\xe7\x0c\x5d\xc3\xb1\xab\x5c\
-\x9c\x5a\xa5\x62\x87\xe4\xfa\xaf\x7f\x03\x2c\x00\x4b\x80\x9b\xc9\
-\x64\x5a\x6b\xc2\x4c\x26\x83\x65\x59\xc1\x9a\x08\x4f\xea\xc7\xde\
-\xcb\x39\x78\x52\xb0\x63\xb3\xc0\x34\x04\x86\x60\x43\x68\xca\x67\
-\xf2\x83\x2a\x57\xde\x29\xe2\xf9\xb2\x99\x3c\x0f\xdc\x02\xec\xb5\
-\xae\xa9\x63\x59\x3e\x3e\x3e\x2e\x80\xc4\xa4\xff\xcd\x23\x44\xfa\
-\xcf\xa2\xe9\x63\x51\x53\xf0\xc9\xad\x09\xf6\x0d\x49\x06\x07\xfb\
-\xd0\x75\xb3\x65\x4d\x10\x78\xac\xac\xac\xf2\xce\x0d\xc1\x87\x0b\
-\x55\x6a\x9e\x04\xe9\xcf\xe2\xe4\x5f\xb4\xa2\x17\xa6\xc2\x43\x77\
-\x0b\xa8\x36\x97\xe5\x5d\x1b\x93\x50\x44\x0c\x18\x98\x54\x8f\x3e\
-\x89\x1e\x7b\x04\x4d\x1f\x5d\x9b\x8f\x47\x20\xd5\x57\xbf\xc5\x4b\
-\xab\x3e\xb6\xdb\xb4\x58\xfa\xb3\xf8\xe5\xd7\x2d\xfd\xd5\xdf\x87\
-\x87\x6d\x09\x28\x74\xea\x8e\xee\xda\x9a\x8d\x8f\x8f\x6b\x80\x01\
-\xf4\x00\xfd\x93\xb5\x13\x7b\x31\xfb\x0e\x22\x22\x7b\x10\xe6\xee\
-\xf0\x49\x0d\x9f\x13\x2f\x4b\x50\xcb\xe2\x16\x32\x61\x92\xa9\x00\
-\xab\xa1\x80\x0a\xe0\x77\x6a\x56\xef\xa9\x39\x0d\xa3\x61\x86\x11\
-\x89\x87\x88\x85\xdf\xc4\x7a\x32\xab\x97\xda\x0e\x60\x87\x70\x36\
-\x6a\x4e\xff\x0d\xcd\x4a\x06\xf6\x87\x57\xde\x02\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x7b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\
-\x67\x9b\xee\x3c\x1a\x00\x00\x07\x0d\x49\x44\x41\x54\x58\x85\xc5\
-\x97\x49\x6c\x1c\x65\x16\xc7\x7f\xef\xab\xea\xcd\x6e\xdb\xe9\xb6\
-\xe3\x71\x1c\xdb\x31\x31\x6d\x07\x05\xc5\x09\x4b\x34\xc9\x44\x80\
-\x66\xc4\xa2\x44\x42\x39\x70\xe4\x80\x10\x20\x84\x10\x52\x0e\x13\
-\x0e\x20\x61\x09\x44\x16\x89\x1c\xb8\xc0\x81\x2b\x42\x82\x03\x17\
-\x92\x81\x64\x32\x08\x65\x63\x11\x0e\x26\x13\x5b\x4a\x3c\xce\x82\
-\xdb\x59\xec\x76\xa7\xbb\xdd\x5d\xd5\xdd\xb5\xcc\xa1\xaa\xab\x17\
-\x5b\x73\x8b\xe6\x93\x4a\x5f\x2d\xaf\xde\xff\x5f\xff\xf7\xbe\xf7\
-\xbd\x12\xd7\x75\x39\x28\xb2\x17\x98\x00\xc6\x81\x30\xf7\x77\x54\
-\x80\x29\x60\xe2\xa8\xeb\x9e\x90\xbf\xc3\xde\xae\x58\xec\xf8\xdf\
-\x1e\x7a\x88\x1d\x43\x43\x44\x74\xfd\xbe\xa2\x97\x2d\x8b\x8b\x37\
-\x6f\x72\x7a\x66\x86\x9c\x61\xec\xd3\x81\x89\xbf\x6e\xd9\xc2\xf8\
-\xc6\x8d\x5c\x99\x9f\x67\x3e\x93\xa1\x6a\x59\x6b\xbe\x2c\x22\x68\
-\x22\x28\xa5\xd0\xfc\x43\x29\x85\x26\x12\x9c\x2b\xa5\x50\xbe\x4d\
-\xeb\xac\x2b\x45\x22\x1e\xe7\xd1\xa1\x21\x5c\xd7\xe5\xeb\x8b\x17\
-\x27\x74\x60\x7c\x7c\x70\x90\xab\xe9\x34\xf9\xe1\x61\x52\xaf\xbe\
-\x8a\x16\x89\xac\x85\x8e\x00\x4a\x04\x44\x50\xfe\x3d\x25\x82\xf8\
-\xcf\xa4\xe5\x9c\xc6\xfb\x00\xd5\x2a\xa5\x33\x67\xc8\xcd\xce\x32\
-\x3e\x38\xc8\xd7\x17\x2f\x8e\xeb\x40\x38\xac\x69\xa4\x33\x19\x52\
-\xaf\xbd\x86\x1e\x8f\xaf\xc6\x6e\x70\x12\xea\xea\x22\xdc\xdd\x4d\
-\x28\x91\x40\xeb\xea\xc2\xb2\x6d\xcc\x4c\x06\x29\x14\xd0\x56\x56\
-\x70\x56\x56\x02\xb5\xa4\x75\x0e\x85\x88\x3f\xf1\x04\xf9\xcb\x97\
-\x59\xe7\xe1\x84\x75\x00\xd7\x75\xa9\xda\x36\xae\x6d\x63\xf9\x0e\
-\x5a\xc1\xe3\x23\x23\x24\x77\xed\x42\x8f\xc5\x56\x11\xec\xec\xef\
-\xaf\xc7\xb8\x58\xe4\xc6\xe9\xd3\x24\x0b\x05\x10\x09\xd4\x0b\x66\
-\xc7\x01\x11\x5c\xd7\x05\x20\x20\x00\x60\x15\x8b\x88\xa6\x35\xc7\
-\x3c\x16\xa3\xf7\xa9\xa7\xe8\x18\x1d\x5d\x33\x2f\x5a\x47\xa4\xbd\
-\x9d\xd1\xe7\x9f\xe7\xc6\xe4\x24\x32\x39\x49\xbb\x52\x75\x70\x11\
-\xc4\x71\x50\xad\x04\x1c\xff\xc2\x2e\x16\xc1\x27\x20\x40\x7c\x78\
-\x98\xfe\xfd\xfb\x09\x35\x84\xc5\xb1\x6d\x96\xe6\xe7\xb9\x33\x37\
-\xc7\xdd\xb9\x39\xda\x22\x11\x12\x43\x43\x74\x0f\x0f\xd3\x3d\x30\
-\x80\xf2\x01\x37\x3d\xf2\x08\xc5\xcd\x9b\xb9\xf6\xd5\x57\xf4\x57\
-\x2a\x01\x01\xd7\x71\x50\x4a\x05\x98\x1e\x01\xc7\x01\xa0\x9a\xcf\
-\x23\xa1\x10\x4a\x04\x3d\x1e\x5f\x05\x7e\xed\xb7\xdf\xf8\xd7\xa7\
-\x9f\xb2\x29\x14\x62\x7d\x3c\xce\x48\x2c\x86\x52\x0a\xb9\x71\x83\
-\xdc\xf7\xdf\x73\x2b\x12\xa1\x6f\xff\x7e\x7a\xb7\x6c\x01\xa0\x7d\
-\xdd\x3a\x1e\x78\xe1\x05\xa6\x3e\xfa\x88\x2d\x89\x84\xa7\x80\xeb\
-\xa2\x44\x02\x4c\x05\x60\xfb\x17\xb7\x4e\x9e\xa4\xba\xbc\x8c\x5d\
-\x2a\xd1\xbf\x6f\x5f\x00\x5e\x35\x4d\xfe\xf1\xf1\xc7\x9c\x3b\x72\
-\x84\x3f\xb7\xb7\xf3\x40\x7b\x3b\x1d\x80\x6b\x9a\xb8\x86\x81\x6b\
-\x18\x44\x2c\x8b\x64\xa9\x84\xf5\xc5\x17\x5c\xff\xf2\x4b\xaa\xe5\
-\xb2\x47\x22\x91\x60\xfd\x73\xcf\x91\xcb\x66\xc1\x34\x11\xd3\x44\
-\x44\x02\x4c\xd5\x14\x82\x5c\x8e\xa5\x1f\x7e\xa0\x63\x64\x84\x75\
-\xdb\xb7\x07\x5f\x7e\xea\x93\x4f\xa8\x5e\xb8\xc0\x63\x3d\x3d\x84\
-\x2c\xcb\x03\x35\x4d\x22\x03\x03\x44\x06\x07\x71\x0d\xc3\x73\xee\
-\xcf\x91\xc9\x49\xf2\xdf\x7c\x13\xbc\x9f\xda\xb3\x87\x74\x77\x37\
-\xf8\x64\x95\x48\x80\x19\x28\xa0\xc0\x93\xb3\x5a\x65\xe8\xc5\x17\
-\xeb\xb2\xff\xfa\x2b\x37\x4f\x9c\x60\x24\x16\xf3\x80\x4b\x25\x1c\
-\xc3\x20\xf9\xec\xb3\xf4\xbf\xf1\x06\x7d\xaf\xbf\x4e\x61\xd7\x2e\
-\x8c\x5c\x0e\xd7\x34\xa1\x54\x02\xc3\xc0\x3a\x73\x86\xc2\xcc\x4c\
-\xe0\xe7\xd1\x97\x5f\xe6\xf2\xfc\xbc\xa7\x40\x83\xea\xaa\x96\x03\
-\xb5\x8a\xd6\x91\x4a\x11\x4e\x26\x83\x84\x3b\xfe\xc1\x07\xec\xe8\
-\xec\xf4\xd8\x97\x4a\x01\x89\xf8\xce\x9d\x81\xf3\x4d\x4f\x3e\xc9\
-\xd5\x3b\x77\xa0\x54\xf2\x48\x18\x06\x18\x06\xe5\xcf\x3f\xc7\xb5\
-\x6d\x00\x62\x5d\x5d\x64\xc3\x61\x9c\x4c\x06\x59\x95\x03\xae\x1b\
-\x94\xd3\x75\xdb\xb6\x05\x8e\xef\x5e\xb9\x42\x78\x66\x86\x68\x0b\
-\x38\xa6\x89\x34\x54\xcb\x70\x2c\x46\xae\x50\x80\x1a\xb8\x69\x82\
-\x69\xe2\xcc\xcf\x53\x4d\xa7\x03\xbb\xe8\x86\x0d\x54\xd3\x69\x94\
-\x08\x76\x63\x08\x1c\xc7\x09\x6a\x79\x57\x03\x81\xf4\xd4\x14\x5d\
-\x8e\x43\x35\x9d\xc6\x5a\x5a\xf2\xe4\xad\x81\x34\x0e\xd7\x85\x4a\
-\x05\xca\x65\xa4\x5c\x0e\x08\x88\x69\xe2\xcc\xcd\x05\x66\xbd\xa9\
-\x14\xf7\x2c\x6b\x0d\x05\x6a\x21\x50\x8a\x8e\x87\x1f\x0e\x5e\x58\
-\xf8\xfd\x77\x92\xa1\x90\xb7\xb6\x0d\x03\x7b\x79\x19\xf7\xde\x3d\
-\xdc\x62\xd1\x03\x6d\x1c\x95\x4a\xf0\xf5\x52\x2a\x41\x3e\x8f\x9b\
-\xcd\x62\x5d\xba\x14\x98\xfc\x69\xeb\x56\x32\xd5\x2a\x4a\xa9\x20\
-\x07\x74\x00\xdb\xb6\xd1\x94\x42\x6a\x55\xcb\x1f\x22\x42\x5c\xd7\
-\x83\xdd\x4c\x03\xc4\xb6\xbd\xaf\x6c\x19\x52\x2e\x23\x86\x51\xdf\
-\x90\xfc\x8d\xaa\xc5\x21\x2b\xb6\xed\x2d\x43\x3f\x37\x14\x80\xe5\
-\x87\x40\x53\x0a\x63\x7a\x3a\xb0\xdf\x38\x3e\x4e\xb1\x41\x9d\xc6\
-\xed\xb6\x75\x28\x1f\x50\x35\x80\x8b\x08\xa1\xb1\xb1\xc0\x66\xf1\
-\xf2\x65\x12\xe1\x30\x4a\x04\xab\x29\x04\xb6\x8d\xf8\xab\xa0\xd8\
-\x40\xa0\x7f\xdb\x36\x0a\xb5\xfc\x68\xd9\xdb\x57\x29\xb0\x06\xb8\
-\x12\x41\x4f\xa5\xea\x04\xa6\xa7\x59\x1f\x89\xac\x56\xc0\x76\x9c\
-\xa0\xd1\x30\x1a\xd6\xee\xfa\x54\x0a\xab\xaf\x6f\xcd\x06\xa3\x55\
-\x83\x46\xd0\xda\xa1\xf5\xf5\xa1\x86\x86\x02\x9b\xcc\xcc\x4c\x9d\
-\x40\x6b\x12\x8a\x2f\x6f\xe5\xfa\x75\x2a\xd9\xac\xf7\x50\xd3\x78\
-\xfc\xfd\xf7\x29\xf8\x3b\x58\x23\x89\x46\xa2\x77\x2e\x5d\x22\xa2\
-\x69\xcd\x21\x50\x8a\xb6\x03\x07\x82\xdd\xd5\xc8\x66\x51\xe9\x34\
-\xba\x52\xab\x0b\x91\x65\xdb\x75\xe7\x22\xa4\x8f\x1e\x0d\x9c\x0f\
-\xef\xde\x8d\xb1\x6f\x5f\xd0\xfd\xd4\xec\x4a\x9f\x7d\xc6\xad\x1f\
-\x7f\xe4\xe6\xf9\xf3\x9c\x3f\x76\x8c\x91\xb6\xb6\x26\xf0\xf0\xde\
-\xbd\xe8\xe3\xe3\x81\x9f\x73\x87\x0e\x31\x16\x8f\x7b\xca\x89\x60\
-\xf9\x21\xd0\x6b\x0a\xa8\x5a\x5f\x27\x42\xe9\xf4\x69\x16\x4f\x9d\
-\x62\xfd\xd3\x4f\x03\xb0\xfb\xed\xb7\xf9\xb7\xae\x93\x38\x79\x32\
-\x20\x61\xcf\xce\x22\xef\xbc\x43\xbe\x5a\x65\x4f\x28\x44\x5b\x34\
-\xda\x04\x1e\x79\xe5\x95\x00\x7c\xf6\xdb\x6f\x29\x9f\x3d\xcb\x58\
-\x6f\x6f\xd0\xa6\xad\x0a\x41\x6b\xa2\xe5\x8e\x1d\xc3\xcc\x64\x00\
-\x08\xc5\x62\xec\x78\xf7\x5d\xc2\x87\x0f\x53\xee\xe9\xa9\xc7\x59\
-\x29\xfa\xa2\x51\xda\x74\xdd\x6b\x5e\x36\x6c\xa0\xfd\xc3\x0f\x89\
-\xbd\xf9\x26\x2a\x1a\x05\xa0\xb4\xb8\xc8\xcf\x47\x8e\xf0\x97\x64\
-\xd2\x03\x6f\x21\xa0\xd7\x42\x10\x0d\x87\x9b\x62\xec\xe6\x72\xdc\
-\x7d\xef\x3d\x7a\x26\x26\x68\xeb\xe9\x01\xa0\x7f\xf7\x6e\x9c\x9d\
-\x3b\x29\x5e\xbb\x46\xe5\xca\x15\xe4\xea\x55\x22\x9a\x86\x36\x3a\
-\x8a\x4a\xa5\x08\x6d\xda\xd4\xd4\x51\x95\x16\x17\xf9\xe7\xc1\x83\
-\x6c\xd7\x34\xda\x43\xa1\x00\xdc\x6d\x0d\x41\x53\x0e\x34\xcc\xf6\
-\xd4\x14\x0b\x2f\xbd\x44\xe4\xad\xb7\x18\x7c\xe6\x19\x4f\x32\x5d\
-\xa7\x23\x95\x82\x86\xe5\xb5\xd6\xf8\xcf\x77\xdf\x31\x79\xf4\x28\
-\x8f\xe9\x3a\x03\x1d\x1d\xf5\xce\xd8\x6f\x4a\x56\x13\x80\xb5\x7b\
-\xf9\x95\x15\xd4\xe1\xc3\xcc\x9e\x3d\xcb\xc6\x03\x07\x88\x25\x12\
-\xff\x13\xd8\xc8\x66\x39\x77\xe8\x10\xea\xc2\x05\xf6\x26\x12\x84\
-\x35\xad\x19\xdc\xb7\x6b\x26\xe0\x38\xb8\xb0\xe6\x7a\xd7\x94\x42\
-\x44\xe8\x38\x7f\x9e\xc5\x73\xe7\xb8\xdd\xdb\x8b\x1a\x1d\x25\x36\
-\x36\x46\xf7\xd6\xad\x80\x57\xe1\x32\xd3\xd3\x54\x66\x67\x89\x2e\
-\x2c\x30\x12\x8b\x31\xd0\xdd\xdd\x14\xf3\xc6\x7f\x84\xaa\x6d\x07\
-\x95\x50\x07\x2a\xa6\x65\x85\x8b\xa6\x49\xb4\xb3\x73\x4d\xf0\x5a\
-\xd2\xb5\x29\xc5\x83\xcb\xcb\xc8\x4f\x3f\xa1\x7e\xf9\x05\xd3\x71\
-\xc8\x59\x16\x09\x4d\x63\x73\x38\xec\xad\xf1\x64\xb2\x0e\xb8\x06\
-\xb8\x88\x90\x5e\x5a\xc2\xf4\xfe\xbe\x2a\x3a\x30\x75\xbb\x50\x78\
-\x5c\xc3\xeb\x84\x93\x9d\x9d\x28\xd7\x45\xfc\xd6\xb9\x26\x59\x6d\
-\xef\x73\xfc\xbf\x22\xc7\x75\x89\x2a\x45\x9b\x5f\xd9\xc4\xbf\x27\
-\xae\x5b\x07\xac\x9d\xfb\xfe\x6c\xdb\x66\x7e\x71\x91\xab\x0b\x0b\
-\xdc\x2e\x14\x00\xa6\x74\x60\xe2\x66\x3e\x7f\xdc\x05\xca\xb6\xcd\
-\x82\x5f\x05\xef\xd7\xb0\x5d\x97\xc5\x52\x89\x3f\xf2\x79\x80\x09\
-\xf9\x7f\xff\x9e\xff\x17\xc5\xd6\x3d\x9a\xb0\xf3\x6b\xe8\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\xc8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x04\x7f\x49\x44\x41\x54\x58\x85\xe5\x95\x5d\x88\x54\x65\
-\x18\xc7\x7f\xcf\xfb\x9e\xf7\xcc\xcc\xce\xce\xaa\xd3\xae\xba\xa6\
-\x22\x21\x45\x51\x5e\x29\x42\x10\x52\x6c\x69\x5d\x78\xd1\x85\x15\
-\x94\xd9\x77\x2c\x05\x06\x19\x45\x58\x29\xb1\x19\x22\xdd\x18\x84\
-\xa2\x84\x25\x54\x84\x17\x52\x51\x11\x19\x04\x2d\x51\x11\x48\x41\
-\x28\xa1\xc6\x20\x9b\x5b\xbb\xb4\xbb\xee\x9c\xef\xb7\x8b\x73\x66\
-\xe7\x6b\xd9\x81\xdd\xbd\x08\x7a\xe0\x7c\xcc\x39\xef\x9c\xff\xff\
-\xfd\x3f\xff\xe7\x79\xe0\xff\x1e\xd2\xf8\x63\xfd\xf6\x83\x43\x71\
-\x1c\xed\xb1\x16\x07\xe0\x54\xf9\xa5\x45\x03\xba\x77\xec\x8d\x1a\
-\x60\xa4\x94\x3e\xf0\xfb\x27\x2f\xec\x05\x52\xa0\x5a\xc4\x71\xbc\
-\xe7\xad\x97\xef\x77\x4a\x5d\x2e\x63\xff\x5c\xe5\xa6\xd1\x73\x10\
-\x79\x0b\x47\x77\xf2\x0c\x86\x03\x14\xbb\x72\x4c\x5c\xf5\x9d\x23\
-\x27\xbf\x7a\x11\x68\x27\x60\xad\x75\x96\x14\x73\x1c\xff\xf2\x1c\
-\xa3\x57\xfe\xe6\xee\xae\x8f\x91\x60\x72\xc1\xf8\xd6\x2d\x71\xfa\
-\xca\x00\xa5\x25\x25\xb6\x6e\x5a\x4b\x4d\xe1\x36\x02\x00\x88\xf0\
-\xed\x99\x61\x56\xaf\x59\xc5\xd8\xb3\x67\xe9\xee\x2e\x2d\x98\xc0\
-\xd4\xd4\x24\xd5\x57\xbe\xa2\x72\xe9\x0f\xb6\x6e\x5c\xdb\xf4\x4e\
-\xb5\xe1\x03\xbb\x9f\xdc\x4e\x9c\x24\xe9\x02\xa5\x16\x7c\x00\xd8\
-\x24\xe1\x91\x07\x06\x48\x5a\xf0\xda\x14\x10\x11\xce\x5e\x1c\x9f\
-\x71\xe7\x33\xbb\x9f\x63\xe7\x43\xf7\xcd\x7b\xf7\x27\xde\xfb\x90\
-\xa1\xfd\xaf\x21\x08\x3f\x9d\x1b\x65\xcb\x86\x55\x73\x13\x40\x40\
-\x29\x41\x32\x06\xef\x1c\x3e\x3c\x6f\x70\x80\x5b\x37\xdf\xc6\xd8\
-\xd8\x5f\x20\x82\x52\x82\xc5\xce\x4d\x40\x10\x94\x08\xb5\x0a\xd5\
-\x5a\x2f\x88\xc0\xcc\x77\x25\x55\xd7\x36\xe3\xcf\x96\x02\x10\x25\
-\x48\x26\xc1\x13\x83\x83\xec\x7c\x70\xc7\xbc\x81\x4f\xbc\xff\x11\
-\x43\xfb\x5e\x45\x20\x53\xa0\xa9\xf5\xcc\x92\x02\x52\xe3\xd5\x52\
-\xf0\xee\xd1\xa3\xf3\x06\x07\xb8\x63\xcb\x9d\x5c\xbe\x5c\xc9\x52\
-\xa0\xb0\xb6\x53\x0a\xa4\x96\x82\x1a\x99\x45\x4e\x41\xcb\xf3\x36\
-\x02\x96\xe6\x14\xec\x7c\xec\xd1\x45\x4a\x41\xcd\x84\x9d\x08\x58\
-\x50\x52\xaf\x82\x13\xc7\x8e\xcf\x1b\x1c\x60\xe0\xf6\x6d\x54\x2a\
-\x97\xd2\xea\x12\xc1\xb6\x34\x82\xb6\x46\x64\xad\x45\xa9\x7a\x15\
-\x2c\x56\x88\x08\xa2\x04\x2b\x1d\x4c\x98\xd8\x74\xb1\xd6\x29\xb7\
-\x4a\xe5\xd2\xe2\x10\x50\xa9\xb7\x3a\xa6\x20\xc9\x5c\xba\x7c\x65\
-\x2f\x0f\x1f\xfc\x0e\x9b\xb5\xe4\xba\x79\xed\xcc\x7d\xa3\xa3\x6d\
-\x76\xb2\xe9\xa9\xbe\x36\x85\xa7\xaf\xb7\x9c\xb6\xe5\x4e\x7d\x20\
-\xc9\x16\xf4\xf7\xf7\xd1\xdf\xdf\x57\x07\xb0\x29\x60\x0d\xc0\x5a\
-\x9b\x1d\xb5\xe7\xb3\x3c\x6b\xb8\x6f\x24\x3e\x37\x81\xa4\x79\xd5\
-\xc4\xf9\x6f\x98\xbc\x30\x8c\x6d\x75\xcf\x1c\x21\x4a\x13\x97\x37\
-\x30\x5d\xbc\x11\xa5\x04\xad\x14\xc5\x52\x37\x85\x42\x1e\xdb\x62\
-\xad\x59\xaa\xa0\x99\xc0\xe4\xc5\x61\x9e\xdf\xb3\x9b\xa5\x4b\xcb\
-\x18\xc7\xe0\x38\x06\xc7\x71\x30\x8e\x41\x6b\x87\x38\x89\x89\xe3\
-\x98\x24\x8e\x89\xa2\x08\x3f\xf0\xb9\x3a\x35\xc5\xd0\x81\x37\x59\
-\x7f\xcb\x5d\x88\xb2\x58\x9b\x30\x32\x32\x8e\x2a\x16\x3a\xb7\xe2\
-\x16\x01\xb0\x49\x42\xb9\xdc\xcb\x6f\xe7\x7f\xe1\xb3\x4f\xbf\x66\
-\x62\x7c\x1c\x80\x6b\x7a\x57\x30\xf8\xf4\xe3\xf8\x41\x80\x1f\x78\
-\xe9\xd5\xf7\x01\xcb\xda\xd5\xeb\x48\xe2\x88\xc4\x5a\x6c\x64\xe9\
-\x2e\xb8\x18\x63\x32\x13\x76\xac\x82\xf6\x44\x69\xad\xd1\xda\x61\
-\x74\x64\x84\xe4\xe6\xa7\x10\x6b\xb9\xfc\xeb\x11\xfc\x30\xc0\x0f\
-\x7c\xfc\x20\x20\xf0\x7d\xc2\x30\x20\x9f\x2f\xd4\x55\x54\x02\x16\
-\x5c\xa3\xd1\x8e\xee\x68\x42\x37\x4d\x41\x1b\x3e\x5a\x69\x72\x6e\
-\x0e\x80\x62\x21\xbd\x56\x81\x28\x0c\x89\xa2\x90\x28\x0c\x09\xa3\
-\x10\x63\x5c\x8c\x63\x66\xfe\x57\xdb\x71\xce\xe8\x99\x21\xd7\xe0\
-\x81\x12\x30\x59\x23\x20\x40\x0f\x40\xdc\x9a\x03\xd2\x79\xe0\x66\
-\x04\x0a\x85\x1c\x82\xa5\x0a\x84\x51\x44\x18\x85\x84\x51\x84\x52\
-\x0a\xd7\x18\x8c\x71\x91\x4c\x66\xa5\xd2\xf1\x9b\x33\x0a\x95\xf5\
-\x81\x06\x05\x4a\x40\x58\xeb\x84\x2e\x90\x4b\x15\xb0\x2c\xe9\x32\
-\x34\x86\xd6\x9a\x9c\x9b\x07\xa0\xab\xe0\x52\xc8\x54\x48\x77\x1f\
-\x11\xc7\x11\xc6\x71\x31\xc6\xc5\x35\x66\xa6\x89\x8a\x28\x44\x04\
-\xd7\x68\x44\xa5\x24\x1a\x2c\x90\x07\xdc\xa6\x56\xac\x84\xd1\x93\
-\xa7\x87\xc3\x1b\x56\xf5\xd0\xd3\x40\x42\x29\x45\xce\xcd\x51\xee\
-\xed\xe3\xcf\x33\x87\x18\x39\x73\x88\xee\x9e\x1e\xc2\x46\xe9\x8d\
-\xc9\x0e\x17\xcf\xab\x66\x04\x98\xd9\xb9\x6a\x6f\xc5\x02\x75\x0f\
-\x04\x80\x3f\xf2\xfd\xb1\x6d\x3f\xb3\xeb\x83\xc4\xb2\x6e\xc7\x3d\
-\x9b\x4d\x62\x2d\x95\x2f\x00\x0b\xd7\xae\x5c\xc3\xeb\xfb\xf6\xe3\
-\x79\x1e\x9e\xef\xa5\x25\xe7\x7b\x84\x61\x90\xf6\x79\x51\x68\xa5\
-\xf1\x3c\x9f\x6a\x75\x1a\x80\xfe\x65\x79\x12\x0b\xdd\x79\x87\xe5\
-\x4b\x0b\x14\x0a\x39\xa6\xbd\x00\x25\x12\x01\x1e\x10\x34\xd6\x44\
-\x0e\x58\x56\x5c\x7e\xfd\x8a\x95\x9b\x76\x9d\x8a\xad\x5c\x07\xb0\
-\xa9\xf4\x23\x4a\xd7\xd5\x68\x72\x88\xb5\xd4\xc6\x66\xe3\x87\x2c\
-\x60\xe3\x90\x1f\x26\x37\xd2\x1a\x22\x12\x13\x57\xdf\xbe\xf0\xf9\
-\xbe\xbd\xc0\x44\xeb\xc8\x33\x40\x17\xa9\x27\x34\xb3\x4c\xcb\x05\
-\x46\x0c\x84\xc0\x34\xa9\x02\x73\xce\x5c\xd5\xe1\xfd\x7c\x09\xfc\
-\xb7\xe2\x5f\x35\xdd\xd1\x9e\x87\xbb\x44\x1b\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\x34\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x0d\x00\x00\
-\x0b\x0d\x01\xed\x07\xc0\x2c\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xd3\x0a\x09\x13\x23\x1e\x35\x00\xc4\x21\x00\x00\x05\xc1\x49\x44\
-\x41\x54\x78\xda\xc5\x97\xcb\x6f\x1b\x55\x14\xc6\x7f\x73\xc7\x33\
-\xb6\x93\xd6\x79\x34\xd0\x36\xa1\xb4\x85\x52\xb5\x94\x42\x9a\x01\
-\x84\x28\x05\x8a\x04\x48\x08\x89\x82\x58\xf2\x06\x03\x5d\x84\x15\
-\xea\x06\x09\x09\xfe\x01\x24\xd8\x00\x16\x85\x02\x1b\x58\xf0\x5a\
-\x74\xc1\xab\x88\x42\x01\x89\xb8\x24\x55\x01\x15\x0c\x09\x10\x9c\
-\x34\x0f\x3b\x89\xed\x99\xf1\xcc\xdc\xcb\xc2\xef\xd8\x49\x48\x84\
-\xc4\x95\x3e\x69\xe6\x9c\x7b\xe7\x7c\xf7\xcc\xb9\xe7\x9c\x0b\xff\
-\xf3\xd0\x56\x33\x79\xe0\xf0\xf0\x76\x50\x07\x41\xf6\x03\xfd\x28\
-\x59\xf7\x0d\x35\x82\x92\x23\x48\xef\x84\xc5\xb1\x14\x20\x13\x89\
-\x84\xfa\x4f\x08\x0c\x1c\x1e\x7e\x18\x78\x08\xb8\x11\x14\x20\x41\
-\x98\x20\x22\xa5\x09\xd2\x81\xc0\xa9\x5f\x72\x0a\xe9\xbf\x6d\xa9\
-\xd7\x8e\x02\x5e\x22\x91\x90\x6b\x22\x30\x70\x78\x78\x1f\x9a\x78\
-\x01\x25\x6f\x42\xe8\x60\x76\x82\xd9\x8d\x19\x8e\xb2\x25\x36\xcf\
-\x35\x17\x65\x00\xc8\x39\xf0\xd9\xe8\x56\x6c\xa7\x08\xee\x14\x38\
-\x33\xa0\x3c\x40\xd9\x04\xce\xd3\x16\x6f\xbe\x01\x38\xad\x88\x68\
-\x2b\xec\xfa\x28\x00\xd1\x4d\x98\xeb\x2e\xe4\xd1\x6b\xc7\xd9\x7b\
-\xc9\x3a\x76\x5e\xd4\x46\xc4\x14\x4d\x6b\xc6\xa7\x5d\xbe\xfd\x69\
-\x8e\x93\x3f\xc3\xf7\xa3\x06\xe4\xc7\x4a\x8a\xa0\xf8\xbe\xc5\xeb\
-\x8f\x01\xf3\x89\x44\xc2\x5f\x91\x40\xd5\xb8\x1e\x86\xd8\x4e\xee\
-\xdb\xf7\x17\x77\xed\xef\xa1\x6b\x5d\x68\x49\x6f\xa9\x45\x9f\x3a\
-\x79\x26\xcb\x2b\x27\x0c\x26\x27\x26\xc0\xcf\x81\xf4\x46\x2c\x75\
-\xf4\x36\x60\xaa\xde\x13\xfa\x92\xc6\x43\x6d\x6c\xd9\xb2\x99\xa7\
-\x6f\xcf\x71\xeb\xd5\xdd\x18\x21\x81\x2f\x59\x12\x81\x54\x0d\xe8\
-\xeb\x09\x73\x60\x17\x64\x72\x3e\xa3\x53\x1a\xa8\x60\x63\x5a\xed\
-\xb9\xbc\x97\xe1\x0f\x2d\xcb\xf2\x93\xc9\xa4\x6a\x22\x30\x70\xf8\
-\x87\x7d\xa0\x1d\x47\x37\xe8\xeb\xeb\xe3\xc8\x9d\x8a\x6d\x1b\x23\
-\x78\xbe\x5a\x13\x42\xba\xc6\xde\x6d\x51\xce\xcf\x4b\xfe\x9c\x01\
-\x50\x97\xa5\xbd\xed\xdf\xf4\x8a\x1f\xff\x2c\x93\x60\xb1\x4f\x5f\
-\x87\x00\x62\x7b\x79\xe4\xc0\x0c\xb1\xb6\x36\x0a\xae\x5a\xf5\xd9\
-\xfe\x62\x78\x8e\x9b\xaf\xea\xa8\xbe\x3f\x70\x30\xc6\xe4\x82\xc1\
-\xaf\xbf\xe5\xc0\xec\x7c\x0e\xc9\x69\xc0\x03\x3c\xbd\xb6\xfb\xe4\
-\xc3\xa0\x9e\x20\xda\xcb\xfd\xd7\x66\xd8\xbd\x75\x1d\x5e\xa0\x1a\
-\xf0\xf5\xd9\x05\x46\x27\x5d\x46\x27\x5d\x2e\xec\x32\x9a\xf4\x95\
-\x39\x83\x87\x36\x33\x3a\xe9\x54\x65\x0a\xd8\xd6\x23\xf9\x32\xd5\
-\x09\xde\xfc\xe6\xb4\xdc\x9d\xed\xd5\x46\x4e\x5b\x96\x55\xac\x79\
-\x40\xc9\x87\xd0\x0c\x36\xf6\xac\x67\xd7\x56\x87\xbc\xd3\x7c\x74\
-\x07\x0f\x6d\xae\x3e\x7f\xfe\xc3\x5c\x93\xfe\xec\x68\xa1\x3a\x67\
-\xf1\xfa\x58\xbb\xc1\xdd\xfd\xd3\xbc\x7f\xca\x00\x3d\x72\x0f\x92\
-\xb7\x00\x3b\x04\x30\xf0\xe4\xf7\xdb\x81\x1b\x89\x6c\xe0\x96\x1d\
-\x33\xf8\x41\x3b\x7e\x10\x2c\xeb\xe6\x82\xdb\xa8\xff\x3d\xed\x36\
-\x10\xac\xd7\x7b\xbe\x62\x66\xbe\x88\x42\x87\xc8\x06\xb0\x27\xfa\
-\x87\xdc\x3b\x76\x5b\xe1\xe3\x99\x8a\x07\x0e\x02\x60\x76\xd3\x13\
-\x9b\x27\x6f\xcb\x15\xff\x73\xfd\x9c\xf3\x59\xaf\xc1\x78\x45\x3f\
-\x31\xeb\xf0\xc7\xac\xc6\x77\xe3\x7d\x35\x85\x69\x83\x3d\x01\x46\
-\xc7\x7e\xe0\x74\x85\x40\x3f\xc0\xa6\x0e\x89\x6a\xb1\xbb\xe5\x3c\
-\x90\xb3\x65\x93\xf1\x8a\x7e\x36\x17\xf0\xdd\xf8\xd6\x06\xb9\x19\
-\x8e\x52\x04\x10\xe6\x2e\x20\x5a\x23\xa0\x47\xe8\x8a\x16\xc9\xfd\
-\x8b\xdd\x57\x0c\x2f\x8e\x8b\xfa\xf1\xd5\x2f\x06\x60\xa0\x55\x4a\
-\x55\xf9\x30\xe9\x02\xd0\x0c\x10\xc1\x0e\x24\x91\x5a\x10\x8a\x08\
-\xb1\x70\x91\xbc\x5b\x23\xd0\x1e\x16\xcb\x92\x58\xca\x38\xc0\xb9\
-\xd9\xee\x5a\x7c\x2b\xd0\xb4\x1a\x09\x42\xed\xe0\xda\x1a\x60\x84\
-\xea\x53\x72\xde\x33\x59\xb0\xfd\x3a\x02\x6b\x33\xde\x54\x70\x96\
-\x2e\x79\xa2\xe6\x01\xe9\x90\xb1\x23\x84\x44\x2d\xf1\x4c\xe4\x1a\
-\x77\x34\x78\xa8\xf6\x7e\xe0\x79\x38\xf9\xec\x2a\x9b\x8f\x0a\x11\
-\x3f\x5f\x95\x85\xaa\xcd\x44\xe0\xdc\x90\x75\xc3\xf8\xaa\x75\xc1\
-\x59\x6f\x7a\x80\xd1\x20\x5b\x2d\x89\x90\x00\x2f\xa0\x54\xaa\x95\
-\x97\x02\xa4\x28\x27\xa1\x91\xd2\xd1\xf1\x71\x03\xbd\x25\x9c\xc0\
-\x68\xf9\xd1\x03\xcf\xaf\x6c\xd8\xd0\x4b\xd0\x34\x4a\x3d\x03\x40\
-\xe0\xa6\x00\xaf\x44\x40\x7a\x27\x00\x28\xce\x20\x84\x68\x09\x7d\
-\x99\x78\x5c\x89\x84\x2e\x6a\xa0\x38\x53\x12\x16\x33\x49\xc0\x11\
-\x00\xe5\x1e\xee\x14\xf6\x14\x86\xe6\x11\x0d\xb5\xc6\x72\x63\x31\
-\x89\xae\xa8\x57\x45\x65\xbd\xa1\x79\x60\x4f\x81\xf4\xcf\x58\xd1\
-\x8f\xc7\xaa\xa9\x18\x90\x48\xff\x6d\x04\xd7\xcf\x67\xa7\xb9\xb4\
-\xaf\x7d\x29\x67\x56\x9f\x2e\xe9\x9a\x6f\xd2\x3e\xf8\x12\x1c\x1b\
-\x8c\x95\x08\x44\xec\x26\x7d\x6a\x3c\x5f\xfa\xff\x7e\xee\x13\x74\
-\xf2\x80\x5d\x3d\x20\xf1\x78\x3c\x3c\xa4\x3f\xfe\x05\x68\xd7\x5d\
-\xbe\x73\x1b\x5d\xed\xab\x2f\xc3\x95\xf1\xe2\xe3\x3d\x3c\xf5\xea\
-\x74\x83\x2c\x93\xd7\xf8\xf1\xdc\x68\x69\xf7\xea\xb5\x41\x60\x0c\
-\x48\xd7\x87\xbc\x47\xe0\x1c\x41\x8f\x7e\x99\x1a\x1b\xe7\x86\x2b\
-\x2f\xc0\xd0\xd7\x46\xe2\x99\x63\x7f\xb3\xbe\x2e\x87\x78\x81\x46\
-\x6a\x6c\xaa\xf4\xe2\xa4\x5f\x26\x4c\x16\xc8\x36\xf4\x03\xc9\x64\
-\x52\xdd\x69\x85\xd2\x69\x75\x45\x26\x90\xe2\xf6\xe9\xac\xcb\x8e\
-\x5e\x13\xd3\xd0\x31\x74\x6d\xcd\x10\xf8\x7c\x3d\x92\xa1\xe0\x78\
-\x50\xcc\xbc\x60\x19\x1f\x7c\x06\xa4\x81\x6c\x22\x91\x08\x16\xc7\
-\xb6\x6f\x71\xec\x15\x02\xfb\xc8\x42\xa1\xc8\xa7\x43\x19\x3c\xd7\
-\x26\x6c\x88\x35\xc1\x73\x6d\x3e\x1d\xca\xb0\x50\x28\x96\x8c\xeb\
-\xef\xbe\x07\x4c\x02\x19\xc0\x6f\xea\x09\x93\xc9\x24\x96\x65\x05\
-\xbd\x0c\x0f\xa7\xd5\x9e\x39\x4f\xea\xb7\x9e\x1b\x77\xf0\xa4\x60\
-\xcb\x06\x81\x11\x12\x84\x04\x2b\x42\x53\x3e\x43\xbf\x16\xf8\xe6\
-\x6c\x16\xcf\x97\xf5\xc6\xd3\xc0\x79\xc0\xae\xdc\x9a\x5a\x66\xe9\
-\x78\x3c\x2e\x80\xb6\x21\xff\xde\x9b\x31\x3b\x9f\x43\xd3\x07\xc2\
-\x86\xe0\xe2\x4d\x6d\xec\xe9\x95\x74\x77\x77\xa0\xeb\x8d\x89\x29\
-\x08\x3c\x66\x67\xe7\x38\xfb\xb7\xe0\x8f\x89\x02\xae\x27\x41\xfa\
-\x67\x70\xd2\x2f\x5b\xe1\xe3\xa7\xcb\x3b\x3f\x0f\x14\xea\xdb\xf2\
-\x25\xcb\x44\x99\x44\x04\xe8\x1a\x52\xf7\x3d\x82\x1e\xb9\x07\x4d\
-\xef\xaf\xe8\xa3\x26\xf4\x74\x94\x62\x78\x7a\xce\xc7\x2e\xd6\x2d\
-\x96\xfe\x19\xfc\xdc\x27\x96\xfe\xce\x47\xe5\x60\x9b\x2e\xbb\xbd\
-\xe9\x76\xb4\xec\xd5\x2c\x1e\x8f\x6b\xe5\x7a\xd1\x0e\x74\x0e\xb9\
-\x77\xec\xc6\xe8\xd8\x8f\x30\x77\x21\x8c\x1d\x28\x55\x5b\xaf\xbc\
-\x14\x81\x9b\xa2\x98\x49\x96\x93\x4c\x1e\x98\x2b\x13\xc8\x03\x7e\
-\xab\xcb\xea\xbf\xba\x9c\x96\xbd\x61\x94\x3d\x12\x2d\x23\x52\x96\
-\x89\x6a\x32\x2b\xb5\xda\x0e\x60\x97\xe1\xac\x74\x39\xfd\x07\x20\
-\x06\x06\xca\xee\x16\xad\xbd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x06\x2c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x0d\x00\x00\
-\x0b\x0d\x01\xed\x07\xc0\x2c\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xd3\x0a\x09\x13\x22\x36\x19\xae\x5d\x9a\x00\x00\x05\xb9\x49\x44\
-\x41\x54\x78\xda\xc5\x97\x5b\x8c\x13\x55\x18\xc7\x7f\x73\xa6\x33\
-\x6d\x77\x97\xee\x85\x55\x60\x57\x04\x14\x09\x88\x98\x65\x47\x8d\
-\x11\x51\x31\xf1\x12\x63\xe2\x25\xea\x93\x77\xad\xca\x83\x3e\x29\
-\x2f\x26\x26\xfa\xea\x83\x89\xbe\xa8\x8d\x28\xea\x8b\x9a\x78\x7b\
-\x30\x46\x41\x8c\x28\x6a\x42\x0b\xbb\xc4\x4b\x90\x1a\x16\x5d\xba\
-\xb0\x97\x76\x97\xb6\x33\xed\xcc\x9c\xe3\x43\xa7\xdb\x96\x6d\xdd\
-\x4b\x4c\x9c\xe4\x9f\x5e\xbe\x73\xe6\xfb\x7f\xff\x99\xef\x72\xe0\
-\x7f\xbe\xb4\xc5\x2c\x1e\xdc\x39\xb4\x0e\xd4\x0e\x90\x03\xc0\x00\
-\x4a\xd6\xdd\x43\x0d\xa3\xe4\x30\xd2\xdd\x6f\xb1\x27\x0d\xc8\x44\
-\x22\xa1\xfe\x13\x02\x83\x3b\x87\x1e\x01\x1e\x06\xae\x03\x05\x48\
-\x10\x26\x88\x48\x65\x81\x74\xc0\x77\xea\xb7\x1c\x44\x7a\xef\x5b\
-\xea\xad\xdd\x80\x9b\x48\x24\xe4\x92\x08\x0c\xee\x1c\xda\x8a\x26\
-\x5e\x41\xc9\xeb\x11\x3a\x98\x5d\x60\xf6\x60\x86\xa3\xac\x8e\xcd\
-\x70\xe5\x05\x59\x00\xf2\x0e\xec\x3b\xb1\x06\xdb\x29\x43\x69\x1c\
-\x9c\x49\x50\x2e\xa0\x6c\x7c\xe7\x59\x8b\x77\xdf\x01\x9c\x66\x44\
-\xb4\x79\xa2\xde\x0d\x40\x74\x25\x66\xc7\xf9\x3c\x76\xd5\x28\x5b\
-\x2e\xea\x60\xc3\x05\x6d\x44\x4c\x31\x67\xcf\xe8\x44\x89\x9f\x7e\
-\x9b\xe6\xc0\xef\x70\xe8\x84\x01\x85\x91\x8a\xc1\x2f\x7f\x62\xf1\
-\xf6\xe3\xc0\x4c\x22\x91\xf0\xe6\x25\x30\xeb\x5c\x0f\x43\x6c\x03\
-\xf7\x6f\xfd\x9b\x3b\xb6\xf5\xd2\xdd\x11\x6a\xa9\x96\x3a\xe7\x56\
-\x07\x8e\xe6\x78\x63\xbf\xc1\xe9\xb1\x31\xf0\xf2\x20\xdd\x61\x4b\
-\xed\xbe\x19\x18\xaf\x57\x42\x6f\xe9\x3c\xd4\xc6\xea\xd5\xab\x78\
-\xf6\x96\x3c\x37\x5d\xd1\x83\x11\x12\x78\x92\x96\xf0\xa5\x6a\x40\
-\x7f\x6f\x98\xed\x1b\x21\x9b\xf7\x38\x31\xae\x81\xf2\x57\x64\xd4\
-\xe6\x4b\xfb\x18\xfa\xcc\xb2\x2c\x2f\x95\x4a\xa9\x39\x04\x06\x77\
-\x1e\xd9\x0a\xda\x17\xe8\x06\xfd\xfd\xfd\xec\xba\x5d\xb1\x76\x45\
-\x04\xd7\x53\x4b\x42\x48\xd7\xd8\xb2\x36\xca\x99\x19\xc9\x5f\x93\
-\x00\xea\x92\x8c\xbb\xee\xc7\x3e\xf1\xeb\x5f\x01\x09\xce\xd5\xf4\
-\x6d\xf0\x21\xb6\x85\x47\xb7\x4f\x12\x6b\x6b\xa3\x58\xaa\x65\xd2\
-\x97\x87\xb2\xdc\x7a\x45\xf7\xa2\x73\xfd\xc1\x1d\x31\x4e\x9f\x35\
-\x38\xfe\x67\x1e\xcc\xae\x17\x91\x1c\x06\x5c\xc0\xd5\x6b\xd1\xa7\
-\x1e\x01\xf5\x24\xd1\x3e\x1e\xb8\x2a\xcb\xa6\x35\x1d\xb8\xbe\x6a\
-\xc0\x7d\xd7\xf7\xf2\xee\xde\x33\xf4\x2d\x37\xe7\xd8\x5c\x5f\xb1\
-\xef\xc8\x34\xc7\x4f\x39\x1c\x3f\xe5\x34\xac\x51\xc0\xda\x5e\xc9\
-\x77\xe9\x2e\x70\x67\x56\x65\xe4\xa6\x5c\x9f\x36\x7c\xd8\xb2\xac\
-\x72\x4d\x01\x25\x1f\x46\x33\x58\xd1\xbb\x8c\x8d\x6b\x1c\x0a\x4e\
-\xf3\xd4\x7d\xee\xde\x7e\x5e\xfe\x68\x14\xeb\x92\x8e\xa6\xb6\xea\
-\xf5\xcd\x91\xe9\x06\x5b\xac\xdd\xe0\xae\x81\x09\x3e\x39\x68\x80\
-\x1e\xb9\x1b\xc9\x7b\x80\x2d\x00\x06\x9f\x3a\xb4\x0e\xb8\x8e\xc8\
-\x72\x6e\x5c\x3f\x89\xe7\x43\xb1\xe4\xcf\x41\xbd\xa3\xe4\x1f\xf9\
-\x96\x76\x68\xdc\x3f\x5d\xf0\xf8\x33\x53\x44\xa1\x43\x64\x39\x68\
-\xfa\x40\xb2\x74\xdb\x26\x20\x52\x55\x60\x07\x00\x66\x0f\xbd\xb1\
-\x19\x0a\xb6\x9c\xf7\xb9\x56\x95\xb8\xf0\xbc\x70\x53\x7b\xc1\x96\
-\x8c\x4d\x39\x9c\x9c\xd2\xf8\x79\xb4\xa6\x0c\xa6\x0d\xf6\x18\x18\
-\x9d\xdb\x80\xc3\xd5\x6a\x32\x00\xb0\xb2\x53\xa2\x68\x1e\xfd\xb9\
-\x11\x56\x49\x9c\x1c\x2f\xb5\x54\x60\x2a\xef\x37\x3a\x07\xcc\x70\
-\xb4\xf2\x45\x98\x1b\x81\x68\x68\x96\x80\x1e\xa1\x3b\x5a\x26\xbf\
-\x80\xe8\x9b\x29\x11\x31\x1a\x2b\xe3\xf7\x7f\x18\x80\x81\x56\x6d\
-\x55\x41\x32\xe9\x02\xd0\x0c\x10\xfe\x7a\x24\x91\xda\x2e\x11\x21\
-\x16\x2e\x53\x28\xc9\x59\x2c\x86\x84\xe3\x36\xae\x3f\x36\xd5\xc3\
-\xb1\xa9\x9e\x59\xe7\x5a\x7d\xa1\x0c\xb5\x83\x52\x1a\x60\x84\xea\
-\x4b\x72\xc1\x35\x39\x6b\xd7\x4a\x75\x7b\x78\x71\x4a\xb4\xec\x78\
-\xad\x5b\x9e\xa8\xa5\xa1\x74\xc8\xda\x11\x42\xa2\x56\x78\xc6\xf2\
-\x8d\x11\x3d\x7d\x67\x6b\x02\xdb\x5f\x82\x03\x2f\xcc\xd3\xfb\xab\
-\x44\xbc\x42\x4d\x8c\xd9\x61\xc2\x77\xae\xcd\x95\xc2\x78\xaa\x79\
-\xc3\x59\x66\xba\x80\xd1\xd2\xf9\x42\xae\x90\x00\xd7\xa7\xd2\xaa\
-\x95\x9b\x06\x64\x28\x28\x42\xc3\x68\x3a\x05\xdb\xc3\xd0\x43\x2d\
-\xba\x9d\x58\xb2\x73\xa3\xae\xe3\xd8\x4e\x39\x68\xd1\xa5\x34\x3a\
-\x6e\xc5\x9b\x74\xf7\xa3\xeb\x50\x9e\x44\x88\x55\x0b\x7e\xee\x0b\
-\x8d\x5c\xaf\xe7\x5e\x9e\x0c\x3e\xb3\x29\xa2\x38\x02\x20\x98\xe1\
-\x0e\x62\x8f\x63\x68\x2e\xd1\x50\x73\x2c\xc6\x79\x77\xd4\x9d\x45\
-\x75\xbf\xa1\xb9\x60\x8f\x83\xf4\x8e\x5a\xd1\xaf\x46\x00\xbb\xaa\
-\xb7\x44\x7a\xef\x23\xb8\x66\x26\x37\xc1\xc5\xfd\xed\xad\xc4\x04\
-\xe0\xa1\xd7\x66\xb8\xa8\x69\x53\x8c\xd5\x08\x44\xec\x39\xd6\xf4\
-\x68\xa1\xf2\xfc\xbd\xfc\xd7\xe8\x14\x00\x7b\x36\x41\xe2\xf1\x78\
-\x38\xa9\x3f\xf1\x2d\x68\x57\x5f\xba\x61\x2d\xdd\xed\x73\x07\xda\
-\x57\x9f\xe8\xe5\x99\x37\x27\x96\x34\x7e\x67\x0b\x1a\xbf\x1e\x3b\
-\x51\x89\x5e\xbd\xf5\x34\x30\x02\x64\xea\xdf\x38\x17\xdf\xd9\x85\
-\x1e\xfd\x2e\x3d\x32\xca\xb5\x97\x9f\x87\xa1\x37\x92\x78\x7e\xcf\
-\x29\x96\x85\x17\xef\xdc\xf5\x35\xd2\x23\xe3\x95\x1f\x4e\xe6\x75\
-\xc2\xe4\x80\x5c\xc3\x3c\x90\x4a\xa5\xd4\xed\x56\x28\x93\x51\x97\
-\x65\x7d\x29\x6e\x99\xc8\x95\x58\xdf\x67\x62\x1a\x3a\x86\xae\x2d\
-\x19\x02\x8f\x1f\x86\xb3\x14\x1d\x17\xca\xd9\x57\x2c\xe3\xd3\x7d\
-\x40\x06\xc8\x25\x12\x09\xff\xdc\xdc\xf2\x2c\xf6\xbc\x81\x6f\xef\
-\x3a\x5b\x2c\xb3\x37\x99\xc5\x2d\xd9\x84\x0d\xb1\x24\xb8\x25\x9b\
-\xbd\xc9\x2c\x67\x8b\xe5\x8a\x73\xfd\xc3\x8f\x81\xd3\x40\x16\xf0\
-\xe6\xcc\x84\xa9\x54\x0a\xcb\xb2\xfc\x3e\x86\x86\x32\x6a\xf3\xb4\
-\x2b\xf5\x9b\x8e\x8d\x3a\xb8\x52\xb0\x7a\xb9\xc0\x08\x09\x42\x82\
-\x79\xa1\x29\x8f\xe4\xf1\x22\x3f\xfe\x92\xc3\xf5\x64\xbd\xf3\x0c\
-\x70\x06\xb0\xab\xa7\xa6\xa6\x55\x3a\x1e\x8f\x0b\xa0\x2d\xe9\xdd\
-\x73\x03\x66\xd7\x8b\x68\xfa\x60\xd8\x10\x5c\xb8\xb2\x8d\xcd\x7d\
-\x92\x9e\x9e\x4e\x74\xbd\xb1\x2a\xfa\xbe\xcb\xd4\xd4\x34\xbf\x9c\
-\x12\x9c\x1c\x2b\x52\x72\x25\x48\xef\x28\x4e\xe6\x75\x2b\xfc\xc5\
-\xe1\x20\xf2\x33\x40\xb1\x7e\x2c\x6f\xd9\x26\x02\x12\x11\xa0\x3b\
-\xa9\xee\x7f\x14\x3d\x72\x37\x9a\x3e\x50\xb5\x47\x4d\xe8\xed\xac\
-\xbc\xc3\x13\xd3\x1e\x76\xb9\x6e\xb3\xf4\x8e\xe2\xe5\xbf\xb6\xf4\
-\x0f\x3e\x0f\x5e\xb6\x89\x40\xf6\x39\xa7\xa3\x7f\x3d\x9a\xc5\xe3\
-\x71\x2d\xe8\x17\xed\x40\x57\xb2\x74\xdb\x26\x8c\xce\x6d\x08\x73\
-\x23\xc2\x58\x1f\xb4\xd4\xa0\x56\xbb\x69\xfc\x52\x9a\x72\x36\x15\
-\x14\x99\x02\x30\x1d\x10\x28\x00\x5e\xb3\xc3\xea\x82\x0e\xa7\x81\
-\x1a\x46\xa0\x48\x34\x40\x24\xf8\x4f\xcc\x16\xb3\xca\xa8\xed\x00\
-\x76\x00\x67\xbe\xc3\xe9\x3f\x1b\x12\x1d\x02\xc3\x6b\x0b\x76\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = "\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x0a\
-\x0c\xad\x0f\x07\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0c\xf7\x59\xc7\
-\x00\x6e\
-\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x07\xa7\x57\x87\
-\x00\x61\
-\x00\x64\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xc9\x59\xa7\
-\x00\x70\
-\x00\x72\x00\x65\x00\x76\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0c\x07\x58\x47\
-\x00\x71\
-\x00\x75\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xc8\x58\x67\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x09\xa7\x8d\x47\
-\x00\x66\
-\x00\x69\x00\x72\x00\x73\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xa7\x59\x07\
-\x00\x6c\
-\x00\x61\x00\x73\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct = "\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x02\
-\x00\x00\x00\x42\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x33\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x16\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x12\
-\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x11\x36\
-\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x23\xde\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x17\x93\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x05\xc0\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
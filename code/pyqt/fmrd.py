@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+STARTED = time.time()
+
+import os
+import sys
+import ConfigParser
+from optparse import OptionParser
+from PyQt4.QtCore import *
+from PyQt4.QtSql import *
+
+"""
+Headless command-line tool for batch operations on an FMRD database.
+
+Runs one subcommand per invocation without a GUI: the database is opened from command-line
+flags or a configuration file instead of the driver and login dialogs, and only QtCore and
+QtSql are loaded.  The FmrdLib modules of a subcommand are imported when it runs, so that
+every subcommand starts quickly enough for cron jobs and pipelines (see --timing).  Only
+the benchmark subcommand, which replays sessions against the data entry dialogs, loads QtGui.
+
+Subcommands:
+import -- import match feeds (JSON or CSV)
+export -- export matches as a match feed (JSON Lines or CSV)
+validate -- report lineups that are not ready for match event entry
+stats -- print row counts of FMRD tables
+generate -- build a synthetic database at a size tier (creates a missing SQLite file)
+benchmark -- replay data entry sessions against the dialogs (see fmrd_benchmark.py)
+
+The configuration file is an INI file with a [database] section (or the section given with
+--profile) holding driver, name, host, port, user and password.  It is read from --config,
+or from the file named by the FMRD_CONFIG environment variable.  Flags override it.
+
+Examples:
+    python fmrd.py import --database medium.db season_2010.json
+    python fmrd.py export --config /etc/fmrd.ini --profile archive --from 2010-01-01 - > 2010.jsonl
+    python fmrd.py validate --driver QPSQL --user fmrd --database fmrd_huge
+    python fmrd.py generate --tier small --script ../../sql/fmrd-sqlite.sql --database small.db
+    python fmrd.py benchmark --database medium.db --repeat 3 --output new.json
+"""
+
+CONFIG_ENV = "FMRD_CONFIG"
+DEFAULT_PROFILE = "database"
+DATABASE_SETTINGS = ("driver", "name", "host", "port", "user", "password")
+DEFAULT_SETTINGS = {"driver": "QSQLITE", "name": None, "host": "localhost", "port": "5432",
+                    "user": "", "password": ""}
+
+
+class CommandError(Exception):
+    """Exception raised when a subcommand cannot run."""
+    pass
+
+
+# ----------------------------------------------------------
+# database settings and connection
+
+def addDatabaseOptions(parser):
+    """Adds database connection options to a subcommand's parser."""
+    parser.add_option("-D", "--database", dest="name", metavar="NAME",
+                      help="SQLite database file or PostgreSQL database name")
+    parser.add_option("-d", "--driver", choices=["QSQLITE", "QPSQL"],
+                      help="database driver, QSQLITE or QPSQL [default: QSQLITE]")
+    parser.add_option("--host", help="PostgreSQL host [default: localhost]")
+    parser.add_option("--port", help="PostgreSQL port [default: 5432]")
+    parser.add_option("-u", "--user", help="PostgreSQL user name")
+    parser.add_option("-p", "--password", help="PostgreSQL password")
+    parser.add_option("--config", metavar="FILE",
+                      help="configuration file with database settings [default: $%s]" % CONFIG_ENV)
+    parser.add_option("--profile", default=DEFAULT_PROFILE,
+                      help="section of configuration file [default: %default]")
+    parser.add_option("--timing", action="store_true", default=False,
+                      help="print startup and run times to standard error")
+
+def databaseSettings(options):
+    """Returns database settings from defaults, configuration file and flags, in increasing precedence."""
+    settings = dict(DEFAULT_SETTINGS)
+    configFile = options.config or os.environ.get(CONFIG_ENV)
+    if configFile:
+        config = ConfigParser.SafeConfigParser()
+        try:
+            if not config.read(configFile):
+                raise CommandError("Cannot read configuration file %s" % configFile)
+            for key in DATABASE_SETTINGS:
+                if config.has_option(options.profile, key):
+                    settings[key] = config.get(options.profile, key)
+        except ConfigParser.Error, e:
+            raise CommandError("Configuration file %s: %s" % (configFile, e))
+        if not config.has_section(options.profile):
+            raise CommandError("Configuration file %s has no [%s] section" % (configFile, options.profile))
+    for key in DATABASE_SETTINGS:
+        if getattr(options, key) is not None:
+            settings[key] = getattr(options, key)
+    if not settings["name"]:
+        raise CommandError("No database given (use --database or a configuration file)")
+    if settings["driver"] not in ("QSQLITE", "QPSQL"):
+        raise CommandError("Unknown driver %s (use QSQLITE or QPSQL)" % settings["driver"])
+    try:
+        settings["port"] = int(settings["port"])
+    except ValueError:
+        raise CommandError("Invalid port %s" % settings["port"])
+    return settings
+
+def openDatabase(settings, create=False):
+    """Opens default database connection.  Raises CommandError if it cannot be opened.
+
+    A missing SQLite database file is an error unless create is True.
+    """
+    if settings["driver"] == "QSQLITE" and not create and not os.path.exists(settings["name"]):
+        # the SQLite driver would silently create an empty database
+        raise CommandError("Database file %s does not exist" % settings["name"])
+    db = QSqlDatabase.addDatabase(settings["driver"])
+    db.setDatabaseName(settings["name"])
+    if settings["driver"] == "QPSQL":
+        db.setHostName(settings["host"])
+        db.setPort(settings["port"])
+        db.setUserName(settings["user"])
+        db.setPassword(settings["password"])
+    if not db.open():
+        raise CommandError("Cannot open database %s: %s" % (settings["name"], db.lastError().text()))
+    return db
+
+def report(message):
+    """Writes message to standard error, which is kept free of command output."""
+    sys.stderr.write((u"%s\n" % message).encode("utf-8"))
+
+# ----------------------------------------------------------
+# subcommands
+
+def importOptions(parser):
+    from FmrdLib.FeedImporter import CHUNK_SIZE
+    parser.add_option("-c", "--chunk", type="int", default=CHUNK_SIZE,
+                      help="number of matches written in one transaction [default: %default]")
+
+def importCommand(options, args):
+    """Imports match feeds.  Returns exit status."""
+    from FmrdLib.FeedImporter import FeedError, FeedImporter, ReadFeed
+    if not args:
+        raise CommandError("At least one feed is required")
+    counts = {}
+    try:
+        importer = FeedImporter(chunkSize=options.chunk, progress=report)
+        for feed in args:
+            report("Importing %s..." % feed)
+            for table, count in importer.run(ReadFeed(feed)).items():
+                counts[table] = counts.get(table, 0) + count
+    except FeedError, e:
+        raise CommandError(unicode(e))
+    for table in sorted(counts.keys()):
+        print "%-24s %9d rows" % (table, counts[table])
+    report("%d matches imported, %d already in database" % (counts.get("tbl_matches", 0), importer.skipped))
+    return 0
+
+def exportOptions(parser):
+    from FmrdLib.FeedExporter import FORMATS
+    parser.add_option("-f", "--format", default="jsonl", choices=list(FORMATS),
+                      help="output format, jsonl (file, or - for standard output) or csv (directory) [default: %default]")
+    parser.add_option("-c", "--competition", action="append", default=[], metavar="NAME",
+                      help="export matches of competition (name or ID); may be repeated")
+    parser.add_option("--from", dest="firstDate", metavar="YYYY-MM-DD", help="first match date to export")
+    parser.add_option("--to", dest="lastDate", metavar="YYYY-MM-DD", help="last match date to export")
+    parser.add_option("--ids", action="store_true", default=False,
+                      help="write IDs instead of names of teams, players and lookup values")
+
+def exportCommand(options, args):
+    """Exports matches to a file, standard output or a directory.  Returns exit status."""
+    from FmrdLib.FeedExporter import FeedError, FeedExporter
+    if len(args) != 1:
+        raise CommandError("One output file or directory is required")
+    if options.format == "csv" and args[0] == "-":
+        raise CommandError("csv output must be a directory")
+    try:
+        exporter = FeedExporter(competitions=[name.decode("utf-8") for name in options.competition],
+                                firstDate=options.firstDate, lastDate=options.lastDate, ids=options.ids)
+        counts = exporter.run(args[0], options.format)
+    except FeedError, e:
+        raise CommandError(unicode(e))
+    for section in sorted(counts.keys()):
+        report("%-24s %9d rows" % (section, counts[section]))
+    return 0
+
+def validateCommand(options, args):
+    """Prints lineups that are not ready for match event entry.  Returns 1 if there are any."""
+    from FmrdLib.LineupReadiness import LineupReadinessReport, ReadinessError, ReadinessReportLines
+    try:
+        lines = ReadinessReportLines(LineupReadinessReport())
+    except ReadinessError, e:
+        raise CommandError("Cannot check lineups: %s" % e)
+    for line in lines:
+        print line.encode("utf-8")
+    report("%d lineups not ready" % len(lines))
+    return int(bool(lines))
+
+def statsCommand(options, args):
+    """Prints row counts of FMRD tables.  Returns exit status."""
+    from FmrdLib.QueryCache import ScalarQuery
+    db = QSqlDatabase.database()
+    tables = sorted(unicode(table) for table in db.tables() if unicode(table).startswith("tbl_"))
+    if not tables:
+        raise CommandError("Database %s contains no FMRD tables" % db.databaseName())
+    for table in tables:
+        print "%-24s %9d rows" % (table, ScalarQuery("SELECT COUNT(*) FROM %s" % table).toInt()[0])
+    return 0
+
+def generateOptions(parser):
+    from FmrdLib.DataGenerator import TIERS
+    parser.add_option("-t", "--tier", default="small",
+                      help="size tier: %s [default: %%default]" % ", ".join(sorted(TIERS.keys())))
+    parser.add_option("-s", "--seed", type="int", default=1,
+                      help="seed of random number generator [default: %default]")
+    parser.add_option("--script", action="append", default=[], metavar="FILE",
+                      help="SQL script to run before generating data (schema, reference data); may be repeated")
+
+def generateCommand(options, args):
+    """Builds a synthetic database for testing and benchmarking.  Returns exit status."""
+    from FmrdLib.DataGenerator import TIERS, DataGenerator, GeneratorError, RunScript
+    if args:
+        raise CommandError("generate takes no arguments")
+    if options.tier not in TIERS:
+        raise CommandError("Unknown tier %s" % options.tier)
+    try:
+        for fileName in options.script:
+            report("Running %s..." % fileName)
+            RunScript(fileName)
+        counts = DataGenerator(options.tier, options.seed, progress=report).run()
+    except GeneratorError, e:
+        raise CommandError(unicode(e))
+    for table in sorted(counts.keys()):
+        print "%-24s %9d rows" % (table, counts[table])
+    report("Tier %s (seed %d) generated" % (options.tier, options.seed))
+    return 0
+
+def benchmarkOptions(parser):
+    import fmrd_benchmark
+    fmrd_benchmark.benchmarkOptions(parser)
+
+def benchmarkCommand(options, args):
+    """Replays data entry sessions on the configured database.  Returns exit status.
+
+    Sessions write records, so an SQLite database is copied to a temporary directory and the
+    copy is benchmarked.  The dialogs need a QApplication, which this subcommand creates.
+    """
+    import shutil
+    import tempfile
+    import fmrd_benchmark
+    from PyQt4.QtGui import QApplication
+    if args:
+        raise CommandError("benchmark takes no arguments")
+    try:
+        sessions = fmrd_benchmark.benchmarkSessions(options)
+    except ValueError, e:
+        raise CommandError(unicode(e))
+    settings = databaseSettings(options)
+    benchmarked = settings
+    workDir = None
+    if settings["driver"] == "QSQLITE":
+        workDir = tempfile.mkdtemp(prefix="fmrd_benchmark")
+        benchmarked = dict(settings, name=os.path.join(workDir, os.path.basename(settings["name"])))
+    # referenced until the dialogs are closed and the database is closed
+    app = QApplication(sys.argv)
+    try:
+        if workDir is not None:
+            try:
+                shutil.copyfile(settings["name"], benchmarked["name"])
+            except IOError, e:
+                raise CommandError("Cannot copy database %s: %s" % (settings["name"], e.strerror))
+        db = openDatabase(benchmarked)
+        try:
+            return fmrd_benchmark.runBenchmark(options, sessions, settings["name"])
+        finally:
+            db.close()
+    finally:
+        if workDir is not None:
+            shutil.rmtree(workDir, True)
+
+# subcommands: {name: (function, options function, arguments, description, opens database)}
+# (generate creates a missing SQLite file; benchmark opens a copy of the database itself)
+COMMANDS = {
+    "import": (importCommand, importOptions, "FEED...", "import match feeds (JSON files or directories of CSV files)", True),
+    "export": (exportCommand, exportOptions, "OUTPUT", "export matches as a match feed", True),
+    "validate": (validateCommand, None, "", "report lineups that are not ready for match event entry", True),
+    "stats": (statsCommand, None, "", "print row counts of FMRD tables", True),
+    "generate": (generateCommand, generateOptions, "", "build a synthetic database at a size tier", True),
+    "benchmark": (benchmarkCommand, benchmarkOptions, "",
+                  "replay data entry sessions against the dialogs (loads QtGui)", False),
+}
+
+def main():
+    """Parses command line, opens database and runs subcommand."""
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print "Usage: %s COMMAND [options] [arguments]\n\nCommands:" % os.path.basename(sys.argv[0])
+        for name in sorted(COMMANDS.keys()):
+            print "  %-10s %s" % (name, COMMANDS[name][3])
+        print "\nUse %s COMMAND --help for the options of a command." % os.path.basename(sys.argv[0])
+        return int(len(sys.argv) < 2 or sys.argv[1] not in ("-h", "--help")) * 2
+
+    command = sys.argv[1]
+    function, addOptions, arguments, description, opensDatabase = COMMANDS[command]
+    parser = OptionParser(usage="%%prog %s [options] %s" % (command, arguments), description=description)
+    addDatabaseOptions(parser)
+    if addOptions:
+        addOptions(parser)
+    (options, args) = parser.parse_args(sys.argv[2:])
+
+    try:
+        if not opensDatabase:
+            return function(options, args)
+        # referenced until the database is closed, as Qt loads SQL driver plugins through it
+        app = QCoreApplication(sys.argv)
+        db = openDatabase(databaseSettings(options), create=(command == "generate"))
+        opened = time.time()
+        try:
+            status = function(options, args)
+        finally:
+            db.close()
+    except CommandError, e:
+        report(u"Error: %s" % unicode(e))
+        return 1
+    if options.timing:
+        report("startup %.0f ms (imports and connection), %s %.0f ms" %
+               ((opened - STARTED) * 1000.0, command, (time.time() - opened) * 1000.0))
+    return status
+
+
+# ----------------------------------------------------------
+# Call main() to run command
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+# dialogs are never shown; use an offscreen platform where Qt supports one
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt4.QtCore import *
+from PyQt4.QtGui import *
+from PyQt4.QtSql import *
+
+from FmrdLib import Constants
+from FmrdLib.Benchmark import *
+from FmrdLib.QueryCache import *
+
+from fmrd_match import MatchEntryDlg
+from fmrd_personnel import LineupEntryDlg
+from fmrd_subs import SubsEntryDlg
+from fmrd_goals import GoalEntryDlg
+from fmrd_shootouts import PenShootoutEntryDlg
+
+"""
+Replays scripted data entry sessions against the FMRD dialogs (fmrd.py benchmark subcommand).
+
+Each session opens a dialog, walks the Competition/Phase/Round/Match selection, navigates
+records and enters new ones, timing every step.  Latency percentiles and SQL round trips per
+step are written to a JSON results file, and compared to a baseline file if one is given.
+The exit status is 1 if a regression is found.
+
+Sessions write records, so fmrd.py copies an SQLite database to a temporary file before the
+run.  A PostgreSQL database should be a disposable copy (e.g. built with fmrd.py generate).
+
+Example:
+    python fmrd.py benchmark --database medium.db --output new.json --baseline baseline.json
+
+Qt 4 builds without the QPA offscreen platform need a virtual display (e.g. xvfb-run).
+"""
+
+SESSIONS = ("MatchEntryDlg", "LineupEntryDlg", "SubsEntryDlg", "GoalEntryDlg", "PenShootoutEntryDlg")
+
+LINEUP_SIZE = Constants.MAX_TEAM_STARTERS + 7
+NUM_SUBSTITUTIONS = 6
+NUM_GOALS = 3
+
+# ----------------------------------------------------------
+# widget helpers
+
+def selectIndex(combo, index):
+    """Sets index of combobox if it has that many items.  Returns True if successful."""
+    if combo.count() <= index:
+        return False
+    combo.setCurrentIndex(index)
+    return True
+
+def selectText(combo, text):
+    """Sets combobox to item with text.  Returns True if item was found."""
+    index = combo.findText(text, Qt.MatchExactly)
+    if index < 0:
+        return False
+    combo.setCurrentIndex(index)
+    return True
+
+def selectRecord(combo, field, value):
+    """Sets combobox to row of its model whose field equals value.  Returns True if row was found."""
+    model = combo.model()
+    while model.canFetchMore():
+        model.fetchMore()
+    for row in range(model.rowCount()):
+        if unicode(model.record(row).value(field).toString()) == unicode(value):
+            combo.setCurrentIndex(row)
+            return True
+    return False
+
+def closeDialog(dialog):
+    """Closes dialog without prompting and schedules its deletion."""
+    dialog.mapper.revert()
+    dialog.model.revertAll()
+    QDialog.reject(dialog)
+    dialog.deleteLater()
+    QApplication.processEvents()
+
+def navigate(recorder, dialog, count):
+    """Steps forward through the records of a dialog, wrapping round at the last record."""
+    for k in range(count):
+        if dialog.nextEntry.isEnabled():
+            recorder.measure("navigate", dialog.saveRecord, Constants.NEXT)
+        elif dialog.model.rowCount() > 1:
+            recorder.measure("navigate", dialog.saveRecord, Constants.FIRST)
+        else:
+            recorder.skip("navigate")
+            return
+
+# ----------------------------------------------------------
+# fixtures
+
+def firstRow(sql):
+    """Returns first row of query as list of strings, or None."""
+    rows = RowsQuery(sql)
+    if not rows:
+        return None
+    return [unicode(value.toString()) for value in rows[0]]
+
+def findFixtures():
+    """Selects the matches used by the sessions from the benchmark database."""
+    fixtures = {}
+    # league match with lineups
+    fixtures["league"] = firstRow("SELECT competition, round, match_id FROM league_match_list "
+                                  "WHERE match_id IN (SELECT match_id FROM tbl_lineups) ORDER BY match_id")
+    # knockout match with lineups, preferably with a penalty shootout
+    fixtures["knockout"] = firstRow("SELECT competition, round, game, match_id FROM knockout_match_list "
+                                    "WHERE match_id IN (SELECT match_id FROM tbl_penshootoutopeners) ORDER BY match_id") or \
+                           firstRow("SELECT competition, round, game, match_id FROM knockout_match_list "
+                                    "WHERE match_id IN (SELECT match_id FROM tbl_lineups) ORDER BY match_id")
+    # match without lineups, and players for a new lineup (two goalkeepers first)
+    fixtures["lineup"] = firstRow("SELECT tbl_hometeams.match_id, tbl_hometeams.team_id, tm_name FROM tbl_hometeams, tbl_teams "
+                                  "WHERE tbl_hometeams.team_id = tbl_teams.team_id AND "
+                                  "tbl_hometeams.match_id NOT IN (SELECT match_id FROM tbl_lineups) "
+                                  "ORDER BY tbl_hometeams.match_id")
+    goalkeepers = ColumnQuery("SELECT player_id FROM tbl_players WHERE position_id IN "
+                              "(SELECT position_id FROM positions_list WHERE position_name = ?) ORDER BY player_id",
+                              ("Goalkeeper", ))[:2]
+    outfield = ColumnQuery("SELECT player_id FROM tbl_players WHERE position_id NOT IN "
+                           "(SELECT position_id FROM positions_list WHERE position_name = ?) ORDER BY player_id",
+                           ("Goalkeeper", ))[:LINEUP_SIZE - 2]
+    players = [unicode(value.toString()) for value in goalkeepers[:1] + outfield[:Constants.MAX_TEAM_STARTERS - 1] +
+               goalkeepers[1:] + outfield[Constants.MAX_TEAM_STARTERS - 1:]]
+    fixtures["players"] = players
+    return fixtures
+
+def cascadeLeague(recorder, dialog, fixture):
+    """Walks Competition -> Phase -> Round -> Match selection of an event dialog."""
+    competition, roundName, match_id = fixture
+    recorder.measure("select competition", selectText, dialog.compSelect, competition)
+    recorder.measure("select phase", selectText, dialog.phaseSelect, "League")
+    recorder.measure("select round", selectText, dialog.lgRoundSelect, roundName)
+    return recorder.measure("select match", selectRecord, dialog.matchSelect, "match_id", match_id)
+
+# ----------------------------------------------------------
+# sessions
+
+def matchSession(recorder, options, fixtures):
+    """Opens Match dialog, navigates matches and adds a new match record."""
+    for k in range(options.repeat):
+        dialog = recorder.measure("open", MatchEntryDlg)
+        navigate(recorder, dialog, options.navigate)
+        recorder.measure("add record", dialog.addRecord)
+        closeDialog(dialog)
+
+def lineupSession(recorder, options, fixtures):
+    """Opens Lineup dialog for a match without lineups and enters a squad of 18."""
+    if fixtures["lineup"] is None or len(fixtures["players"]) < LINEUP_SIZE:
+        recorder.skip("add player")
+        return
+    match_id, team_id, teamName = fixtures["lineup"]
+    dialog = recorder.measure("open", LineupEntryDlg, QString(match_id), QString(team_id), QString(teamName))
+    for k, player_id in enumerate(fixtures["players"]):
+        recorder.measure("add record", dialog.addRecord)
+        if not recorder.measure("select player", selectRecord, dialog.playerSelect, "player_id", player_id):
+            recorder.skip("select player")
+            continue
+        dialog.startingButton.setChecked(k < Constants.MAX_TEAM_STARTERS)
+        dialog.captButton.setChecked(k == 1)
+        recorder.measure("save record", dialog.saveRecord, Constants.NULL)
+    navigate(recorder, dialog, options.navigate)
+    closeDialog(dialog)
+
+def subsSession(recorder, options, fixtures):
+    """Opens Substitutions dialog, selects a league match and enters six substitutions."""
+    if fixtures["league"] is None:
+        recorder.skip("select match")
+        return
+    for k in range(options.repeat):
+        dialog = recorder.measure("open", SubsEntryDlg)
+        if cascadeLeague(recorder, dialog, fixtures["league"]) and k == 0:
+            for n in range(NUM_SUBSTITUTIONS):
+                recorder.measure("add record", dialog.addRecord)
+                recorder.measure("select team", selectIndex, dialog.teamSelect, n % 2)
+                if not (selectIndex(dialog.inplayerSelect, 0) and selectIndex(dialog.outplayerSelect, 0)):
+                    recorder.skip("save record")
+                    dialog.mapper.revert()
+                    continue
+                dialog.subtimeEdit.setText(QString.number(60 + n))
+                recorder.measure("save record", dialog.saveRecord, Constants.NULL)
+            navigate(recorder, dialog, options.navigate)
+        closeDialog(dialog)
+
+def goalSession(recorder, options, fixtures):
+    """Opens Goals dialog, selects a league match, navigates its goals and enters new goals."""
+    if fixtures["league"] is None:
+        recorder.skip("select match")
+        return
+    for k in range(options.repeat):
+        dialog = recorder.measure("open", GoalEntryDlg)
+        if cascadeLeague(recorder, dialog, fixtures["league"]) and k == 0:
+            navigate(recorder, dialog, options.navigate)
+            for n in range(NUM_GOALS):
+                recorder.measure("add record", dialog.addRecord)
+                recorder.measure("select team", selectIndex, dialog.teamSelect, n % 2)
+                if not selectIndex(dialog.playerSelect, 0):
+                    recorder.skip("save record")
+                    dialog.mapper.revert()
+                    continue
+                selectIndex(dialog.goaleventSelect, 0)
+                selectIndex(dialog.goaltypeSelect, 0)
+                dialog.goaltimeEdit.setText(QString.number(20 + 25 * n))
+                recorder.measure("save record", dialog.saveRecord, Constants.NULL)
+        closeDialog(dialog)
+
+def shootoutSession(recorder, options, fixtures):
+    """Opens Penalty Shootout dialog, selects a knockout match, navigates kicks and enters a kick."""
+    if fixtures["knockout"] is None:
+        recorder.skip("select match")
+        return
+    competition, roundName, matchday, match_id = fixtures["knockout"]
+    for k in range(options.repeat):
+        dialog = recorder.measure("open", PenShootoutEntryDlg)
+        recorder.measure("select competition", selectText, dialog.compSelect, competition)
+        recorder.measure("select round", selectText, dialog.koRoundSelect, roundName)
+        recorder.measure("select matchday", selectText, dialog.koMatchdaySelect, matchday)
+        if recorder.measure("select match", selectRecord, dialog.matchSelect, "match_id", match_id) and k == 0:
+            navigate(recorder, dialog, options.navigate)
+            recorder.measure("add record", dialog.addRecord)
+            if dialog.penFirstSelect.isEnabled():
+                recorder.measure("select opener", selectIndex, dialog.penFirstSelect, 0)
+            recorder.measure("select shootout round", selectIndex, dialog.roundSelect, 0)
+            recorder.measure("select team", selectIndex, dialog.teamSelect, 0)
+            if selectIndex(dialog.playerSelect, 0) and selectIndex(dialog.penoutcomeSelect, 0):
+                recorder.measure("save record", dialog.saveRecord, Constants.NULL)
+            else:
+                recorder.skip("save record")
+        closeDialog(dialog)
+
+_sessionFunctions = {
+    "MatchEntryDlg": matchSession,
+    "LineupEntryDlg": lineupSession,
+    "SubsEntryDlg": subsSession,
+    "GoalEntryDlg": goalSession,
+    "PenShootoutEntryDlg": shootoutSession,
+}
+
+# ----------------------------------------------------------
+
+def datasetDescription(fileName):
+    """Returns row counts of the main tables of the benchmark database."""
+    dataset = {"database": os.path.basename(unicode(fileName))}
+    for table in ("tbl_matches", "tbl_lineups", "tbl_goals", "tbl_substitutions", "tbl_penaltyshootouts"):
+        dataset[table] = ScalarQuery("SELECT COUNT(*) FROM %s" % table).toInt()[0]
+    return dataset
+
+def benchmarkOptions(parser):
+    """Adds benchmark options to the parser of the fmrd.py benchmark subcommand."""
+    parser.add_option("--sessions", default=",".join(SESSIONS),
+                      help="comma-separated sessions to run [default: all]")
+    parser.add_option("-r", "--repeat", type="int", default=5,
+                      help="number of times each dialog is opened [default: %default]")
+    parser.add_option("-n", "--navigate", type="int", default=100,
+                      help="number of records navigated per session [default: %default]")
+    parser.add_option("-o", "--output", default="fmrd_benchmark.json",
+                      help="results file [default: %default]")
+    parser.add_option("-b", "--baseline", metavar="FILE", help="baseline results file to compare against")
+    parser.add_option("--tolerance", type="float", default=DEFAULT_TOLERANCE,
+                      help="allowed relative slowdown of median latency [default: %default]")
+    parser.add_option("--min-delta", type="float", default=DEFAULT_MIN_DELTA_MS,
+                      help="ignore slowdowns smaller than this many ms [default: %default]")
+
+def benchmarkSessions(options):
+    """Returns names of sessions selected with --sessions.  Raises ValueError for an unknown session."""
+    sessions = [name.strip() for name in options.sessions.split(",") if name.strip()]
+    for name in sessions:
+        if name not in _sessionFunctions:
+            raise ValueError("Unknown session %s" % name)
+    return sessions
+
+def runBenchmark(options, sessions, databaseName):
+    """Runs sessions on the open default connection, writes results and compares them to the baseline.
+
+    Arguments:
+        options -- options of benchmarkOptions()
+        sessions -- names of sessions from benchmarkSessions()
+        databaseName -- name of the benchmarked database, recorded in the results
+
+    Returns exit status, which is 1 if a regression is found.
+    """
+    ClearQueryCache()
+    recorder = BenchmarkRecorder()
+    responder = MessageBoxResponder(recorder)
+    responder.install()
+    try:
+        dataset = datasetDescription(databaseName)
+        fixtures = findFixtures()
+        for name in sessions:
+            print "Running %s session..." % name
+            recorder.begin(name)
+            try:
+                _sessionFunctions[name](recorder, options, fixtures)
+            finally:
+                recorder.end()
+    finally:
+        responder.uninstall()
+        recorder.close()
+        ClearQueryCache()
+
+    results = WriteResults(options.output, recorder, dataset)
+    for session, steps in sorted(results["sessions"].items()):
+        print session
+        for step, stats in sorted(steps.items()):
+            print "    %-24s %4d x  p50 %8.1f ms  p90 %8.1f ms  p99 %8.1f ms  %6.1f round trips" % \
+                (step, stats["samples"], stats["p50_ms"], stats["p90_ms"], stats["p99_ms"], stats["roundtrips"])
+    print "Results written to %s" % options.output
+
+    if options.baseline:
+        baseline = ReadResults(options.baseline)
+        if baseline is None:
+            print "Cannot read baseline %s" % options.baseline
+            return 1
+        regressions = CompareResults(results, baseline, options.tolerance, options.min_delta)
+        if regressions:
+            print "Regressions against %s:" % options.baseline
+            for message in regressions:
+                print "    " + message
+            return 1
+        print "No regressions against %s" % options.baseline
+    return 0
@@ -25,6 +25,9 @@ from FmrdMain import *
 from FmrdLib import (Constants, MsgPrompts)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.QueryExecutor import (QueryExecutor, KeyFilter)
+from FmrdLib.ReferenceData import ReferenceTableModel
 
 """Contains GoalEntryDlg class that implements data entry to Goals table of FMRD."""
 
@@ -81,19 +84,13 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         #
         
         # Competition combobox
-        self.compModel = QSqlTableModel(self)
-        self.compModel.setTable("tbl_competitions")
-        self.compModel.setSort(CMP_ID, Qt.AscendingOrder)
-        self.compModel.select()
+        self.compModel = ReferenceTableModel("tbl_competitions", CMP_ID, self)
         self.compSelect.setModel(self.compModel)
         self.compSelect.setModelColumn(self.compModel.fieldIndex("comp_name"))
         self.compSelect.setCurrentIndex(-1)
                 
         # Competition Phases combobox
-        self.phaseModel = QSqlTableModel(self)
-        self.phaseModel.setTable("tbl_phases")
-        self.phaseModel.setSort(PHS_ID, Qt.AscendingOrder)
-        self.phaseModel.select()
+        self.phaseModel = ReferenceTableModel("tbl_phases", PHS_ID, self)
         self.phaseSelect.setModel(self.phaseModel)
         self.phaseSelect.setModelColumn(self.phaseModel.fieldIndex("phase_desc"))
         self.phaseSelect.setCurrentIndex(-1)
@@ -103,10 +100,7 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         #
         
         # League Rounds
-        leagueRoundModel = QSqlTableModel(self)
-        leagueRoundModel.setTable("tbl_rounds")
-        leagueRoundModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        leagueRoundModel.select()
+        leagueRoundModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.lgRoundSelect.setModel(leagueRoundModel)
         self.lgRoundSelect.setModelColumn(leagueRoundModel.fieldIndex("round_desc"))
         self.lgRoundSelect.setCurrentIndex(-1)
@@ -116,28 +110,19 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         #
         
         # Group Rounds
-        groupRoundModel = QSqlTableModel(self)
-        groupRoundModel.setTable("tbl_grouprounds")
-        groupRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        groupRoundModel.select()
+        groupRoundModel = ReferenceTableModel("tbl_grouprounds", RND_ID, self)
         self.grpRoundSelect.setModel(groupRoundModel)
         self.grpRoundSelect.setModelColumn(groupRoundModel.fieldIndex("grpround_desc"))
         self.grpRoundSelect.setCurrentIndex(-1)
         
         # Groups
-        groupNameModel = QSqlTableModel(self)
-        groupNameModel.setTable("tbl_groups")
-        groupNameModel.setSort(GROUP_NAME, Qt.AscendingOrder)
-        groupNameModel.select()
+        groupNameModel = ReferenceTableModel("tbl_groups", GROUP_NAME, self)
         self.groupSelect.setModel(groupNameModel)
         self.groupSelect.setModelColumn(groupNameModel.fieldIndex("group_desc"))
         self.groupSelect.setCurrentIndex(-1)
         
         # Matchdays
-        groupMatchdayModel = QSqlTableModel(self)
-        groupMatchdayModel.setTable("tbl_rounds")
-        groupMatchdayModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        groupMatchdayModel.select()
+        groupMatchdayModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.grpMatchdaySelect.setModel(groupMatchdayModel)
         self.grpMatchdaySelect.setModelColumn(groupMatchdayModel.fieldIndex("round_desc"))
         self.grpMatchdaySelect.setCurrentIndex(-1)
@@ -147,19 +132,13 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         #
 
         # Knockout Rounds
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         self.koRoundSelect.setModel(knockoutRoundModel)
         self.koRoundSelect.setModelColumn(knockoutRoundModel.fieldIndex("koround_desc"))
         self.koRoundSelect.setCurrentIndex(-1)
         
         # Matchdays (Knockout phase)
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         self.koMatchdaySelect.setModel(knockoutMatchdayModel)
         self.koMatchdaySelect.setModelColumn(knockoutMatchdayModel.fieldIndex("matchday_desc"))
         self.koMatchdaySelect.setCurrentIndex(-1)
@@ -175,8 +154,8 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         
         # 
         # underlying database model (tbl_goals)
-        # because of foreign keys, instantiate QSqlRelationalTableModel and define relations to it        
-        self.model = QSqlRelationalTableModel(self)
+        # because of foreign keys, instantiate RelationalIDTableModel and define relations to it        
+        self.model = RelationalIDTableModel(self)
         self.model.setTable("tbl_goals")
         self.model.setRelation(GoalEntryDlg.TEAM_ID, QSqlRelation("tbl_teams", "team_id", "tm_name"))
         self.model.setRelation(GoalEntryDlg.LINEUP_ID, QSqlRelation("lineup_list", "lineup_id", "player"))
@@ -295,7 +274,12 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         self.connect(self.koRoundSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatchdays)
         self.connect(self.koMatchdaySelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatches)
         
+        # look up records of selected match on worker threads
+        self.executor = QueryExecutor(self)
         self.connect(self.matchSelect, SIGNAL("currentIndexChanged(int)"), self.filterGoals)
+        self.connect(self.executor, SIGNAL("resultReady(QString,PyQt_PyObject)"), self.applyMatchFilter)
+        self.connect(self.executor, SIGNAL("queryFailed(QString,PyQt_PyObject)"), 
+                     lambda key, error: MsgPrompts.DatabaseQueryErrorPrompt(self, error))
         self.connect(self.goaltimeEdit, SIGNAL("editingFinished()"),  lambda: self.enableStoppageTime(self.stoppageEdit))
    
     def accept(self):
@@ -403,15 +387,11 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(goal_id) FROM tbl_goals"))
-        if query.next():
-            maxGoalID= query.value(0).toInt()[0]
-            if not maxGoalID:
-                goal_id = Constants.MinGoalID
-            else:
-                goal_id= QString()
-                goal_id.setNum(maxGoalID+1)                  
+        try:
+            goal_id = NextID("tbl_goals")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
         
@@ -471,10 +451,10 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         return False
 
     def filterGoals(self):
-        """Sets filter for Goals table based on Match selection."""
+        """Looks up lineups of selected match on worker thread.
         
-        # clear filter
-        self.model.setFilter(QString())
+        Entry widgets are disabled until applyMatchFilter() receives the result.
+        """
         
         # get current index
         currentIndex = self.matchSelect.currentIndex()
@@ -482,9 +462,22 @@ class GoalEntryDlg(QDialog, ui_goalentry.Ui_GoalEntryDlg):
         # get match_id
         match_id = self.matchModel.record(currentIndex).value("match_id").toString()
         
-        # filter goals to those scored by players who were in the lineup for the match (match_id)
-        self.model.setFilter(QString("tbl_goals.lineup_id IN (SELECT lineup_id FROM lineup_list WHERE matchup IN "
-                                                    "(SELECT matchup FROM match_list WHERE match_id = %1))").arg(match_id))
+        # disable entry widgets and buttons while lookup is pending
+        for widget in self.lowerFormWidgets + (self.stoppageEdit, self.addEntry, self.saveEntry, self.deleteEntry, 
+                       self.firstEntry, self.prevEntry, self.nextEntry, self.lastEntry):
+            widget.setDisabled(True)
+        
+        # players who were in the lineup for the match (match_id)
+        self.executor.submit("match", [
+            ("SELECT lineup_id FROM lineup_list WHERE matchup IN "
+             "(SELECT matchup FROM match_list WHERE match_id = ?)", (match_id, ))])
+        
+    def applyMatchFilter(self, key, results):
+        """Sets filter for Goals table with lineups of selected match."""
+        lineups, = results
+        
+        # filter goals to those scored by players who were in the lineup for the match
+        self.model.setFilter(KeyFilter("tbl_goals.lineup_id", lineups))
         self.mapper.toFirst()        
         
         # enable add/delete buttons
@@ -23,6 +23,12 @@ from PyQt4.QtSql import *
 
 from FmrdMain import (ui_fmrdlogin, ui_fmrddbfile)
 from FmrdLib import Constants
+from FmrdLib.QueryCache import ClearQueryCache
+from FmrdLib.IDAllocator import ResetIDAllocator
+from FmrdLib.TableCounters import InvalidateCounters
+from FmrdLib.ReferenceData import InvalidateReferenceData
+from FmrdLib.CheckTables import InvalidateChildTables
+from FmrdLib.RosterState import InvalidateRosterState
 
 """
 Contains implementation of login dialog for access to FMRD.
@@ -63,6 +69,13 @@ class DBFileLoadDlg(QDialog, ui_fmrddbfile.Ui_DBFileLoadDlg):
                     "Unable to open or create database file. Please check your SQLite3 installation.", 
                     QMessageBox.Close)
                 self.reject()
+            # discard prepared statements, reserved IDs and cached tables and metadata of any previous connection
+            ClearQueryCache(db.connectionName())
+            ResetIDAllocator(db.connectionName())
+            InvalidateCounters(db.connectionName())
+            InvalidateReferenceData(connectionName=db.connectionName())
+            InvalidateChildTables(db.connectionName())
+            InvalidateRosterState(connectionName=db.connectionName())
             # set foreign key checking to ON
             cmd = QSqlQuery()
             cmd.exec_("PRAGMA foreign_key = ON")
@@ -151,6 +164,13 @@ class DBLoginDlg(QDialog, ui_fmrdlogin.Ui_DBLoginDlg):
                     QMessageBox.Close)
                 self.reject()
         else:
+            # discard prepared statements, reserved IDs and cached tables and metadata of any previous connection
+            ClearQueryCache(db.connectionName())
+            ResetIDAllocator(db.connectionName())
+            InvalidateCounters(db.connectionName())
+            InvalidateReferenceData(connectionName=db.connectionName())
+            InvalidateChildTables(db.connectionName())
+            InvalidateRosterState(connectionName=db.connectionName())
             self.accept()
 
     def enableWidget(self, widget):
@@ -20,6 +20,8 @@
 
 import sys
 import functools
+# imported first, so that startup times include the imports below
+from FmrdLib import StartupTimes
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 
@@ -43,24 +45,29 @@ user or admin switchboards.
     
 def main():
     """ Conducts database authentication and executes GUI loop if successful."""
+    StartupTimes.Mark("imports")
         
     # create app objects
     app = QApplication(sys.argv)
     
     driver = DBDriverDlg()
+    StartupTimes.WatchFirstPaint(driver, "driver dialog painted")
     # open driver window with wrapper function so that tuple is returned
     # status = (QDialog.DialogCode, ButtonState)
     outcome = driver.execute()
+    StartupTimes.Mark("driver selected", interactive=True)
     
     if outcome[0] == QDialog.Accepted:
         if outcome[1] == Constants.SQLITE:
             dbload = DBFileLoadDlg()
+            StartupTimes.WatchFirstPaint(dbload, "login dialog painted")
             
             # open file load window with wrapper function so that tuple is returned
             # status = (QDialog.DialogCode, ButtonState)
             status = dbload.execute()
         elif outcome[1] == Constants.POSTGRES:
             login = DBLoginDlg() 
+            StartupTimes.WatchFirstPaint(login, "login dialog painted")
                 
             # open login window with wrapper function so that tuple is returned
             # status = (QDialog.DialogCode, ButtonState)
@@ -70,12 +77,15 @@ def main():
         #    open switchboard based on return value of ButtonState
         # if login unsuccessful or aborted (QDialog.DialogCode == QDialog.Rejected)
         #    exit application
+        StartupTimes.Mark("login accepted", interactive=True)
         if status[0] == QDialog.Accepted:
             if status[1] == Constants.USER:
                 userwindow = UserMainSwitchboard()
+                StartupTimes.WatchFirstPaint(userwindow, "switchboard painted", report=True)
                 userwindow.show()
             elif status[1] == Constants.ADMIN:
                 adminwindow = MainSwitchboard()
+                StartupTimes.WatchFirstPaint(adminwindow, "switchboard painted", report=True)
                 adminwindow.show()
             sys.exit(app.exec_())
 
@@ -22,9 +22,12 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import *
-from FmrdLib import (CheckTables, Constants, MsgPrompts)
+from FmrdLib import (CheckTables, Constants, MsgPrompts, TableChanges)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.ReferenceData import ReferenceTableModel
 
 from fmrd_personnel import LineupEntryDlg
 
@@ -35,6 +38,10 @@ EnviroEntryDlg - data entry to Environments table
 MatchEntryDlg - data entry to Matches table
 """
 
+# child tables of Matches table whose records are deleted along with the match record
+MATCH_CASCADED = ["tbl_environments", "tbl_hometeams", "tbl_awayteams", "tbl_homemanagers", 
+                  "tbl_awaymanagers", "tbl_leaguematches", "tbl_groupmatches", "tbl_knockoutmatches"]
+
 class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
     """Implements match entry dialog, and accesses and writes to Matches table.
     
@@ -95,14 +102,14 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         
         # define underlying database model (tbl_matches)
         # because of foreign keys, instantiate QSqlRelationalTableModel and define relations to it
-        self.model = QSqlRelationalTableModel(self)
+        self.model = PagedRelationalTableModel(self)
         self.model.setTable("tbl_matches")
         self.model.setRelation(MatchEntryDlg.COMP_ID, QSqlRelation("tbl_competitions", "competition_id", "comp_name"))
         self.model.setRelation(MatchEntryDlg.PHASE_ID, QSqlRelation("tbl_phases", "phase_id", "phase_desc"))
         self.model.setRelation(MatchEntryDlg.VENUE_ID, QSqlRelation("tbl_venues", "venue_id", "ven_name"))
         self.model.setRelation(MatchEntryDlg.REF_ID, QSqlRelation("referees_list", "referee_id", "full_name"))
         self.model.setSort(MatchEntryDlg.ID, Qt.AscendingOrder)
-        self.model.select()
+        self.model.selectFirst()
         
         # define main mapper (Matches)
         # establish ties between underlying database model and data widgets on form
@@ -157,10 +164,7 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         # define models used for League matches
         #
         
-        leagueRoundModel = QSqlTableModel(self)
-        leagueRoundModel.setTable("tbl_rounds")
-        leagueRoundModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        leagueRoundModel.select()
+        leagueRoundModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         
         # League Match linking model
         self.leagueMatchModel = LeagueLinkingModel("tbl_leaguematches", self)
@@ -182,20 +186,11 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         # define models used for Group matches
         #
         
-        groupNameModel = QSqlTableModel(self)
-        groupNameModel.setTable("tbl_groups")
-        groupNameModel.setSort(GROUP_NAME, Qt.AscendingOrder)
-        groupNameModel.select()
+        groupNameModel = ReferenceTableModel("tbl_groups", GROUP_NAME, self)
         
-        groupRoundModel = QSqlTableModel(self)
-        groupRoundModel.setTable("tbl_grouprounds")
-        groupRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        groupRoundModel.select()
+        groupRoundModel = ReferenceTableModel("tbl_grouprounds", RND_ID, self)
         
-        groupMatchdayModel = QSqlTableModel(self)
-        groupMatchdayModel.setTable("tbl_rounds")
-        groupMatchdayModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        groupMatchdayModel.select()
+        groupMatchdayModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         
         # Group Match linking model
         self.groupMatchModel = GroupLinkingModel("tbl_groupmatches", self)
@@ -227,15 +222,9 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         # define models used for Knockout matches
         #
 
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         
         # Knockout Match linking model
         self.knockoutMatchModel = KnockoutLinkingModel("tbl_knockoutmatches", self)
@@ -264,25 +253,13 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         # so that there is no confusion in SQL logic
         #
         
-        self.homeTeamModel = QSqlTableModel(self)
-        self.homeTeamModel.setTable("tbl_teams")
-        self.homeTeamModel.setSort(TEAM_NAME, Qt.AscendingOrder)
-        self.homeTeamModel.select()
-        
-        self.awayTeamModel = QSqlTableModel(self)
-        self.awayTeamModel.setTable("tbl_teams")
-        self.awayTeamModel.setSort(TEAM_NAME, Qt.AscendingOrder)
-        self.awayTeamModel.select()
+        # rows are served from the reference data cache, which may have been
+        # loaded in the background after login
+        self.homeTeamModel = ReferenceTableModel("tbl_teams", TEAM_NAME, self)
+        self.awayTeamModel = ReferenceTableModel("tbl_teams", TEAM_NAME, self)
 
-        self.homeManagerModel = QSqlTableModel(self)
-        self.homeManagerModel.setTable("managers_list")
-        self.homeManagerModel.setSort(MGR_SORT, Qt.AscendingOrder)
-        self.homeManagerModel.select()
-        
-        self.awayManagerModel = QSqlTableModel(self)
-        self.awayManagerModel.setTable("managers_list")
-        self.awayManagerModel.setSort(MGR_SORT, Qt.AscendingOrder)
-        self.awayManagerModel.select()
+        self.homeManagerModel = ReferenceTableModel("managers_list", MGR_SORT, self)
+        self.awayManagerModel = ReferenceTableModel("managers_list", MGR_SORT, self)
         
         # set up Home Team linking table 
         # set up Home Team combobox with items from tbl_teams table
@@ -385,8 +362,8 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         self.firstEntry.setDisabled(True)
         self.prevEntry.setDisabled(True)        
         
-        # disable Next and Last Entry buttons if less than two records
-        if self.model.rowCount() < 2:
+        # disable Next and Last Entry buttons if no records after first record
+        if not self.model.hasNext(0):
             self.nextEntry.setDisabled(True)
             self.lastEntry.setDisabled(True)
             
@@ -435,23 +412,86 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
 
         self.connect(self.enviroButton, SIGNAL("clicked()"), lambda: self.openEnviros(self.matchID_display.text()))
         self.connect(self.homeLineupButton, SIGNAL("clicked()"), 
-                                                                lambda: self.openLineups(self.matchID_display.text(), self.hometeamSelect.currentText()))
+                                                                lambda: self.openLineups(self.matchID_display.text(), ComboBoxID(self.hometeamSelect, "team_id"), 
+                                                                                          self.hometeamSelect.currentText()))
         self.connect(self.awayLineupButton, SIGNAL("clicked()"), 
-                                                               lambda: self.openLineups(self.matchID_display.text(), self.awayteamSelect.currentText()))
+                                                               lambda: self.openLineups(self.matchID_display.text(), ComboBoxID(self.awayteamSelect, "team_id"), 
+                                                                                         self.awayteamSelect.currentText()))
 
     def accept(self):
         """Submits changes to database and closes window upon confirmation from user."""
         row = self.mapper.currentIndex()
         if self.isDirty(row):
             if MsgPrompts.SaveDiscardOptionPrompt(self):
-                if not self.mapper.submit():
-                    MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
-                else:
-                    self.submitForms()
+                self.saveMatch()
         QDialog.accept(self)
     
+    def saveMatch(self):
+        """Writes current match record and its linking tables in one transaction.
+        
+        If any write fails, the transaction is rolled back so that no part of the match is 
+        saved, and the user is alerted.  Returns True if successful.
+        """
+        db = self.model.database()
+        row = self.mapper.currentIndex()
+        match_id = self.matchID_display.text()
+        state = self.formState()
+        db.transaction()
+        if self.mapper.submit():
+            error = self.submitForms()
+            if error is None:
+                if db.commit():
+                    return True
+                error = db.lastError()
+        else:
+            error = self.model.lastError()
+        db.rollback()
+        self.restoreUnsavedMatch(row, match_id, state)
+        MsgPrompts.DatabaseCommitErrorPrompt(self, error)
+        return False
+        
+    def formState(self):
+        """Returns contents of match form widgets, to be restored by restoreFormState()."""
+        state = []
+        for widget in self.selectWidgets:
+            state.append((widget, widget.currentIndex()))
+        for widget in (self.matchID_display, self.firstHalfLengthEdit, self.secondHalfLengthEdit, 
+                       self.firstExtraLengthEdit, self.secondExtraLengthEdit, self.matchAttendanceEdit):
+            state.append((widget, widget.text()))
+        state.append((self.matchDateEdit, self.matchDateEdit.date()))
+        return state
+        
+    def restoreFormState(self, state):
+        """Restores contents of match form widgets returned by formState(), without emitting signals."""
+        for widget, value in state:
+            widget.blockSignals(True)
+            if isinstance(widget, QComboBox):
+                widget.setCurrentIndex(value)
+            elif isinstance(widget, QDateEdit):
+                widget.setDate(value)
+            else:
+                widget.setText(value)
+            widget.blockSignals(False)
+            
+    def restoreUnsavedMatch(self, row, match_id, state):
+        """Shows match record as it was before a save that has been rolled back.
+        
+        The model and linking models were updated by writes inside the rolled-back transaction,
+        so they are read again.  A new record that was not saved is inserted again, and the 
+        form is restored, so that the user's entries are kept as unsaved edits.
+        """
+        phaseText = self.matchPhaseSelect.currentText()
+        self.model.select()
+        if row >= self.model.rowCount() or self.model.record(row).value("match_id").toString() != match_id:
+            row = self.model.rowCount()
+            self.model.insertRow(row)
+        self.mapper.setCurrentIndex(row)
+        self.refreshSubForms(match_id)
+        self.refreshPhaseForms(match_id, phaseText)
+        self.restoreFormState(state)
+        
     def submitForms(self):
-        """Writes to linking tables."""
+        """Writes to linking tables.  Returns None if successful, otherwise error of the failed write (QSqlError)."""
         
         mapperList = [self.hometeamMapper, self.awayteamMapper, self.homemgrMapper, self.awaymgrMapper]
         editorList = [self.hometeamSelect, self.awayteamSelect, self.homemgrSelect, self.awaymgrSelect]
@@ -459,71 +499,53 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         # write to home/away linking tables
         for mapper, editor in zip(mapperList, editorList):
             if not self.updateLinkingTable(mapper, editor, 0):
-                return
+                return mapper.model().lastError()
         
         # write to specific Phase linking tables
         # update linking table, then call submit()
         phaseText = self.matchPhaseSelect.currentText()
         if phaseText == "League":
-            self.updateLinkingTable(self.leagueMatchMapper, self.lgRoundSelect, 1)
-            self.leagueMatchModel.submit()
+            if not self.updateLinkingTable(self.leagueMatchMapper, self.lgRoundSelect, 1):
+                return self.leagueMatchModel.lastError()
+            return None
         elif phaseText == "Group":
             editorList = [self.grpRoundSelect, self.groupSelect, self.grpMatchdaySelect]
             for editor,  column in zip(editorList, range(1, 4)):
-                self.updateLinkingTable(self.groupMatchMapper, editor, column)
-            self.groupMatchModel.submit()
+                if not self.updateLinkingTable(self.groupMatchMapper, editor, column):
+                    self.groupMatchModel.resetID()
+                    return self.groupMatchModel.lastError()
+            if not self.groupMatchModel.submit():
+                return self.groupMatchModel.lastError()
         elif phaseText == "Knockout":
             editorList = [self.koRoundSelect, self.koMatchdaySelect]
             for editor,  column in zip(editorList, range(1, 3)):
-                self.updateLinkingTable(self.knockoutMatchMapper, editor, column)                
-            self.knockoutMatchModel.submit()
+                if not self.updateLinkingTable(self.knockoutMatchMapper, editor, column):
+                    self.knockoutMatchModel.resetID()
+                    return self.knockoutMatchModel.lastError()
+            if not self.knockoutMatchModel.submit():
+                return self.knockoutMatchModel.lastError()
+        return None
             
     def saveRecord(self, where):
         """"Submits changes to database, navigates through form, and resets subforms."""
         row = self.mapper.currentIndex()
         if self.isDirty(row):
             if MsgPrompts.SaveDiscardOptionPrompt(self):
-                if not self.mapper.submit():
-                    MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
-                else:
-                    self.submitForms()
+                self.saveMatch()
             else:
                 self.mapper.revert()
         
         for widget in self.phaseWidgets:
             widget.blockSignals(True)
         
-        if where == Constants.FIRST:
-            self.firstEntry.setDisabled(True)
-            self.prevEntry.setDisabled(True)
-            if not self.nextEntry.isEnabled():
-                self.nextEntry.setEnabled(True)
-                self.lastEntry.setEnabled(True)
-            row = 0
-        elif where == Constants.PREV:
-            row -= 1
-            if not self.nextEntry.isEnabled():
-                    self.nextEntry.setEnabled(True)
-                    self.lastEntry.setEnabled(True)   
-            if row == 0:
-                self.firstEntry.setDisabled(True)
-                self.prevEntry.setDisabled(True)                
-        elif where == Constants.NEXT:
-            row += 1
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            if row == self.model.rowCount() - 1:
-                self.nextEntry.setDisabled(True)
-                self.lastEntry.setDisabled(True)
-        elif where == Constants.LAST:
-            self.nextEntry.setDisabled(True)
-            self.lastEntry.setDisabled(True)
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            row = self.model.rowCount() - 1
+        row = self.model.navigate(where, row)
         self.mapper.setCurrentIndex(row)
+        
+        # enable navigation buttons if there are records before/after current record
+        self.firstEntry.setEnabled(self.model.hasPrevious(row))
+        self.prevEntry.setEnabled(self.model.hasPrevious(row))
+        self.nextEntry.setEnabled(self.model.hasNext(row))
+        self.lastEntry.setEnabled(self.model.hasNext(row))
                     
         # disable Phase comboboxes
         # prevent user from editing Competition Phase once record is saved
@@ -596,24 +618,20 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         if row != -1:
             if self.isDirty(row):
                 if MsgPrompts.SaveDiscardOptionPrompt(self):
-                    if not self.mapper.submit():
-                        MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
-                    else:
-                        self.submitForms()
+                    self.saveMatch()
                 else:
                     self.mapper.revert()
                     return
         
+        try:
+            match_id = NextID("tbl_matches")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
+        
+        # new record is appended to last page
+        self.model.selectLast()
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(match_id) FROM tbl_matches"))
-        if query.next():
-            maxMatchID= query.value(0).toInt()[0]
-            if not maxMatchID:
-                match_id = Constants.MinMatchID
-            else:
-                match_id= QString()
-                match_id.setNum(maxMatchID+1)                  
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
         
@@ -627,7 +645,7 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
         self.nextEntry.setDisabled(True)
         self.lastEntry.setDisabled(True)
         # enable first/previous navigation buttons
-        if self.model.rowCount() > 1:
+        if self.model.hasPrevious(row):
             self.prevEntry.setEnabled(True)
             self.firstEntry.setEnabled(True)
             # enable Delete button if at least one record
@@ -686,51 +704,47 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
     def deleteRecord(self):
         """Deletes record from database upon user confirmation.
         
-        First, check that the match record is not being referenced in any of the following tables:
-            - Lineups table
-            - PenShootoutOpeners linking table
+        First, check that the match record is not being referenced in any child table (e.g. Lineups
+        and PenShootoutOpeners tables) other than those deleted along with it.
         If it is not being referenced in the child tables, ask for user confirmation and upon pos-
-        itive confirmation, delete records in the following order:
-            (1) HomeTeams and AwayTeams linking tables
-            (2) HomeManagers and AwayManagers linking tables
-            (3) LeagueMatches, GroupMatches, and KnockoutMatches linking tables
-            (4) WeatherKickoff, WeatherHalftime, and WeatherFulltime linking tables
-            (5) Environments table
+        itive confirmation, delete records in the following order in one transaction:
+            (1) WeatherKickoff, WeatherHalftime, and WeatherFulltime linking tables
+            (2) Environments table
+            (3) HomeTeams and AwayTeams linking tables
+            (4) HomeManagers and AwayManagers linking tables
+            (5) LeagueMatches, GroupMatches, and KnockoutMatches linking tables
             (6) Match table
+        If any deletion fails, none of the records are deleted.
         If match record is being referenced by Lineups, alert user.
         """
-        childTableList = ["tbl_lineups", "tbl_penshootoutopeners"]
-        fieldName = "match_id"
         match_id = self.matchID_display.text()
         
-        if not CheckTables.CountChildRecords(childTableList, fieldName, match_id):
+        if not CheckTables.HasChildRecords("tbl_matches", match_id, MATCH_CASCADED):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
                 return
             else:
-                # delete corresponding records in HomeTeams and AwayTeams 
-                self.hometeamModel.delete(match_id)
-                self.awayteamModel.delete(match_id)
-                
-                # delete corresponding records in HomeManagers and AwayManagers
-                self.homemgrModel.delete(match_id)
-                self.awaymgrModel.delete(match_id)
-                
-                # delete corresponding records in LeagueMatches, GroupMatches, and KnockoutMatches
-                # (will be in one of either, but make a sweep through all three to make sure)
-                self.leagueMatchModel.delete(match_id)
-                self.groupMatchModel.delete(match_id)
-                self.knockoutMatchModel.delete(match_id)
+                db = self.model.database()
+                db.transaction()
                 
-                # find enviro_id in Environments table that contains match_id
-                self.deleteEnviroTables(match_id)
+                # delete corresponding records in linking tables and Environments table
+                error = self.deleteLinkingTables(match_id)
+                ok = error is None
                 
                 # delete record in Match table
                 row = self.mapper.currentIndex()
-                self.model.removeRow(row)
-                if not self.model.submitAll():
-                    MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
+                if ok:
+                    self.model.removeRow(row)
+                    ok = self.model.submitAll()
+                    error = self.model.lastError()
+                if not ok or not db.commit():
+                    if ok:
+                        error = db.lastError()
+                    db.rollback()
+                    self.model.select()
+                    self.mapper.setCurrentIndex(row)
+                    MsgPrompts.DatabaseCommitErrorPrompt(self, error)
                     return
                 if row + 1 >= self.model.rowCount():
                     row = self.model.rowCount() - 1
@@ -780,7 +794,7 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
                     for widget in (self.prevEntry, self.firstEntry, self.nextEntry, self.lastEntry):
                         widget.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, CheckTables.ChildRecordCounts("tbl_matches", match_id, MATCH_CASCADED))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -831,29 +845,22 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
 
         return False                
 
-    def deleteEnviroTables(self, match_id):
-        """Deletes environmental conditions tables that reference a specific match.
+    def deleteLinkingTables(self, match_id):
+        """Deletes linking table and environmental conditions records that reference a specific match.
         
-        (1) Find the enviro_id record in Environments that is tied to a specific match (match_id).
-        (2) Delete the linking tables associated with enviro_id.
-        (3) Delete the enviro_id record in Environments table.
+        Each table is cleared with one statement; weather linking records are found through 
+        the Environments records of the match.  Must be called inside a transaction.
+        Returns None if all statements succeed, otherwise error of the failed statement (QSqlError).
         
         """
-        query = QSqlQuery()
-        query.prepare("SELECT enviro_id FROM tbl_environments WHERE match_id = ?")
-        query.addBindValue(QVariant(match_id))
-        query.exec_()
-        if query.next():
-            enviro_id = query.value(0).toInt()[0]
-        else:
-            return
-            
-        list = ["tbl_weatherkickoff", "tbl_weatherhalftime", "tbl_weatherfulltime",  "tbl_environments"]
-        deletionQuery = QSqlQuery()
-        for table in list:
-            deletionQuery.prepare(QString("DELETE FROM %1 WHERE enviro_id = ?").arg(table))
-            deletionQuery.addBindValue(QVariant(enviro_id))
-            deletionQuery.exec_()
+        enviroClause = "enviro_id IN (SELECT enviro_id FROM tbl_environments WHERE match_id = ?)"
+        statements = [QString("DELETE FROM %1 WHERE %2").arg(table).arg(enviroClause) 
+                      for table in ("tbl_weatherkickoff", "tbl_weatherhalftime", "tbl_weatherfulltime")]
+        statements += [QString("DELETE FROM %1 WHERE match_id = ?").arg(table) for table in MATCH_CASCADED]
+        for sql in statements:
+            if not ExecQuery(sql, (match_id, )):
+                return QueryError(sql)
+        return None
                 
     def updateLinkingTable(self, mapper, editor, column):
         """Updates custom linking table."""
@@ -932,16 +939,21 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
             MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
             return
             
-        subdialog = EnviroEntryDlg(match_id, self)
-        subdialog.exec_()
+        try:
+            subdialog = EnviroEntryDlg(match_id, self)
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+        else:
+            subdialog.exec_()
         self.mapper.setCurrentIndex(row)
         
-    def openLineups(self, match_id, teamName):
+    def openLineups(self, match_id, team_id, teamName):
         """Opens Lineups subdialog for one of the teams in a specific match from Match dialog.
         
         Saves current match record, instantiates LineupEntryDlg object and opens window.
         Arguments: 
         match_id -- primary key of current record in Matches table
+        team_id -- primary key of one of the two participants in current Match record
         teamName -- team name corresponding to one of the two participants in 
                             current Match record
         
@@ -954,7 +966,7 @@ class MatchEntryDlg(QDialog, ui_matchentry.Ui_MatchEntryDlg):
             MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
             return
             
-        subdialog = LineupEntryDlg(match_id, teamName, self)
+        subdialog = LineupEntryDlg(match_id, team_id, teamName, self)
 #        print "Match ID: %s" % match_id
 #        print "Team Name: %s" % teamName
         subdialog.exec_()
@@ -969,6 +981,8 @@ class EnviroEntryDlg(QDialog, ui_enviroentry.Ui_EnviroEntryDlg):
     Argument:
     match_id -- primary key of current record in Matches table
     
+    Raises IDAllocationError if the match has no Environments record and no ID can be allocated for one.
+    
     """
 
     ENVIRO_ID,  MATCH_ID,  KICKOFF,  TEMP = range(4)
@@ -987,21 +1001,19 @@ class EnviroEntryDlg(QDialog, ui_enviroentry.Ui_EnviroEntryDlg):
         self.model.setTable("tbl_environments")
         self.model.setFilter(QString("match_id = %1").arg(match_id))
         self.model.select()
+        TableChanges.WatchTableChanges(self.model)
         
         # if no entry for given table, create one
         # assign new id to enviro_id edit box
         row = self.model.rowCount()
         if not row:
-            # get highest enviro_id from entries in table
-            query = QSqlQuery()
-            query.exec_(QString("SELECT MAX(enviro_id) FROM tbl_environments"))
-            if query.next():
-                maxEnviroID = query.value(0).toInt()[0]
-                if not maxEnviroID:
-                    enviro_id = Constants.MinEnviroID
-                else:
-                    enviro_id= QString()
-                    enviro_id.setNum(maxEnviroID+1)
+            # get next enviro_id from ID allocator
+            try:
+                enviro_id = NextID("tbl_environments")
+            except IDAllocationError:
+                # dialog is not opened; detach it from its parent so that it is destroyed
+                self.setParent(None)
+                raise
             # insert row into model
             self.model.insertRow(row)
             # assign ID to enviroID display field
@@ -1022,10 +1034,7 @@ class EnviroEntryDlg(QDialog, ui_enviroentry.Ui_EnviroEntryDlg):
         self.mapper.toFirst()
 
         # define Weather Conditions table
-        weatherModel = QSqlTableModel(self)
-        weatherModel.setTable("tbl_weather")
-        weatherModel.setSort(WX_COND, Qt.AscendingOrder)
-        weatherModel.select()
+        weatherModel = ReferenceTableModel("tbl_weather", WX_COND, self)
 
         # set up Kickoff Weather linking table 
         # set up Kickoff Weather Condition combobox with items from tbl_weather table
@@ -23,9 +23,12 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import *
-from FmrdLib import (Constants, MsgPrompts)
+from FmrdLib import (Constants, MsgPrompts, TableChanges)
 from FmrdLib.CheckTables import *
 from FmrdLib.CustomDelegates import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.ReferenceData import (ReferenceTableModel, WatchReferenceTable)
 
 
 """Contains classes that implement match overview entry forms to main tables of FMRD.
@@ -57,6 +60,7 @@ class CompEntryDlg(QDialog, ui_competitionentry.Ui_CompEntryDlg):
         self.model.setTable("tbl_competitions")
         self.model.setSort(CompEntryDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -171,15 +175,11 @@ class CompEntryDlg(QDialog, ui_competitionentry.Ui_CompEntryDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(competition_id) FROM tbl_competitions"))
-        if query.next():
-            maxCompetitionID= query.value(0).toInt()[0]
-            if not maxCompetitionID:
-                competition_id = Constants.MinCompetitionID
-            else:
-                competition_id= QString()
-                competition_id.setNum(maxCompetitionID+1)          
+        try:
+            competition_id = NextID("tbl_competitions")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -214,11 +214,9 @@ class CompEntryDlg(QDialog, ui_competitionentry.Ui_CompEntryDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_matches"]
-        fieldName = "competition_id"
         competition_id = self.compID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, competition_id):
+        if not HasChildRecords("tbl_competitions", competition_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -236,7 +234,7 @@ class CompEntryDlg(QDialog, ui_competitionentry.Ui_CompEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_competitions", competition_id))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -309,10 +307,7 @@ class TeamEntryDlg(QDialog, ui_teamentry.Ui_TeamEntryDlg):
         
         # set up Confederation combobox that links to tbl_confederations
         # this result is not saved in database record, only used to filter Country combobox
-        self.confedModel = QSqlTableModel(self)
-        self.confedModel.setTable("tbl_confederations")
-        self.confedModel.setSort(CONFED_ID, Qt.AscendingOrder)
-        self.confedModel.select()
+        self.confedModel = ReferenceTableModel("tbl_confederations", CONFED_ID, self)
         
         # define Confederation mapper 
         # establish ties between Confederation database model and data widgets on form
@@ -425,15 +420,11 @@ class TeamEntryDlg(QDialog, ui_teamentry.Ui_TeamEntryDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(team_id) FROM tbl_teams"))
-        if query.next():
-            maxTeamID= query.value(0).toInt()[0]
-            if not maxTeamID:
-                team_id = Constants.MinTeamID
-            else:
-                team_id= QString()
-                team_id.setNum(maxTeamID+1)          
+        try:
+            team_id = NextID("tbl_teams")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -479,11 +470,9 @@ class TeamEntryDlg(QDialog, ui_teamentry.Ui_TeamEntryDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_hometeams", "tbl_awayteams", "tbl_venues", "tbl_lineups", "tbl_goals", "tbl_penshootoutopeners"]
-        fieldName = "team_id"
         team_id = self.teamID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, team_id):
+        if not HasChildRecords("tbl_teams", team_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -501,7 +490,7 @@ class TeamEntryDlg(QDialog, ui_teamentry.Ui_TeamEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_teams", team_id))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -539,11 +528,9 @@ class TeamEntryDlg(QDialog, ui_teamentry.Ui_TeamEntryDlg):
         # make query on tbl_confederations
         # extract confederation name corresponding to confederation ID
         # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
+        value = ScalarQuery("SELECT confed_name FROM tbl_confederations WHERE confed_id = ?", (id, ))
+        if value.isValid():
+            confedStr = value.toString()
         else:
             confedStr = "-1"
             
@@ -647,10 +634,7 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
                 
         # set up Confederation combobox that links to tbl_confederations
         # this result is not saved in database record, only used to filter Country combobox
-        self.confedModel = QSqlTableModel(self)
-        self.confedModel.setTable("tbl_confederations")
-        self.confedModel.setSort(CONFED_ID, Qt.AscendingOrder)
-        self.confedModel.select()  
+        self.confedModel = ReferenceTableModel("tbl_confederations", CONFED_ID, self)
         # define Confederation mapper 
         # establish ties between Confederation database model and data widgets on form
         confedMapper = QDataWidgetMapper(self)
@@ -772,15 +756,11 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
                     return
         
         row = self.model.rowCount()        
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(venue_id) FROM tbl_venues"))
-        if query.next():
-            maxVenueID= query.value(0).toInt()[0]
-            if not maxVenueID:
-                venue_id = Constants.MinVenueID
-            else:
-                venue_id= QString()
-                venue_id.setNum(maxVenueID+1)          
+        try:
+            venue_id = NextID("tbl_venues")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -835,11 +815,9 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
         If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_matches"]
-        fieldName = "venue_id"
         venue_id = self.venueID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, venue_id):
+        if not HasChildRecords("tbl_venues", venue_id, ["tbl_venuehistory"]):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -860,7 +838,7 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_venues", venue_id, ["tbl_venuehistory"]))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -895,10 +873,7 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
     def deleteVenueHistories(self, venue_id):
         """Deletes venue history records that reference a specific match venue."""
         
-        deletionQuery = QSqlQuery()
-        deletionQuery.prepare("DELETE FROM tbl_venuehistory WHERE venue_id = ?")
-        deletionQuery.addBindValue(QVariant(venue_id))
-        deletionQuery.exec_()
+        ExecQuery("DELETE FROM tbl_venuehistory WHERE venue_id = ?", (venue_id, ))
 
     def updateConfed(self):
         """Updates current index of Confederation combobox.
@@ -918,11 +893,9 @@ class VenueEntryDlg(QDialog, ui_venueentry.Ui_VenueEntryDlg):
         # make query on tbl_confederations
         # extract confederation name corresponding to confederation ID
         # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
+        value = ScalarQuery("SELECT confed_name FROM tbl_confederations WHERE confed_id = ?", (id, ))
+        if value.isValid():
+            confedStr = value.toString()
         else:
             confedStr = "-1"
             
@@ -1004,9 +977,10 @@ class VenueHistoryDlg(QDialog, ui_venuehistoryentry.Ui_VenueHistoryDlg):
         self.model = QSqlRelationalTableModel(self)
         self.model.setTable("tbl_venuehistory")
         self.model.setRelation(VenueHistoryDlg.SURFACE_ID, QSqlRelation("tbl_venuesurfaces", "venuesurface_id", "vensurf_desc"))
-        self.model.setFilter(QString("venue_id = %1").arg(venue_id))
+        self.model.setFilter(QString("tbl_venuehistory.venue_id = %1").arg(venue_id))
         self.model.setSort(VenueHistoryDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        TableChanges.WatchTableChanges(self.model)
         
         # set up validators
         self.venueLengthEdit.setInputMask("000")
@@ -1152,15 +1126,11 @@ class VenueHistoryDlg(QDialog, ui_venuehistoryentry.Ui_VenueHistoryDlg):
         
         row = self.model.rowCount()
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(venuehistory_id) FROM tbl_venuehistory"))
-        if query.next():
-            maxVenueHistoryID = query.value(0).toInt()[0]
-            if not maxVenueHistoryID:
-                venuehistory_id = Constants.MinVenueHistoryID
-            else:
-                venuehistory_id= QString()
-                venuehistory_id.setNum(maxVenueHistoryID+1)
+        try:
+            venuehistory_id = NextID("tbl_venuehistory")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
     
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
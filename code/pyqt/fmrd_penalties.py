@@ -25,6 +25,10 @@ from FmrdMain import *
 from FmrdLib import (Constants, MsgPrompts)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.QueryExecutor import (QueryExecutor, KeyFilter)
+from FmrdLib.ReferenceData import ReferenceTableModel
 
 """Contains classes that implement penalty-related entry forms to main tables of FMRD. 
 
@@ -84,19 +88,13 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         #
         
         # Competition combobox
-        self.compModel = QSqlTableModel(self)
-        self.compModel.setTable("tbl_competitions")
-        self.compModel.setSort(CMP_ID, Qt.AscendingOrder)
-        self.compModel.select()
+        self.compModel = ReferenceTableModel("tbl_competitions", CMP_ID, self)
         self.compSelect.setModel(self.compModel)
         self.compSelect.setModelColumn(self.compModel.fieldIndex("comp_name"))
         self.compSelect.setCurrentIndex(-1)
 
         # Competition Phases combobox
-        self.phaseModel = QSqlTableModel(self)
-        self.phaseModel.setTable("tbl_phases")
-        self.phaseModel.setSort(PHS_ID, Qt.AscendingOrder)
-        self.phaseModel.select()
+        self.phaseModel = ReferenceTableModel("tbl_phases", PHS_ID, self)
         self.phaseSelect.setModel(self.phaseModel)
         self.phaseSelect.setModelColumn(self.phaseModel.fieldIndex("phase_desc"))
         self.phaseSelect.setCurrentIndex(-1)
@@ -106,10 +104,7 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         #
         
         # League Rounds
-        leagueRoundModel = QSqlTableModel(self)
-        leagueRoundModel.setTable("tbl_rounds")
-        leagueRoundModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        leagueRoundModel.select()
+        leagueRoundModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.lgRoundSelect.setModel(leagueRoundModel)
         self.lgRoundSelect.setModelColumn(leagueRoundModel.fieldIndex("round_desc"))
         self.lgRoundSelect.setCurrentIndex(-1)
@@ -119,28 +114,19 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         #
         
         # Group Rounds
-        groupRoundModel = QSqlTableModel(self)
-        groupRoundModel.setTable("tbl_grouprounds")
-        groupRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        groupRoundModel.select()
+        groupRoundModel = ReferenceTableModel("tbl_grouprounds", RND_ID, self)
         self.grpRoundSelect.setModel(groupRoundModel)
         self.grpRoundSelect.setModelColumn(groupRoundModel.fieldIndex("grpround_desc"))
         self.grpRoundSelect.setCurrentIndex(-1)
         
         # Groups
-        groupNameModel = QSqlTableModel(self)
-        groupNameModel.setTable("tbl_groups")
-        groupNameModel.setSort(GROUP_NAME, Qt.AscendingOrder)
-        groupNameModel.select()
+        groupNameModel = ReferenceTableModel("tbl_groups", GROUP_NAME, self)
         self.groupSelect.setModel(groupNameModel)
         self.groupSelect.setModelColumn(groupNameModel.fieldIndex("group_desc"))
         self.groupSelect.setCurrentIndex(-1)
         
         # Matchdays
-        groupMatchdayModel = QSqlTableModel(self)
-        groupMatchdayModel.setTable("tbl_rounds")
-        groupMatchdayModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        groupMatchdayModel.select()
+        groupMatchdayModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.grpMatchdaySelect.setModel(groupMatchdayModel)
         self.grpMatchdaySelect.setModelColumn(groupMatchdayModel.fieldIndex("round_desc"))
         self.grpMatchdaySelect.setCurrentIndex(-1)
@@ -150,19 +136,13 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         #
 
         # Knockout Rounds
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         self.koRoundSelect.setModel(knockoutRoundModel)
         self.koRoundSelect.setModelColumn(knockoutRoundModel.fieldIndex("koround_desc"))
         self.koRoundSelect.setCurrentIndex(-1)
         
         # Matchdays (Knockout phase)
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         self.koMatchdaySelect.setModel(knockoutMatchdayModel)
         self.koMatchdaySelect.setModelColumn(knockoutMatchdayModel.fieldIndex("matchday_desc"))
         self.koMatchdaySelect.setCurrentIndex(-1)
@@ -195,8 +175,8 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         
         # 
         # underlying database model (tbl_goals)
-        # because of foreign keys, instantiate QSqlRelationalTableModel and define relations to it        
-        self.model = QSqlRelationalTableModel(self)
+        # because of foreign keys, instantiate RelationalIDTableModel and define relations to it        
+        self.model = RelationalIDTableModel(self)
         self.model.setTable("tbl_penalties")
         self.model.setRelation(PenaltyEntryDlg.LINEUP_ID, QSqlRelation("lineup_list", "lineup_id", "player"))
         self.model.setRelation(PenaltyEntryDlg.FOUL_ID, QSqlRelation("tbl_fouls", "foul_id", "foul_desc"))
@@ -300,7 +280,12 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         self.connect(self.koRoundSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatchdays)
         self.connect(self.koMatchdaySelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatches)
         
+        # look up records of selected match on worker threads
+        self.executor = QueryExecutor(self)
         self.connect(self.matchSelect, SIGNAL("currentIndexChanged(int)"), self.filterPenaltiesAndTeams)
+        self.connect(self.executor, SIGNAL("resultReady(QString,PyQt_PyObject)"), self.applyMatchFilter)
+        self.connect(self.executor, SIGNAL("queryFailed(QString,PyQt_PyObject)"), 
+                     lambda key, error: MsgPrompts.DatabaseQueryErrorPrompt(self, error))
         self.connect(self.teamSelect, SIGNAL("currentIndexChanged(int)"), self.filterPlayers)        
         self.connect(self.pentimeEdit, SIGNAL("editingFinished()"),  lambda: self.enableStoppageTime(self.stoppageEdit))
 
@@ -447,15 +432,11 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(penalty_id) FROM tbl_penalties"))
-        if query.next():
-            maxPenaltyID = query.value(0).toInt()[0]
-            if not maxPenaltyID:
-                penalty_id = Constants.MinPenaltyID
-            else:
-                penalty_id = QString()
-                penalty_id.setNum(maxPenaltyID+1)                  
+        try:
+            penalty_id = NextID("tbl_penalties")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
         
@@ -492,24 +473,17 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
     def refreshTeamBox(self):
         """Sets index of team box so that it corresponds with selected player."""
         
-        compName = self.compSelect.currentText()
-        phaseText = self.phaseSelect.currentText()
-        playerName = self.playerSelect.currentText()
-        
-        # look for team name
-        query = QSqlQuery()
-        query.prepare("SELECT team FROM lineup_list WHERE player = ? AND "
-                               "matchup IN (SELECT matchup FROM match_list WHERE competition = ? AND phase = ?)")
-        query.addBindValue(QVariant(playerName))
-        query.addBindValue(QVariant(compName))
-        query.addBindValue(QVariant(phaseText))
-        query.exec_()
-        if query.next():
-            teamName = query.value(0).toString()
+        # get lineup_id from current item of player combobox
+        lineup_id = ComboBoxID(self.playerSelect, "lineup_id")
+        
+        # look for team of lineup entry
+        value = ScalarQuery("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?", (lineup_id, ))
+        if value.isValid():
+            team_id = value.toString()
         else:
-            teamName = "-1"
+            team_id = "-1"
                         
-        currentIndex = self.teamSelect.findText(teamName, Qt.MatchExactly)
+        currentIndex = ComboBoxIndex(self.teamSelect, "team_id", team_id)
         self.teamSelect.setCurrentIndex(currentIndex)
 
     def filterPlayers(self):
@@ -520,28 +494,11 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         lineupListModel = self.playerSelect.model()
         lineupListModel.setFilter(QString())
         
-        # get current matchup
-        matchup = self.matchSelect.currentText()
-                
-        # get match_id by making a query on match_list with matchup
-        query = QSqlQuery()
-        query.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        query.addBindValue(QVariant(matchup))
-        query.exec_()
-        if query.next():
-            match_id = query.value(0).toString()
-        
-        # get current team
-        teamName = self.teamSelect.currentText()
-        
-        # get team_id by querying tbl_teams with team name
-        team_id = "-1"
-        query = QSqlQuery()
-        query.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        query.addBindValue(QVariant(teamName))
-        query.exec_()
-        if query.next():
-            team_id = query.value(0).toString()
+        # get match_id from current item of match combobox
+        match_id = ComboBoxID(self.matchSelect, "match_id")
+        
+        # get team_id from current item of team combobox
+        team_id = ComboBoxID(self.teamSelect, "team_id")
         
         # filter lineup list model by match_id
         lineupListModel.setFilter(QString("lineup_id IN "
@@ -561,13 +518,10 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         self.playerSelect.blockSignals(False)
 
     def filterPenaltiesAndTeams(self):
-        """Filters Penalties table to display all entries from selected match, and filters Teams combobox down to the two participants."""
+        """Looks up lineups and teams of selected match on worker thread.
         
-        # block signals from team combobox
-        self.teamSelect.blockSignals(True)
-
-        # clear filter
-        self.model.setFilter(QString())
+        Entry widgets are disabled until applyMatchFilter() receives the result.
+        """
         
         # get current index
         currentIndex = self.matchSelect.currentIndex()
@@ -575,17 +529,32 @@ class PenaltyEntryDlg(QDialog, ui_penaltyentry.Ui_PenaltyEntryDlg):
         # get match_id
         match_id = self.matchModel.record(currentIndex).value("match_id").toString()
         
-        # filter penalties taken by players who were in lineup for match (match_id)
-        self.model.setFilter(QString("tbl_penalties.lineup_id IN (SELECT lineup_id FROM lineup_list WHERE matchup IN "
-                                                    "(SELECT matchup FROM match_list WHERE match_id = %1))").arg(match_id))
+        # disable entry widgets and buttons while lookup is pending
+        for widget in self.lowerFormWidgets + (self.teamSelect, self.stoppageEdit, self.addEntry, self.saveEntry, 
+                       self.deleteEntry, self.firstEntry, self.prevEntry, self.nextEntry, self.lastEntry):
+            widget.setDisabled(True)
+        
+        # players who were in lineup for match (match_id), and teams involved in match
+        self.executor.submit("match", [
+            ("SELECT lineup_id FROM lineup_list WHERE matchup IN "
+             "(SELECT matchup FROM match_list WHERE match_id = ?)", (match_id, )), 
+            ("SELECT team_id FROM tbl_hometeams WHERE match_id = ? "
+             "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = ?", (match_id, match_id))])
+        
+    def applyMatchFilter(self, key, results):
+        """Filters Penalties table to display all entries from selected match, and filters Teams combobox down to the two participants."""
+        lineups, teams = results
+        
+        # block signals from team combobox
+        self.teamSelect.blockSignals(True)
+        
+        # filter penalties taken by players who were in lineup for match
+        self.model.setFilter(KeyFilter("tbl_penalties.lineup_id", lineups))
         self.mapper.toFirst()        
         
         # filter teams involved in match
         teamModel = self.teamSelect.model()
-        teamModel.setFilter(QString())
-        teamModel.setFilter(QString("team_id IN"
-            "(SELECT team_id FROM tbl_hometeams WHERE match_id = %1"
-            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1)").arg(match_id))
+        teamModel.setFilter(KeyFilter("team_id", teams))
         self.teamSelect.setCurrentIndex(-1)            
         
         # refresh team select box
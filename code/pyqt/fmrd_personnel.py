@@ -22,10 +22,15 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import *
-from FmrdLib import (Constants,  MsgPrompts)
+from FmrdLib import (Constants,  MsgPrompts, TableChanges)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
 from FmrdLib.CheckTables import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.LineupReadiness import LineupSummary
+from FmrdLib.ReferenceData import ReferenceTableModel
+from FmrdLib.RosterState import WatchLineupTable
 
 
 """Contains classes that implement personnel entry forms to main tables of FMRD.
@@ -58,11 +63,11 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
         # define underlying database model
         # because of foreign keys, instantiate QSqlRelationalTableModel and
         # define relations to it
-        self.model = QSqlRelationalTableModel(self)
+        self.model = PagedRelationalTableModel(self)
         self.model.setTable("tbl_managers")
         self.model.setRelation(ManagerEntryDlg.CTRY_ID, QSqlRelation("tbl_countries", "country_id", "cty_name"))                
         self.model.setSort(ManagerEntryDlg.ID, Qt.AscendingOrder)
-        self.model.select()
+        self.model.selectFirst()
         
         # define mapper to Managers table
         # establish ties between underlying database model and data widgets on form
@@ -94,10 +99,7 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
  
         # set up Confederation combobox that links to tbl_confederations
         # this result is not saved in database record, only used to filter Country combobox
-        self.confedModel = QSqlTableModel(self)
-        self.confedModel.setTable("tbl_confederations")
-        self.confedModel.setSort(CONFED_ID, Qt.AscendingOrder)
-        self.confedModel.select()  
+        self.confedModel = ReferenceTableModel("tbl_confederations", CONFED_ID, self)
         # define Confederation mapper 
         # establish ties between Confederation database model and data widgets on form
         confedMapper = QDataWidgetMapper(self)
@@ -126,8 +128,8 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
         self.firstEntry.setDisabled(True)
         self.prevEntry.setDisabled(True)        
         
-        # disable Next and Last Entry buttons if less than two records
-        if self.model.rowCount() < 2:
+        # disable Next and Last Entry buttons if no records after first record
+        if not self.model.hasNext(0):
             self.nextEntry.setDisabled(True)
             self.lastEntry.setDisabled(True)
             
@@ -162,41 +164,15 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
             else:
                 self.mapper.revert()
                 return
-        if where == Constants.FIRST:
-            self.firstEntry.setDisabled(True)
-            self.prevEntry.setDisabled(True)
-            if not self.nextEntry.isEnabled():
-                self.nextEntry.setEnabled(True)
-                self.lastEntry.setEnabled(True)
-            row = 0
-        elif where == Constants.PREV:
-            if row <= 1:
-                self.firstEntry.setDisabled(True)
-                self.prevEntry.setDisabled(True)                
-                row = 0
-            else:
-                if not self.nextEntry.isEnabled():
-                    self.nextEntry.setEnabled(True)
-                    self.lastEntry.setEnabled(True)                    
-                row -= 1
-        elif where == Constants.NEXT:
-            row += 1
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            if row >= self.model.rowCount() - 1:
-                self.nextEntry.setDisabled(True)
-                self.lastEntry.setDisabled(True)
-                row = self.model.rowCount() - 1
-        elif where == Constants.LAST:
-            self.nextEntry.setDisabled(True)
-            self.lastEntry.setDisabled(True)
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            row = self.model.rowCount() - 1
+        row = self.model.navigate(where, row)
         self.mapper.setCurrentIndex(row)
         
+        # enable navigation buttons if there are records before/after current record
+        self.firstEntry.setEnabled(self.model.hasPrevious(row))
+        self.prevEntry.setEnabled(self.model.hasPrevious(row))
+        self.nextEntry.setEnabled(self.model.hasNext(row))
+        self.lastEntry.setEnabled(self.model.hasNext(row))
+        
     def addRecord(self):
         """Adds new record at end of entry list."""        
         # save current index if valid
@@ -210,16 +186,15 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
                     self.mapper.revert()
                     return
         
+        try:
+            manager_id = NextID("tbl_managers")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
+        
+        # new record is appended to last page
+        self.model.selectLast()
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(manager_id) FROM tbl_managers"))
-        if query.next():
-            maxManagerID = query.value(0).toInt()[0]
-            if not maxManagerID:
-                manager_id = Constants.MinManagerID
-            else:
-                manager_id= QString()
-                manager_id.setNum(maxManagerID+1)  
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -230,7 +205,7 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
         self.nextEntry.setDisabled(True)
         self.lastEntry.setDisabled(True)
         # enable first/previous navigation buttons
-        if self.model.rowCount() > 1:
+        if self.model.hasPrevious(row):
             self.prevEntry.setEnabled(True)
             self.firstEntry.setEnabled(True)
             # enable Delete button if at least one record
@@ -265,11 +240,9 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_homemanagers", "tbl_awaymanagers"]
-        fieldName = "manager_id"
         manager_id = self.mgrID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, manager_id):
+        if not HasChildRecords("tbl_managers", manager_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -287,7 +260,7 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_managers", manager_id))
         
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -339,11 +312,9 @@ class ManagerEntryDlg(QDialog, ui_managerentry.Ui_ManagerEntryDlg):
         # make query on tbl_confederations
         # extract confederation name corresponding to confederation ID
         # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
+        value = ScalarQuery("SELECT confed_name FROM tbl_confederations WHERE confed_id = ?", (id, ))
+        if value.isValid():
+            confedStr = value.toString()
         else:
             confedStr = "-1"
             
@@ -388,11 +359,11 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         # define underlying database model
         # because of foreign keys, instantiate QSqlRelationalTableModel and
         # define relations to it
-        self.model = QSqlRelationalTableModel(self)
+        self.model = PagedRelationalTableModel(self)
         self.model.setTable("tbl_referees")
         self.model.setRelation(RefereeEntryDlg.CTRY_ID, QSqlRelation("tbl_countries", "country_id", "cty_name"))                
         self.model.setSort(RefereeEntryDlg.ID, Qt.AscendingOrder)
-        self.model.select()
+        self.model.selectFirst()
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -422,10 +393,7 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         
         # set up Confederation combobox that links to tbl_confederations
         # this result is not saved in database record, only used to filter Country combobox
-        self.confedModel = QSqlTableModel(self)
-        self.confedModel.setTable("tbl_confederations")
-        self.confedModel.setSort(CONFED_ID, Qt.AscendingOrder)
-        self.confedModel.select()  
+        self.confedModel = ReferenceTableModel("tbl_confederations", CONFED_ID, self)
         # define Confederation mapper 
         # establish ties between Confederation database model and data widgets on form
         confedMapper = QDataWidgetMapper(self)
@@ -453,8 +421,8 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         self.firstEntry.setDisabled(True)
         self.prevEntry.setDisabled(True)        
         
-        # disable Next and Last Entry buttons if less than two records
-        if self.model.rowCount() < 2:
+        # disable Next and Last Entry buttons if no records after first record
+        if not self.model.hasNext(0):
             self.nextEntry.setDisabled(True)
             self.lastEntry.setDisabled(True)
             
@@ -490,41 +458,15 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
                 self.mapper.revert()
                 return
 
-        if where == Constants.FIRST:
-            self.firstEntry.setDisabled(True)
-            self.prevEntry.setDisabled(True)
-            if not self.nextEntry.isEnabled():
-                self.nextEntry.setEnabled(True)
-                self.lastEntry.setEnabled(True)
-            row = 0
-        elif where == Constants.PREV:
-            if row <= 1:
-                self.firstEntry.setDisabled(True)
-                self.prevEntry.setDisabled(True)                
-                row = 0
-            else:
-                if not self.nextEntry.isEnabled():
-                    self.nextEntry.setEnabled(True)
-                    self.lastEntry.setEnabled(True)                    
-                row -= 1
-        elif where == Constants.NEXT:
-            row += 1
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            if row >= self.model.rowCount() - 1:
-                self.nextEntry.setDisabled(True)
-                self.lastEntry.setDisabled(True)
-                row = self.model.rowCount() - 1
-        elif where == Constants.LAST:
-            self.nextEntry.setDisabled(True)
-            self.lastEntry.setDisabled(True)
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            row = self.model.rowCount() - 1        
+        row = self.model.navigate(where, row)
         self.mapper.setCurrentIndex(row)
         
+        # enable navigation buttons if there are records before/after current record
+        self.firstEntry.setEnabled(self.model.hasPrevious(row))
+        self.prevEntry.setEnabled(self.model.hasPrevious(row))
+        self.nextEntry.setEnabled(self.model.hasNext(row))
+        self.lastEntry.setEnabled(self.model.hasNext(row))
+        
         # enable Delete button if at least one record
         if self.model.rowCount():
             self.deleteEntry.setEnabled(True)
@@ -542,17 +484,15 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
                     self.mapper.revert()
                     return
         
-        row = self.model.rowCount()
+        try:
+            referee_id = NextID("tbl_referees")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(referee_id) FROM tbl_referees"))
-        if query.next():
-            maxRefereeID = query.value(0).toInt()[0]
-            if not maxRefereeID:
-                referee_id = Constants.MinRefereeID
-            else:
-                referee_id= QString()
-                referee_id.setNum(maxRefereeID+1)    
+        # new record is appended to last page
+        self.model.selectLast()
+        row = self.model.rowCount()
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -563,7 +503,7 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         self.nextEntry.setDisabled(True)
         self.lastEntry.setDisabled(True)
         # enable first/previous navigation buttons
-        if self.model.rowCount() > 1:
+        if self.model.hasPrevious(row):
             self.prevEntry.setEnabled(True)
             self.firstEntry.setEnabled(True)
             # enable Delete button if at least one record
@@ -595,11 +535,9 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         record upon positive confirmation.  If it is being referenced by Lineups, alert user.
         """
         
-        childTableList = ["tbl_lineups"]
-        fieldName = "referee_id"
         referee_id = self.refID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, referee_id):
+        if not HasChildRecords("tbl_referees", referee_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -617,7 +555,7 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_referees", referee_id))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -669,11 +607,9 @@ class RefereeEntryDlg(QDialog, ui_refereeentry.Ui_RefereeEntryDlg):
         # make query on tbl_confederations
         # extract confederation name corresponding to confederation ID
         # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
+        value = ScalarQuery("SELECT confed_name FROM tbl_confederations WHERE confed_id = ?", (id, ))
+        if value.isValid():
+            confedStr = value.toString()
         else:
             confedStr = "-1"
             
@@ -719,12 +655,12 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         # define underlying database model
         # because of foreign keys, instantiate QSqlRelationalTableModel and
         # define relations to it
-        self.model = QSqlRelationalTableModel(self)
+        self.model = PagedRelationalTableModel(self)
         self.model.setTable("tbl_players")
         self.model.setRelation(PlayerEntryDlg.CTRY_ID, QSqlRelation("tbl_countries", "country_id", "cty_name"))   
         self.model.setRelation(PlayerEntryDlg.POS_ID, QSqlRelation("positions_list", "position_id", "position_name"))
         self.model.setSort(PlayerEntryDlg.ID, Qt.AscendingOrder)
-        self.model.select()
+        self.model.selectFirst()
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -764,10 +700,7 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         
         # set up Confederation combobox that links to tbl_confederations
         # this result is not saved in database record, only used to filter Country combobox
-        self.confedModel = QSqlTableModel(self)
-        self.confedModel.setTable("tbl_confederations")
-        self.confedModel.setSort(CONFED_ID, Qt.AscendingOrder)
-        self.confedModel.select()  
+        self.confedModel = ReferenceTableModel("tbl_confederations", CONFED_ID, self)
         # define Confederation mapper 
         # establish ties between Confederation database model and data widgets on form
         confedMapper = QDataWidgetMapper(self)
@@ -783,8 +716,8 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         self.firstEntry.setDisabled(True)
         self.prevEntry.setDisabled(True)
 
-        # disable Next and Last Entry buttons if less than two records
-        if self.model.rowCount() < 2:
+        # disable Next and Last Entry buttons if no records after first record
+        if not self.model.hasNext(0):
             self.nextEntry.setDisabled(True)
             self.lastEntry.setDisabled(True)
 
@@ -836,38 +769,15 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
                 self.mapper.revert()
                 return
         
-        if where == Constants.FIRST:
-            self.firstEntry.setDisabled(True)
-            self.prevEntry.setDisabled(True)
-            if not self.nextEntry.isEnabled():
-                self.nextEntry.setEnabled(True)
-                self.lastEntry.setEnabled(True)
-            row = 0
-        elif where == Constants.PREV:
-            row -= 1
-            if not self.nextEntry.isEnabled():
-                    self.nextEntry.setEnabled(True)
-                    self.lastEntry.setEnabled(True)   
-            if row == 0:
-                self.firstEntry.setDisabled(True)
-                self.prevEntry.setDisabled(True)                
-        elif where == Constants.NEXT:
-            row += 1
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            if row == self.model.rowCount() - 1:
-                self.nextEntry.setDisabled(True)
-                self.lastEntry.setDisabled(True)
-        elif where == Constants.LAST:
-            self.nextEntry.setDisabled(True)
-            self.lastEntry.setDisabled(True)
-            if not self.prevEntry.isEnabled():
-                self.prevEntry.setEnabled(True)
-                self.firstEntry.setEnabled(True)
-            row = self.model.rowCount() - 1
+        row = self.model.navigate(where, row)
         self.mapper.setCurrentIndex(row)
         
+        # enable navigation buttons if there are records before/after current record
+        self.firstEntry.setEnabled(self.model.hasPrevious(row))
+        self.prevEntry.setEnabled(self.model.hasPrevious(row))
+        self.nextEntry.setEnabled(self.model.hasNext(row))
+        self.lastEntry.setEnabled(self.model.hasNext(row))
+        
         # enable Delete button if at least one record
         if self.model.rowCount():
             self.deleteEntry.setEnabled(True)
@@ -886,18 +796,15 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
                     self.mapper.revert()
                     return
         
-        row = self.model.rowCount()
+        try:
+            player_id = NextID("tbl_players")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(player_id) FROM tbl_players"))
-        if query.next():
-            maxPlayerID = query.value(0).toInt()[0]
-            if not maxPlayerID:
-                player_id = Constants.MinPlayerID
-            else:
-                player_id= QString()
-                player_id.setNum(maxPlayerID+1)
-    
+        # new record is appended to last page
+        self.model.selectLast()
+        row = self.model.rowCount()
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -908,7 +815,7 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         self.nextEntry.setDisabled(True)
         self.lastEntry.setDisabled(True)
         # enable first/previous navigation buttons
-        if self.model.rowCount() > 1:
+        if self.model.hasPrevious(row):
             self.prevEntry.setEnabled(True)
             self.firstEntry.setEnabled(True)
             # enable Delete button if at least one record
@@ -947,11 +854,9 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         If the record is being referenced by Lineups, alert user.
         """
         
-        childTableList = ["tbl_lineups"]
-        fieldName = "player_id"
         player_id = self.plyrID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, player_id):
+        if not HasChildRecords("tbl_players", player_id, ["tbl_playerhistory"]):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -972,7 +877,7 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_players", player_id, ["tbl_playerhistory"]))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1011,10 +916,7 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
     def deletePlayerHistories(self, player_id):
         """Deletes player history records that reference a specific player."""
         
-        deletionQuery = QSqlQuery()
-        deletionQuery.prepare("DELETE FROM tbl_playerhistory WHERE player_id = ?")
-        deletionQuery.addBindValue(QVariant(player_id))
-        deletionQuery.exec_()
+        ExecQuery("DELETE FROM tbl_playerhistory WHERE player_id = ?", (player_id, ))
         
     def updateConfed(self):
         """Updates current index of Confederation combobox.
@@ -1032,11 +934,9 @@ class PlayerEntryDlg(QDialog, ui_playerentry.Ui_PlayerEntryDlg):
         # make query on tbl_confederations
         # extract confederation name corresponding to confederation ID
         # there will only be one confederation in query result
-        query = QSqlQuery()
-        query.exec_(QString("SELECT confed_name FROM tbl_confederations WHERE confed_id = %1").arg(id))
-        if query.isActive():
-            query.next()
-            confedStr = query.value(0).toString()
+        value = ScalarQuery("SELECT confed_name FROM tbl_confederations WHERE confed_id = ?", (id, ))
+        if value.isValid():
+            confedStr = value.toString()
         else:
             confedStr = "-1"
             
@@ -1103,12 +1003,10 @@ class PlayerHistoryDlg(QDialog, ui_playerhistoryentry.Ui_PlayerHistoryDlg):
         self.model.setFilter(QString("player_id = %1").arg(player_id))
         self.model.setSort(PlayerHistoryDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        TableChanges.WatchTableChanges(self.model)
         
         # get birthdate from Players table
-        query = QSqlQuery()
-        query.exec_(QString("SELECT plyr_birthdate FROM tbl_players WHERE player_id = %1").arg(player_id))
-        if query.next():
-            minBirthDate = query.value(0).toString()
+        minBirthDate = ScalarQuery("SELECT plyr_birthdate FROM tbl_players WHERE player_id = ?", (player_id, )).toString()
         
         # set up validators
         minDate = QDate()
@@ -1237,15 +1135,11 @@ class PlayerHistoryDlg(QDialog, ui_playerhistoryentry.Ui_PlayerHistoryDlg):
         
         row = self.model.rowCount()
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(playerhistory_id) FROM tbl_playerhistory"))
-        if query.next():
-            maxPlayerHistoryID = query.value(0).toInt()[0]
-            if not maxPlayerHistoryID:
-                playerhistory_id = Constants.MinPlayerHistoryID
-            else:
-                playerhistory_id= QString()
-                playerhistory_id.setNum(maxPlayerHistoryID+1)
+        try:
+            playerhistory_id = NextID("tbl_playerhistory")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
     
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
@@ -1338,11 +1232,12 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
    
     ID,  MATCH_ID, TEAM_ID, PLYR_ID, POS_ID, ST_FLAG, CAPT_FLAG = range(7)
     
-    def __init__(self, match_id, teamName, parent=None):
+    def __init__(self, match_id, team_id, teamName, parent=None):
         """Constructor for LineupEntryDlg class."""
         super(LineupEntryDlg, self).__init__(parent)
         self.setupUi(self)
         self.teamName = teamName
+        self.team_id = team_id
         self.match_id = match_id
         
         # Set values to display fields
@@ -1357,8 +1252,20 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         self.model.setRelation(LineupEntryDlg.TEAM_ID, QSqlRelation("tbl_teams", "team_id", "tm_name"))
         self.model.setRelation(LineupEntryDlg.PLYR_ID, QSqlRelation("players_list", "player_id", "full_name"))
         self.model.setRelation(LineupEntryDlg.POS_ID, QSqlRelation("positions_list", "position_id", "position_name"))
+        # select only lineup entries of team in match
+        # (columns qualified, as related tables have the same key names)
+        self.model.setFilter(QString("tbl_lineups.match_id = %1 AND tbl_lineups.team_id = %2").arg(self.match_id).arg(self.team_id))
         self.model.setSort(LineupEntryDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        # discard roster state of lineup when it is edited
+        WatchLineupTable(self.model, self.match_id, self.team_id)
+        # count writes, so that pooled event dialogs re-read their lineup lists
+        TableChanges.WatchTableChanges(self.model)
+        
+        # counts of lineup, adjusted as entries are saved and deleted
+        self.summary = LineupSummary(self.match_id, self.team_id)
+        # row inserted by addRecord() and not yet saved
+        self.insertedRow = None
                
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -1398,7 +1305,6 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         self.positionSelect.setModelColumn(self.positionModel.fieldIndex("position_name"))
         self.positionSelect.setCurrentIndex(-1)
         self.mapper.addMapping(self.positionSelect, LineupEntryDlg.POS_ID)
-        self.model.setFilter(QString("match_id = %1 AND tm_name = '%2'").arg(self.match_id).arg(teamName))         
         self.mapper.toFirst()
         
         # get status report
@@ -1435,7 +1341,7 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         row = self.mapper.currentIndex()
         if self.isDirty(row):
             if MsgPrompts.SaveDiscardOptionPrompt(self):
-                if not self.mapper.submit():
+                if not self.submitEntry(row):
                     MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
         QDialog.accept(self)
     
@@ -1446,7 +1352,7 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         if row != -1:
             if self.isDirty(row):
                 if MsgPrompts.SaveDiscardOptionPrompt(self):
-                    if not self.mapper.submit():
+                    if not self.submitEntry(row):
                         MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
                 else:
                     self.mapper.revert()
@@ -1454,18 +1360,15 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         
         row = self.model.rowCount()
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(lineup_id) FROM tbl_lineups"))
-        if query.next():
-            maxLineupID = query.value(0).toInt()[0]
-            if not maxLineupID:
-                lineup_id = Constants.MinLineupID
-            else:
-                lineup_id= QString()
-                lineup_id.setNum(maxLineupID+1)
+        try:
+            lineup_id = NextID("tbl_lineups")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
     
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
+        self.insertedRow = row
 
         # assign value to lineupID field
         self.lineupID_display.setText(lineup_id)
@@ -1496,22 +1399,23 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_goals",  "tbl_penalties", "tbl_offenses", \
-        "tbl_insubstitutions", "tbl_outsubstitutions", "tbl_switchpositions",  "tbl_penaltyshootouts"]
-        fieldName = "lineup_id"
         lineup_id = self.lineupID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, lineup_id):
+        if not HasChildRecords("tbl_lineups", lineup_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
                 return
             else:
                 row = self.mapper.currentIndex()
+                entry = self.entryFlags(row) if row != self.insertedRow else None
                 self.model.removeRow(row)
                 if not self.model.submitAll():
                     MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
                     return
+                if entry is not None:
+                    self.summary.adjust(entry, -1)
+                self.insertedRow = None
                 if row + 1 >= self.model.rowCount():
                     row = self.model.rowCount() - 1
                 self.mapper.setCurrentIndex(row) 
@@ -1519,7 +1423,7 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                                
         else:
-                DeletionErrorPrompt(self)
+                MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_lineups", lineup_id))
                 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1550,6 +1454,21 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
                     
         return False                                
 
+    def entryFlags(self, row):
+        """Returns (starting, captain, position name) of lineup entry in model row."""
+        return LineupSummary.EntryFlags(self.model.data(self.model.index(row, LineupEntryDlg.ST_FLAG)), 
+                                        self.model.data(self.model.index(row, LineupEntryDlg.CAPT_FLAG)), 
+                                        self.model.data(self.model.index(row, LineupEntryDlg.POS_ID)))
+        
+    def submitEntry(self, row):
+        """Submits current record through mapper and adjusts lineup counts.  Returns True if successful."""
+        previous = self.entryFlags(row) if row != self.insertedRow else None
+        if not self.mapper.submit():
+            return False
+        self.summary.replace(previous, self.entryFlags(row))
+        self.insertedRow = None
+        return True
+        
     def saveRecord(self, where):
         """Submits changes to database and navigates through form."""
         row = self.mapper.currentIndex()
@@ -1558,7 +1477,7 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         # make checks
         if self.isDirty(row):
             if MsgPrompts.SaveDiscardOptionPrompt(self):
-                if not self.mapper.submit():
+                if not self.submitEntry(row):
                     MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
             else:
                 self.mapper.revert()
@@ -1625,27 +1544,11 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         # look for position name and set index
         editor.setCurrentIndex(editor.findText(positionText, Qt.MatchExactly))
         
-    def checkPersonnelRecords(self, match_id, team_id):
-        """Checks number of personnel records in Lineup table for specific match and team.
-        
-        Required number of personnel records:
-            (1) Exactly 11 starting players
-            (2) Exactly 1 starting goalkeeper
-            (3) Exactly 1 starting captain
-        There also has to be at least one substitute in order to open the Substitutes dialog.
-        
-        """
-        reqStarters = (CountStarters(match_id, team_id) == Constants.MAX_TEAM_STARTERS)
-        reqCaptain = (CountCaptains(match_id, team_id) == Constants.MAX_TEAM_STARTING_CAPTAINS)
-        reqGoalkeeper = (CountGoalkeepers(match_id, team_id) == Constants.MAX_TEAM_STARTING_GOALKEEPERS)
-        
-        return reqStarters & reqCaptain & reqGoalkeeper
-
     def statusReport(self):
         """Updates status fields at bottom of Lineups data entry dialog.
         
-        Calls CountStarters(), CountSubstitutes(), CountCaptains() and CountGoalkeepers() 
-        and reports results in status fields. Required number of personnel records:
+        Reports counts of lineup summary, which are kept current as entries are saved and 
+        deleted, in status fields. Required number of personnel records:
             (1) Exactly 11 starting players
             (2) Exactly 1 starting goalkeeper
             (3) Exactly 1 starting captain
@@ -1656,33 +1559,22 @@ class LineupEntryDlg(QDialog, ui_lineupentry.Ui_LineupEntryDlg):
         """
         text = QString()
         
-        match_id = self.match_id
-        
-        # get team_id by querying tbl_teams with team name
-        team_id = "-1"
-        query = QSqlQuery()
-        query.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        query.addBindValue(QVariant(self.teamName))
-        query.exec_()
-        if query.next():
-            team_id = query.value(0).toString()
-            
         #   - Number of starters
-        numStarters = CountStarters(match_id, team_id)
+        numStarters = self.summary.starters
         self.NumStarter_display.setText(text.setNum(numStarters))
         self.colorCode(self.NumStarter_display, Constants.MAX_TEAM_STARTERS)
         
         #   - Number of subs
-        numSubs = CountSubstitutes(match_id, team_id)
+        numSubs = self.summary.substitutes
         self.NumSubs_display.setText(text.setNum(numSubs))
         
         #   - Starting Captain
-        numCaptains = CountCaptains(match_id, team_id)
+        numCaptains = self.summary.captains
         self.NumCapt_display.setText(text.setNum(numCaptains))
         self.colorCode(self.NumCapt_display, Constants.MAX_TEAM_STARTING_CAPTAINS)
         
         #   - Starting Goalkeeper
-        numGoalkeepers = CountGoalkeepers(match_id, team_id)
+        numGoalkeepers = self.summary.goalkeepers
         self.NumGK_display.setText(text.setNum(numGoalkeepers))
         self.colorCode(self.NumGK_display, Constants.MAX_TEAM_STARTING_GOALKEEPERS)
         
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+#
+#    Desktop-based data entry tool for the Football Match Result Database (FMRD)
+#
+#    Copyright (C) 2010-2011, Howard Hamilton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from FmrdLib.Resources import RegisterResources
+
+"""Registers the FMRD icons for the generated user interface modules.
+
+pyuic4 writes 'import fmrd_resources_rc' into every user interface module that uses the
+icons.  FmrdMain and FmrdAdmin have no copy of the resource module, so both packages
+import this one, and the shared resource data is registered once, on first use.
+"""
+
+RegisterResources()
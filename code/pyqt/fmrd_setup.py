@@ -25,6 +25,8 @@ from FmrdAdmin import *
 from FmrdLib import (Constants, MsgPrompts)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CheckTables import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.ReferenceData import WatchReferenceTable
 
 
 """ 
@@ -194,15 +196,11 @@ class CardSetupDlg(QDialog, ui_cardsetup.Ui_CardSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(card_id) FROM tbl_cards"))
-        if query.next():
-            maxCardID= query.value(0).toInt()[0]
-            if not maxCardID:
-                card_id = Constants.MinCardID
-            else:
-                card_id = QString()
-                card_id.setNum(maxCardID+1)          
+        try:
+            card_id = NextID("tbl_cards")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -237,11 +235,9 @@ class CardSetupDlg(QDialog, ui_cardsetup.Ui_CardSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_offenses"]
-        fieldName = "card_id"
         card_id = self.cardID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, card_id):
+        if not HasChildRecords("tbl_cards", card_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -259,7 +255,7 @@ class CardSetupDlg(QDialog, ui_cardsetup.Ui_CardSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_cards", card_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -413,15 +409,11 @@ class FoulSetupDlg(QDialog, ui_foulsetup.Ui_FoulSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(foul_id) FROM tbl_fouls"))
-        if query.next():
-            maxFoulID= query.value(0).toInt()[0]
-            if not maxFoulID:
-                foul_id = Constants.MinFoulID
-            else:
-                foul_id = QString()
-                foul_id.setNum(maxFoulID+1)          
+        try:
+            foul_id = NextID("tbl_fouls")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -459,11 +451,9 @@ class FoulSetupDlg(QDialog, ui_foulsetup.Ui_FoulSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_penalties", "tbl_fouls"]
-        fieldName = "foul_id"
         foul_id = self.foulID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, foul_id):
+        if not HasChildRecords("tbl_fouls", foul_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -481,7 +471,7 @@ class FoulSetupDlg(QDialog, ui_foulsetup.Ui_FoulSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_fouls", foul_id))
         
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -520,6 +510,7 @@ class GroupSetupDlg(QDialog, ui_groupsetup.Ui_GroupSetupDlg):
         self.model.setTable("tbl_groups")
         self.model.setSort(GroupSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -635,15 +626,11 @@ class GroupSetupDlg(QDialog, ui_groupsetup.Ui_GroupSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(group_id) FROM tbl_groups"))
-        if query.next():
-            maxGroupID = query.value(0).toInt()[0]
-            if not maxGroupID:
-                outcome_id = Constants.MinGroupID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxGroupID+1)          
+        try:
+            outcome_id = NextID("tbl_groups")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -679,11 +666,9 @@ class GroupSetupDlg(QDialog, ui_groupsetup.Ui_GroupSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_groupmatches"]
-        fieldName = "group_id"
         group_id = self.groupID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, group_id):
+        if not HasChildRecords("tbl_groups", group_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -701,7 +686,7 @@ class GroupSetupDlg(QDialog, ui_groupsetup.Ui_GroupSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_groups", group_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -740,6 +725,7 @@ class MatchdaySetupDlg(QDialog, ui_matchdaysetup.Ui_MatchdaySetupDlg):
         self.model.setTable("tbl_matchdays")
         self.model.setSort(MatchdaySetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -855,15 +841,11 @@ class MatchdaySetupDlg(QDialog, ui_matchdaysetup.Ui_MatchdaySetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(matchday_id) FROM tbl_matchdays"))
-        if query.next():
-            maxMatchdayID = query.value(0).toInt()[0]
-            if not maxMatchdayID:
-                outcome_id = Constants.MinMatchdayID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxMatchdayID+1)          
+        try:
+            outcome_id = NextID("tbl_matchdays")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -899,11 +881,9 @@ class MatchdaySetupDlg(QDialog, ui_matchdaysetup.Ui_MatchdaySetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_knockoutmatches"]
-        fieldName = "knockout_id"
         matchday_id = self.matchdayID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, matchday_id):
+        if not HasChildRecords("tbl_matchdays", matchday_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -921,7 +901,7 @@ class MatchdaySetupDlg(QDialog, ui_matchdaysetup.Ui_MatchdaySetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_matchdays", matchday_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -960,6 +940,7 @@ class GroupRoundSetupDlg(QDialog, ui_grproundsetup.Ui_GroupRoundSetupDlg):
         self.model.setTable("tbl_grouprounds")
         self.model.setSort(GroupRoundSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -1075,15 +1056,11 @@ class GroupRoundSetupDlg(QDialog, ui_grproundsetup.Ui_GroupRoundSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(grpround_id) FROM tbl_grouprounds"))
-        if query.next():
-            maxGroupRoundID = query.value(0).toInt()[0]
-            if not maxGroupRoundID:
-                outcome_id = Constants.MinGroupRoundID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxGroupRoundID+1)          
+        try:
+            outcome_id = NextID("tbl_grouprounds")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -1119,11 +1096,9 @@ class GroupRoundSetupDlg(QDialog, ui_grproundsetup.Ui_GroupRoundSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_groupmatches"]
-        fieldName = "grpround_id"
         grpround_id = self.grproundID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, grpround_id):
+        if not HasChildRecords("tbl_grouprounds", grpround_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -1141,7 +1116,7 @@ class GroupRoundSetupDlg(QDialog, ui_grproundsetup.Ui_GroupRoundSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_grouprounds", grpround_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1180,6 +1155,7 @@ class KnockoutRoundSetupDlg(QDialog, ui_koroundsetup.Ui_KnockoutRoundSetupDlg):
         self.model.setTable("tbl_knockoutrounds")
         self.model.setSort(KnockoutRoundSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -1295,15 +1271,11 @@ class KnockoutRoundSetupDlg(QDialog, ui_koroundsetup.Ui_KnockoutRoundSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(koround_id) FROM tbl_knockoutrounds"))
-        if query.next():
-            maxKnockoutRoundID = query.value(0).toInt()[0]
-            if not maxKnockoutRoundID:
-                outcome_id = Constants.MinKnockoutRoundID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxKnockoutRoundID+1)          
+        try:
+            outcome_id = NextID("tbl_knockoutrounds")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -1339,11 +1311,9 @@ class KnockoutRoundSetupDlg(QDialog, ui_koroundsetup.Ui_KnockoutRoundSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_knockoutmatches"]
-        fieldName = "koround_id"
         koround_id = self.koroundID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, koround_id):
+        if not HasChildRecords("tbl_knockoutrounds", koround_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -1361,7 +1331,7 @@ class KnockoutRoundSetupDlg(QDialog, ui_koroundsetup.Ui_KnockoutRoundSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_knockoutrounds", koround_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1400,6 +1370,7 @@ class PhaseSetupDlg(QDialog, ui_phasesetup.Ui_PhaseSetupDlg):
         self.model.setTable("tbl_phases")
         self.model.setSort(PhaseSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -1515,15 +1486,11 @@ class PhaseSetupDlg(QDialog, ui_phasesetup.Ui_PhaseSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(phase_id) FROM tbl_phases"))
-        if query.next():
-            maxPhaseID = query.value(0).toInt()[0]
-            if not maxPhaseID:
-                outcome_id = Constants.MinPhaseID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxPhaseID+1)          
+        try:
+            outcome_id = NextID("tbl_phases")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -1559,11 +1526,9 @@ class PhaseSetupDlg(QDialog, ui_phasesetup.Ui_PhaseSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_matches"]
-        fieldName = "phase_id"
         phase_id = self.phaseID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, phase_id):
+        if not HasChildRecords("tbl_phases", phase_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -1581,7 +1546,7 @@ class PhaseSetupDlg(QDialog, ui_phasesetup.Ui_PhaseSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_phases", phase_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1735,15 +1700,11 @@ class PenSetupDlg(QDialog, ui_penoutcomesetup.Ui_PenSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(penoutcome_id) FROM tbl_penoutcomes"))
-        if query.next():
-            maxPenOutcomeID = query.value(0).toInt()[0]
-            if not maxPenOutcomeID:
-                outcome_id = Constants.MinPenOutcomeID
-            else:
-                outcome_id = QString()
-                outcome_id.setNum(maxPenOutcomeID+1)          
+        try:
+            outcome_id = NextID("tbl_penoutcomes")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -1781,11 +1742,9 @@ class PenSetupDlg(QDialog, ui_penoutcomesetup.Ui_PenSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_penalties", "tbl_penaltyshootouts"]
-        fieldName = "penoutcome_id"
         penoutcome_id = self.penoutcomeID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, penoutcome_id):
+        if not HasChildRecords("tbl_penoutcomes", penoutcome_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -1803,7 +1762,7 @@ class PenSetupDlg(QDialog, ui_penoutcomesetup.Ui_PenSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_penoutcomes", penoutcome_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -1957,15 +1916,11 @@ class GoalEventSetupDlg(QDialog, ui_goaleventsetup.Ui_GoalEventSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(gtetype_id) FROM tbl_goalevents"))
-        if query.next():
-            maxGoalEventID= query.value(0).toInt()[0]
-            if not maxGoalEventID:
-                event_id = Constants.MinGoalEventID
-            else:
-                event_id = QString()
-                event_id.setNum(maxGoalEventID+1)          
+        try:
+            event_id = NextID("tbl_goalevents")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -2001,11 +1956,9 @@ class GoalEventSetupDlg(QDialog, ui_goaleventsetup.Ui_GoalEventSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_goals"]
-        fieldName = "gtetype_id"
         gtetype_id = self.goaleventID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, gtetype_id):
+        if not HasChildRecords("tbl_goalevents", gtetype_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -2023,7 +1976,7 @@ class GoalEventSetupDlg(QDialog, ui_goaleventsetup.Ui_GoalEventSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_goalevents", gtetype_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -2176,15 +2129,11 @@ class GoalStrikeSetupDlg(QDialog, ui_goalstrikesetup.Ui_GoalStrikeSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(gtstype_id) FROM tbl_goalstrikes"))
-        if query.next():
-            maxGoalStrikeID= query.value(0).toInt()[0]
-            if not maxGoalStrikeID:
-                strike_id = Constants.MinGoalStrikeID
-            else:
-                strike_id = QString()
-                strike_id.setNum(maxGoalStrikeID+1)          
+        try:
+            strike_id = NextID("tbl_goalstrikes")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -2220,11 +2169,9 @@ class GoalStrikeSetupDlg(QDialog, ui_goalstrikesetup.Ui_GoalStrikeSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_goals"]
-        fieldName = "gtstype_id"
         gtstype_id = self.goalstrikeID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, gtstype_id):
+        if not HasChildRecords("tbl_goalstrikes", gtstype_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -2242,7 +2189,7 @@ class GoalStrikeSetupDlg(QDialog, ui_goalstrikesetup.Ui_GoalStrikeSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_goalstrikes", gtstype_id))
         
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -2395,15 +2342,11 @@ class FieldPosSetupDlg(QDialog, ui_fieldpossetup.Ui_FieldPosSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(posfield_id) FROM tbl_fieldnames"))
-        if query.next():
-            maxFieldID= query.value(0).toInt()[0]
-            if not maxFieldID:
-                field_id = Constants.MinFieldID
-            else:
-                field_id = QString()
-                field_id.setNum(maxFieldID+1)          
+        try:
+            field_id = NextID("tbl_fieldnames")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -2439,11 +2382,9 @@ class FieldPosSetupDlg(QDialog, ui_fieldpossetup.Ui_FieldPosSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_positions"]
-        fieldName = "posfield_id"
         field_id = self.fieldposID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, field_id):
+        if not HasChildRecords("tbl_fieldnames", field_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -2461,7 +2402,7 @@ class FieldPosSetupDlg(QDialog, ui_fieldpossetup.Ui_FieldPosSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_fieldnames", field_id))
 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -2618,15 +2559,11 @@ class FlankPosSetupDlg(QDialog, ui_flankpossetup.Ui_FlankPosSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(posflank_id) FROM tbl_flanknames"))
-        if query.next():
-            maxFlankID= query.value(0).toInt()[0]
-            if not maxFlankID:
-                flank_id = Constants.MinFlankID
-            else:
-                flank_id = QString()
-                flank_id.setNum(maxFlankID+1)          
+        try:
+            flank_id = NextID("tbl_flanknames")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -2662,11 +2599,9 @@ class FlankPosSetupDlg(QDialog, ui_flankpossetup.Ui_FlankPosSetupDlg):
         record upon positive confirmation.  If it is being referenced by dependent table, alert user.
         """
         
-        childTableList = ["tbl_positions"]
-        fieldName = "posflank_id"
         flank_id = self.flankposID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, flank_id):
+        if not HasChildRecords("tbl_flanknames", flank_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -2684,7 +2619,7 @@ class FlankPosSetupDlg(QDialog, ui_flankpossetup.Ui_FlankPosSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_flanknames", flank_id))
 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -2849,15 +2784,11 @@ class PosSetupDlg(QDialog, ui_positionsetup.Ui_PosSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(position_id) FROM tbl_positions"))
-        if query.next():
-            maxPositionID = query.value(0).toInt()[0]
-            if not maxPositionID:
-                position_id = Constants.MinPositionID
-            else:
-                position_id = QString()
-                position_id.setNum(maxPositionID+1)          
+        try:
+            position_id = NextID("tbl_positions")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -2897,11 +2828,9 @@ class PosSetupDlg(QDialog, ui_positionsetup.Ui_PosSetupDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_players", "tbl_lineups"]
-        fieldName = "position_id"
         position_id = self.positionID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, position_id):
+        if not HasChildRecords("tbl_positions", position_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -2919,7 +2848,7 @@ class PosSetupDlg(QDialog, ui_positionsetup.Ui_PosSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_positions", position_id))
 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -3088,15 +3017,11 @@ class CountrySetupDlg(QDialog, ui_countrysetup.Ui_CountrySetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(country_id) FROM tbl_countries"))
-        if query.next():
-            maxCountryID= query.value(0).toInt()[0]
-            if not maxCountryID:
-                country_id = Constants.MinCountryID
-            else:
-                country_id = QString()
-                country_id.setNum(maxCountryID+1)          
+        try:
+            country_id = NextID("tbl_countries")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -3138,11 +3063,9 @@ class CountrySetupDlg(QDialog, ui_countrysetup.Ui_CountrySetupDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_players", "tbl_referees",  "tbl_managers",  "tbl_venues"]
-        fieldName = "country_id"
         country_id = self.countryID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, country_id):
+        if not HasChildRecords("tbl_countries", country_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -3160,7 +3083,7 @@ class CountrySetupDlg(QDialog, ui_countrysetup.Ui_CountrySetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_countries", country_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -3199,6 +3122,7 @@ class ConfedSetupDlg(QDialog, ui_confederationsetup.Ui_ConfedSetupDlg):
         self.model.setTable("tbl_confederations")
         self.model.setSort(ConfedSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -3311,15 +3235,11 @@ class ConfedSetupDlg(QDialog, ui_confederationsetup.Ui_ConfedSetupDlg):
         
         # move to end of table and insert new record
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(confed_id) FROM tbl_confederations"))
-        if query.next():
-            maxConfedID= query.value(0).toInt()[0]
-            if not maxConfedID:
-                confed_id = Constants.MinConfedID
-            else:
-                confed_id = QString()
-                confed_id.setNum(maxConfedID+1)          
+        try:
+            confed_id = NextID("tbl_confederations")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -3354,11 +3274,9 @@ class ConfedSetupDlg(QDialog, ui_confederationsetup.Ui_ConfedSetupDlg):
         record upon positive confirmation.  If it is being referenced by the dependent table, alert user.
         """
         
-        childTableList = ["tbl_countries"]
-        fieldName = "confed_id"
         confed_id = self.confedID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, confed_id):
+        if not HasChildRecords("tbl_confederations", confed_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -3376,7 +3294,7 @@ class ConfedSetupDlg(QDialog, ui_confederationsetup.Ui_ConfedSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_confederations", confed_id))
 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -3548,15 +3466,11 @@ class TimeZoneSetupDlg(QDialog, ui_timezonesetup.Ui_TimeZoneSetupDlg):
         
         # move to end of table and insert new record
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(timezone_id) FROM tbl_timezones"))
-        if query.next():
-            maxTimeZoneID= query.value(0).toInt()[0]
-            if not maxTimeZoneID:
-                timezone_id = Constants.MinTimeZoneID
-            else:
-                timezone_id = QString()
-                timezone_id.setNum(maxTimeZoneID+1)          
+        try:
+            timezone_id = NextID("tbl_timezones")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -3596,11 +3510,9 @@ class TimeZoneSetupDlg(QDialog, ui_timezonesetup.Ui_TimeZoneSetupDlg):
         record upon positive confirmation.  If it is being referenced by the dependent table, alert user.
         """
         
-        childTableList = ["tbl_venues"]
-        fieldName = "timezone_id"
         timezone_id = self.timezoneID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, timezone_id):
+        if not HasChildRecords("tbl_timezones", timezone_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -3618,7 +3530,7 @@ class TimeZoneSetupDlg(QDialog, ui_timezonesetup.Ui_TimeZoneSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_timezones", timezone_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -3775,15 +3687,11 @@ class VenueSurfaceSetupDlg(QDialog, ui_venuesurfacesetup.Ui_VenueSurfaceSetupDlg
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(venuesurface_id) FROM tbl_venuesurfaces"))
-        if query.next():
-            maxSurfaceID = query.value(0).toInt()[0]
-            if not maxSurfaceID:
-                surface_id = Constants.MinSurfaceID
-            else:
-                surface_id = QString()
-                surface_id.setNum(maxRoundID+1)          
+        try:
+            surface_id = NextID("tbl_venuesurfaces")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -3819,11 +3727,9 @@ class VenueSurfaceSetupDlg(QDialog, ui_venuesurfacesetup.Ui_VenueSurfaceSetupDlg
         record upon positive confirmation.  If it is being referenced by the dependent table, alert user.
         """
         
-        childTableList = ["tbl_venuehistory"]
-        fieldName = "venuesurface_id"
         surface_id = self.vensurfID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, surface_id):
+        if not HasChildRecords("tbl_venuesurfaces", surface_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -3841,7 +3747,7 @@ class VenueSurfaceSetupDlg(QDialog, ui_venuesurfacesetup.Ui_VenueSurfaceSetupDlg
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_venuesurfaces", surface_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -3880,6 +3786,7 @@ class RoundSetupDlg(QDialog, ui_roundsetup.Ui_RoundSetupDlg):
         self.model.setTable("tbl_rounds")
         self.model.setSort(RoundSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -3995,15 +3902,11 @@ class RoundSetupDlg(QDialog, ui_roundsetup.Ui_RoundSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(round_id) FROM tbl_rounds"))
-        if query.next():
-            maxRoundID = query.value(0).toInt()[0]
-            if not maxRoundID:
-                round_id = Constants.MinRoundID
-            else:
-                round_id = QString()
-                round_id.setNum(maxRoundID+1)          
+        try:
+            round_id = NextID("tbl_rounds")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -4042,11 +3945,9 @@ class RoundSetupDlg(QDialog, ui_roundsetup.Ui_RoundSetupDlg):
         record upon positive confirmation.  If it is being referenced by the dependent table, alert user.
         """
         
-        childTableList = ["tbl_leaguematches",  "tbl_groupmatches", "tbl_penaltyshootouts"]
-        fieldName = "round_id"
         round_id = self.roundID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, round_id):
+        if not HasChildRecords("tbl_rounds", round_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -4064,7 +3965,7 @@ class RoundSetupDlg(QDialog, ui_roundsetup.Ui_RoundSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_rounds", round_id))
 
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -4103,6 +4004,7 @@ class WxCondSetupDlg(QDialog, ui_weathersetup.Ui_WxCondSetupDlg):
         self.model.setTable("tbl_weather")
         self.model.setSort(WxCondSetupDlg.ID, Qt.AscendingOrder)
         self.model.select()
+        WatchReferenceTable(self.model)
         
         # define mapper
         # establish ties between underlying database model and data widgets on form
@@ -4217,15 +4119,11 @@ class WxCondSetupDlg(QDialog, ui_weathersetup.Ui_WxCondSetupDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(weather_id) FROM tbl_weather"))
-        if query.next():
-            maxWeatherID = query.value(0).toInt()[0]
-            if not maxWeatherID:
-                weather_id = Constants.MinWeatherID
-            else:
-                weather_id = QString()
-                weather_id.setNum(maxWeatherID+1)          
+        try:
+            weather_id = NextID("tbl_weather")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
 
@@ -4264,11 +4162,9 @@ class WxCondSetupDlg(QDialog, ui_weathersetup.Ui_WxCondSetupDlg):
         record upon positive confirmation.  If it is being referenced by child tables, alert user.
         """
         
-        childTableList = ["tbl_weatherkickoff", "tbl_weatherhalftime", "tbl_weatherfulltime"]
-        fieldName = "weather_id"
         weather_id = self.weatherID_display.text()
         
-        if not CountChildRecords(childTableList, fieldName, weather_id):
+        if not HasChildRecords("tbl_weather", weather_id):
             if QMessageBox.question(self, QString("Delete Record"), 
                                                 QString("Delete current record?"), 
                                                 QMessageBox.Yes|QMessageBox.No) == QMessageBox.No:
@@ -4286,7 +4182,7 @@ class WxCondSetupDlg(QDialog, ui_weathersetup.Ui_WxCondSetupDlg):
                 if not self.model.rowCount():
                     self.deleteEntry.setDisabled(True)                
         else:
-            DeletionErrorPrompt(self)
+            MsgPrompts.DeletionErrorPrompt(self, ChildRecordCounts("tbl_weather", weather_id))
             
     def isDirty(self, row):
         """Compares current state of data entry form to current record in database, and returns a boolean.
@@ -22,9 +22,13 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import *
-from FmrdLib import (Constants, MsgPrompts)
+from FmrdLib import (Constants, MsgPrompts, RosterState)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.ReferenceData import ReferenceTableModel
+from FmrdLib.ShootoutState import ShootoutState
 
 """Contains classes that implement penalty-related entry forms to main tables of FMRD. 
 
@@ -68,28 +72,19 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         #
         
         # Competition combobox
-        self.compModel = QSqlTableModel(self)
-        self.compModel.setTable("tbl_competitions")
-        self.compModel.setSort(CMP_ID, Qt.AscendingOrder)
-        self.compModel.select()
+        self.compModel = ReferenceTableModel("tbl_competitions", CMP_ID, self)
         self.compSelect.setModel(self.compModel)
         self.compSelect.setModelColumn(self.compModel.fieldIndex("comp_name"))
         self.compSelect.setCurrentIndex(-1)
 
         # Knockout Rounds combobox
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         self.koRoundSelect.setModel(knockoutRoundModel)
         self.koRoundSelect.setModelColumn(knockoutRoundModel.fieldIndex("koround_desc"))
         self.koRoundSelect.setCurrentIndex(-1)
         
         # Matchdays (Knockout phase) combobox
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         self.koMatchdaySelect.setModel(knockoutMatchdayModel)
         self.koMatchdaySelect.setModelColumn(knockoutMatchdayModel.fieldIndex("matchday_desc"))
         self.koMatchdaySelect.setCurrentIndex(-1)
@@ -145,10 +140,13 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         # Define Penalty Shootouts data entry
         #
         
+        # shootout of selected match, shared with delegates
+        self.shootout = ShootoutState()
+        
         # 
         # underlying database model (tbl_penaltyshootouts)
-        # because of foreign keys, instantiate QSqlRelationalTableModel and define relations to it        
-        self.model = QSqlRelationalTableModel(self)
+        # because of foreign keys, instantiate RelationalIDTableModel and define relations to it        
+        self.model = RelationalIDTableModel(self)
         self.model.setTable("tbl_penaltyshootouts")
         self.model.setRelation(PenShootoutEntryDlg.LINEUP_ID, QSqlRelation("lineup_list", "lineup_id", "player"))
         self.model.setRelation(PenShootoutEntryDlg.ROUND_ID, QSqlRelation("tbl_rounds", "round_id", "round_desc"))
@@ -233,7 +231,7 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         self.connect(self.koMatchdaySelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatches)
         self.connect(self.matchSelect, SIGNAL("currentIndexChanged(int)"), self.filterShootouts)
         self.connect(self.penFirstSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterShootoutRounds)
-        self.connect(self.roundSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterTeams)
+        self.connect(self.roundSelect, SIGNAL("currentIndexChanged(int)"), lambda: self.enableAndFilterTeams())
         self.connect(self.teamSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterPlayers)
 #        self.connect(self.penFirstSelect, SIGNAL("currentIndexChanged(int)"), lambda: self.enableWidget(self.roundSelect))
 #        self.connect(self.roundSelect, SIGNAL("currentIndexChanged(int)"), lambda: self.enableWidget(self.teamSelect))
@@ -268,21 +266,18 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
                     if not self.mapper.submit():
                         MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
                     else:
+                        self.shootout.load()
                         if row == 0:
                             self.updateLinkingTable(self.penOpenerMapper, self.penFirstSelect)
                 else:
                     self.mapper.revert()
                     return
         
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(penshootout_id) FROM tbl_penaltyshootouts"))
-        if query.next():
-            maxShootoutID= query.value(0).toInt()[0]
-            if not maxShootoutID:
-                shootout_id = Constants.MinShootoutID
-            else:
-                shootout_id= QString()
-                shootout_id.setNum(maxShootoutID+1)       
+        try:
+            shootout_id = NextID("tbl_penaltyshootouts")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
                 
         row = self.model.rowCount()
         self.model.insertRow(row)
@@ -317,35 +312,27 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
             widget.setCurrentIndex(-1)
         self.enableWidget(self.roundSelect)        
         
+        # select round and team of next kick in shootout
+        round_id, team_id = self.shootout.nextKick(ComboBoxID(self.penFirstSelect, "team_id"))
+        if round_id != -1:
+            self.roundSelect.setCurrentIndex(ComboBoxIndex(self.roundSelect, "round_id", str(round_id)))
+            if team_id != -1:
+                self.teamSelect.setCurrentIndex(ComboBoxIndex(self.teamSelect, "team_id", str(team_id)))
+        
     def refreshTeamBox(self):
         """Sets index of team box so that it corresponds with selected player."""
         
         row = self.mapper.currentIndex()
         
-        compName = self.compSelect.currentText()
-        playerName = self.model.record(row).value("player").toString()
-        roundName = self.koRoundSelect.currentText()
-        matchdayName = self.koMatchdaySelect.currentText()
+        # lineup ID of player in current record
+        lineup_id = self.model.foreignKey(row, PenShootoutEntryDlg.LINEUP_ID).toInt()[0]
         
         # set team filter
-        self.enableAndFilterTeams(playerName)
-        
-        # look for team name
-        query = QSqlQuery()
-        query.prepare("SELECT team FROM lineup_list WHERE player = ? AND "
-                               "matchup IN (SELECT matchup FROM knockout_match_list WHERE competition = ? AND round = ? AND game = ?)")
-        query.addBindValue(QVariant(playerName))
-        query.addBindValue(QVariant(compName))
-        query.addBindValue(QVariant(roundName))
-        query.addBindValue(QVariant(matchdayName))
-        query.exec_()
-        if query.next():
-            teamName = query.value(0).toString()
-        else:
-            teamName = "-1"
+        self.enableAndFilterTeams(lineup_id)
         
-        currentIndex = self.teamSelect.findText(teamName, Qt.MatchExactly)
-        self.teamSelect.setCurrentIndex(currentIndex)
+        # select team of player
+        team_id = RosterState.LineupTeam(lineup_id)
+        self.teamSelect.setCurrentIndex(ComboBoxIndex(self.teamSelect, "team_id", str(team_id)))
         
     def deleteRecord(self):
         """Deletes record from database upon user confirmation."""
@@ -363,6 +350,7 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         if not self.model.submitAll():
             MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
             return
+        self.shootout.load()
         if row + 1 >= self.model.rowCount():
             row = self.model.rowCount() - 1
         self.mapper.setCurrentIndex(row) 
@@ -424,6 +412,7 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
                 if not self.mapper.submit():
                     MsgPrompts.DatabaseCommitErrorPrompt(self, self.model.lastError())
                 else:
+                    self.shootout.load()
                     self.updateLinkingTable(self.penOpenerMapper, self.penFirstSelect)
             else:
                 self.mapper.revert()
@@ -509,128 +498,6 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         if widget.isEnabled():
             widget.setDisabled(True)
 
-    def getShootoutRotation(self, round_id):
-        """Determine 11-round rotation in which current shootout round is a member."""
-        minRoundID = int(Constants.MinRoundID)
-        startRotationID = minRoundID
-
-        # get maximum Round ID
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(round_id) FROM tbl_rounds"))
-        if query.next():
-            maxRoundID = query.value(0).toInt()[0]
-        
-        if round_id < minRoundID:
-            if minRoundID + Constants.MAX_TEAM_STARTERS > maxRoundID:
-                endRotationID = maxRoundID + 1
-            else:
-                endRotationID = minRoundID + Constants.MAX_TEAM_STARTERS
-        else:
-            while round_id not in range(startRotationID, startRotationID+Constants.MAX_TEAM_STARTERS):
-                startRotationID += Constants.MAX_TEAM_STARTERS
-            endRotationID = startRotationID + Constants.MAX_TEAM_STARTERS
-        rotationList = range(startRotationID, endRotationID)
-
-        return rotationList
-        
-    def getAvailableRounds(self, match_id):
-        """Returns rounds that have not had maximum participation in Penalty Shootout table.
-        
-        Argument:
-            match_id -- match ID from knockout_match_list
-        """
-        roundIDList = []
-        roundstr = QString()
-        
-        # define min/max round ID in table
-        minRoundID = int(Constants.MinRoundID)
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(round_id) FROM tbl_rounds"))
-        if query.next():
-            maxRoundID = query.value(0).toInt()[0]
-            
-        # loop through round ID
-        # if round referenced less than twice in table, add it to list
-        for round_id in range(minRoundID, maxRoundID+1):
-            roundQuery = QSqlQuery()
-            roundstr.setNum(round_id)
-            roundQuery.exec_(QString("SELECT COUNT(*) FROM tbl_penaltyshootouts WHERE round_id = %1 "
-                                "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE match_id = %2)").arg(roundstr, match_id))
-            if roundQuery.next():
-                if roundQuery.value(0).toInt()[0] < Constants.MAX_PARTICIPATION:
-                    roundIDList.append(round_id)
-                    
-        return roundIDList
-        
-    def getAvailableTeams(self, match_id, round_id):
-        """Returns teams whose players have yet to participate in shootout round."""
-        teamList = []
-        
-        # query participating teams in match, save results to list
-        teamQuery = QSqlQuery()
-        teamQuery.exec_(QString("SELECT team_id FROM tbl_teams where team_id IN"
-            "(SELECT team_id FROM tbl_hometeams WHERE match_id = %1"
-            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1)").arg(match_id))
-        while teamQuery.next():
-            teamList.append(teamQuery.value(0).toInt()[0])
-            
-        # count number of players in team lineup who have participated in specific round of penalty shootout
-        countQuery = QSqlQuery()
-        countQuery.prepare("SELECT COUNT(*) FROM tbl_penaltyshootouts WHERE round_id = ? "
-                                "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE match_id = ? AND team_id = ?)")
-        # loop through list of teams
-        for team_id in teamList:
-            countQuery.addBindValue(QVariant(round_id))
-            countQuery.addBindValue(QVariant(match_id))
-            countQuery.addBindValue(QVariant(team_id))
-            countQuery.exec_()
-            if countQuery.next():
-                if countQuery.value(0).toInt()[0]:
-                    teamList.remove(team_id)
-                    
-        return teamList
-        
-    def getEligiblePlayers(self, match_id, team_id):
-        """Returns list of players who are eligible to participate in penalty shootout.
-        
-        The list contains players who meet the following two criteria:
-            (1) Starting players on the same team who have not been substituted out of the match.
-            (2) Non-starting players on the same team who have been substituted into the match.
-        """
-        eligibleList = []
-        
-        lineupQuery = QSqlQuery()
-        eligibleQueryString = QString("SELECT lineup_id FROM tbl_lineups WHERE "
-                "lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions) "
-                "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %1 AND team_id = %2) "
-                "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions) AND "
-                "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %1 AND team_id = %2))"
-                ).arg(match_id).arg(team_id)  
-        lineupQuery.prepare(eligibleQueryString)
-        lineupQuery.exec_()
-        while lineupQuery.next():
-            eligibleList.append(lineupQuery.value(0).toInt()[0])
-            
-        return eligibleList
-        
-    def getUsedPlayers(self, match_id, team_id, round_id):
-        """Returns players who have already participated in current rotation (11 round period) of penalty shootout. """
-        usedList = []
-        
-        # get rotation that contains current shootout round
-        rotationList = self.getShootoutRotation(round_id)
-        
-        participateQuery = QSqlQuery()
-        participateQuery.prepare(QString("SELECT lineup_id FROM tbl_lineups WHERE match_id = %1 AND team_id = %2 "
-                                 "AND lineup_id IN (SELECT lineup_id FROM tbl_penaltyshootouts WHERE round_id = ?)").arg(match_id, team_id))
-        for round_id in rotationList:
-            participateQuery.addBindValue(round_id)
-            participateQuery.exec_()
-            while participateQuery.next():
-                usedList.append(participateQuery.value(0).toInt()[0])
-                
-        return usedList
-        
     def enableAndFilterPlayers(self):
         """Enables Players combobox and filters its contents based on players eligible to participate in penalty shootout.
         
@@ -654,8 +521,8 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         roundIndex = self.roundSelect.currentIndex()
         round_id = self.roundModel.record(roundIndex).value("round_id").toInt()[0]
         
-        # get current player name
-        playerName = self.model.record(row).value("player").toString()
+        # get lineup ID of player in current record
+        lineup_id = self.model.foreignKey(row, PenShootoutEntryDlg.LINEUP_ID).toInt()[0]
         
         # block signals from player combobox
         self.playerSelect.blockSignals(True)
@@ -663,21 +530,13 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         # enable playerSelect combobox if not enabled already
         self.enableWidget(self.playerSelect)
         # get set of team players eligible to participate in penalty shootout
-        teamEligibleSet = set(self.getEligiblePlayers(match_id, team_id))
+        teamEligibleSet = set(RosterState.OnFieldPlayers(match_id, team_id))
         # get available players for current rotation of shootout round
-        playersUsedList = self.getUsedPlayers(match_id, team_id, round_id)
+        playersUsedList = self.shootout.usedPlayers(team_id, round_id)
         availableList = list(teamEligibleSet.difference(playersUsedList))
         
         # include player in current record
-        if playerName:
-            lineupQuery = QSqlQuery()
-            lineupQuery.prepare("SELECT lineup_id FROM lineup_list WHERE player = ? "
-                "AND matchup IN (SELECT matchup FROM knockout_match_list WHERE match_id = ?)")
-            lineupQuery.addBindValue(QVariant(playerName))
-            lineupQuery.addBindValue(QVariant(match_id))
-            lineupQuery.exec_()
-            if lineupQuery.next():
-                lineup_id = lineupQuery.value(0).toInt()[0]
+        if lineup_id != -1:
             availableList.append(lineup_id)
             availableList = list(set(availableList))
             
@@ -687,24 +546,23 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         self.playerModel.setFilter(filterString)
         self.playerModel.select()
         # reset playerSelect index
-        if playerName:
-            self.playerSelect.setCurrentIndex(self.playerSelect.findText(playerName, Qt.MatchExactly))
+        if lineup_id != -1:
+            self.playerSelect.setCurrentIndex(ComboBoxIndex(self.playerSelect, "lineup_id", str(lineup_id)))
         else:
             self.playerSelect.setCurrentIndex(-1)    
         
         # unblock signals from player combobox
         self.playerSelect.blockSignals(False)
 
-    def enableAndFilterTeams(self, player=None):
-        """Enables Teams combobox and filters its contents based on competing teams in selected match."""
-        
-        # get current index of match combobox
-        currentIndex = self.matchSelect.currentIndex()
-        match_id = self.matchModel.record(currentIndex).value("match_id").toString()
+    def enableAndFilterTeams(self, lineup_id=None):
+        """Enables Teams combobox and filters its contents based on competing teams in selected match.
         
+        Argument:
+            lineup_id -- lineup ID of player in current record (default None)
+        """
         # get current index of shootout round combobox
         roundIndex = self.roundSelect.currentIndex()
-        round_id = self.roundModel.record(roundIndex).value("round_id").toString()
+        round_id = self.roundModel.record(roundIndex).value("round_id").toInt()[0]
         
         # block signals from team combobox
         self.teamSelect.blockSignals(True)
@@ -712,25 +570,15 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         # enable teamSelect combobox if not enabled already
         self.enableWidget(self.teamSelect)
         # get available teams for shootout round
-        teamList = self.getAvailableTeams(match_id, round_id)
-        # if player name has been passed, get its team_id and add it to list
-        if player:
-            teamQuery = QSqlQuery()
-            teamQuery.prepare("SELECT team_id FROM tbl_teams WHERE tm_name IN "
-            "(SELECT team FROM lineup_list WHERE player = ? AND matchup IN "
-            "(SELECT matchup FROM knockout_match_list WHERE match_id = ?))")
-            teamQuery.addBindValue(player)
-            teamQuery.addBindValue(match_id)
-            teamQuery.exec_()
-            if teamQuery.next():
-                team_id = teamQuery.value(0).toInt()[0]
-            teamList.append(team_id)
+        teamList = self.shootout.availableTeams(round_id)
+        # if player has been passed, get its team_id and add it to list
+        if lineup_id is not None and lineup_id != -1:
+            teamList.append(RosterState.LineupTeam(lineup_id))
             teamList = list(set(teamList))
             
         # filter teams involved in match
         self.teamModel.setFilter(QString())
-        baseFilterString = QString("team_id IN (SELECT team_id FROM tbl_hometeams WHERE match_id = %1"
-            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1) ").arg(match_id)
+        baseFilterString = QString("team_id IN (%1) ").arg(",".join(str(n) for n in self.shootout.teams) or "-1")
         augFilterString = "AND team_id IN (" + ",".join((str(n) for n in teamList)) + ")"
         teamFilterString = baseFilterString + augFilterString
         self.teamModel.setFilter(baseFilterString)
@@ -748,12 +596,8 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         
         row = self.mapper.currentIndex()
         
-        # get current match_id of selected match
-        currentIndex = self.matchSelect.currentIndex()
-        match_id = self.matchModel.record(currentIndex).value("match_id").toString()
-
         # shootout round in current record of penalty shootout model
-        roundName = self.model.record(row).value("round_desc").toString()
+        round_id = self.model.foreignKey(row, PenShootoutEntryDlg.ROUND_ID).toInt()[0]
         
         # enable Add button
         self.enableWidget(self.addEntry)
@@ -765,15 +609,9 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         self.roundModel.setFilter(QString())
         
         # get available rounds in shootout
-        roundList = self.getAvailableRounds(match_id)
-        # if there is a valid record, get round_id and add it to roundList
-        if roundName:
-            roundQuery = QSqlQuery()
-            roundQuery.prepare(QString("SELECT round_id FROM tbl_rounds WHERE round_desc = ?"))
-            roundQuery.addBindValue(roundName)
-            roundQuery.exec_()
-            if roundQuery.next():
-                round_id = roundQuery.value(0).toInt()[0]
+        roundList = self.shootout.availableRounds()
+        # if there is a valid record, add its round_id to roundList
+        if round_id != -1:
             roundList.append(round_id)
             roundList = list(set(roundList))
             
@@ -810,6 +648,9 @@ class PenShootoutEntryDlg(QDialog, ui_penshootoutentry.Ui_PenShootoutEntryDlg):
         matchIndex = self.matchSelect.currentIndex()
         match_id = self.matchModel.record(matchIndex).value("match_id").toString()
         
+        # load shootout of match
+        self.shootout.setMatch(match_id)
+        
         # filter penalty shootouts taken by players who were in lineup for match (match_id)
         self.model.setFilter(QString("tbl_penaltyshootouts.lineup_id IN (SELECT lineup_id FROM lineup_list WHERE matchup IN "
                                                     "(SELECT matchup FROM match_list WHERE match_id = %1))").arg(match_id))
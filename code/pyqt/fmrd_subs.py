@@ -22,9 +22,13 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import *
-from FmrdLib import (Constants, MsgPrompts)
+from FmrdLib import (Constants, MsgPrompts, RosterState)
 from FmrdLib.CustomDelegates import *
 from FmrdLib.CustomModels import *
+from FmrdLib.QueryCache import *
+from FmrdLib.IDAllocator import (IDAllocationError, NextID)
+from FmrdLib.QueryExecutor import (QueryExecutor, KeyFilter)
+from FmrdLib.ReferenceData import ReferenceTableModel
 
 """Contains classes that implement substitute-related entry forms to main tables of FMRD. 
 
@@ -85,19 +89,13 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         #
         
         # Competition combobox
-        self.compModel = QSqlTableModel(self)
-        self.compModel.setTable("tbl_competitions")
-        self.compModel.setSort(CMP_ID, Qt.AscendingOrder)
-        self.compModel.select()
+        self.compModel = ReferenceTableModel("tbl_competitions", CMP_ID, self)
         self.compSelect.setModel(self.compModel)
         self.compSelect.setModelColumn(self.compModel.fieldIndex("comp_name"))
         self.compSelect.setCurrentIndex(-1)
         
         # Competition Phases combobox
-        self.phaseModel = QSqlTableModel(self)
-        self.phaseModel.setTable("tbl_phases")
-        self.phaseModel.setSort(PHS_ID, Qt.AscendingOrder)
-        self.phaseModel.select()
+        self.phaseModel = ReferenceTableModel("tbl_phases", PHS_ID, self)
         self.phaseSelect.setModel(self.phaseModel)
         self.phaseSelect.setModelColumn(self.phaseModel.fieldIndex("phase_desc"))
         self.phaseSelect.setCurrentIndex(-1)
@@ -107,10 +105,7 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         #
         
         # League Rounds
-        leagueRoundModel = QSqlTableModel(self)
-        leagueRoundModel.setTable("tbl_rounds")
-        leagueRoundModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        leagueRoundModel.select()
+        leagueRoundModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.lgRoundSelect.setModel(leagueRoundModel)
         self.lgRoundSelect.setModelColumn(leagueRoundModel.fieldIndex("round_desc"))
         self.lgRoundSelect.setCurrentIndex(-1)
@@ -120,28 +115,19 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         #
         
         # Group Rounds
-        groupRoundModel = QSqlTableModel(self)
-        groupRoundModel.setTable("tbl_grouprounds")
-        groupRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        groupRoundModel.select()
+        groupRoundModel = ReferenceTableModel("tbl_grouprounds", RND_ID, self)
         self.grpRoundSelect.setModel(groupRoundModel)
         self.grpRoundSelect.setModelColumn(groupRoundModel.fieldIndex("grpround_desc"))
         self.grpRoundSelect.setCurrentIndex(-1)
         
         # Groups
-        groupNameModel = QSqlTableModel(self)
-        groupNameModel.setTable("tbl_groups")
-        groupNameModel.setSort(GROUP_NAME, Qt.AscendingOrder)
-        groupNameModel.select()
+        groupNameModel = ReferenceTableModel("tbl_groups", GROUP_NAME, self)
         self.groupSelect.setModel(groupNameModel)
         self.groupSelect.setModelColumn(groupNameModel.fieldIndex("group_desc"))
         self.groupSelect.setCurrentIndex(-1)
         
         # Matchdays
-        groupMatchdayModel = QSqlTableModel(self)
-        groupMatchdayModel.setTable("tbl_rounds")
-        groupMatchdayModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        groupMatchdayModel.select()
+        groupMatchdayModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.grpMatchdaySelect.setModel(groupMatchdayModel)
         self.grpMatchdaySelect.setModelColumn(groupMatchdayModel.fieldIndex("round_desc"))
         self.grpMatchdaySelect.setCurrentIndex(-1)
@@ -151,19 +137,13 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         #
 
         # Knockout Rounds
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         self.koRoundSelect.setModel(knockoutRoundModel)
         self.koRoundSelect.setModelColumn(knockoutRoundModel.fieldIndex("koround_desc"))
         self.koRoundSelect.setCurrentIndex(-1)
         
         # Matchdays (Knockout phase)
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         self.koMatchdaySelect.setModel(knockoutMatchdayModel)
         self.koMatchdaySelect.setModelColumn(knockoutMatchdayModel.fieldIndex("matchday_desc"))
         self.koMatchdaySelect.setCurrentIndex(-1)
@@ -312,7 +292,14 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         self.connect(self.koRoundSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatchdays)
         self.connect(self.koMatchdaySelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatches)
         
+        # look up records of selected match on worker threads
+        # (substitutions of the match: rows of subs_id, as delivered by the executor)
+        self.executor = QueryExecutor(self)
+        self.matchSubstitutions = []
         self.connect(self.matchSelect, SIGNAL("currentIndexChanged(int)"), self.filterSubstitutionsAndTeams)      
+        self.connect(self.executor, SIGNAL("resultReady(QString,PyQt_PyObject)"), self.applyMatchFilter)
+        self.connect(self.executor, SIGNAL("queryFailed(QString,PyQt_PyObject)"), 
+                     lambda key, error: MsgPrompts.DatabaseQueryErrorPrompt(self, error))
         self.connect(self.teamSelect, SIGNAL("currentIndexChanged(int)"), self.filterPlayers)                
         self.connect(self.subtimeEdit, SIGNAL("editingFinished()"),  lambda: self.enableStoppageTime(self.stoppageEdit))
  
@@ -481,16 +468,18 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
                     self.mapper.revert()
                     return
         
+        try:
+            subs_id = NextID("tbl_substitutions")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
+        
+        # add new substitution to match filter before the row is inserted, as the model 
+        # is selected again with the filter when the row is saved
+        self.matchSubstitutions.append([QVariant(subs_id)])
+        self.model.setFilter(KeyFilter("subs_id", self.matchSubstitutions))
+        
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(subs_id) FROM tbl_substitutions"))
-        if query.next():
-            maxSubsID = query.value(0).toInt()[0]
-            if not maxSubsID:
-                subs_id = Constants.MinSubstitutionID
-            else:
-                subs_id = QString()
-                subs_id.setNum(maxSubsID+1)                  
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
         
@@ -530,24 +519,17 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
     def refreshTeamBox(self):
         """Sets index of team box so that it corresponds with selected player."""
         
-        compName = self.compSelect.currentText()
-        phaseText = self.phaseSelect.currentText()
-        playerName = self.inplayerSelect.currentText()
-        
-        # look for team name
-        query = QSqlQuery()
-        query.prepare("SELECT team FROM lineup_list WHERE player = ? AND "
-                               "matchup IN (SELECT matchup FROM match_list WHERE competition = ? AND phase = ?)")
-        query.addBindValue(QVariant(playerName))
-        query.addBindValue(QVariant(compName))
-        query.addBindValue(QVariant(phaseText))
-        query.exec_()
-        if query.next():
-            teamName = query.value(0).toString()
+        # get lineup_id from current item of player combobox
+        lineup_id = ComboBoxID(self.inplayerSelect, "lineup_id")
+        
+        # look for team of lineup entry
+        value = ScalarQuery("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?", (lineup_id, ))
+        if value.isValid():
+            team_id = value.toString()
         else:
-            teamName = "-1"
+            team_id = "-1"
                         
-        currentIndex = self.teamSelect.findText(teamName, Qt.MatchExactly)
+        currentIndex = ComboBoxIndex(self.teamSelect, "team_id", team_id)
         self.teamSelect.setCurrentIndex(currentIndex)
 
     def filterPlayers(self):
@@ -599,67 +581,33 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         # suppress signals from inplayerSelect
         self.inplayerSelect.blockSignals(True)
         
-        # get matchup from current text in matchSelect (main form)
-        matchup = self.matchSelect.currentText()
+        # get match_id from current item of matchSelect (main form)
+        match_id = ComboBoxID(self.matchSelect, "match_id")
        
-        # get team name from current text in teamSelect (main form)
-        teamName = self.teamSelect.currentText()
+        # get team_id from current item of teamSelect (main form)
+        team_id = ComboBoxID(self.teamSelect, "team_id")
         
-        # get player name from current text in inplayerSelect (main form)
-        playerName = self.inplayerSelect.currentText()
+        # get lineup_id from current item of inplayerSelect (main form)
+        lineup_id = ComboBoxID(self.inplayerSelect, "lineup_id")
         
         # lineup list model for combobox, reset filter on lineup list
         lineupListModel = self.inplayerSelect.model()
         lineupListModel.setFilter(QString())        
-            
-        # get lineup_id 
-        lineupQuery = QSqlQuery()
-        lineupQuery.exec_(QString("SELECT lineup_id FROM lineup_list WHERE player = %1").arg(playerName))
-        if lineupQuery.isActive():
-           lineupQuery.next()
-           lineup_id = unicode(lineupQuery.value(0).toString())
-        else:
-           lineup_id = "-1"
-           
-        # get match_id by making a query on match_list with matchup
-        matchQuery = QSqlQuery()
-        matchQuery.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        matchQuery.addBindValue(QVariant(matchup))
-        matchQuery.exec_()
-        if matchQuery.next():
-            match_id = matchQuery.value(0).toString()
-        else:
-            match_id = "-1"
-
-        # get team_id from tbl_teams
-        teamQuery = QSqlQuery()
-        teamQuery.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        teamQuery.addBindValue(QVariant(teamName))
-        teamQuery.exec_()        
-        if teamQuery.next():
-            team_id = teamQuery.value(0).toString()
-        else:
-            team_id = "-1"
                 
         # if there exists an entry, then find player name and set filter string for
         # Player combobox
         #
         #    -- filter players who can be subbed into match
         #    -- same match, same team, not starting, not already subbed in
-        #    SELECT lineup_id FROM tbl_lineups WHERE lineup_id NOT IN
-        #        (SELECT lineup_id FROM tbl_insubstitutions) AND 
-        #        NOT lp_starting AND match_id = ? AND team_id = ?
-        
-        filterString = QString("lineup_id NOT IN "
-                                   "(SELECT lineup_id FROM tbl_insubstitutions WHERE lineup_id <> %1) AND "
-                                   "lineup_id IN (SELECT lineup_id from tbl_lineups WHERE "
-                                   "NOT lp_starting AND match_id = %2 AND team_id = %3)").arg(lineup_id).arg(match_id).arg(team_id)
+        #    (read from roster state of match and team)
+        
+        filterString = RosterState.LineupFilter(RosterState.BenchPlayers(match_id, team_id, lineup_id))
 
         # filter Player combobox
         lineupListModel.setFilter(filterString)
         
         # set current index to item that matches data value
-        self.inplayerSelect.setCurrentIndex(self.inplayerSelect.findText(playerName, Qt.MatchExactly))
+        self.inplayerSelect.setCurrentIndex(ComboBoxIndex(self.inplayerSelect, "lineup_id", lineup_id))
         
         self.inplayerSelect.blockSignals(False)
         
@@ -680,79 +628,38 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         
         self.outplayerSelect.blockSignals(True)
         
-        # get match_id from current text in matchSelect (main form)
-        matchup = self.matchSelect.currentText()
+        # get match_id from current item of matchSelect (main form)
+        match_id = ComboBoxID(self.matchSelect, "match_id")
        
-        # get team_id from current text in teamSelect (main form)
-        teamName = self.teamSelect.currentText()
+        # get team_id from current item of teamSelect (main form)
+        team_id = ComboBoxID(self.teamSelect, "team_id")
         
-        # get player name from current text in outplayerSelect (main form)
-        playerName = self.outplayerSelect.currentText()
+        # get lineup_id from current item of outplayerSelect (main form)
+        lineup_id = ComboBoxID(self.outplayerSelect, "lineup_id")
 
         # lineup list model for combobox, reset filter on lineup list
         lineupListModel = self.outplayerSelect.model()
         lineupListModel.setFilter(QString())
         
-        # get lineup_id 
-        lineupQuery = QSqlQuery()
-        lineupQuery.prepare("SELECT lineup_id FROM lineup_list WHERE player = ?")
-        lineupQuery.addBindValue(QVariant(playerName))
-        lineupQuery.exec_()
-        if lineupQuery.next():
-           lineup_id = unicode(lineupQuery.value(0).toString())
-        else:
-           lineup_id = "-1"
-           
-        # get match_id by making a query on match_list with matchup
-        matchQuery = QSqlQuery()
-        matchQuery.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        matchQuery.addBindValue(QVariant(matchup))
-        matchQuery.exec_()
-        if matchQuery.next():
-            match_id = matchQuery.value(0).toString()
-        else:
-            match_id = "-1"
-
-        # get team_id from tbl_teams
-        teamQuery = QSqlQuery()
-        teamQuery.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        teamQuery.addBindValue(QVariant(teamName))
-        teamQuery.exec_()        
-        if teamQuery.next():
-            team_id = teamQuery.value(0).toString()
-        else:
-            team_id = "-1"        
-                
         #    -- filter players who can be subbed out of match
         #    -- same match, same team, on lineup list, starting or already subbed in, not already subbed out
-        #    SELECT player FROM tbl_lineups WHERE lineup_id NOT IN
-        #        (SELECT lineup_id FROM tbl_outsubstitutions) AND lp_starting AND match_id = ? AND team_id = ?
-        #    UNION
-        #    SELECT player FROM tbl_lineups WHERE lineup_id IN
-        #        (SELECT lineup_id FROM tbl_insubstitutions) AND NOT lp_starting AND match_id = ? AND team_id = ?
+        #    (read from roster state of match and team)
 
-        filterString = QString("lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions WHERE lineup_id <> %1) "
-                               "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %2 AND team_id = %3) "
-                               "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions WHERE lineup_id <> %1) AND "
-                               "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %2 AND team_id = %3))"
-                               ).arg(lineup_id).arg(match_id).arg(team_id)
+        filterString = RosterState.LineupFilter(RosterState.OnFieldPlayers(match_id, team_id, lineup_id))
             
         # filter Player combobox
         lineupListModel.setFilter(filterString)
 
         # set current index to item that matches data value
-        self.outplayerSelect.setCurrentIndex(self.outplayerSelect.findText(playerName, Qt.MatchExactly))
+        self.outplayerSelect.setCurrentIndex(ComboBoxIndex(self.outplayerSelect, "lineup_id", lineup_id))
         
         self.outplayerSelect.blockSignals(False)
 
     def filterSubstitutionsAndTeams(self):
-        """Filters Substitutions table from match selection."""
+        """Looks up lineups and teams of selected match on worker thread.
         
-        # block signals from team combobox
-        self.teamSelect.blockSignals(True)
-        
-        # clear filter
-        self.model.setFilter(QString())
+        Entry widgets are disabled until applyMatchFilter() receives the result.
+        """
         
         # get current index
         currentIndex = self.matchSelect.currentIndex()
@@ -760,9 +667,28 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         # get match_id
         match_id = self.matchModel.record(currentIndex).value("match_id").toString()
         
-        # filter substitutions of players from a specific match match (match_id)
-        self.model.setFilter(QString("subs_id IN (SELECT subs_id FROM tbl_insubstitutions WHERE lineup_id IN "
-                                                  "(SELECT lineup_id FROM tbl_lineups WHERE match_id = %1))").arg(match_id))
+        # disable entry widgets and buttons while lookup is pending
+        for widget in self.lowerFormWidgets + (self.teamSelect, self.stoppageEdit, self.addEntry, self.saveEntry, 
+                       self.deleteEntry, self.firstEntry, self.prevEntry, self.nextEntry, self.lastEntry):
+            widget.setDisabled(True)
+        
+        # substitutions of players in lineups of a specific match (match_id), and teams involved in match
+        self.executor.submit("match", [
+            ("SELECT i.subs_id FROM tbl_insubstitutions i, tbl_lineups l "
+             "WHERE l.lineup_id = i.lineup_id AND l.match_id = ?", (match_id, )), 
+            ("SELECT team_id FROM tbl_hometeams WHERE match_id = ? "
+             "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = ?", (match_id, match_id))])
+        
+    def applyMatchFilter(self, key, results):
+        """Filters Substitutions table and team combobox with substitutions and teams of selected match."""
+        self.matchSubstitutions, teams = results
+        
+        # block signals from team combobox
+        self.teamSelect.blockSignals(True)
+        
+        # filter substitutions of players from selected match
+        # (substitutions added later are appended to the keys by addRecord())
+        self.model.setFilter(KeyFilter("subs_id", self.matchSubstitutions))
         self.mapper.toFirst()        
         
         # after subs_id populates, refresh subforms
@@ -771,10 +697,7 @@ class SubsEntryDlg(QDialog, ui_subsentry.Ui_SubsEntryDlg):
         
         # filter teams involved in match
         teamModel = self.teamSelect.model()
-        teamModel.setFilter(QString())
-        teamModel.setFilter(QString("team_id IN"
-            "(SELECT team_id FROM tbl_hometeams WHERE match_id = %1"
-            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1)").arg(match_id))
+        teamModel.setFilter(KeyFilter("team_id", teams))
         self.teamSelect.setCurrentIndex(-1)            
         
         # refresh team select box
@@ -1097,19 +1020,13 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         #
         
         # Competition combobox
-        self.compModel = QSqlTableModel(self)
-        self.compModel.setTable("tbl_competitions")
-        self.compModel.setSort(CMP_ID, Qt.AscendingOrder)
-        self.compModel.select()
+        self.compModel = ReferenceTableModel("tbl_competitions", CMP_ID, self)
         self.compSelect.setModel(self.compModel)
         self.compSelect.setModelColumn(self.compModel.fieldIndex("comp_name"))
         self.compSelect.setCurrentIndex(-1)
         
         # Competition Phases combobox
-        self.phaseModel = QSqlTableModel(self)
-        self.phaseModel.setTable("tbl_phases")
-        self.phaseModel.setSort(PHS_ID, Qt.AscendingOrder)
-        self.phaseModel.select()
+        self.phaseModel = ReferenceTableModel("tbl_phases", PHS_ID, self)
         self.phaseSelect.setModel(self.phaseModel)
         self.phaseSelect.setModelColumn(self.phaseModel.fieldIndex("phase_desc"))
         self.phaseSelect.setCurrentIndex(-1)
@@ -1119,10 +1036,7 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         #
         
         # League Rounds
-        leagueRoundModel = QSqlTableModel(self)
-        leagueRoundModel.setTable("tbl_rounds")
-        leagueRoundModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        leagueRoundModel.select()
+        leagueRoundModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.lgRoundSelect.setModel(leagueRoundModel)
         self.lgRoundSelect.setModelColumn(leagueRoundModel.fieldIndex("round_desc"))
         self.lgRoundSelect.setCurrentIndex(-1)
@@ -1132,28 +1046,19 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         #
         
         # Group Rounds
-        groupRoundModel = QSqlTableModel(self)
-        groupRoundModel.setTable("tbl_grouprounds")
-        groupRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        groupRoundModel.select()
+        groupRoundModel = ReferenceTableModel("tbl_grouprounds", RND_ID, self)
         self.grpRoundSelect.setModel(groupRoundModel)
         self.grpRoundSelect.setModelColumn(groupRoundModel.fieldIndex("grpround_desc"))
         self.grpRoundSelect.setCurrentIndex(-1)
         
         # Groups
-        groupNameModel = QSqlTableModel(self)
-        groupNameModel.setTable("tbl_groups")
-        groupNameModel.setSort(GROUP_NAME, Qt.AscendingOrder)
-        groupNameModel.select()
+        groupNameModel = ReferenceTableModel("tbl_groups", GROUP_NAME, self)
         self.groupSelect.setModel(groupNameModel)
         self.groupSelect.setModelColumn(groupNameModel.fieldIndex("group_desc"))
         self.groupSelect.setCurrentIndex(-1)
         
         # Matchdays
-        groupMatchdayModel = QSqlTableModel(self)
-        groupMatchdayModel.setTable("tbl_rounds")
-        groupMatchdayModel.setSort(ROUND_NAME, Qt.AscendingOrder)
-        groupMatchdayModel.select()
+        groupMatchdayModel = ReferenceTableModel("tbl_rounds", ROUND_NAME, self)
         self.grpMatchdaySelect.setModel(groupMatchdayModel)
         self.grpMatchdaySelect.setModelColumn(groupMatchdayModel.fieldIndex("round_desc"))
         self.grpMatchdaySelect.setCurrentIndex(-1)
@@ -1163,19 +1068,13 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         #
 
         # Knockout Rounds
-        knockoutRoundModel = QSqlTableModel(self)
-        knockoutRoundModel.setTable("tbl_knockoutrounds")
-        knockoutRoundModel.setSort(RND_ID, Qt.AscendingOrder)
-        knockoutRoundModel.select()
+        knockoutRoundModel = ReferenceTableModel("tbl_knockoutrounds", RND_ID, self)
         self.koRoundSelect.setModel(knockoutRoundModel)
         self.koRoundSelect.setModelColumn(knockoutRoundModel.fieldIndex("koround_desc"))
         self.koRoundSelect.setCurrentIndex(-1)
         
         # Matchdays (Knockout phase)
-        knockoutMatchdayModel = QSqlTableModel(self)
-        knockoutMatchdayModel.setTable("tbl_matchdays")
-        knockoutMatchdayModel.setSort(MATCHDAY_NAME, Qt.AscendingOrder)
-        knockoutMatchdayModel.select()
+        knockoutMatchdayModel = ReferenceTableModel("tbl_matchdays", MATCHDAY_NAME, self)
         self.koMatchdaySelect.setModel(knockoutMatchdayModel)
         self.koMatchdaySelect.setModelColumn(knockoutMatchdayModel.fieldIndex("matchday_desc"))
         self.koMatchdaySelect.setCurrentIndex(-1)
@@ -1207,8 +1106,8 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         #
         
         # underlying database model (tbl_switchpositions)
-        # because of foreign keys, instantiate QSqlRelationalTableModel and define relations to it        
-        self.model = QSqlRelationalTableModel(self)
+        # because of foreign keys, instantiate RelationalIDTableModel and define relations to it        
+        self.model = RelationalIDTableModel(self)
         self.model.setTable("tbl_switchpositions")
         self.model.setRelation(SwitchEntryDlg.LINEUP_ID, QSqlRelation("lineup_list", "lineup_id", "player"))
         self.model.setRelation(SwitchEntryDlg.POS_ID, QSqlRelation("positions_list", "position_id", "position_name"))
@@ -1303,7 +1202,12 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         self.connect(self.koRoundSelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatchdays)
         self.connect(self.koMatchdaySelect, SIGNAL("currentIndexChanged(int)"), self.enableAndFilterMatches)
         
+        # look up records of selected match on worker threads
+        self.executor = QueryExecutor(self)
         self.connect(self.matchSelect, SIGNAL("currentIndexChanged(int)"), self.filterSwitchesAndTeams)      
+        self.connect(self.executor, SIGNAL("resultReady(QString,PyQt_PyObject)"), self.applyMatchFilter)
+        self.connect(self.executor, SIGNAL("queryFailed(QString,PyQt_PyObject)"), 
+                     lambda key, error: MsgPrompts.DatabaseQueryErrorPrompt(self, error))
         self.connect(self.teamSelect, SIGNAL("currentIndexChanged(int)"), self.filterPlayers)                
         self.connect(self.switchtimeEdit, SIGNAL("editingFinished()"),  lambda: self.enableStoppageTime(self.stoppageEdit))        
         
@@ -1457,15 +1361,11 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
                     return
         
         row = self.model.rowCount()
-        query = QSqlQuery()
-        query.exec_(QString("SELECT MAX(switch_id) FROM tbl_switchpositions"))
-        if query.next():
-            maxSwitchID = query.value(0).toInt()[0]
-            if not maxSwitchID:
-                switch_id = Constants.MinSwitchID
-            else:
-                switch_id = QString()
-                switch_id.setNum(maxSwitchID+1)                  
+        try:
+            switch_id = NextID("tbl_switchpositions")
+        except IDAllocationError, e:
+            MsgPrompts.DatabaseCommitErrorPrompt(self, e.error)
+            return
         self.model.insertRow(row)
         self.mapper.setCurrentIndex(row)
         
@@ -1502,24 +1402,17 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
     def refreshTeamBox(self):
         """Sets index of team box so that it corresponds with selected player."""
         
-        compName = self.compSelect.currentText()
-        phaseText = self.phaseSelect.currentText()
-        playerName = self.playerSelect.currentText()
-        
-        # look for team name
-        query = QSqlQuery()
-        query.prepare("SELECT team FROM lineup_list WHERE player = ? AND "
-                               "matchup IN (SELECT matchup FROM match_list WHERE competition = ? AND phase = ?)")
-        query.addBindValue(QVariant(playerName))
-        query.addBindValue(QVariant(compName))
-        query.addBindValue(QVariant(phaseText))
-        query.exec_()
-        if query.next():
-            teamName = query.value(0).toString()
+        # get lineup_id from current item of player combobox
+        lineup_id = ComboBoxID(self.playerSelect, "lineup_id")
+        
+        # look for team of lineup entry
+        value = ScalarQuery("SELECT team_id FROM tbl_lineups WHERE lineup_id = ?", (lineup_id, ))
+        if value.isValid():
+            team_id = value.toString()
         else:
-            teamName = "-1"
+            team_id = "-1"
                         
-        currentIndex = self.teamSelect.findText(teamName, Qt.MatchExactly)
+        currentIndex = ComboBoxIndex(self.teamSelect, "team_id", team_id)
         self.teamSelect.setCurrentIndex(currentIndex)
         
     def filterPlayers(self):
@@ -1534,59 +1427,21 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         """
         self.playerSelect.blockSignals(True)
         
-        # get current matchup from current text in matchSelect (main form)
-        matchup = self.matchSelect.currentText()
+        # get match_id from current item of matchSelect (main form)
+        match_id = ComboBoxID(self.matchSelect, "match_id")
                 
-        # get current team from current text in teamSelect (main form)
-        teamName = self.teamSelect.currentText()
-        
-        # get player name from current text in playerSelect (main form)
-        playerName = self.playerSelect.currentText()
+        # get team_id from current item of teamSelect (main form)
+        team_id = ComboBoxID(self.teamSelect, "team_id")
         
         # lineup list model for combobox, reset filter on lineup list
         lineupListModel = self.playerSelect.model()
         lineupListModel.setFilter(QString())
         
-        # get lineup_id by making a query on lineup_list with player name
-        lineupQuery = QSqlQuery()
-        lineupQuery.prepare("SELECT lineup_id FROM lineup_list WHERE player = ?")
-        lineupQuery.addBindValue(QVariant(playerName))
-        lineupQuery.exec_()
-        if lineupQuery.next():
-           lineup_id = unicode(lineupQuery.value(0).toString())
-        else:
-           lineup_id = "-1"
-        
-        # get match_id by making a query on match_list with matchup
-        matchQuery = QSqlQuery()
-        matchQuery.prepare("SELECT match_id FROM match_list WHERE matchup = ?")
-        matchQuery.addBindValue(QVariant(matchup))
-        matchQuery.exec_()
-        if matchQuery.next():
-            match_id = matchQuery.value(0).toString()
-        
-        # get team_id by querying tbl_teams with team name
-        team_id = "-1"
-        teamQuery = QSqlQuery()
-        teamQuery.prepare("SELECT team_id FROM tbl_teams WHERE tm_name = ?")
-        teamQuery.addBindValue(QVariant(teamName))
-        teamQuery.exec_()
-        if teamQuery.next():
-            team_id = teamQuery.value(0).toString()
-        
         #    -- filter players who can be subbed out of match
         #    -- same match, same team, on lineup list, starting or already subbed in, not already subbed out
-        #    SELECT player FROM tbl_lineups WHERE lineup_id NOT IN
-        #        (SELECT lineup_id FROM tbl_outsubstitutions) AND lp_starting AND match_id = ? AND team_id = ?
-        #    UNION
-        #    SELECT player FROM tbl_lineups WHERE lineup_id IN
-        #        (SELECT lineup_id FROM tbl_insubstitutions) AND NOT lp_starting AND match_id = ? AND team_id = ?
-        
-        filterString = QString("lineup_id NOT IN (SELECT lineup_id FROM tbl_outsubstitutions) "
-                               "AND lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE lp_starting AND match_id = %1 AND team_id = %2) "
-                               "OR (lineup_id IN (SELECT lineup_id FROM tbl_insubstitutions) AND "
-                               "lineup_id IN (SELECT lineup_id FROM tbl_lineups WHERE NOT lp_starting AND match_id = %1 AND team_id = %2))"
-                               ).arg(match_id).arg(team_id)
+        #    (read from roster state of match and team)
+        
+        filterString = RosterState.LineupFilter(RosterState.OnFieldPlayers(match_id, team_id))
         
         # filter Players combobox
         lineupListModel.setFilter(filterString)
@@ -1606,13 +1461,10 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         self.playerSelect.blockSignals(False)
 
     def filterSwitchesAndTeams(self):
-        """Filters SwitchPositions table from match selection."""
-
-        # block signals from team combobox
-        self.teamSelect.blockSignals(True)
+        """Looks up lineups and teams of selected match on worker thread.
         
-        # clear filter
-        self.model.setFilter(QString())
+        Entry widgets are disabled until applyMatchFilter() receives the result.
+        """
         
         # get current index
         currentIndex = self.matchSelect.currentIndex()
@@ -1620,17 +1472,32 @@ class SwitchEntryDlg(QDialog, ui_switchentry.Ui_SwitchEntryDlg):
         # get match_id
         match_id = self.matchModel.record(currentIndex).value("match_id").toString()
         
-        # filter position switches of players who were in lineup for match (match_id)
-        self.model.setFilter(QString("tbl_switchpositions.lineup_id IN (SELECT lineup_id FROM lineup_list WHERE matchup IN "
-                                                    "(SELECT matchup FROM match_list WHERE match_id = %1))").arg(match_id))
+        # disable entry widgets and buttons while lookup is pending
+        for widget in self.lowerFormWidgets + (self.teamSelect, self.stoppageEdit, self.addEntry, self.saveEntry, 
+                       self.deleteEntry, self.firstEntry, self.prevEntry, self.nextEntry, self.lastEntry):
+            widget.setDisabled(True)
+        
+        # players who were in lineup for match (match_id), and teams involved in match
+        self.executor.submit("match", [
+            ("SELECT lineup_id FROM lineup_list WHERE matchup IN "
+             "(SELECT matchup FROM match_list WHERE match_id = ?)", (match_id, )), 
+            ("SELECT team_id FROM tbl_hometeams WHERE match_id = ? "
+             "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = ?", (match_id, match_id))])
+        
+    def applyMatchFilter(self, key, results):
+        """Filters SwitchPositions table and team combobox with lineups and teams of selected match."""
+        lineups, teams = results
+
+        # block signals from team combobox
+        self.teamSelect.blockSignals(True)
+        
+        # filter position switches of players who were in lineup for selected match
+        self.model.setFilter(KeyFilter("tbl_switchpositions.lineup_id", lineups))
         self.mapper.toFirst()        
         
         # filter teams involved in match
         teamModel = self.teamSelect.model()
-        teamModel.setFilter(QString())
-        teamModel.setFilter(QString("team_id IN"
-            "(SELECT team_id FROM tbl_hometeams WHERE match_id = %1"
-            "UNION SELECT team_id FROM tbl_awayteams WHERE match_id = %1)").arg(match_id))
+        teamModel.setFilter(KeyFilter("team_id", teams))
         self.teamSelect.setCurrentIndex(-1)            
         
         # refresh team select box
@@ -24,19 +24,14 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import ui_mainswitchboard
+from FmrdLib import (Constants, QueryStats)
 from FmrdLib.CheckTables import *
+from FmrdLib.TableCounters import (InvalidateCounters, RefreshCounters)
+from FmrdLib.LineupReadiness import (LineupReadinessReport, ReadinessError, ReadinessReportLines)
 from FmrdLib.MsgPrompts import *
 from FmrdLib.Constants import *
-
-from fmrd_setup import *
-from fmrd_match import *
-from fmrd_goals import *
-from fmrd_penalties import *
-from fmrd_subs import *
-from fmrd_offenses import *
-from fmrd_shootouts import *
-from fmrd_overview import *
-from fmrd_personnel import *
+from FmrdLib.DialogPool import DialogPool
+from FmrdLib.Prewarm import Prewarmer
 
 """Implements the Main Switchboard for the FMRD data entry tool.
 
@@ -58,6 +53,18 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         super(MainSwitchboard, self).__init__(parent)
         self.setupUi(self) 
         
+        # data entry dialogs, kept alive between uses
+        self.dialogs = DialogPool(self)
+        
+        # load reference data in the background once the switchboard is displayed,
+        # unless the operator opens a dialog first
+        self.prewarmer = Prewarmer(self)
+        self.connect(self.prewarmer, SIGNAL("progress(QString)"), self.statusbar.showMessage)
+        self.connect(self.prewarmer, SIGNAL("done(QString)"), lambda message: self.statusbar.showMessage(message, 5000))
+        self.connect(self.dialogs, SIGNAL("dialogOpening(QString)"), self.prewarmer.cancel)
+        self.connect(QApplication.instance(), SIGNAL("aboutToQuit()"), self.prewarmer.stop)
+        QTimer.singleShot(0, self.prewarmer.start)
+        
         # center window in screen
         desktop = QDesktopWidget()
         mainScreen = desktop.screen(desktop.primaryScreen())
@@ -111,134 +118,152 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         QObject.connect(self.actionFouls, SIGNAL("triggered()"), self.OpenFouls)
         QObject.connect(self.actionCards, SIGNAL("triggered()"), self.OpenCards)
         QObject.connect(self.actionAbout, SIGNAL("triggered()"), self.OpenAbout)
+        
+        # menu action for query instrumentation
+        self.actionQuery_Statistics = QAction("Query &Statistics", self)
+        self.actionQuery_Statistics.setCheckable(True)
+        self.actionQuery_Statistics.setChecked(QueryStats.IsEnabled())
+        self.menuMain.insertAction(self.actionQuit, self.actionQuery_Statistics)
+        QObject.connect(self.actionQuery_Statistics, SIGNAL("toggled(bool)"), self.ToggleQueryStatistics)
+        
+        # menu action for lineup readiness report
+        self.actionLineup_Readiness = QAction("&Lineup Readiness Report", self)
+        self.menuMain.insertAction(self.actionQuit, self.actionLineup_Readiness)
+        QObject.connect(self.actionLineup_Readiness, SIGNAL("triggered()"), self.ShowLineupReadiness)
     
     # routines for opening menu dialogs
      
+    def ToggleQueryStatistics(self, checked):
+        """Switches query instrumentation on or off, and reports location of session summary."""
+        fileName = QueryStats.SetEnabled(checked)
+        if checked:
+            self.statusbar.showMessage("Query statistics on")
+        elif fileName:
+            self.statusbar.showMessage(QString("Query statistics written to %1").arg(fileName))
+        else:
+            self.statusbar.showMessage("Query statistics off")
+        
+    def ShowLineupReadiness(self):
+        """Checks lineups of all matches and reports those that are not ready for match event entry."""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            lines = ReadinessReportLines(LineupReadinessReport())
+        except ReadinessError, e:
+            QApplication.restoreOverrideCursor()
+            DatabaseQueryErrorPrompt(self, e.error)
+            return
+        QApplication.restoreOverrideCursor()
+        LineupReadinessPrompt(self, lines)
+        
     def OpenAbout(self):
         """Opens About window."""
         DisplayAboutDialog(self, Constants.DATAENTRY_VERSION, Constants.SQL_VERSION)
         
     def OpenCards(self):
         """Opens Disciplinary Cards window."""
-        dialog = CardSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("CardSetupDlg")
         
     def OpenFouls(self):
         """Opens Fouls window."""
-        dialog = FoulSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("FoulSetupDlg")
         
     def OpenPenOutcomes(self):
         """Opens Penalty Outcomes window."""
-        dialog = PenSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("PenSetupDlg")
         
     def OpenGoalEvents(self):
         """Opens Goal Events window."""
-        dialog = GoalEventSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("GoalEventSetupDlg")
         
     def OpenGoalStrikes(self):
         """Opens Goal Strikes window."""
-        dialog = GoalStrikeSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("GoalStrikeSetupDlg")
         
     def OpenFieldPositions(self):
         """Opens Field Position Name window."""
-        dialog = FieldPosSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("FieldPosSetupDlg")
+        # goalkeepers are counted by position name
+        RefreshCounters(["goalkeepers"])
         
     def OpenFlankPositions(self):
         """Opens Flank Name window."""
-        dialog = FlankPosSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("FlankPosSetupDlg")
         
     def OpenPositions(self):
         """Opens composite Position Name window."""
-        dialog = PosSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("PosSetupDlg")
+        # goalkeepers are counted by position name
+        RefreshCounters(["goalkeepers"])
         
     def OpenCountries(self):
         """Opens Country window."""
-        dialog = CountrySetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("CountrySetupDlg")
         
     def OpenConfederations(self):
         """Opens Confederation window."""
-        dialog = ConfedSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("ConfedSetupDlg")
         
     def OpenPhases(self):
         """Open Competition Phases window."""
-        dialog = PhaseSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("PhaseSetupDlg")
         
     def OpenGroups(self):
         """Open Groups window."""
-        dialog = GroupSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("GroupSetupDlg")
         
     def OpenRounds(self):
         """Opens Rounds (League phase) window."""
-        dialog = RoundSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("RoundSetupDlg")
         
     def OpenGroupRounds(self):
         """Open Rounds (Group phase) window."""
-        dialog = GroupRoundSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("GroupRoundSetupDlg")
         
     def OpenKnockoutRounds(self):
         """Open Rounds (Knockout phase) window."""
-        dialog = KnockoutRoundSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("KnockoutRoundSetupDlg")
         
     def OpenMatchdays(self):
         """Open Matchdays (Knockout phase) window."""
-        dialog = MatchdaySetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("MatchdaySetupDlg")
         
     def OpenTimeZones(self):
         """Opens Time Zones window."""
-        dialog = TimeZoneSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("TimeZoneSetupDlg")
 
     def OpenVenueSurfaces(self):
         """Opens Venue Field Surfaces window."""
-        dialog = VenueSurfaceSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("VenueSurfaceSetupDlg")
 
     def OpenWeatherConditions(self):
         """Opens Weather Conditions window."""
-        dialog = WxCondSetupDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("WxCondSetupDlg")
         
     # routines for opening main dialogs (access by pushbuttons)
     
     def OpenCompetitions(self):
         """Opens Competitions window."""
-        dialog = CompEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("CompEntryDlg")
+        InvalidateCounters()
                 
     def OpenTeams(self):
         """Opens Teams window."""
-        dialog = TeamEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("TeamEntryDlg")
+        InvalidateCounters()
         
     def OpenPlayers(self):
         """Opens Players window."""
-        dialog = PlayerEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("PlayerEntryDlg")
         
     def OpenManagers(self):
         """Opens Managers window."""
-        dialog = ManagerEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("ManagerEntryDlg")
+        InvalidateCounters()
         
     def OpenReferees(self):
         """Opens Referees window."""
-        dialog = RefereeEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("RefereeEntryDlg")
+        InvalidateCounters()
 
     def OpenVenues(self):
         """Opens Venues window.
@@ -249,8 +274,8 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumVenueHosts():
             VenueErrorPrompt(self)
         else:
-            dialog = VenueEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("VenueEntryDlg")
+            InvalidateCounters()
         
     def OpenMatches(self):
         """Opens Matches window.
@@ -266,8 +291,8 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumMatchCriteria():
             MatchErrorPrompt(self)
         else:
-            dialog = MatchEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("MatchEntryDlg")
+            InvalidateCounters()
 
     def OpenGoals(self):
         """Opens Goals window.
@@ -281,8 +306,7 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:
-            dialog = GoalEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("GoalEntryDlg")
         
     def OpenPenalties(self):
         """Opens Penalties window.
@@ -296,8 +320,7 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:
-            dialog = PenaltyEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("PenaltyEntryDlg")
         
     def OpenOffenses(self):
         """Opens Offenses window.
@@ -311,8 +334,7 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:      
-            dialog = OffenseEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("OffenseEntryDlg")
         
     def OpenSubstitutions(self):
         """Opens Substitutions window.
@@ -323,8 +345,7 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumSubstitutes():
             SubstitutesErrorPrompt(self)
         else:
-            dialog = SubsEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("SubsEntryDlg")
         
     def OpenPosSwitches(self):
         """Opens Position Switches window.
@@ -338,8 +359,7 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:        
-            dialog = SwitchEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("SwitchEntryDlg")
         
     def OpenPenaltyShootouts(self):
         """Opens Penalty Kick Shootouts window.
@@ -349,9 +369,9 @@ class MainSwitchboard(QMainWindow, ui_mainswitchboard.Ui_MainSwitchboard):
         if not CheckMinimumKnockoutMatches():
             KnockoutMatchErrorPrompt(self)
         else:
-            dialog = PenShootoutEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("PenShootoutEntryDlg")
         
     def close(self):
         """Hides Switchboard window and exits application."""
+        self.prewarmer.stop()
         sys.exit()
@@ -24,18 +24,14 @@ from PyQt4.QtGui import *
 from PyQt4.QtSql import *
 
 from FmrdMain import ui_usermainswitchboard
+from FmrdLib import Constants
 from FmrdLib.CheckTables import *
+from FmrdLib.TableCounters import InvalidateCounters
+from FmrdLib.LineupReadiness import (LineupReadinessReport, ReadinessError, ReadinessReportLines)
 from FmrdLib.MsgPrompts import *
 from FmrdLib.Constants import *
-
-from fmrd_match import *
-from fmrd_goals import *
-from fmrd_penalties import *
-from fmrd_subs import *
-from fmrd_offenses import *
-from fmrd_shootouts import *
-from fmrd_overview import *
-from fmrd_personnel import *
+from FmrdLib.DialogPool import DialogPool
+from FmrdLib.Prewarm import Prewarmer
 
 """Implements the Main User Switchboard for the FMRD data entry tool.
 
@@ -54,6 +50,18 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         super(UserMainSwitchboard, self).__init__(parent)
         self.setupUi(self) 
         
+        # data entry dialogs, kept alive between uses
+        self.dialogs = DialogPool(self)
+        
+        # load reference data in the background once the switchboard is displayed,
+        # unless the operator opens a dialog first
+        self.prewarmer = Prewarmer(self)
+        self.connect(self.prewarmer, SIGNAL("progress(QString)"), self.statusbar.showMessage)
+        self.connect(self.prewarmer, SIGNAL("done(QString)"), lambda message: self.statusbar.showMessage(message, 5000))
+        self.connect(self.dialogs, SIGNAL("dialogOpening(QString)"), self.prewarmer.cancel)
+        self.connect(QApplication.instance(), SIGNAL("aboutToQuit()"), self.prewarmer.stop)
+        QTimer.singleShot(0, self.prewarmer.start)
+        
         # center window in screen
         desktop = QDesktopWidget()
         mainScreen = desktop.screen(desktop.primaryScreen())
@@ -88,9 +96,26 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         
         # signal/slot connections for menu actions
         QObject.connect(self.actionAbout, SIGNAL("triggered()"), self.OpenAbout)
+        
+        # menu action for lineup readiness report
+        self.actionLineup_Readiness = QAction("&Lineup Readiness Report", self)
+        self.menuMain.insertAction(self.actionQuit, self.actionLineup_Readiness)
+        QObject.connect(self.actionLineup_Readiness, SIGNAL("triggered()"), self.ShowLineupReadiness)
      
      # routines for opening menu dialogs
      
+    def ShowLineupReadiness(self):
+        """Checks lineups of all matches and reports those that are not ready for match event entry."""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            lines = ReadinessReportLines(LineupReadinessReport())
+        except ReadinessError, e:
+            QApplication.restoreOverrideCursor()
+            DatabaseQueryErrorPrompt(self, e.error)
+            return
+        QApplication.restoreOverrideCursor()
+        LineupReadinessPrompt(self, lines)
+        
     def OpenAbout(self):
         """Opens About window."""
         DisplayAboutDialog(self, Constants.DATAENTRY_VERSION, Constants.SQL_VERSION)
@@ -99,28 +124,27 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
     
     def OpenCompetitions(self):
         """Opens Competitions window."""
-        dialog = CompEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("CompEntryDlg")
+        InvalidateCounters()
                 
     def OpenTeams(self):
         """Opens Teams window."""
-        dialog = TeamEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("TeamEntryDlg")
+        InvalidateCounters()
         
     def OpenPlayers(self):
         """Opens Players window."""
-        dialog = PlayerEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("PlayerEntryDlg")
         
     def OpenManagers(self):
         """Opens Managers window."""
-        dialog = ManagerEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("ManagerEntryDlg")
+        InvalidateCounters()
         
     def OpenReferees(self):
         """Opens Referees window."""
-        dialog = RefereeEntryDlg(self)
-        dialog.exec_()
+        self.dialogs.exec_("RefereeEntryDlg")
+        InvalidateCounters()
 
     def OpenVenues(self):
         """Opens Venues window.
@@ -131,8 +155,8 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumVenueHosts():
             VenueErrorPrompt(self)
         else:
-            dialog = VenueEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("VenueEntryDlg")
+            InvalidateCounters()
         
     def OpenMatches(self):
         """Opens Matches window.
@@ -148,8 +172,8 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumMatchCriteria():
             MatchErrorPrompt(self)
         else:
-            dialog = MatchEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("MatchEntryDlg")
+            InvalidateCounters()
 
     def OpenGoals(self):
         """Opens Goals window.
@@ -163,8 +187,7 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:
-            dialog = GoalEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("GoalEntryDlg")
         
     def OpenPenalties(self):
         """Opens Penalties window.
@@ -178,8 +201,7 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:
-            dialog = PenaltyEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("PenaltyEntryDlg")
         
     def OpenOffenses(self):
         """Opens Offenses window.
@@ -193,8 +215,7 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:      
-            dialog = OffenseEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("OffenseEntryDlg")
         
     def OpenSubstitutions(self):
         """Opens Substitutions window.
@@ -205,8 +226,7 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumSubstitutes():
             SubstitutesErrorPrompt(self)
         else:
-            dialog = SubsEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("SubsEntryDlg")
         
     def OpenPosSwitches(self):
         """Opens Position Switches window.
@@ -220,8 +240,7 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumLineups():
             MatchDetailErrorPrompt(self)
         else:        
-            dialog = SwitchEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("SwitchEntryDlg")
             
     def OpenPenaltyShootouts(self):
         """Opens Penalty Kick Shootouts window.
@@ -231,9 +250,9 @@ class UserMainSwitchboard(QMainWindow, ui_usermainswitchboard.Ui_UserMainSwitchb
         if not CheckMinimumKnockoutMatches():
             KnockoutMatchErrorPrompt(self)
         else:
-            dialog = PenShootoutEntryDlg(self)
-            dialog.exec_()
+            self.dialogs.exec_("PenShootoutEntryDlg")
         
     def close(self):
         """Hides Switchboard window and exits application."""
+        self.prewarmer.stop()
         sys.exit()
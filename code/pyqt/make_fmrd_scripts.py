@@ -111,7 +111,8 @@ AdminList = ["ui_cardsetup.py",
              "ui_weathersetup.py"]
              
 guiResourceFile = "fmrd_resources.qrc"
-resourceFile = "fmrd_resources_rc.py"
+# single copy of the resources, registered on first use (see FmrdLib/Resources.py)
+resourceFile = "FmrdLib/fmrd_resources_data.py"
                    
 print "Autoencoding main UIs..."                   
 for mainFile,guiFile in zip(MainList,GuiMainList):
@@ -131,13 +132,12 @@ for adminFile,guiFile in zip(AdminList,GuiAdminList):
 	else:
 		print "%s: No need to rebuild" % adminFile
 	
-print "Autoencoding resource files..."
-for localDir in (adminDir,mainDir):
-	if not os.path.isfile(localDir+resourceFile) or \
-	 os.path.getmtime(localDir+resourceFile) < os.path.getmtime(guiDir+guiResourceFile):
-		print "Building %s" % resourceFile
-		subprocess.call("pyrcc4 -o "+localDir+resourceFile+" "+guiDir+guiResourceFile,shell=True)		
-	else:
-		print "%s: No need to rebuild" % resourceFile		
+print "Autoencoding resource file..."
+if not os.path.isfile(resourceFile) or \
+ os.path.getmtime(resourceFile) < os.path.getmtime(guiDir+guiResourceFile):
+	print "Building %s" % resourceFile
+	subprocess.call("pyrcc4 -o "+resourceFile+" "+guiDir+guiResourceFile,shell=True)		
+else:
+	print "%s: No need to rebuild" % resourceFile		
 		
 print "Autocoding complete."		